@@ -143,6 +143,13 @@ async def cache_set_async(key, value, timeout=DEFAULT_TIMEOUT, version=None, ali
     return await caches[alias].aset(key, value, timeout, version)
 
 
+def _annotate_cache_hit(hit: bool) -> None:
+    # 실행 추적 중이면 현재 span(LLM 호출)에 캐시 적중 여부 기록
+    from pyhub.llm.tracing import annotate_span
+
+    annotate_span(cache_hit=hit)
+
+
 async def cache_make_key_and_get_async(
     type: str,
     kwargs: dict[
@@ -176,6 +183,8 @@ async def cache_make_key_and_get_async(
         else:
             logger.debug("cache[%s] hit : not sending api request", cache_alias)
 
+        _annotate_cache_hit(cached_value is not None)
+
     return cache_key, cached_value
 
 
@@ -212,6 +221,8 @@ def cache_make_key_and_get(
         else:
             logger.debug("cache[%s] hit : not sending api request", cache_alias)
 
+        _annotate_cache_hit(cached_value is not None)
+
     return cache_key, cached_value
 
 
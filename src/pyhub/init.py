@@ -409,6 +409,22 @@ def make_settings(
     )
 
 
+def get_sqlite_pragmas(env: Optional[Env] = None) -> dict[str, Union[str, int]]:
+    """SQLite 연결에 적용할 PRAGMA 설정 (PRAGMA_* 환경변수로 변경 가능)"""
+    env = env or Env()
+
+    return {
+        "foreign_keys": env.str("PRAGMA_FOREIGN_KEYS", default="ON"),
+        "journal_mode": env.str("PRAGMA_JOURNAL_MODE", default="WAL"),
+        "synchronous": env.str("PRAGMA_SYNCHRONOUS", default="NORMAL"),
+        "busy_timeout": env.int("PRAGMA_BUSY_TIMEOUT", default=5000),
+        "temp_store": env.str("PRAGMA_TEMP_STORE", default="MEMORY"),
+        "mmap_size": env.int("PRAGMA_MMAP_SIZE", default=134_217_728),
+        "journal_size_limit": env.int("PRAGMA_JOURNAL_SIZE_LIMIT", default=67_108_864),
+        "cache_size": env.int("PRAGMA_CACHE_SIZE", default=2000),
+    }
+
+
 def get_databases(base_dir: Path):
     env = Env()
 
@@ -433,27 +449,10 @@ def get_databases(base_dir: Path):
 
             _databases[db_name].setdefault("OPTIONS", {})
 
-            PRAGMA_FOREIGN_KEYS = env.str("PRAGMA_FOREIGN_KEYS", default="ON")
-            PRAGMA_JOURNAL_MODE = env.str("PRAGMA_JOURNAL_MODE", default="WAL")
-            PRAGMA_SYNCHRONOUS = env.str("PRAGMA_SYNCHRONOUS", default="NORMAL")
-            PRAGMA_BUSY_TIMEOUT = env.int("PRAGMA_BUSY_TIMEOUT", default=5000)
-            PRAGMA_TEMP_STORE = env.str("PRAGMA_TEMP_STORE", default="MEMORY")
-            PRAGMA_MMAP_SIZE = env.int("PRAGMA_MMAP_SIZE", default=134_217_728)
-            PRAGMA_JOURNAL_SIZE_LIMIT = env.int("PRAGMA_JOURNAL_SIZE_LIMIT", default=67_108_864)
-            PRAGMA_CACHE_SIZE = env.int("PRAGMA_CACHE_SIZE", default=2000)
             # "IMMEDIATE" or "EXCLUSIVE"
             PRAGMA_TRANSACTION_MODE = env.str("PRAGMA_TRANSACTION_MODE", default="IMMEDIATE")
 
-            init_command = (
-                f"PRAGMA foreign_keys={PRAGMA_FOREIGN_KEYS};"
-                f"PRAGMA journal_mode = {PRAGMA_JOURNAL_MODE};"
-                f"PRAGMA synchronous = {PRAGMA_SYNCHRONOUS};"
-                f"PRAGMA busy_timeout = {PRAGMA_BUSY_TIMEOUT};"
-                f"PRAGMA temp_store = {PRAGMA_TEMP_STORE};"
-                f"PRAGMA mmap_size = {PRAGMA_MMAP_SIZE};"
-                f"PRAGMA journal_size_limit = {PRAGMA_JOURNAL_SIZE_LIMIT};"
-                f"PRAGMA cache_size = {PRAGMA_CACHE_SIZE};"
-            )
+            init_command = "".join(f"PRAGMA {name} = {value};" for name, value in get_sqlite_pragmas(env).items())
 
             # https://gcollazo.com/optimal-sqlite-settings-for-django/
             _databases[db_name]["OPTIONS"].update(
@@ -5,11 +5,13 @@ from .base import (
     BaseTool,
     Tool,
     ToolExecutor,
+    ToolResultCache,
     ValidationLevel,
 )
 from .react import (
     AsyncReactAgent,
     ReactAgent,
+    ReactScratchpad,
     create_react_agent,
 )
 
@@ -19,7 +21,9 @@ __all__ = [
     "AsyncBaseTool",
     "ValidationLevel",
     "ToolExecutor",
+    "ToolResultCache",
     "create_react_agent",
     "ReactAgent",
     "AsyncReactAgent",
+    "ReactScratchpad",
 ]
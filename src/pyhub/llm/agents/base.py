@@ -1,15 +1,20 @@
 """Base classes for agent system."""
 
 import asyncio
+import hashlib
+import json
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Awaitable, Callable, List, Optional, Tuple, Type, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from asgiref.sync import async_to_sync
 from pydantic import BaseModel, ValidationError
 
+from ..tracing import annotate_span, trace_span
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +36,11 @@ class Tool:
     args_schema: Optional[Type[BaseModel]] = None
     validation_level: ValidationLevel = ValidationLevel.STRICT
     pre_validators: List[Callable] = field(default_factory=list)
+    timeout: Optional[float] = None  # 도구 1회 실행의 최대 시간 (초)
+    max_concurrency: Optional[int] = None  # 한 턴에서 이 도구를 동시에 실행할 최대 개수
+    cacheable: bool = False  # 같은 인자에 대해 같은 결과를 반환하는 도구이면 True (결과 메모이제이션)
+    cache_ttl: Optional[int] = None  # 결과 캐시 유지 시간 (초). None이면 만료되지 않습니다. (순수 함수)
+    cache_alias: str = "default"  # 결과를 저장할 pyhub 캐시 alias
     is_async: bool = field(init=False)
 
     def __post_init__(self):
@@ -74,6 +84,106 @@ class Tool:
         return True, None
 
 
+class ToolResultCache:
+    """cacheable로 선언된 도구의 실행 결과를 pyhub 캐시에 저장하고 재사용합니다.
+
+    캐시 키는 도구 이름과 인자를 정규화(JSON, 키 정렬)한 값의 해시로 만들며,
+    도구별 캐시 적중/실패 횟수를 stats에 기록합니다.
+    """
+
+    def __init__(self):
+        self.stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0})
+
+    @property
+    def hits(self) -> int:
+        return sum(stat["hits"] for stat in self.stats.values())
+
+    @property
+    def misses(self) -> int:
+        return sum(stat["misses"] for stat in self.stats.values())
+
+    def reset_stats(self) -> None:
+        self.stats.clear()
+
+    @staticmethod
+    def make_key(tool: Tool, args: tuple = (), kwargs: Optional[Dict[str, Any]] = None) -> str:
+        canonical = json.dumps(
+            {"args": list(args), "kwargs": kwargs or {}},
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"pyhub:tool:{tool.name}:{digest}"
+
+    @staticmethod
+    def _is_enabled(tool: Tool) -> bool:
+        if not tool.cacheable:
+            return False
+
+        from django.conf import settings
+        from django.core.cache import caches
+
+        if not settings.configured:
+            return False
+
+        if tool.cache_alias not in caches:
+            logger.warning(
+                "The specified cache alias '%s' is not configured. Skipping tool result cache.", tool.cache_alias
+            )
+            return False
+        return True
+
+    def _record(self, tool: Tool, cache_key: str, value: Any) -> Any:
+        annotate_span(cache_hit=value is not None)
+        if value is None:
+            self.stats[tool.name]["misses"] += 1
+            logger.debug("tool cache[%s] miss : %s", tool.cache_alias, cache_key)
+        else:
+            self.stats[tool.name]["hits"] += 1
+            logger.debug("tool cache[%s] hit : %s", tool.cache_alias, cache_key)
+        return value
+
+    def get(self, tool: Tool, args: tuple = (), kwargs: Optional[Dict[str, Any]] = None) -> Tuple[Optional[str], Any]:
+        """(캐시 키, 캐시된 결과) 튜플을 반환합니다. 캐시 대상이 아니면 캐시 키는 None입니다."""
+        if not self._is_enabled(tool):
+            return None, None
+
+        from pyhub.caches import cache_get
+
+        cache_key = self.make_key(tool, args, kwargs)
+        return cache_key, self._record(tool, cache_key, cache_get(cache_key, alias=tool.cache_alias))
+
+    async def aget(
+        self, tool: Tool, args: tuple = (), kwargs: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[str], Any]:
+        """get의 비동기 버전"""
+        if not self._is_enabled(tool):
+            return None, None
+
+        from pyhub.caches import cache_get_async
+
+        cache_key = self.make_key(tool, args, kwargs)
+        return cache_key, self._record(tool, cache_key, await cache_get_async(cache_key, alias=tool.cache_alias))
+
+    def set(self, tool: Tool, cache_key: Optional[str], value: Any) -> None:
+        if cache_key is not None and value is not None:
+            from pyhub.caches import cache_set
+
+            cache_set(cache_key, value, timeout=tool.cache_ttl, alias=tool.cache_alias)
+
+    async def aset(self, tool: Tool, cache_key: Optional[str], value: Any) -> None:
+        if cache_key is not None and value is not None:
+            from pyhub.caches import cache_set_async
+
+            await cache_set_async(cache_key, value, timeout=tool.cache_ttl, alias=tool.cache_alias)
+
+
+# 도구 실행기들이 공유하는 기본 결과 캐시
+tool_result_cache = ToolResultCache()
+
+
 class BaseTool(ABC):
     """동기 도구 기본 클래스"""
 
@@ -103,11 +213,27 @@ class AsyncBaseTool(ABC):
 
 
 class ToolExecutor:
-    """도구 실행을 관리하는 클래스"""
+    """도구 실행을 관리하는 클래스
+
+    cacheable로 선언된 도구는 result_cache를 통해 같은 인자의 실행 결과를 재사용합니다.
+    """
+
+    result_cache: ToolResultCache = tool_result_cache
 
     @staticmethod
     def execute_tool(tool: Tool, *args, **kwargs) -> str:
         """동기 도구 실행"""
+        with trace_span(f"tool:{tool.name}", kind="tool"):
+            cache_key, cached_result = ToolExecutor.result_cache.get(tool, args, kwargs)
+            if cached_result is not None:
+                return cached_result
+
+            result = ToolExecutor._execute_tool(tool, *args, **kwargs)
+            ToolExecutor.result_cache.set(tool, cache_key, result)
+            return result
+
+    @staticmethod
+    def _execute_tool(tool: Tool, *args, **kwargs) -> str:
         if tool.is_async:
             # 이미 실행 중인 이벤트 루프가 있는지 확인
             try:
@@ -129,6 +255,17 @@ class ToolExecutor:
     @staticmethod
     async def aexecute_tool(tool: Tool, *args, **kwargs) -> str:
         """비동기 도구 실행"""
+        with trace_span(f"tool:{tool.name}", kind="tool"):
+            cache_key, cached_result = await ToolExecutor.result_cache.aget(tool, args, kwargs)
+            if cached_result is not None:
+                return cached_result
+
+            result = await ToolExecutor._aexecute_tool(tool, *args, **kwargs)
+            await ToolExecutor.result_cache.aset(tool, cache_key, result)
+            return result
+
+    @staticmethod
+    async def _aexecute_tool(tool: Tool, *args, **kwargs) -> str:
         if tool.is_async:
             return await tool.func(*args, **kwargs)
         # 동기 도구를 비동기로 실행
@@ -3,6 +3,7 @@
 from .client import MCPClient
 from .loader import load_mcp_tools
 from .multi_client import MultiServerMCPClient, create_multi_server_client_from_config
+from .pool import MCPSessionPool, PooledMCPClient, get_mcp_session_pool
 from .wrapper import MCPTool
 
 __all__ = [
@@ -11,4 +12,7 @@ __all__ = [
     "MCPTool",
     "MultiServerMCPClient",
     "create_multi_server_client_from_config",
+    "MCPSessionPool",
+    "PooledMCPClient",
+    "get_mcp_session_pool",
 ]
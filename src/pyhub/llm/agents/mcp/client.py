@@ -1,9 +1,11 @@
 """MCP client implementation for pyhub."""
 
+import inspect
 import logging
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
+from ...tracing import trace_span
 from .transports import create_transport
 
 logger = logging.getLogger(__name__)
@@ -12,12 +14,17 @@ logger = logging.getLogger(__name__)
 class MCPClient:
     """MCP 서버와 통신하는 클라이언트 래퍼"""
 
-    def __init__(self, server_params_or_config: Union[Any, Dict[str, Any]]):
+    def __init__(
+        self,
+        server_params_or_config: Union[Any, Dict[str, Any]],
+        on_tools_changed: Optional[Callable[[], Any]] = None,
+    ):
         """
         Args:
             server_params_or_config: MCP 서버 연결 파라미터 또는 설정 딕셔너리
                 - StdioServerParameters 인스턴스 (레거시 지원)
                 - Dict with transport configuration
+            on_tools_changed: 서버가 tools/list_changed 알림을 보낼 때 호출할 콜백 (동기/비동기)
         """
         # 레거시 지원: StdioServerParameters 직접 전달
         if not isinstance(server_params_or_config, dict):
@@ -28,6 +35,8 @@ class MCPClient:
             self.server_params = None
             self.transport = create_transport(server_params_or_config)
 
+        self.on_tools_changed = on_tools_changed
+
         self._session = None
         self._read = None
         self._write = None
@@ -46,7 +55,7 @@ class MCPClient:
                 self._read = read
                 self._write = write
 
-                async with ClientSession(read, write) as session:
+                async with ClientSession(read, write, message_handler=self._handle_message) as session:
                     self._session = session
 
                     # 연결 초기화
@@ -67,7 +76,7 @@ class MCPClient:
                 self._read = read
                 self._write = write
 
-                async with ClientSession(read, write) as session:
+                async with ClientSession(read, write, message_handler=self._handle_message) as session:
                     self._session = session
 
                     # 연결 초기화
@@ -80,13 +89,39 @@ class MCPClient:
                         self._session = None
                         logger.info("MCP session closed")
 
+    async def _handle_message(self, message: Any) -> None:
+        """서버에서 받은 알림 처리 (tools/list_changed)"""
+        from mcp import types
+
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            logger.info("MCP server tool list changed")
+            if self.on_tools_changed is not None:
+                result = self.on_tools_changed()
+                if inspect.isawaitable(result):
+                    await result
+
+    async def ping(self) -> bool:
+        """세션이 살아있는지 확인"""
+        if not self._session:
+            return False
+
+        try:
+            await self._session.send_ping()
+            return True
+        except Exception as e:
+            logger.warning(f"MCP session ping failed: {e}")
+            return False
+
     async def list_tools(self) -> List[Dict[str, Any]]:
         """MCP 서버에서 사용 가능한 도구 목록 가져오기"""
         if not self._session:
             raise RuntimeError("MCP session not initialized. Use 'async with client.connect():'")
 
         # MCP 프로토콜에 따라 도구 목록 요청
-        result = await self._session.list_tools()
+        with trace_span("mcp:list_tools", kind="mcp"):
+            result = await self._session.list_tools()
 
         tools = []
         for tool in result.tools:
@@ -110,7 +145,8 @@ class MCPClient:
 
         try:
             # MCP 도구 호출
-            result = await self._session.call_tool(tool_name, arguments)
+            with trace_span(f"mcp:call_tool:{tool_name}", kind="mcp"):
+                result = await self._session.call_tool(tool_name, arguments)
 
             # 결과를 문자열로 변환
             if hasattr(result, "content"):
@@ -5,35 +5,38 @@ from typing import Any, Dict, List, Optional, Union
 
 from ..base import Tool
 from .client import MCPClient
+from .pool import MCPSessionPool, PooledMCPClient, get_mcp_session_pool
 from .wrapper import MCPTool
 
 logger = logging.getLogger(__name__)
 
 
 async def load_mcp_tools(
-    client_or_params: Union[MCPClient, Any], filter_tools: Optional[List[str]] = None
+    client_or_params: Union[MCPClient, PooledMCPClient, Any],
+    filter_tools: Optional[List[str]] = None,
+    pool: Optional[MCPSessionPool] = None,
 ) -> List[Tool]:
     """
     MCP 서버에서 도구를 로드하여 pyhub Tool로 변환
 
     Args:
-        client_or_params: MCPClient 인스턴스 또는 서버 파라미터
+        client_or_params: MCPClient 인스턴스 또는 서버 파라미터(설정 딕셔너리)
         filter_tools: 로드할 도구 이름 필터 (None이면 모든 도구 로드)
+        pool: 서버 파라미터를 받은 경우 사용할 세션 풀 (None이면 기본 공유 풀)
 
     Returns:
         Tool 객체 리스트
     """
 
     # MCPClient가 아닌 경우 클라이언트 생성
-    if isinstance(client_or_params, MCPClient):
+    if isinstance(client_or_params, (MCPClient, PooledMCPClient)):
         client = client_or_params
         # 이미 연결된 클라이언트 사용
         mcp_tools_def = await client.list_tools()
     else:
-        # 서버 파라미터로 새 클라이언트 생성
-        client = MCPClient(client_or_params)
-        async with client.connect():
-            mcp_tools_def = await client.list_tools()
+        # 서버 파라미터는 세션 풀을 통해 연결 (세션 재사용, 도구 목록 캐시)
+        client = (pool or get_mcp_session_pool()).client(client_or_params)
+        mcp_tools_def = await client.list_tools()
 
     tools = []
 
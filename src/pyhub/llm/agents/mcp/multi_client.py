@@ -2,11 +2,11 @@
 
 import asyncio
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from ..base import Tool
-from .client import MCPClient
 from .loader import load_mcp_tools
+from .pool import MCPSessionPool, PooledMCPClient, get_mcp_session_pool
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +14,12 @@ logger = logging.getLogger(__name__)
 class MultiServerMCPClient:
     """여러 MCP 서버를 동시에 관리하는 클라이언트"""
 
-    def __init__(self, servers: Dict[str, Dict[str, Any]], prefix_tools: bool = False):
+    def __init__(
+        self,
+        servers: Dict[str, Dict[str, Any]],
+        prefix_tools: bool = False,
+        pool: Optional[MCPSessionPool] = None,
+    ):
         """
         Args:
             servers: 서버 설정 딕셔너리
@@ -27,11 +32,12 @@ class MultiServerMCPClient:
                     }
                 }
             prefix_tools: 도구 이름에 서버 이름을 prefix로 추가할지 여부
+            pool: 세션 풀 (None이면 기본 공유 풀). 컨텍스트를 벗어나도 세션은 풀에 남아 재사용됩니다.
         """
         self.servers = servers
         self.prefix_tools = prefix_tools
-        self._clients: Dict[str, MCPClient] = {}
-        self._active_connections: Dict[str, Any] = {}
+        self.pool = pool or get_mcp_session_pool()
+        self._clients: Dict[str, PooledMCPClient] = {}
 
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
@@ -53,14 +59,8 @@ class MultiServerMCPClient:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """비동기 컨텍스트 매니저 종료"""
-        # 모든 연결 종료
-        for server_name in list(self._active_connections.keys()):
-            try:
-                await self._active_connections[server_name].__aexit__(None, None, None)
-                del self._active_connections[server_name]
-                logger.info(f"Disconnected from '{server_name}'")
-            except Exception as e:
-                logger.error(f"Error disconnecting from '{server_name}': {e}")
+        # 세션은 풀이 관리하므로 닫지 않고 참조만 해제 (로드된 도구는 계속 사용 가능)
+        self._clients.clear()
 
     async def _connect_server(self, server_name: str, config: Dict[str, Any]):
         """개별 서버에 연결"""
@@ -72,16 +72,11 @@ class MultiServerMCPClient:
             if "transport" not in config:
                 config["transport"] = infer_transport_type(config)
 
-            # 클라이언트 생성 (새로운 설정 기반 방식)
-            client = MCPClient(config)
-
-            # 연결 컨텍스트 매니저 저장
-            connection_context = client.connect()
-            # 연결 시작
-            await connection_context.__aenter__()
+            # 풀에서 클라이언트 생성 후 도구 목록으로 연결 확인 (캐시되어 있으면 연결하지 않음)
+            client = self.pool.client(config)
+            await client.list_tools()
 
             self._clients[server_name] = client
-            self._active_connections[server_name] = connection_context
 
             logger.info(f"Connected to '{server_name}' successfully via {config['transport']}")
 
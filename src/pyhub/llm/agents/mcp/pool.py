@@ -0,0 +1,375 @@
+"""Long-lived MCP session pool."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Deque, Dict, List, Optional, Union
+
+from ...tracing import trace_span
+from .client import MCPClient
+
+logger = logging.getLogger(__name__)
+
+
+def make_server_key(config: Union[Any, Dict[str, Any]]) -> str:
+    """서버 설정(딕셔너리 또는 StdioServerParameters)에서 풀 키 생성"""
+    if isinstance(config, dict):
+        # filter_tools는 연결과 무관하므로 키에서 제외
+        data = {key: value for key, value in config.items() if key != "filter_tools"}
+    elif hasattr(config, "model_dump"):
+        data = config.model_dump(mode="json")
+    else:
+        data = repr(config)
+
+    canonical = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+class _PooledSession:
+    """백그라운드 태스크에서 연결 컨텍스트를 유지하는 MCP 세션
+
+    connect()는 anyio 태스크 그룹을 사용하므로 진입과 종료가 같은 태스크에서
+    이루어져야 합니다. 전용 태스크가 연결을 열어 두고 close() 때 닫습니다.
+    """
+
+    def __init__(self, config: Union[Any, Dict[str, Any]], on_tools_changed=None):
+        self.client = MCPClient(config, on_tools_changed=on_tools_changed)
+        self.loop = asyncio.get_running_loop()
+        self.last_used = time.monotonic()
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+
+    async def start(self, timeout: Optional[float] = None) -> None:
+        self._task = asyncio.create_task(self._run())
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            await self.close()
+            raise TimeoutError(f"MCP session did not initialize within {timeout}s")
+
+        if self._error is not None:
+            raise self._error
+        self.last_used = time.monotonic()
+
+    async def _run(self) -> None:
+        try:
+            async with self.client.connect():
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as e:
+            self._error = e
+            logger.error(f"MCP session terminated: {e}")
+        finally:
+            self._ready.set()
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self._task is not None
+            and not self._task.done()
+            and self.client._session is not None
+            and self.loop is asyncio.get_running_loop()
+        )
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task is not None and not self._task.done() and self.loop is asyncio.get_running_loop():
+            try:
+                await asyncio.wait_for(self._task, timeout=5)
+            except Exception as e:
+                logger.warning(f"Error closing MCP session: {e}")
+
+    def discard(self) -> None:
+        """다른 이벤트 루프에서 세션을 버릴 때, 세션이 속한 루프에서 연결을 닫도록 예약합니다.
+
+        연결 컨텍스트(stdio 프로세스, transport)는 세션을 연 태스크에서만 닫을 수 있습니다.
+        닫힌 루프는 asyncio.run()이 종료하면서 남은 태스크를 취소하므로 연결도 이미 닫혀 있습니다.
+        """
+        if self._task is None or self._task.done() or self.loop.is_closed():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.close(), self.loop)
+        except RuntimeError:
+            # 예약하는 사이에 루프가 닫힌 경우
+            pass
+
+
+class _ServerState:
+    """서버별 세션 목록과 도구 목록 캐시"""
+
+    def __init__(self, config: Union[Any, Dict[str, Any]]):
+        self.config = config
+        self.tools: Optional[List[Dict[str, Any]]] = None
+        self.tools_fetched_at = 0.0
+        self.reset()
+
+    def reset(self) -> None:
+        """현재 이벤트 루프 기준으로 세션 상태 초기화 (도구 캐시는 유지)"""
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.sessions: List[_PooledSession] = []
+        self.idle: Deque[_PooledSession] = deque()
+        # 연결 중인 세션 수 (세션 수 제한에 포함)
+        self.opening = 0
+        self.condition: Optional[asyncio.Condition] = None
+
+
+class MCPSessionPool:
+    """MCP 서버 세션을 재사용하는 풀
+
+    서버 설정별로 초기화된 세션을 유지하여 Agent를 만들 때마다 서버 프로세스를
+    띄우고 initialize 핸드셰이크를 반복하지 않도록 합니다.
+
+    - 서버당 세션 수는 max_sessions_per_server로 제한하며, 모두 사용 중이면 반환을 기다립니다.
+    - health_check_interval 이상 쉬었던 세션은 ping으로 확인하고, 죽었으면 새로 연결합니다.
+    - 도구 목록은 tools_ttl 동안 메모리와 pyhub 캐시(cache_alias)에 보관하며,
+      서버의 tools/list_changed 알림을 받으면 무효화합니다.
+
+    세션은 생성된 이벤트 루프에 묶이므로, 다른 루프에서 사용하면 새로 연결하고
+    이전 루프의 세션은 그 루프에서 닫도록 예약합니다.
+    """
+
+    def __init__(
+        self,
+        max_sessions_per_server: int = 2,
+        tools_ttl: float = 300,
+        health_check_interval: float = 30,
+        connect_timeout: Optional[float] = 30,
+        cache_alias: Optional[str] = "default",
+    ):
+        if max_sessions_per_server < 1:
+            raise ValueError("max_sessions_per_server must be at least 1")
+
+        self.max_sessions_per_server = max_sessions_per_server
+        self.tools_ttl = tools_ttl
+        self.health_check_interval = health_check_interval
+        self.connect_timeout = connect_timeout
+        self.cache_alias = cache_alias
+        self._states: Dict[str, _ServerState] = {}
+
+    def client(self, config: Union[Any, Dict[str, Any]]) -> "PooledMCPClient":
+        """MCPClient와 같은 인터페이스로 풀을 사용하는 클라이언트 반환"""
+        return PooledMCPClient(self, config)
+
+    def _get_state(self, config: Union[Any, Dict[str, Any]]) -> _ServerState:
+        key = make_server_key(config)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _ServerState(config)
+
+        loop = asyncio.get_running_loop()
+        if state.loop is not loop:
+            if state.sessions:
+                logger.debug("Event loop changed. Closing %d MCP sessions for '%s'", len(state.sessions), key)
+            for session in state.sessions:
+                session.discard()
+            state.reset()
+            state.loop = loop
+            state.condition = asyncio.Condition()
+        return state
+
+    async def _open_session(self, state: _ServerState) -> _PooledSession:
+        key = make_server_key(state.config)
+        session = _PooledSession(state.config, on_tools_changed=lambda: self.invalidate_tools(state.config))
+        try:
+            with trace_span("mcp:connect", kind="mcp", server=key):
+                await session.start(timeout=self.connect_timeout)
+        except BaseException:
+            # 연결 중에 취소되거나 실패하면 반쯤 열린 연결을 닫습니다.
+            await session.close()
+            raise
+        logger.info("Opened MCP session for '%s' (%d/%d)", key, len(state.sessions) + 1, self.max_sessions_per_server)
+        return session
+
+    async def _is_healthy(self, session: _PooledSession) -> bool:
+        if not session.alive:
+            return False
+        if time.monotonic() - session.last_used < self.health_check_interval:
+            return True
+        try:
+            return await asyncio.wait_for(session.client.ping(), timeout=self.connect_timeout)
+        except asyncio.TimeoutError:
+            return False
+
+    async def _acquire(self, state: _ServerState) -> _PooledSession:
+        """
+        세션을 빌립니다.
+
+        대기 중인 세션을 꺼내거나 새 세션 자리를 예약하는 것만 condition 잠금 안에서 하고,
+        ping과 연결은 잠금 밖에서 하므로 느린 연결이 다른 대여를 막지 않습니다.
+        """
+        while True:
+            async with state.condition:
+                while not state.idle and len(state.sessions) + state.opening >= self.max_sessions_per_server:
+                    await state.condition.wait()
+                if state.idle:
+                    session = state.idle.popleft()
+                else:
+                    session = None
+                    state.opening += 1
+
+            if session is None:
+                try:
+                    session = await self._open_session(state)
+                finally:
+                    async with state.condition:
+                        state.opening -= 1
+                        if session is not None:
+                            state.sessions.append(session)
+                        else:
+                            state.condition.notify()
+                return session
+
+            try:
+                healthy = await self._is_healthy(session)
+            except BaseException:
+                # ping 중에 취소되거나 실패하면 세션 상태를 알 수 없으므로 버리고 자리를 돌려줍니다.
+                await self._discard(state, session)
+                raise
+            if healthy:
+                return session
+
+            # 죽은 세션은 버리고 다시 연결
+            logger.info("Discarding unhealthy MCP session for '%s'", make_server_key(state.config))
+            await self._discard(state, session)
+
+    async def _discard(self, state: _ServerState, session: _PooledSession) -> None:
+        """세션을 풀에서 빼고 자리를 돌려준 뒤 연결을 닫습니다."""
+        async with state.condition:
+            if session in state.sessions:
+                state.sessions.remove(session)
+            state.condition.notify()
+        await session.close()
+
+    async def _release(self, state: _ServerState, session: _PooledSession) -> None:
+        session.last_used = time.monotonic()
+        async with state.condition:
+            if session in state.sessions:
+                if session.alive:
+                    state.idle.append(session)
+                else:
+                    state.sessions.remove(session)
+            state.condition.notify()
+
+    @asynccontextmanager
+    async def session(self, config: Union[Any, Dict[str, Any]]):
+        """풀에서 연결된 MCPClient를 빌려 사용"""
+        state = self._get_state(config)
+        session = await self._acquire(state)
+        try:
+            yield session.client
+        finally:
+            await self._release(state, session)
+
+    def _cache_key(self, config: Union[Any, Dict[str, Any]]) -> Optional[str]:
+        if not self.cache_alias or not self.tools_ttl:
+            return None
+
+        from django.conf import settings
+        from django.core.cache import caches
+
+        if not settings.configured or self.cache_alias not in caches:
+            return None
+        return f"pyhub:mcp:tools:{make_server_key(config)}"
+
+    async def list_tools(self, config: Union[Any, Dict[str, Any]], refresh: bool = False) -> List[Dict[str, Any]]:
+        """도구 목록 반환 (TTL 동안 캐시)"""
+        state = self._get_state(config)
+        cache_key = self._cache_key(config)
+
+        if not refresh:
+            if state.tools is not None and time.monotonic() - state.tools_fetched_at < self.tools_ttl:
+                return state.tools
+
+            if cache_key is not None:
+                from pyhub.caches import cache_get_async
+
+                cached = await cache_get_async(cache_key, alias=self.cache_alias)
+                if cached is not None:
+                    logger.debug("MCP tools cache hit : %s", cache_key)
+                    state.tools, state.tools_fetched_at = cached, time.monotonic()
+                    return cached
+
+        async with self.session(config) as client:
+            tools = await client.list_tools()
+
+        state.tools, state.tools_fetched_at = tools, time.monotonic()
+        if cache_key is not None:
+            from pyhub.caches import cache_set_async
+
+            await cache_set_async(cache_key, tools, timeout=self.tools_ttl, alias=self.cache_alias)
+        return tools
+
+    async def invalidate_tools(self, config: Union[Any, Dict[str, Any]]) -> None:
+        """캐시된 도구 목록 무효화"""
+        state = self._states.get(make_server_key(config))
+        if state is not None:
+            state.tools = None
+
+        cache_key = self._cache_key(config)
+        if cache_key is not None:
+            from django.core.cache import caches
+
+            await caches[self.cache_alias].adelete(cache_key)
+
+    async def execute_tool(self, config: Union[Any, Dict[str, Any]], tool_name: str, arguments: Dict[str, Any]) -> str:
+        async with self.session(config) as client:
+            return await client.execute_tool(tool_name, arguments)
+
+    async def get_prompts(self, config: Union[Any, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        async with self.session(config) as client:
+            return await client.get_prompts()
+
+    async def close(self) -> None:
+        """모든 세션 종료 (다른 이벤트 루프의 세션은 해당 루프에서 닫도록 예약)"""
+        loop = asyncio.get_running_loop()
+        for state in self._states.values():
+            if state.loop is loop:
+                await asyncio.gather(*(session.close() for session in state.sessions), return_exceptions=True)
+            else:
+                for session in state.sessions:
+                    session.discard()
+            state.reset()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class PooledMCPClient:
+    """MCPSessionPool을 통해 세션을 빌려 쓰는 MCPClient 호환 클라이언트
+
+    MCPTool에 전달하면 도구를 실행할 때마다 풀에서 세션을 빌리므로,
+    도구를 로드한 연결 컨텍스트가 끝난 뒤에도 도구를 사용할 수 있습니다.
+    """
+
+    def __init__(self, pool: MCPSessionPool, config: Union[Any, Dict[str, Any]]):
+        self.pool = pool
+        self.config = config
+
+    async def list_tools(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        return await self.pool.list_tools(self.config, refresh=refresh)
+
+    async def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
+        return await self.pool.execute_tool(self.config, tool_name, arguments)
+
+    async def get_prompts(self) -> List[Dict[str, Any]]:
+        return await self.pool.get_prompts(self.config)
+
+
+_default_pool: Optional[MCPSessionPool] = None
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """프로세스 전역에서 공유하는 기본 MCP 세션 풀"""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = MCPSessionPool()
+    return _default_pool
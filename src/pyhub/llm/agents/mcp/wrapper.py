@@ -1,6 +1,8 @@
 """MCP tool wrapper for pyhub agents."""
 
+import json
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Type
 
 from pydantic import BaseModel, Field, create_model
@@ -12,8 +14,23 @@ logger = logging.getLogger(__name__)
 
 
 def create_pydantic_schema(parameters: Dict[str, Any]) -> Type[BaseModel]:
-    """MCP 파라미터 정의에서 Pydantic 스키마 생성"""
+    """MCP 파라미터 정의에서 Pydantic 스키마 생성
 
+    같은 JSON Schema에 대해서는 생성된 모델을 재사용합니다.
+    """
+    try:
+        schema_json = json.dumps(parameters or {}, sort_keys=True)
+    except (TypeError, ValueError):
+        return _create_pydantic_schema(parameters)
+    return _create_pydantic_schema_cached(schema_json)
+
+
+@lru_cache(maxsize=1024)
+def _create_pydantic_schema_cached(schema_json: str) -> Type[BaseModel]:
+    return _create_pydantic_schema(json.loads(schema_json))
+
+
+def _create_pydantic_schema(parameters: Dict[str, Any]) -> Type[BaseModel]:
     if not parameters:
         # 파라미터가 없는 경우 빈 모델 반환
         return create_model("EmptySchema")
@@ -1,13 +1,15 @@
 """React Agent implementation."""
 
 import asyncio
+import functools
 import json
 import logging
 import re
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from ..base import BaseLLM
+from ..tracing import trace_span
 from .base import AsyncBaseAgent, BaseAgent, Tool, ToolExecutor
 from .simple_template import SimpleTemplate
 
@@ -40,12 +42,128 @@ class ReactStep:
     action_input: Optional[Dict[str, Any]] = None
     observation: Optional[str] = None
     final_answer: Optional[str] = None
+    error: Optional[str] = None
 
     @property
     def is_final(self) -> bool:
         """최종 답변인지 확인"""
         return self.final_answer is not None
 
+    def to_text(self) -> str:
+        """ReAct 형식의 텍스트로 변환"""
+        lines = []
+        if self.thought:
+            lines.append(f"Thought: {self.thought}")
+        if self.action:
+            lines.append(f"Action: {self.action}")
+        if self.action_input is not None:
+            lines.append(f"Action Input: {json.dumps(self.action_input, ensure_ascii=False)}")
+        if self.observation is not None:
+            lines.append(f"Observation: {self.observation}")
+        if self.error:
+            lines.append(f"Error: {self.error}")
+        return "\n".join(lines)
+
+
+# LLM이 Observation을 지어내지 않도록 이 지점에서 생성을 멈춥니다.
+REACT_STOP_SEQUENCES = ["Observation:"]
+
+
+def approximate_token_count(text: str) -> int:
+    """토크나이저 없이 토큰 수를 근사 (UTF-8 3바이트당 1토큰)"""
+    return (len(text.encode("utf-8")) + 2) // 3
+
+
+def summarize_react_steps(steps: List[ReactStep]) -> str:
+    """오래된 단계들을 한 줄씩 요약 (기본 요약기)"""
+    lines = ["Summary of earlier steps:"]
+    for step in steps:
+        if step.action:
+            action_input = json.dumps(step.action_input, ensure_ascii=False) if step.action_input else ""
+            result = step.error or step.observation or ""
+            result = " ".join(result.split())
+            if len(result) > 100:
+                result = result[:100] + "..."
+            lines.append(f"- {step.action}({action_input}) -> {result}")
+        elif step.error:
+            lines.append(f"- Error: {step.error}")
+    return "\n".join(lines)
+
+
+@dataclass
+class ReactScratchpad:
+    """ReAct 실행 기록 (Thought/Action/Observation)
+
+    기록을 문자열로 계속 이어붙이면 반복할수록 프롬프트가 커집니다.
+    단계별로 보관하다가 렌더링할 때 토큰 예산(max_tokens)을 넘으면
+    최근 keep_recent_steps 단계만 원문으로 남기고 이전 단계는 요약하며,
+    그래도 넘치면 오래된 것부터 버립니다.
+    """
+
+    max_tokens: Optional[int] = 4000
+    max_observation_length: Optional[int] = 2000
+    keep_recent_steps: int = 3
+    token_counter: Callable[[str], int] = approximate_token_count
+    summarizer: Callable[[List[ReactStep]], str] = summarize_react_steps
+    steps: List[ReactStep] = field(default_factory=list)
+
+    def add(self, step: ReactStep) -> ReactStep:
+        """단계 추가 (Observation은 max_observation_length로 잘라냄)"""
+        if step.observation is not None:
+            step.observation = self._truncate(step.observation)
+        self.steps.append(step)
+        return step
+
+    def _truncate(self, text: str) -> str:
+        limit = self.max_observation_length
+        if limit is None or len(text) <= limit:
+            return text
+        return f"{text[:limit]}... [truncated {len(text) - limit} chars]"
+
+    def _fits(self, text: str) -> bool:
+        return self.max_tokens is None or self.token_counter(text) <= self.max_tokens
+
+    def render(self) -> str:
+        """토큰 예산에 맞춰 프롬프트에 넣을 텍스트 생성"""
+        full_text = "\n\n".join(step.to_text() for step in self.steps)
+        if self._fits(full_text):
+            return full_text
+
+        keep = max(1, self.keep_recent_steps)
+        older = self.steps[:-keep]
+        recent_texts = [step.to_text() for step in self.steps[-keep:]]
+        summary_lines = self.summarizer(older).splitlines() if older else []
+
+        # 요약의 오래된 줄부터 버리고, 그래도 넘치면 최근 단계도 최신 1개까지 버림
+        while True:
+            text = "\n\n".join(filter(None, ["\n".join(summary_lines), *recent_texts]))
+            if self._fits(text):
+                return text
+            if summary_lines:
+                summary_lines.pop(1 if len(summary_lines) > 1 else 0)
+            elif len(recent_texts) > 1:
+                recent_texts.pop(0)
+            else:
+                return text
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __str__(self) -> str:
+        return self.render()
+
+
+def _scratchpad_options(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Agent kwargs에서 ReactScratchpad 옵션 추출"""
+    mapping = {
+        "max_scratchpad_tokens": "max_tokens",
+        "max_observation_length": "max_observation_length",
+        "keep_recent_steps": "keep_recent_steps",
+        "token_counter": "token_counter",
+        "scratchpad_summarizer": "summarizer",
+    }
+    return {field_name: kwargs[key] for key, field_name in mapping.items() if key in kwargs}
+
 
 def parse_react_output(output: str) -> ReactStep:
     """LLM 출력을 ReactStep으로 파싱"""
@@ -128,6 +246,8 @@ class ReactAgent(BaseAgent):
                 self.user_prompt_template = SimpleTemplate(self._get_default_user_prompt())
 
         self.verbose = kwargs.get("verbose", False)
+        self.scratchpad_options = _scratchpad_options(kwargs)
+        self.scratchpad: Optional[ReactScratchpad] = None
 
     def _get_default_system_prompt(self) -> str:
         """기본 시스템 프롬프트 반환"""
@@ -221,41 +341,53 @@ Important guidelines:
         self.llm.system_prompt = self._format_system_prompt()
 
         try:
-            history = ""
-
-            for iteration in range(self.max_iterations):
-                # 프롬프트 생성
-                prompt = self._format_user_prompt(input, history)
-
-                # LLM 호출
-                response = self.llm.ask(prompt)
-                # Reply 객체를 문자열로 변환
-                response = str(response)
-
-                if self.verbose:
-                    logger.info(f"Iteration {iteration + 1}:\n{response}")
-
-                # 응답 파싱
-                try:
-                    step = parse_react_output(response)
-                except ValueError as e:
-                    logger.error(f"Parsing error: {e}")
-                    history += f"\n{response}\nError: Failed to parse response. Please follow the correct format.\n"
-                    continue
-
-                # 최종 답변인 경우
-                if step.is_final:
-                    return step.final_answer
-
-                # 액션 실행
-                if step.action and step.action_input:
-                    observation = self._execute_tool(step.action, step.action_input)
-                    history += f"\n{response}\nObservation: {observation}\n"
-                else:
-                    history += f"\n{response}\nError: Action and Action Input are required.\n"
-
-            # 최대 반복 횟수 도달
-            return f"Reached maximum iterations ({self.max_iterations}) without finding a final answer."
+            with trace_span(
+                "agent.run", kind="agent", agent=type(self).__name__, max_iterations=self.max_iterations
+            ) as agent_span:
+                scratchpad = self.scratchpad = ReactScratchpad(**self.scratchpad_options)
+
+                for iteration in range(self.max_iterations):
+                    with trace_span("react.step", kind="agent", iteration=iteration + 1):
+                        # 프롬프트 생성
+                        prompt = self._format_user_prompt(input, scratchpad.render())
+
+                        # LLM 호출 (scratchpad가 매번 전체 맥락을 담으므로 LLM history는 사용하지 않음)
+                        response = self.llm.ask(prompt, use_history=False, stop=REACT_STOP_SEQUENCES)
+                        # Reply 객체를 문자열로 변환
+                        response = str(response)
+
+                        if self.verbose:
+                            logger.info(f"Iteration {iteration + 1}:\n{response}")
+
+                        # 응답 파싱
+                        try:
+                            with trace_span("react.parse", kind="parse"):
+                                step = parse_react_output(response)
+                        except ValueError as e:
+                            logger.error(f"Parsing error: {e}")
+                            scratchpad.add(
+                                ReactStep(
+                                    thought="", error="Failed to parse response. Please follow the correct format."
+                                )
+                            )
+                            continue
+
+                        # 최종 답변인 경우
+                        if step.is_final:
+                            agent_span.set(iterations=iteration + 1)
+                            return step.final_answer
+
+                        # 액션 실행
+                        if step.action and step.action_input:
+                            step.observation = self._execute_tool(step.action, step.action_input)
+                        else:
+                            step.observation = None
+                            step.error = "Action and Action Input are required."
+                        scratchpad.add(step)
+
+                # 최대 반복 횟수 도달
+                agent_span.set(iterations=self.max_iterations)
+                return f"Reached maximum iterations ({self.max_iterations}) without finding a final answer."
 
         finally:
             # 원래 시스템 프롬프트 복원
@@ -296,6 +428,8 @@ class AsyncReactAgent(AsyncBaseAgent):
                 self.user_prompt_template = SimpleTemplate(self._get_default_user_prompt())
 
         self.verbose = kwargs.get("verbose", False)
+        self.scratchpad_options = _scratchpad_options(kwargs)
+        self.scratchpad: Optional[ReactScratchpad] = None
 
     def _get_default_system_prompt(self) -> str:
         """기본 시스템 프롬프트 반환"""
@@ -389,47 +523,64 @@ Important guidelines:
         self.llm.system_prompt = self._format_system_prompt()
 
         try:
-            history = ""
-
-            for iteration in range(self.max_iterations):
-                # 프롬프트 생성
-                prompt = self._format_user_prompt(input, history)
-
-                # LLM 호출
-                if hasattr(self.llm, "aask"):
-                    response = await self.llm.aask(prompt)
-                else:
-                    # 동기 LLM을 비동기로 실행
-                    loop = asyncio.get_event_loop()
-                    response = await loop.run_in_executor(None, self.llm.ask, prompt)
-
-                # Reply 객체를 문자열로 변환
-                response = str(response)
-
-                if self.verbose:
-                    logger.info(f"Iteration {iteration + 1}:\n{response}")
-
-                # 응답 파싱
-                try:
-                    step = parse_react_output(response)
-                except ValueError as e:
-                    logger.error(f"Parsing error: {e}")
-                    history += f"\n{response}\nError: Failed to parse response. Please follow the correct format.\n"
-                    continue
-
-                # 최종 답변인 경우
-                if step.is_final:
-                    return step.final_answer
-
-                # 액션 실행
-                if step.action and step.action_input:
-                    observation = await self._execute_tool(step.action, step.action_input)
-                    history += f"\n{response}\nObservation: {observation}\n"
-                else:
-                    history += f"\n{response}\nError: Action and Action Input are required.\n"
-
-            # 최대 반복 횟수 도달
-            return f"Reached maximum iterations ({self.max_iterations}) without finding a final answer."
+            with trace_span(
+                "agent.run", kind="agent", agent=type(self).__name__, max_iterations=self.max_iterations
+            ) as agent_span:
+                scratchpad = self.scratchpad = ReactScratchpad(**self.scratchpad_options)
+
+                for iteration in range(self.max_iterations):
+                    with trace_span("react.step", kind="agent", iteration=iteration + 1):
+                        # 프롬프트 생성
+                        prompt = self._format_user_prompt(input, scratchpad.render())
+
+                        # LLM 호출 (scratchpad가 매번 전체 맥락을 담으므로 LLM history는 사용하지 않음)
+                        ask_kwargs = {"use_history": False, "stop": REACT_STOP_SEQUENCES}
+                        if hasattr(self.llm, "aask"):
+                            response = await self.llm.aask(prompt, **ask_kwargs)
+                        elif hasattr(self.llm, "ask_async"):
+                            response = await self.llm.ask_async(prompt, **ask_kwargs)
+                        else:
+                            # 동기 LLM을 비동기로 실행
+                            loop = asyncio.get_event_loop()
+                            response = await loop.run_in_executor(
+                                None, functools.partial(self.llm.ask, prompt, **ask_kwargs)
+                            )
+
+                        # Reply 객체를 문자열로 변환
+                        response = str(response)
+
+                        if self.verbose:
+                            logger.info(f"Iteration {iteration + 1}:\n{response}")
+
+                        # 응답 파싱
+                        try:
+                            with trace_span("react.parse", kind="parse"):
+                                step = parse_react_output(response)
+                        except ValueError as e:
+                            logger.error(f"Parsing error: {e}")
+                            scratchpad.add(
+                                ReactStep(
+                                    thought="", error="Failed to parse response. Please follow the correct format."
+                                )
+                            )
+                            continue
+
+                        # 최종 답변인 경우
+                        if step.is_final:
+                            agent_span.set(iterations=iteration + 1)
+                            return step.final_answer
+
+                        # 액션 실행
+                        if step.action and step.action_input:
+                            step.observation = await self._execute_tool(step.action, step.action_input)
+                        else:
+                            step.observation = None
+                            step.error = "Action and Action Input are required."
+                        scratchpad.add(step)
+
+                # 최대 반복 횟수 도달
+                agent_span.set(iterations=self.max_iterations)
+                return f"Reached maximum iterations ({self.max_iterations}) without finding a final answer."
 
         finally:
             # 원래 시스템 프롬프트 복원
@@ -464,4 +615,7 @@ __all__ = [
     "create_react_agent",
     "parse_react_output",
     "ReactStep",
+    "ReactScratchpad",
+    "approximate_token_count",
+    "summarize_react_steps",
 ]
@@ -72,6 +72,8 @@ class Calculator(BaseTool):
         super().__init__(name="calculator", description="Performs mathematical calculations")
         self.args_schema = CalculatorInput
         self.validation_level = ValidationLevel.STRICT
+        # 같은 수식은 항상 같은 결과이므로 결과를 캐시합니다.
+        self.cacheable = True
 
     def run(self, expression: str) -> str:
         """계산 실행"""
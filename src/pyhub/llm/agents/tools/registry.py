@@ -65,6 +65,9 @@ class ToolRegistry:
                 args_schema=getattr(instance, "args_schema", None),
                 validation_level=getattr(instance, "validation_level", None),
                 pre_validators=getattr(instance, "pre_validators", []),
+                cacheable=getattr(instance, "cacheable", False),
+                cache_ttl=getattr(instance, "cache_ttl", None),
+                cache_alias=getattr(instance, "cache_alias", "default"),
             )
         return None
 
@@ -135,7 +135,7 @@ class AnthropicLLM(BaseLLM):
             }
         )
 
-        return dict(
+        request_params = dict(
             model=model,
             system=system_prompt,  # 위에서 계산한 system_prompt 사용
             messages=message_history,
@@ -145,6 +145,11 @@ class AnthropicLLM(BaseLLM):
             max_tokens=self.max_tokens,
         )
 
+        if input_context.get("stop"):
+            request_params["stop_sequences"] = input_context["stop"]
+
+        return request_params
+
     def _make_ask(
         self,
         input_context: dict[str, Any],
@@ -377,6 +382,7 @@ class AnthropicLLM(BaseLLM):
         use_history: bool = True,
         raise_errors: bool = False,
         enable_cache: bool = False,
+        stop: Optional[list[str]] = None,
         tools: Optional[list] = None,
         tool_choice: str = "auto",
         max_tool_calls: int = 5,
@@ -392,6 +398,7 @@ class AnthropicLLM(BaseLLM):
             use_history=use_history,
             raise_errors=raise_errors,
             enable_cache=enable_cache,
+            stop=stop,
             tools=tools,
             tool_choice=tool_choice,
             max_tool_calls=max_tool_calls,
@@ -410,6 +417,7 @@ class AnthropicLLM(BaseLLM):
         raise_errors: bool = False,
         use_history: bool = True,
         enable_cache: bool = False,
+        stop: Optional[list[str]] = None,
         tools: Optional[list] = None,
         tool_choice: str = "auto",
         max_tool_calls: int = 5,
@@ -425,6 +433,7 @@ class AnthropicLLM(BaseLLM):
             use_history=use_history,
             raise_errors=raise_errors,
             enable_cache=enable_cache,
+            stop=stop,
             tools=tools,
             tool_choice=tool_choice,
             max_tool_calls=max_tool_calls,
@@ -462,7 +471,9 @@ class AnthropicLLM(BaseLLM):
 
         return tool_calls
 
-    def _make_ask_with_tools_sync(self, human_prompt, messages, tools, tool_choice, model, files, enable_cache):
+    def _make_ask_with_tools_sync(
+        self, human_prompt, messages, tools, tool_choice, model, files, enable_cache, stop=None
+    ):
         """Anthropic Tool Use를 사용한 동기 호출"""
 
         # 메시지 준비
@@ -485,6 +496,9 @@ class AnthropicLLM(BaseLLM):
         if tools:
             request_params["tools"] = tools
 
+        if stop:
+            request_params["stop_sequences"] = list(stop)
+
         try:
             response = sync_client.messages.create(**request_params)
 
@@ -507,7 +521,9 @@ class AnthropicLLM(BaseLLM):
             logger.error(f"Anthropic API error: {e}")
             return Reply(text=f"API Error: {str(e)}")
 
-    async def _make_ask_with_tools_async(self, human_prompt, messages, tools, tool_choice, model, files, enable_cache):
+    async def _make_ask_with_tools_async(
+        self, human_prompt, messages, tools, tool_choice, model, files, enable_cache, stop=None
+    ):
         """Anthropic Tool Use를 사용한 비동기 호출"""
 
         # 메시지 준비
@@ -530,6 +546,9 @@ class AnthropicLLM(BaseLLM):
         if tools:
             request_params["tools"] = tools
 
+        if stop:
+            request_params["stop_sequences"] = list(stop)
+
         try:
             response = await async_client.messages.create(**request_params)
 
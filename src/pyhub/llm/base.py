@@ -13,6 +13,7 @@ from django.template import Context, Template, TemplateDoesNotExist
 from django.template.loader import get_template
 
 from .settings import llm_settings
+from .tracing import trace_span, usage_attributes
 from .types import (
     ChainReply,
     Embed,
@@ -22,6 +23,7 @@ from .types import (
     Message,
     Reply,
 )
+from .utils.files import resolve_url_files_async
 
 logger = logging.getLogger(__name__)
 
@@ -308,6 +310,7 @@ class BaseLLM(abc.ABC):
         use_history: bool = True,
         raise_errors: bool = False,
         enable_cache: bool = False,
+        stop: Optional[list[str]] = None,
     ):
         """동기 또는 비동기 응답을 생성하는 내부 메서드 (일반/스트리밍)"""
         current_messages = [*self.history] if use_history else []
@@ -324,6 +327,10 @@ class BaseLLM(abc.ABC):
         # enable_cache를 context에 추가
         input_context["enable_cache"] = enable_cache
 
+        # stop sequence를 context에 추가 (각 provider에서 요청 파라미터로 변환)
+        if stop:
+            input_context["stop"] = list(stop)
+
         # choices 처리
         if choices:
             if len(choices) < 2:
@@ -348,6 +355,9 @@ class BaseLLM(abc.ABC):
 
             async def async_stream_handler() -> AsyncGenerator[Reply, None]:
                 try:
+                    # URL 파일은 이벤트 루프를 막지 않도록 미리 동시에 다운로드합니다.
+                    human_message.files = await resolve_url_files_async(human_message.files)
+
                     text_list = []
                     async for ask in self._make_ask_stream_async(
                         input_context=input_context,
@@ -411,12 +421,17 @@ class BaseLLM(abc.ABC):
 
             async def async_handler() -> Reply:
                 try:
-                    ask = await self._make_ask_async(
-                        input_context=input_context,
-                        human_message=human_message,
-                        messages=current_messages,
-                        model=current_model,
-                    )
+                    # URL 파일은 이벤트 루프를 막지 않도록 미리 동시에 다운로드합니다.
+                    human_message.files = await resolve_url_files_async(human_message.files)
+
+                    with trace_span("llm.ask", kind="llm", model=current_model) as span:
+                        ask = await self._make_ask_async(
+                            input_context=input_context,
+                            human_message=human_message,
+                            messages=current_messages,
+                            model=current_model,
+                        )
+                        span.set(**usage_attributes(ask))
                 except Exception as e:
                     if raise_errors:
                         raise e
@@ -437,12 +452,14 @@ class BaseLLM(abc.ABC):
 
             def sync_handler() -> Reply:
                 try:
-                    ask = self._make_ask(
-                        input_context=input_context,
-                        human_message=human_message,
-                        messages=current_messages,
-                        model=current_model,
-                    )
+                    with trace_span("llm.ask", kind="llm", model=current_model) as span:
+                        ask = self._make_ask(
+                            input_context=input_context,
+                            human_message=human_message,
+                            messages=current_messages,
+                            model=current_model,
+                        )
+                        span.set(**usage_attributes(ask))
                 except Exception as e:
                     if raise_errors:
                         raise e
@@ -495,6 +512,7 @@ class BaseLLM(abc.ABC):
         use_history: bool = True,
         raise_errors: bool = False,
         enable_cache: bool = False,
+        stop: Optional[list[str]] = None,
         tools: Optional[list] = None,
         tool_choice: str = "auto",
         max_tool_calls: int = 5,
@@ -518,6 +536,7 @@ class BaseLLM(abc.ABC):
                 use_history=use_history,
                 raise_errors=raise_errors,
                 enable_cache=enable_cache,
+                stop=stop,
                 is_async=False,
             )
         else:
@@ -533,6 +552,7 @@ class BaseLLM(abc.ABC):
                 use_history=use_history,
                 raise_errors=raise_errors,
                 enable_cache=enable_cache,
+                stop=stop,
             )
 
     async def ask_async(
@@ -548,6 +568,7 @@ class BaseLLM(abc.ABC):
         raise_errors: bool = False,
         use_history: bool = True,
         enable_cache: bool = False,
+        stop: Optional[list[str]] = None,
         tools: Optional[list] = None,
         tool_choice: str = "auto",
         max_tool_calls: int = 5,
@@ -571,6 +592,7 @@ class BaseLLM(abc.ABC):
                 use_history=use_history,
                 raise_errors=raise_errors,
                 enable_cache=enable_cache,
+                stop=stop,
                 is_async=True,
             )
         else:
@@ -586,6 +608,7 @@ class BaseLLM(abc.ABC):
                 use_history=use_history,
                 raise_errors=raise_errors,
                 enable_cache=enable_cache,
+                stop=stop,
             )
 
         if stream:
@@ -634,6 +657,7 @@ class BaseLLM(abc.ABC):
         use_history: bool = True,
         raise_errors: bool = False,
         enable_cache: bool = False,
+        stop: Optional[list[str]] = None,
         is_async: bool = False,
     ):
         """도구와 함께 LLM 호출을 처리합니다.
@@ -670,6 +694,7 @@ class BaseLLM(abc.ABC):
                 use_history,
                 raise_errors,
                 enable_cache,
+                stop,
             )
         else:
             return self._ask_with_tools_sync(
@@ -688,6 +713,7 @@ class BaseLLM(abc.ABC):
                 use_history,
                 raise_errors,
                 enable_cache,
+                stop,
             )
 
     def _ask_with_tools_sync(
@@ -707,6 +733,7 @@ class BaseLLM(abc.ABC):
         use_history,
         raise_errors,
         enable_cache,
+        stop=None,
     ):
         """동기 버전의 도구 호출 처리"""
         # Trace 시작
@@ -727,18 +754,23 @@ class BaseLLM(abc.ABC):
                     print(f"\n📞 [TRACE] LLM 호출 #{call_count + 1}")
 
                 # LLM 호출 (도구 포함)
-                response = self._make_ask_with_tools_sync(
-                    human_prompt if call_count == 0 else None,
-                    current_messages,
-                    provider_tools,
-                    tool_choice,
-                    model,
-                    files if call_count == 0 else None,
-                    enable_cache,
-                )
+                with trace_span(
+                    "llm.ask_with_tools", kind="llm", model=model or self.model, iteration=call_count + 1
+                ) as span:
+                    response = self._make_ask_with_tools_sync(
+                        human_prompt if call_count == 0 else None,
+                        current_messages,
+                        provider_tools,
+                        tool_choice,
+                        model,
+                        files if call_count == 0 else None,
+                        enable_cache,
+                        stop=stop,
+                    )
 
-                # 도구 호출 추출
-                tool_calls = self._extract_tool_calls_from_response(response)
+                    # 도구 호출 추출
+                    tool_calls = self._extract_tool_calls_from_response(response)
+                    span.set(tool_calls=len(tool_calls), **usage_attributes(response))
 
                 if llm_settings.trace_function_calls:
                     if tool_calls:
@@ -760,29 +792,30 @@ class BaseLLM(abc.ABC):
                 # 도구 실행
                 if llm_settings.trace_function_calls:
                     print("\n🛠️  [TRACE] 도구 실행 중...")
+                    for tool_call in tool_calls:
+                        # 인자를 더 읽기 쉽게 포맷팅
+                        args_str = ", ".join([f"{k}={v}" for k, v in tool_call["arguments"].items()])
+                        print(f"   실행: {tool_call['name']}({args_str})")
 
-                for tool_call in tool_calls:
-                    try:
-                        if llm_settings.trace_function_calls:
-                            # 인자를 더 읽기 쉽게 포맷팅
-                            args_str = ", ".join([f"{k}={v}" for k, v in tool_call["arguments"].items()])
-                            print(f"   실행: {tool_call['name']}({args_str})")
-
-                        result = executor.execute_tool(tool_call["name"], tool_call["arguments"])
-
+                # 한 응답의 여러 도구 호출은 동시에 실행하고, 결과는 호출 순서대로 받습니다.
+                try:
+                    with trace_span("tools.execute", kind="tool", count=len(tool_calls)):
+                        results = executor.execute_tools(tool_calls)
+                except Exception as e:
+                    if llm_settings.trace_function_calls:
+                        print(f"   ❌ 오류: {str(e)}")
+                    if raise_errors:
+                        raise e
+                    error_msg = f"Tool execution error: {str(e)}"
+                    current_messages.append(Message(role="user", content=f"[Tool Error: {error_msg}]"))
+                else:
+                    for tool_call, result in zip(tool_calls, results):
                         if llm_settings.trace_function_calls:
-                            print(f"   결과: {result}")
+                            print(f"   결과: {tool_call['name']} → {result}")
 
                         # 도구 결과를 메시지에 추가
                         current_messages.append(Message(role="assistant", content=f"[Tool Call: {tool_call['name']}]"))
                         current_messages.append(Message(role="user", content=f"[Tool Result: {result}]"))
-                    except Exception as e:
-                        if llm_settings.trace_function_calls:
-                            print(f"   ❌ 오류: {str(e)}")
-                        if raise_errors:
-                            raise e
-                        error_msg = f"Tool execution error: {str(e)}"
-                        current_messages.append(Message(role="user", content=f"[Tool Error: {error_msg}]"))
 
                 # 첫 번째 호출이면 히스토리에 추가
                 if use_history and call_count == 0:
@@ -804,12 +837,14 @@ class BaseLLM(abc.ABC):
                 final_human_message = Message(role="user", content="", files=files)
                 final_messages = []
 
-            final_response = self._make_ask(
-                input_context={"enable_cache": enable_cache},
-                human_message=final_human_message,
-                messages=final_messages,
-                model=model,
-            )
+            with trace_span("llm.ask", kind="llm", model=model or self.model) as span:
+                final_response = self._make_ask(
+                    input_context={"enable_cache": enable_cache, "stop": list(stop) if stop else None},
+                    human_message=final_human_message,
+                    messages=final_messages,
+                    model=model,
+                )
+                span.set(**usage_attributes(final_response))
             return final_response
         except Exception as e:
             if raise_errors:
@@ -833,8 +868,12 @@ class BaseLLM(abc.ABC):
         use_history,
         raise_errors,
         enable_cache,
+        stop=None,
     ):
         """비동기 버전의 도구 호출 처리"""
+        # URL 파일은 이벤트 루프를 막지 않도록 미리 동시에 다운로드합니다.
+        files = await resolve_url_files_async(files)
+
         # 초기 메시지 준비
         current_messages = [*self.history] if use_history else []
         human_prompt = self.get_human_prompt(input, context or {})
@@ -843,18 +882,23 @@ class BaseLLM(abc.ABC):
         for call_count in range(max_tool_calls):
             try:
                 # LLM 호출 (도구 포함)
-                response = await self._make_ask_with_tools_async(
-                    human_prompt if call_count == 0 else None,
-                    current_messages,
-                    provider_tools,
-                    tool_choice,
-                    model,
-                    files if call_count == 0 else None,
-                    enable_cache,
-                )
+                with trace_span(
+                    "llm.ask_with_tools", kind="llm", model=model or self.model, iteration=call_count + 1
+                ) as span:
+                    response = await self._make_ask_with_tools_async(
+                        human_prompt if call_count == 0 else None,
+                        current_messages,
+                        provider_tools,
+                        tool_choice,
+                        model,
+                        files if call_count == 0 else None,
+                        enable_cache,
+                        stop=stop,
+                    )
 
-                # 도구 호출 추출
-                tool_calls = self._extract_tool_calls_from_response(response)
+                    # 도구 호출 추출
+                    tool_calls = self._extract_tool_calls_from_response(response)
+                    span.set(tool_calls=len(tool_calls), **usage_attributes(response))
 
                 # 도구 호출이 없으면 완료
                 if not tool_calls:
@@ -863,18 +907,20 @@ class BaseLLM(abc.ABC):
                         self._update_history(human_message, response.text)
                     return response
 
-                # 도구 실행
-                for tool_call in tool_calls:
-                    try:
-                        result = await executor.execute_tool_async(tool_call["name"], tool_call["arguments"])
+                # 도구 실행 : 한 응답의 여러 도구 호출은 동시에 실행하고, 결과는 호출 순서대로 받습니다.
+                try:
+                    with trace_span("tools.execute", kind="tool", count=len(tool_calls)):
+                        results = await executor.execute_tools_async(tool_calls)
+                except Exception as e:
+                    if raise_errors:
+                        raise e
+                    error_msg = f"Tool execution error: {str(e)}"
+                    current_messages.append(Message(role="user", content=f"[Tool Error: {error_msg}]"))
+                else:
+                    for tool_call, result in zip(tool_calls, results):
                         # 도구 결과를 메시지에 추가
                         current_messages.append(Message(role="assistant", content=f"[Tool Call: {tool_call['name']}]"))
                         current_messages.append(Message(role="user", content=f"[Tool Result: {result}]"))
-                    except Exception as e:
-                        if raise_errors:
-                            raise e
-                        error_msg = f"Tool execution error: {str(e)}"
-                        current_messages.append(Message(role="user", content=f"[Tool Error: {error_msg}]"))
 
                 # 첫 번째 호출이면 히스토리에 추가
                 if use_history and call_count == 0:
@@ -896,12 +942,14 @@ class BaseLLM(abc.ABC):
                 final_human_message = Message(role="user", content="", files=files)
                 final_messages = []
 
-            final_response = await self._make_ask_async(
-                input_context={"enable_cache": enable_cache},
-                human_message=final_human_message,
-                messages=final_messages,
-                model=model,
-            )
+            with trace_span("llm.ask", kind="llm", model=model or self.model) as span:
+                final_response = await self._make_ask_async(
+                    input_context={"enable_cache": enable_cache, "stop": list(stop) if stop else None},
+                    human_message=final_human_message,
+                    messages=final_messages,
+                    model=model,
+                )
+                span.set(**usage_attributes(final_response))
             return final_response
         except Exception as e:
             if raise_errors:
@@ -918,21 +966,25 @@ class BaseLLM(abc.ABC):
         # 기본적으로 빈 리스트 반환
         return []
 
-    def _make_ask_with_tools_sync(self, human_prompt, messages, tools, tool_choice, model, files, enable_cache):
+    def _make_ask_with_tools_sync(
+        self, human_prompt, messages, tools, tool_choice, model, files, enable_cache, stop=None
+    ):
         """도구와 함께 동기 LLM 호출 (하위 클래스에서 구현)"""
         # 기본적으로 일반 ask 호출
         return self._make_ask(
-            input_context={},
+            input_context={"stop": list(stop)} if stop else {},
             human_message=Message(role="user", content=human_prompt or ""),
             messages=messages,
             model=model,
         )
 
-    async def _make_ask_with_tools_async(self, human_prompt, messages, tools, tool_choice, model, files, enable_cache):
+    async def _make_ask_with_tools_async(
+        self, human_prompt, messages, tools, tool_choice, model, files, enable_cache, stop=None
+    ):
         """도구와 함께 비동기 LLM 호출 (하위 클래스에서 구현)"""
         # 기본적으로 일반 ask 호출
         return await self._make_ask_async(
-            input_context={},
+            input_context={"stop": list(stop)} if stop else {},
             human_message=Message(role="user", content=human_prompt or ""),
             messages=messages,
             model=model,
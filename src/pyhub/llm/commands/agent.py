@@ -1,6 +1,8 @@
 """Agent CLI command."""
 
 import asyncio
+from contextlib import nullcontext
+from pathlib import Path
 from typing import List, Optional
 
 import typer
@@ -12,6 +14,7 @@ from pyhub import init
 from .. import LLM
 from ..agents import create_react_agent
 from ..agents.tools import tool_registry
+from ..tracing import InMemorySpanSink, JSONLSpanSink, Tracer, format_waterfall
 
 app = typer.Typer(
     help="Agent를 실행합니다.",
@@ -40,6 +43,10 @@ def run(
         "--enable-cache",
         help="API 응답 캐시를 활성화합니다",
     ),
+    trace: bool = typer.Option(
+        False, "--trace", help="LLM 호출/파싱/도구 실행 구간별 소요 시간을 waterfall로 출력합니다"
+    ),
+    trace_file: Optional[Path] = typer.Option(None, "--trace-file", help="추적 span을 저장할 JSONL 파일 경로"),
 ):
     """React Agent를 실행합니다."""
 
@@ -101,19 +108,14 @@ def run(
     elif mcp_server_http:
         # HTTP 서버 로드
         try:
-            from ..agents.mcp import MCPClient, load_mcp_tools
+            from ..agents.mcp import load_mcp_tools
 
             # HTTP 설정
             config = {"transport": "streamable_http", "url": mcp_server_http}
 
             console.print(f"[yellow]Loading tools from HTTP MCP server: {mcp_server_http}[/yellow]")
 
-            async def load_from_http():
-                client = MCPClient(config)
-                async with client.connect():
-                    return await load_mcp_tools(client)
-
-            mcp_tools = asyncio.run(load_from_http())
+            mcp_tools = asyncio.run(load_mcp_tools(config))
             agent_tools.extend(mcp_tools)
             console.print(f"[green]Loaded {len(mcp_tools)} tools from HTTP MCP server[/green]")
 
@@ -158,17 +160,27 @@ def run(
     # Agent 생성
     agent = create_react_agent(llm=llm, tools=agent_tools, verbose=verbose, max_iterations=max_iterations)
 
+    # 실행 추적
+    tracer = None
+    span_sink = InMemorySpanSink()
+    if trace or trace_file:
+        sinks = [span_sink]
+        if trace_file:
+            sinks.append(JSONLSpanSink(trace_file))
+        tracer = Tracer(sinks)
+
     # 실행
     console.print(Panel(f"[bold blue]Question:[/bold blue] {question}", expand=False))
 
     try:
-        # 비동기 도구가 있는지 확인
-        if hasattr(agent, "arun"):
-            # 비동기 실행
-            result = asyncio.run(agent.arun(question))
-        else:
-            # 동기 실행
-            result = agent.run(question)
+        with tracer.activate() if tracer else nullcontext():
+            # 비동기 도구가 있는지 확인
+            if hasattr(agent, "arun"):
+                # 비동기 실행
+                result = asyncio.run(agent.arun(question))
+            else:
+                # 동기 실행
+                result = agent.run(question)
 
         console.print("\n[bold green]Final Answer:[/bold green]")
         console.print(Panel(result, expand=False))
@@ -182,6 +194,15 @@ def run(
             console.print(traceback.format_exc())
         raise typer.Exit(1)
 
+    finally:
+        if tracer:
+            tracer.close()
+            if trace:
+                console.print("\n[bold]Trace:[/bold]")
+                console.print(format_waterfall(span_sink.spans), markup=False, highlight=False)
+            if trace_file:
+                console.print(f"[dim]Trace spans saved to {trace_file}[/dim]")
+
 
 @app.command()
 def list_tools():
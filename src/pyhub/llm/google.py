@@ -144,6 +144,7 @@ class GoogleLLM(BaseLLM):
             system_instruction=system_instruction,
             max_output_tokens=self.max_tokens,
             temperature=self.temperature,
+            stop_sequences=input_context.get("stop") or None,
         )
 
         return dict(
@@ -355,6 +356,7 @@ class GoogleLLM(BaseLLM):
         use_history: bool = True,
         raise_errors: bool = False,
         enable_cache: bool = False,
+        stop: Optional[list[str]] = None,
         tools: Optional[list] = None,
         tool_choice: str = "auto",
         max_tool_calls: int = 5,
@@ -370,6 +372,7 @@ class GoogleLLM(BaseLLM):
             use_history=use_history,
             raise_errors=raise_errors,
             enable_cache=enable_cache,
+            stop=stop,
             tools=tools,
             tool_choice=tool_choice,
             max_tool_calls=max_tool_calls,
@@ -388,6 +391,7 @@ class GoogleLLM(BaseLLM):
         use_history: bool = True,
         raise_errors: bool = False,
         enable_cache: bool = False,
+        stop: Optional[list[str]] = None,
         tools: Optional[list] = None,
         tool_choice: str = "auto",
         max_tool_calls: int = 5,
@@ -403,6 +407,7 @@ class GoogleLLM(BaseLLM):
             use_history=use_history,
             raise_errors=raise_errors,
             enable_cache=enable_cache,
+            stop=stop,
             tools=tools,
             tool_choice=tool_choice,
             max_tool_calls=max_tool_calls,
@@ -529,7 +534,9 @@ class GoogleLLM(BaseLLM):
 
         return tool_calls
 
-    def _make_ask_with_tools_sync(self, human_prompt, messages, tools, tool_choice, model, files, enable_cache):
+    def _make_ask_with_tools_sync(
+        self, human_prompt, messages, tools, tool_choice, model, files, enable_cache, stop=None
+    ):
         """Google Function Calling을 사용한 동기 호출"""
         from google.genai.types import FunctionDeclaration, Tool
 
@@ -569,6 +576,7 @@ class GoogleLLM(BaseLLM):
             max_output_tokens=self.max_tokens,
             temperature=self.temperature,
             tools=google_tools if google_tools else None,
+            stop_sequences=list(stop) if stop else None,
         )
 
         try:
@@ -593,7 +601,9 @@ class GoogleLLM(BaseLLM):
             logger.error(f"Google API error: {e}")
             return Reply(text=f"API Error: {str(e)}")
 
-    async def _make_ask_with_tools_async(self, human_prompt, messages, tools, tool_choice, model, files, enable_cache):
+    async def _make_ask_with_tools_async(
+        self, human_prompt, messages, tools, tool_choice, model, files, enable_cache, stop=None
+    ):
         """Google Function Calling을 사용한 비동기 호출"""
         from google.genai.types import FunctionDeclaration, Tool
 
@@ -633,6 +643,7 @@ class GoogleLLM(BaseLLM):
             max_output_tokens=self.max_tokens,
             temperature=self.temperature,
             tools=google_tools if google_tools else None,
+            stop_sequences=list(stop) if stop else None,
         )
 
         try:
@@ -169,13 +169,17 @@ class OllamaLLM(BaseLLM):
 
         logger.debug("Ollama model: %s, temperature: %s", model, self.temperature)
 
+        options = {
+            "temperature": self.temperature,
+            #  "max_tokens": self.max_tokens,  # ollama 에서는 미지원
+        }
+        if input_context.get("stop"):
+            options["stop"] = input_context["stop"]
+
         return {
             "model": model,
             "messages": message_history,
-            "options": {
-                "temperature": self.temperature,
-                #  "max_tokens": self.max_tokens,  # ollama 에서는 미지원
-            },
+            "options": options,
         }
 
     def _make_ask(
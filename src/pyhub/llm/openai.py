@@ -135,6 +135,10 @@ class OpenAIMixin:
             # structured output을 위해 낮은 temperature 사용
             request_params["temperature"] = 0.1
 
+        # stop sequence (OpenAI는 최대 4개까지 지원)
+        if input_context.get("stop"):
+            request_params["stop"] = input_context["stop"][:4]
+
         return request_params
 
     def _make_ask(
@@ -414,7 +418,9 @@ class OpenAIMixin:
 
         return tool_calls
 
-    def _make_ask_with_tools_sync(self, human_prompt, messages, tools, tool_choice, model, files, enable_cache):
+    def _make_ask_with_tools_sync(
+        self, human_prompt, messages, tools, tool_choice, model, files, enable_cache, stop=None
+    ):
         """OpenAI Function Calling을 사용한 동기 호출"""
         from .types import Message
 
@@ -449,6 +455,10 @@ class OpenAIMixin:
             if tool_choice != "auto":
                 request_params["tool_choice"] = tool_choice
 
+        # stop sequence (OpenAI는 최대 4개까지 지원)
+        if stop:
+            request_params["stop"] = list(stop)[:4]
+
         try:
             # 디버깅 정보 로깅
             logger.debug(f"Making Function Calling request to {self.base_url}")
@@ -552,7 +562,9 @@ class OpenAIMixin:
                 error_details += f"\nResponse: {e.response.text[:500]}"
             return Reply(text=f"API Error: {error_details}")
 
-    async def _make_ask_with_tools_async(self, human_prompt, messages, tools, tool_choice, model, files, enable_cache):
+    async def _make_ask_with_tools_async(
+        self, human_prompt, messages, tools, tool_choice, model, files, enable_cache, stop=None
+    ):
         """OpenAI Function Calling을 사용한 비동기 호출"""
         from .types import Message
 
@@ -587,6 +599,10 @@ class OpenAIMixin:
             if tool_choice != "auto":
                 request_params["tool_choice"] = tool_choice
 
+        # stop sequence (OpenAI는 최대 4개까지 지원)
+        if stop:
+            request_params["stop"] = list(stop)[:4]
+
         try:
             # 디버깅 정보 로깅 (비동기 버전)
             logger.debug(f"Making async Function Calling request to {self.base_url}")
@@ -701,6 +717,7 @@ class OpenAIMixin:
         use_history: bool = True,
         raise_errors: bool = False,
         enable_cache: bool = False,
+        stop: Optional[list[str]] = None,
         tools: Optional[list] = None,
         tool_choice: str = "auto",
         max_tool_calls: int = 5,
@@ -716,6 +733,7 @@ class OpenAIMixin:
             use_history=use_history,
             raise_errors=raise_errors,
             enable_cache=enable_cache,
+            stop=stop,
             tools=tools,
             tool_choice=tool_choice,
             max_tool_calls=max_tool_calls,
@@ -734,6 +752,7 @@ class OpenAIMixin:
         use_history: bool = True,
         raise_errors: bool = False,
         enable_cache: bool = False,
+        stop: Optional[list[str]] = None,
         tools: Optional[list] = None,
         tool_choice: str = "auto",
         max_tool_calls: int = 5,
@@ -749,6 +768,7 @@ class OpenAIMixin:
             use_history=use_history,
             raise_errors=raise_errors,
             enable_cache=enable_cache,
+            stop=stop,
             tools=tools,
             tool_choice=tool_choice,
             max_tool_calls=max_tool_calls,
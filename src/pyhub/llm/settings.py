@@ -3,6 +3,7 @@ LLM 모듈 설정 관리
 """
 
 import os
+import tempfile
 
 
 class LLMSettings:
@@ -14,6 +15,12 @@ class LLMSettings:
         self.trace_function_calls = self._parse_bool("PYHUB_LLM_TRACE_FUNCTION_CALLS", False)
         self.trace_level = os.getenv("PYHUB_LLM_TRACE_LEVEL", "INFO").upper()
 
+        # URL 파일 다운로드 캐시 설정
+        self.download_cache_dir = os.getenv(
+            "PYHUB_LLM_DOWNLOAD_CACHE_DIR", os.path.join(tempfile.gettempdir(), "pyhub_downloads")
+        )
+        self.download_max_connections = int(os.getenv("PYHUB_LLM_DOWNLOAD_MAX_CONNECTIONS", "10"))
+
     def _parse_bool(self, env_var: str, default: bool) -> bool:
         """환경변수를 bool 값으로 파싱"""
         value = os.getenv(env_var, str(default)).lower()
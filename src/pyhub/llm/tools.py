@@ -6,32 +6,86 @@ Function Calling and Tool Integration for pyhub.llm
 """
 
 import asyncio
+import contextlib
+import contextvars
 import inspect
 import logging
-from typing import Any, Callable, Dict, List, Type, get_type_hints
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, get_type_hints
 
 from pydantic import BaseModel, Field, create_model
 
-from .agents.base import AsyncBaseTool, BaseTool, Tool, ValidationLevel
+from .agents.base import (
+    AsyncBaseTool,
+    BaseTool,
+    Tool,
+    ToolResultCache,
+    ValidationLevel,
+    tool_result_cache,
+)
 from .agents.mcp.wrapper import MCPTool
+from .tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
 
+# 함수별 스키마 컴파일 결과 캐시 : {함수: {바운드 메서드 여부: 결과}} (함수가 사라지면 캐시도 함께 정리됩니다)
+_function_schema_cache: "weakref.WeakKeyDictionary[Any, Dict[bool, Dict[str, Any]]]" = weakref.WeakKeyDictionary()
+_pydantic_schema_cache: "weakref.WeakKeyDictionary[Any, Dict[bool, Type[BaseModel]]]" = weakref.WeakKeyDictionary()
+
+# Provider별 도구 스키마 변환 결과 캐시 : {스키마 모델 또는 함수: {(provider, 이름, 설명, 바운드 메서드 여부): 변환 결과}}
+_provider_schema_cache: "weakref.WeakKeyDictionary[Any, Dict[tuple, Dict[str, Any]]]" = weakref.WeakKeyDictionary()
+
+
+def _get_schema_cache_key(func: Callable) -> Optional[Tuple[Any, bool]]:
+    """스키마 캐시의 (키, 바운드 메서드 여부)를 반환합니다. 캐시할 수 없는 객체이면 None을 반환합니다.
+
+    바운드 메서드는 접근할 때마다 새 객체가 생성되므로, 원본 함수를 키로 사용합니다.
+    바운드 메서드의 스키마는 첫 인자를 제외하므로 원본 함수의 스키마와 따로 저장합니다.
+    """
+    is_method = inspect.ismethod(func)
+    key = func.__func__ if is_method else func
+    try:
+        weakref.ref(key)
+        hash(key)
+    except TypeError:
+        return None
+    return key, is_method
+
+
 class FunctionToolAdapter:
     """일반 함수를 Tool 객체로 변환하는 어댑터"""
 
     @staticmethod
     def extract_function_schema(func: Callable) -> Dict[str, Any]:
-        """함수에서 스키마 정보를 추출합니다."""
+        """함수에서 스키마 정보를 추출합니다. 같은 함수에 대한 결과는 캐시됩니다."""
+        cache_key = _get_schema_cache_key(func)
+        if cache_key is not None:
+            key, is_method = cache_key
+            cached_schema = _function_schema_cache.get(key, {}).get(is_method)
+            if cached_schema is not None:
+                return {**cached_schema, "callable": func}
+
+        schema = FunctionToolAdapter._extract_function_schema(func)
+        if cache_key is not None:
+            # 캐시 값이 키(함수)를 참조하면 약한 참조가 해제되지 않으므로 callable은 제외하고 저장합니다.
+            _function_schema_cache.setdefault(key, {})[is_method] = {k: v for k, v in schema.items() if k != "callable"}
+        return schema
+
+    @staticmethod
+    def _extract_function_schema(func: Callable) -> Dict[str, Any]:
         # 함수가 callable 객체인지 확인
-        if hasattr(func, "__call__") and not inspect.isfunction(func):
+        if hasattr(func, "__call__") and not (inspect.isfunction(func) or inspect.ismethod(func)):
             # Callable 객체의 경우 __call__ 메서드 사용
             actual_func = func.__call__
             name = func.__class__.__name__
             description = func.__class__.__doc__ or func.__call__.__doc__ or ""
         else:
-            # 일반 함수의 경우
+            # 일반 함수 및 바운드 메서드의 경우 (바운드 메서드의 시그니처에는 첫 인자가 빠져 있습니다)
             actual_func = func
             name = func.__name__
             description = func.__doc__ or ""
@@ -88,7 +142,21 @@ class FunctionToolAdapter:
 
     @staticmethod
     def create_pydantic_schema_from_function(func: Callable) -> Type[BaseModel]:
-        """함수에서 Pydantic 스키마를 생성합니다."""
+        """함수에서 Pydantic 스키마를 생성합니다. 같은 함수에 대해서는 생성된 모델을 재사용합니다."""
+        cache_key = _get_schema_cache_key(func)
+        if cache_key is not None:
+            key, is_method = cache_key
+            cached_model = _pydantic_schema_cache.get(key, {}).get(is_method)
+            if cached_model is not None:
+                return cached_model
+
+        pydantic_schema = FunctionToolAdapter._create_pydantic_schema_from_function(func)
+        if cache_key is not None:
+            _pydantic_schema_cache.setdefault(key, {})[is_method] = pydantic_schema
+        return pydantic_schema
+
+    @staticmethod
+    def _create_pydantic_schema_from_function(func: Callable) -> Type[BaseModel]:
         schema = FunctionToolAdapter.extract_function_schema(func)
         properties = schema["parameters"]["properties"]
         required = schema["parameters"]["required"]
@@ -150,6 +218,11 @@ class ToolAdapter:
                 func=tool_input.run,
                 args_schema=tool_input.args_schema,
                 validation_level=getattr(tool_input, "validation_level", ValidationLevel.STRICT),
+                timeout=getattr(tool_input, "timeout", None),
+                max_concurrency=getattr(tool_input, "max_concurrency", None),
+                cacheable=getattr(tool_input, "cacheable", False),
+                cache_ttl=getattr(tool_input, "cache_ttl", None),
+                cache_alias=getattr(tool_input, "cache_alias", "default"),
             )
 
         # 3. AsyncBaseTool 인스턴스 (비동기)
@@ -160,6 +233,11 @@ class ToolAdapter:
                 func=tool_input.arun,
                 args_schema=tool_input.args_schema,
                 validation_level=getattr(tool_input, "validation_level", ValidationLevel.STRICT),
+                timeout=getattr(tool_input, "timeout", None),
+                max_concurrency=getattr(tool_input, "max_concurrency", None),
+                cacheable=getattr(tool_input, "cacheable", False),
+                cache_ttl=getattr(tool_input, "cache_ttl", None),
+                cache_alias=getattr(tool_input, "cache_alias", "default"),
             )
 
         # 4. MCPTool 인스턴스
@@ -170,6 +248,11 @@ class ToolAdapter:
                 func=tool_input.arun,
                 args_schema=tool_input.args_schema,
                 validation_level=tool_input.validation_level,
+                timeout=getattr(tool_input, "timeout", None),
+                max_concurrency=getattr(tool_input, "max_concurrency", None),
+                cacheable=getattr(tool_input, "cacheable", False),
+                cache_ttl=getattr(tool_input, "cache_ttl", None),
+                cache_alias=getattr(tool_input, "cache_alias", "default"),
             )
 
         # 5. 일반 함수 또는 callable 객체
@@ -186,11 +269,38 @@ class ToolAdapter:
 
 
 class ProviderToolConverter:
-    """Provider별 도구 스키마 변환기"""
+    """Provider별 도구 스키마 변환기
+
+    변환 결과는 (provider, 도구 이름, 설명, 스키마 모델 또는 함수)를 키로 캐시되므로,
+    요청마다 LLM 인스턴스를 새로 만들더라도 같은 도구의 스키마는 한 번만 변환됩니다.
+    반환되는 사전은 공유되므로 수정하지 마세요.
+    """
+
+    @staticmethod
+    def _get_cached(provider: str, tool: Tool, converter: Callable[[Tool], Dict[str, Any]]) -> Dict[str, Any]:
+        if tool.args_schema:
+            schema_key, is_method = tool.args_schema, None
+        else:
+            function_key = _get_schema_cache_key(tool.func)
+            if function_key is None:
+                return converter(tool)
+            schema_key, is_method = function_key
+
+        converted_schemas = _provider_schema_cache.setdefault(schema_key, {})
+        cache_key = (provider, tool.name, tool.description, is_method)
+        try:
+            return converted_schemas[cache_key]
+        except KeyError:
+            converted = converted_schemas[cache_key] = converter(tool)
+            return converted
 
     @staticmethod
     def to_openai_function(tool: Tool) -> Dict[str, Any]:
         """OpenAI Function Calling 형식으로 변환"""
+        return ProviderToolConverter._get_cached("openai", tool, ProviderToolConverter._to_openai_function)
+
+    @staticmethod
+    def _to_openai_function(tool: Tool) -> Dict[str, Any]:
         # Agent Tool의 경우 args_schema를 직접 사용
         if hasattr(tool, "args_schema") and tool.args_schema:
             try:
@@ -226,6 +336,10 @@ class ProviderToolConverter:
     @staticmethod
     def to_anthropic_tool(tool: Tool) -> Dict[str, Any]:
         """Anthropic Tool Use 형식으로 변환"""
+        return ProviderToolConverter._get_cached("anthropic", tool, ProviderToolConverter._to_anthropic_tool)
+
+    @staticmethod
+    def _to_anthropic_tool(tool: Tool) -> Dict[str, Any]:
         schema = FunctionToolAdapter.extract_function_schema(tool.func)
 
         return {"name": tool.name, "description": tool.description, "input_schema": schema["parameters"]}
@@ -233,19 +347,72 @@ class ProviderToolConverter:
     @staticmethod
     def to_google_function(tool: Tool) -> Dict[str, Any]:
         """Google Function Calling 형식으로 변환"""
+        return ProviderToolConverter._get_cached("google", tool, ProviderToolConverter._to_google_function)
+
+    @staticmethod
+    def _to_google_function(tool: Tool) -> Dict[str, Any]:
         schema = FunctionToolAdapter.extract_function_schema(tool.func)
 
         return {"name": tool.name, "description": tool.description, "parameters": schema["parameters"]}
 
 
-class ToolExecutor:
-    """도구 실행을 관리하는 통합 실행기"""
+class _CallStart:
+    """도구 호출이 동시 실행 슬롯을 얻어 실행을 시작한 시각"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self.started_at: Optional[float] = None
+        self.cancelled = False
 
-    def __init__(self, tools: List[Tool]):
+    def set(self) -> bool:
+        """실행 시작 시각을 기록합니다. 슬롯을 기다리다 취소된 호출이면 False를 반환합니다."""
+        with self._lock:
+            if self.cancelled:
+                return False
+            self.started_at = time.monotonic()
+        self._event.set()
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._event.wait(timeout)
+
+    def cancel(self) -> bool:
+        """아직 시작하지 않은 호출을 취소합니다. 이미 시작했으면 False를 반환합니다."""
+        with self._lock:
+            if self.started_at is not None:
+                return False
+            self.cancelled = True
+            return True
+
+
+class ToolExecutor:
+    """도구 실행을 관리하는 통합 실행기
+
+    한 번의 LLM 응답에 여러 도구 호출이 포함된 경우 execute_tools/execute_tools_async로 동시에 실행합니다.
+    도구별 동시 실행 개수(Tool.max_concurrency)와 실행 시간 제한(Tool.timeout)을 따르며,
+    결과는 항상 요청된 순서대로 반환됩니다. 시간 제한은 호출이 동시 실행 슬롯을 얻은 때부터 잽니다.
+    cacheable로 선언된 도구는 result_cache를 통해 같은 인자의 실행 결과를 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        tools: List[Tool],
+        max_workers: Optional[int] = None,
+        result_cache: Optional[ToolResultCache] = None,
+    ):
         self.tools = {tool.name: tool for tool in tools}
+        self.max_workers = max_workers
+        self.result_cache = result_cache or tool_result_cache
+        self._concurrency_limits = {tool.name: tool.max_concurrency for tool in tools if tool.max_concurrency}
+        self._semaphores = {name: threading.BoundedSemaphore(limit) for name, limit in self._concurrency_limits.items()}
 
     def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """도구를 실행하고 결과를 반환합니다."""
+        with trace_span(f"tool:{tool_name}", kind="tool"):
+            return self._execute_tool(tool_name, arguments)
+
+    def _execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         if tool_name not in self.tools:
             return f"Error: Tool '{tool_name}' not found"
 
@@ -257,6 +424,10 @@ class ToolExecutor:
             if not is_valid:
                 return f"Validation error for {tool_name}: {error_message}"
 
+            cache_key, cached_result = self.result_cache.get(tool, kwargs=arguments)
+            if cached_result is not None:
+                return str(cached_result)
+
             # 도구 실행
             if tool.is_async:
                 # 비동기 도구의 경우
@@ -271,7 +442,9 @@ class ToolExecutor:
                 # 동기 도구의 경우
                 result = tool.func(**arguments)
 
-            return str(result)
+            result = str(result)
+            self.result_cache.set(tool, cache_key, result)
+            return result
 
         except Exception as e:
             logger.error(f"Error executing tool '{tool_name}': {e}")
@@ -279,6 +452,10 @@ class ToolExecutor:
 
     async def execute_tool_async(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """비동기로 도구를 실행합니다."""
+        with trace_span(f"tool:{tool_name}", kind="tool"):
+            return await self._execute_tool_async(tool_name, arguments)
+
+    async def _execute_tool_async(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         if tool_name not in self.tools:
             return f"Error: Tool '{tool_name}' not found"
 
@@ -290,20 +467,126 @@ class ToolExecutor:
             if not is_valid:
                 return f"Validation error for {tool_name}: {error_message}"
 
+            cache_key, cached_result = await self.result_cache.aget(tool, kwargs=arguments)
+            if cached_result is not None:
+                return str(cached_result)
+
             # 도구 실행
             if tool.is_async:
-                result = await tool.func(**arguments)
+                coro = tool.func(**arguments)
             else:
                 # 동기 도구를 비동기로 실행
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, lambda: tool.func(**arguments))
+                loop = asyncio.get_running_loop()
+                coro = loop.run_in_executor(None, lambda: tool.func(**arguments))
 
-            return str(result)
+            if tool.timeout is not None:
+                result = await asyncio.wait_for(coro, timeout=tool.timeout)
+            else:
+                result = await coro
 
+            result = str(result)
+            await self.result_cache.aset(tool, cache_key, result)
+            return result
+
+        except asyncio.TimeoutError:
+            logger.error(f"Tool '{tool_name}' timed out after {tool.timeout}s")
+            return f"Error: Tool '{tool_name}' timed out after {tool.timeout}s"
         except Exception as e:
             logger.error(f"Error executing tool '{tool_name}': {e}")
             return f"Error executing {tool_name}: {str(e)}"
 
+    def _execute_tool_with_limit(
+        self, tool_name: str, arguments: Dict[str, Any], start: Optional[_CallStart] = None
+    ) -> str:
+        """동시 실행 슬롯을 얻은 뒤 도구를 실행합니다. start가 있으면 슬롯을 얻은 시각을 기록합니다."""
+        semaphore = self._semaphores.get(tool_name)
+        with semaphore if semaphore is not None else contextlib.nullcontext():
+            if start is not None and not start.set():
+                # 슬롯을 기다리다 시간 초과로 보고된 호출은 실행하지 않습니다.
+                return ""
+            return self.execute_tool(tool_name, arguments)
+
+    def _slot_rounds(self, tool_calls: List[Dict[str, Any]], max_workers: int) -> List[int]:
+        """호출마다 앞선 호출들이 슬롯을 차지할 수 있는 최대 차례 수 (자신의 차례 포함)"""
+        seen: Dict[str, int] = {}
+        rounds = []
+        for index, call in enumerate(tool_calls):
+            ordinal = seen.get(call["name"], 0)
+            seen[call["name"]] = ordinal + 1
+            limit = self._concurrency_limits.get(call["name"])
+            rounds.append(max(ordinal // limit if limit else 0, index // max_workers) + 1)
+        return rounds
+
+    def execute_tools(self, tool_calls: List[Dict[str, Any]]) -> List[str]:
+        """여러 도구 호출을 스레드 풀에서 동시에 실행하고, 요청 순서대로 결과를 반환합니다.
+
+        도구의 timeout은 호출마다 동시 실행 슬롯을 얻은 때부터 잽니다 (호출이 하나여도 적용).
+        시간 초과된 호출의 스레드는 도구 함수가 끝날 때까지 슬롯을 차지하므로, 슬롯을 기다리는 시간은
+        앞선 호출들이 모두 timeout만큼 실행되는 경우까지만 허용하고 그 뒤에는 시간 초과로 보고합니다.
+
+        Args:
+            tool_calls: {"name": ..., "arguments": {...}} 형식의 도구 호출 목록
+        """
+        timeouts = [getattr(self.tools.get(call["name"]), "timeout", None) for call in tool_calls]
+        if len(tool_calls) == 0 or (len(tool_calls) == 1 and timeouts[0] is None):
+            return [self._execute_tool_with_limit(call["name"], call["arguments"]) for call in tool_calls]
+
+        max_workers = self.max_workers or len(tool_calls)
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pyhub-tool")
+        try:
+            batch_started_at = time.monotonic()
+            rounds = self._slot_rounds(tool_calls, max_workers)
+            starts = [_CallStart() for __ in tool_calls]
+            # 실행 추적 컨텍스트(contextvars)를 작업 스레드로 전달
+            futures = [
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self._execute_tool_with_limit,
+                    call["name"],
+                    call["arguments"],
+                    start,
+                )
+                for call, start in zip(tool_calls, starts)
+            ]
+
+            results = []
+            for call, future, start, timeout, call_rounds in zip(tool_calls, futures, starts, timeouts, rounds):
+                try:
+                    if timeout is None:
+                        results.append(future.result())
+                    else:
+                        # 작업 스레드와 동시 실행 슬롯을 기다린 시간은 시간 제한에 포함하지 않습니다.
+                        slot_deadline = batch_started_at + timeout * call_rounds
+                        if not start.wait(max(0.0, slot_deadline - time.monotonic())) and start.cancel():
+                            future.cancel()
+                            raise FutureTimeoutError()
+                        remaining = max(0.0, start.started_at + timeout - time.monotonic())
+                        results.append(future.result(timeout=remaining))
+                except FutureTimeoutError:
+                    logger.error(f"Tool '{call['name']}' timed out after {timeout}s")
+                    results.append(f"Error: Tool '{call['name']}' timed out after {timeout}s")
+            return results
+        finally:
+            # 시간 초과된 도구를 기다리지 않습니다.
+            pool.shutdown(wait=False)
+
+    async def execute_tools_async(self, tool_calls: List[Dict[str, Any]]) -> List[str]:
+        """여러 도구 호출을 동시에 실행하고, 요청 순서대로 결과를 반환합니다.
+
+        Args:
+            tool_calls: {"name": ..., "arguments": {...}} 형식의 도구 호출 목록
+        """
+        semaphores = {name: asyncio.Semaphore(limit) for name, limit in self._concurrency_limits.items()}
+
+        async def run(call: Dict[str, Any]) -> str:
+            semaphore = semaphores.get(call["name"])
+            if semaphore is None:
+                return await self.execute_tool_async(call["name"], call["arguments"])
+            async with semaphore:
+                return await self.execute_tool_async(call["name"], call["arguments"])
+
+        return list(await asyncio.gather(*[run(call) for call in tool_calls]))
+
 
 # 편의 함수들
 def create_tool_from_function(func: Callable) -> Tool:
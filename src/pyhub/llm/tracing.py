@@ -0,0 +1,304 @@
+"""Agent/LLM 실행 추적 (span 기반)
+
+LLM 호출, 응답 파싱, 도구 실행, MCP 호출 구간을 span으로 기록하고
+등록된 sink(JSONL 파일, 메모리, logging)로 내보냅니다.
+
+    tracer = Tracer(InMemorySpanSink())
+    with tracer.activate():
+        agent.run("...")
+    print(format_waterfall(tracer.sinks[0].spans))
+
+활성화된 Tracer가 없으면 trace_span()은 아무 것도 기록하지 않습니다.
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """하나의 실행 구간"""
+
+    name: str
+    kind: str = "internal"  # agent, llm, parse, tool, mcp, internal
+    trace_id: str = ""
+    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    parent_id: Optional[str] = None
+    start_time: float = 0.0  # epoch seconds
+    end_time: Optional[float] = None
+    duration_ms: Optional[float] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    error: Optional[str] = None
+
+    def set(self, **attributes) -> None:
+        """속성 추가 (토큰 수, 캐시 적중 여부 등)"""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _NoopSpan(Span):
+    """Tracer가 비활성일 때 사용하는 span. 속성을 기록하지 않습니다."""
+
+    def set(self, **attributes) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan(name="noop")
+_NOOP_CONTEXT = nullcontext(NOOP_SPAN)
+
+
+class SpanSink(ABC):
+    """종료된 span을 받아 저장하거나 출력하는 대상"""
+
+    @abstractmethod
+    def emit(self, span: Span) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class InMemorySpanSink(SpanSink):
+    """span을 메모리 리스트에 보관 (테스트, CLI waterfall 출력용)"""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def emit(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class JSONLSpanSink(SpanSink):
+    """span을 JSON Lines 파일에 한 줄씩 추가"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def emit(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class LoggingSpanSink(SpanSink):
+    """span을 logging으로 출력"""
+
+    def __init__(self, logger_name: str = "pyhub.llm.trace", level: int = logging.INFO):
+        self.logger = logging.getLogger(logger_name)
+        self.level = level
+
+    def emit(self, span: Span) -> None:
+        self.logger.log(
+            self.level,
+            "[%s] %s %.1fms status=%s %s",
+            span.kind,
+            span.name,
+            span.duration_ms or 0.0,
+            span.status,
+            json.dumps(span.attributes, ensure_ascii=False, default=str),
+        )
+
+
+_current_tracer: ContextVar[Optional["Tracer"]] = ContextVar("pyhub_llm_tracer", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("pyhub_llm_span", default=None)
+
+
+class Tracer:
+    """span을 생성하고 sink로 내보내는 추적기
+
+    현재 tracer와 부모 span은 contextvars로 전파되므로 asyncio 태스크 사이에서도
+    부모-자식 관계가 유지됩니다.
+    """
+
+    def __init__(self, sinks: Union[SpanSink, Iterable[SpanSink], None] = None):
+        if sinks is None:
+            self.sinks: List[SpanSink] = []
+        elif isinstance(sinks, SpanSink):
+            self.sinks = [sinks]
+        else:
+            self.sinks = list(sinks)
+
+    @contextmanager
+    def activate(self):
+        """이 컨텍스트 안의 실행을 추적"""
+        token = _current_tracer.set(self)
+        try:
+            yield self
+        finally:
+            _current_tracer.reset(token)
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", **attributes):
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            kind=kind,
+            trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+            parent_id=parent.span_id if parent else None,
+            start_time=time.time(),
+            attributes=attributes,
+        )
+        started = time.perf_counter()
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            span.duration_ms = (time.perf_counter() - started) * 1000
+            span.end_time = span.start_time + span.duration_ms / 1000
+            self._emit(span)
+
+    def _emit(self, span: Span) -> None:
+        for sink in self.sinks:
+            try:
+                sink.emit(span)
+            except Exception as e:
+                logger.warning("Failed to emit span to %s: %s", type(sink).__name__, e)
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+
+def get_current_tracer() -> Optional[Tracer]:
+    return _current_tracer.get()
+
+
+def get_current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def trace_span(name: str, kind: str = "internal", **attributes):
+    """현재 tracer로 span을 기록하는 컨텍스트 매니저. tracer가 없으면 NOOP_SPAN을 반환합니다."""
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return _NOOP_CONTEXT
+    return tracer.span(name, kind, **attributes)
+
+
+def annotate_span(**attributes) -> None:
+    """현재 span에 속성 추가 (없으면 무시)"""
+    span = _current_span.get()
+    if span is not None:
+        span.set(**attributes)
+
+
+def usage_attributes(reply: Any) -> Dict[str, int]:
+    """Reply의 토큰 사용량을 span 속성으로 변환"""
+    usage = getattr(reply, "usage", None)
+    if usage is None:
+        return {}
+    return {"input_tokens": usage.input, "output_tokens": usage.output}
+
+
+def format_waterfall(spans: List[Span], width: int = 40) -> str:
+    """span 목록을 시간순 waterfall 텍스트로 변환"""
+    if not spans:
+        return "(no spans recorded)"
+
+    trace_start = min(span.start_time for span in spans)
+    trace_end = max(span.end_time or span.start_time for span in spans)
+    total_ms = max((trace_end - trace_start) * 1000, 1e-6)
+
+    span_ids = {span.span_id for span in spans}
+    children: Dict[Optional[str], List[Span]] = {}
+    for span in spans:
+        parent_id = span.parent_id if span.parent_id in span_ids else None
+        children.setdefault(parent_id, []).append(span)
+
+    rows = []
+
+    def visit(parent_id: Optional[str], depth: int) -> None:
+        for span in sorted(children.get(parent_id, []), key=lambda s: s.start_time):
+            rows.append((depth, span))
+            visit(span.span_id, depth + 1)
+
+    visit(None, 0)
+
+    label_width = max(len("  " * depth + span.name) for depth, span in rows)
+    lines = []
+    for depth, span in rows:
+        offset_ms = (span.start_time - trace_start) * 1000
+        duration_ms = span.duration_ms or 0.0
+        bar_start = min(width - 1, int(offset_ms / total_ms * width))
+        bar_length = max(1, min(width - bar_start, round(duration_ms / total_ms * width)))
+        bar = " " * bar_start + "█" * bar_length + " " * (width - bar_start - bar_length)
+
+        notes = []
+        attrs = span.attributes
+        if "input_tokens" in attrs or "output_tokens" in attrs:
+            notes.append(f"tokens={attrs.get('input_tokens', 0)}/{attrs.get('output_tokens', 0)}")
+        if attrs.get("cache_hit"):
+            notes.append("cache hit")
+        if span.status != "ok":
+            notes.append(span.status)
+
+        label = ("  " * depth + span.name).ljust(label_width)
+        lines.append(f"{label} |{bar}| {duration_ms:9.1f}ms {' '.join(notes)}".rstrip())
+
+    # 종류별 합계
+    lines.append("")
+    totals: Dict[str, List[float]] = {}
+    for span in spans:
+        totals.setdefault(span.kind, []).append(span.duration_ms or 0.0)
+    for kind, durations in totals.items():
+        lines.append(f"{kind:<8} count={len(durations):<4} total={sum(durations):.1f}ms")
+
+    input_tokens = sum(span.attributes.get("input_tokens", 0) for span in spans)
+    output_tokens = sum(span.attributes.get("output_tokens", 0) for span in spans)
+    cache_hits = sum(1 for span in spans if span.attributes.get("cache_hit"))
+    lines.append(f"tokens input={input_tokens} output={output_tokens}, cache hits={cache_hits}")
+
+    return "\n".join(lines)
+
+
+__all__ = [
+    "Span",
+    "SpanSink",
+    "InMemorySpanSink",
+    "JSONLSpanSink",
+    "LoggingSpanSink",
+    "Tracer",
+    "trace_span",
+    "annotate_span",
+    "get_current_tracer",
+    "get_current_span",
+    "usage_attributes",
+    "format_waterfall",
+]
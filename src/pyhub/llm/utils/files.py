@@ -1,11 +1,19 @@
+import asyncio
+import hashlib
+import json
 import logging
 import mimetypes
+import os
 import re
+import tempfile
+import threading
 from base64 import b64decode, b64encode
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
 from io import BytesIO
 from pathlib import Path
-from typing import IO, Literal, Optional, Set, TypeVar, Union
+from typing import IO, Any, Iterator, Literal, Optional, Set, TypeVar, Union
 
 import httpx
 from django.core.files import File
@@ -57,6 +65,265 @@ class FileType(Enum):
         return mime_mappings.get(file_type, set())
 
 
+def is_url(value) -> bool:
+    return isinstance(value, str) and value.startswith(("http://", "https://"))
+
+
+def get_file_name_from_url(url: str, content_type: Optional[str] = None) -> str:
+    """URL에서 파일명을 추출합니다. 확장자가 없는 경우 Content-Type에서 추론합니다."""
+    file_name = url.split("?")[0].split("/")[-1]
+
+    if "." not in file_name and content_type:
+        ext = mimetypes.guess_extension(content_type.split(";")[0].strip())
+        if ext:
+            file_name += ext
+
+    return file_name
+
+
+class DownloadCache:
+    """URL 다운로드 결과를 저장하는 content-addressed 디스크 캐시
+
+    응답 본문은 SHA-256 다이제스트를 파일명으로 하여 blobs/ 아래에 저장되고,
+    URL 별 ETag/Last-Modified 정보는 meta/ 아래 JSON 파일로 관리됩니다.
+    같은 URL을 다시 요청할 때는 조건부 요청으로 재검증하여, 304 응답이면 저장된 파일을 재사용합니다.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        self.cache_dir = Path(cache_dir)
+        self.blobs_dir = self.cache_dir / "blobs"
+        self.meta_dir = self.cache_dir / "meta"
+        self.tmp_dir = self.cache_dir / "tmp"
+
+        for dir_path in (self.blobs_dir, self.meta_dir, self.tmp_dir):
+            dir_path.mkdir(parents=True, exist_ok=True)
+
+    def _meta_path(self, url: str) -> Path:
+        return self.meta_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def _blob_path(self, digest: str, file_name: str) -> Path:
+        # 확장자를 유지해야 encode_files에서 mimetype을 추론할 수 있습니다.
+        return self.blobs_dir / digest[:2] / f"{digest}{Path(file_name).suffix}"
+
+    def get(self, url: str) -> Optional[dict]:
+        """URL의 캐시 메타 정보를 반환합니다. 저장된 파일이 없으면 None을 반환합니다."""
+        try:
+            meta = json.loads(self._meta_path(url).read_text(encoding="utf-8"))
+        except (IOError, ValueError):
+            return None
+
+        if not Path(meta.get("path", "")).is_file():
+            return None
+        return meta
+
+    def get_revalidation_headers(self, meta: Optional[dict]) -> dict[str, str]:
+        headers = {}
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def open_temp(self) -> tuple[IO[bytes], Any]:
+        """응답 본문을 스트리밍으로 기록할 임시 파일과 해시 객체를 반환합니다."""
+        tmp_file = tempfile.NamedTemporaryFile(dir=self.tmp_dir, delete=False)
+        return tmp_file, hashlib.sha256()
+
+    def store(self, url: str, tmp_path: Union[str, Path], digest: str, response: httpx.Response) -> Path:
+        """임시 파일을 content-addressed 경로로 옮기고 URL 메타 정보를 기록합니다."""
+        file_name = get_file_name_from_url(url, response.headers.get("Content-Type"))
+        blob_path = self._blob_path(digest, file_name)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if blob_path.exists():
+            os.unlink(tmp_path)
+        else:
+            os.replace(tmp_path, blob_path)
+
+        meta = {
+            "url": url,
+            "path": str(blob_path),
+            "digest": digest,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        meta_path = self._meta_path(url)
+        tmp_meta_path = meta_path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp_meta_path, meta_path)
+
+        return blob_path
+
+
+_sync_client: Optional[httpx.Client] = None
+_sync_client_lock = threading.Lock()
+
+
+def get_download_client() -> httpx.Client:
+    """URL 다운로드에 공용으로 사용하는 동기 httpx 클라이언트를 반환합니다. (커넥션 풀 재사용)"""
+    global _sync_client
+
+    with _sync_client_lock:
+        if _sync_client is None or _sync_client.is_closed:
+            from pyhub.llm.settings import llm_settings
+
+            max_connections = llm_settings.download_max_connections
+            _sync_client = httpx.Client(
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            )
+        return _sync_client
+
+
+def _get_download_cache(cache_dir: Optional[Union[str, Path]] = None) -> DownloadCache:
+    if cache_dir is None:
+        from pyhub.llm.settings import llm_settings
+
+        cache_dir = llm_settings.download_cache_dir
+    return DownloadCache(cache_dir)
+
+
+def _download_file(client: httpx.Client, cache: DownloadCache, url: str, timeout: float) -> Optional[Path]:
+    logger.debug("Downloading file from URL %s", url)
+
+    meta = cache.get(url)
+    try:
+        with client.stream("GET", url, headers=cache.get_revalidation_headers(meta), timeout=timeout) as res:
+            if res.status_code == 304 and meta:
+                logger.debug("download cache hit (not modified) : %s", url)
+                return Path(meta["path"])
+
+            res.raise_for_status()
+
+            tmp_file, hasher = cache.open_temp()
+            try:
+                with tmp_file:
+                    for chunk in res.iter_bytes(cache.CHUNK_SIZE):
+                        hasher.update(chunk)
+                        tmp_file.write(chunk)
+                return cache.store(url, tmp_file.name, hasher.hexdigest(), res)
+            except Exception:
+                Path(tmp_file.name).unlink(missing_ok=True)
+                raise
+    except (HTTPStatusError, httpx.RequestError) as e:
+        logger.error("Error downloading file from URL %s: %s", url, e)
+        return None
+
+
+async def _download_file_async(
+    client: httpx.AsyncClient, cache: DownloadCache, url: str, timeout: float
+) -> Optional[Path]:
+    logger.debug("Downloading file from URL %s", url)
+
+    meta = cache.get(url)
+    try:
+        async with client.stream("GET", url, headers=cache.get_revalidation_headers(meta), timeout=timeout) as res:
+            if res.status_code == 304 and meta:
+                logger.debug("download cache hit (not modified) : %s", url)
+                return Path(meta["path"])
+
+            res.raise_for_status()
+
+            tmp_file, hasher = cache.open_temp()
+            try:
+                with tmp_file:
+                    async for chunk in res.aiter_bytes(cache.CHUNK_SIZE):
+                        hasher.update(chunk)
+                        tmp_file.write(chunk)
+                return cache.store(url, tmp_file.name, hasher.hexdigest(), res)
+            except Exception:
+                Path(tmp_file.name).unlink(missing_ok=True)
+                raise
+    except (HTTPStatusError, httpx.RequestError) as e:
+        logger.error("Error downloading file from URL %s: %s", url, e)
+        return None
+
+
+def download_files(
+    urls: list[str],
+    cache_dir: Optional[Union[str, Path]] = None,
+    timeout: float = 5,
+    max_workers: int = 4,
+) -> list[Optional[Path]]:
+    """URL 목록의 파일들을 다운로드 캐시에 받아 로컬 경로 목록을 반환합니다.
+
+    공용 커넥션 풀을 사용하며, 여러 URL은 스레드 풀에서 동시에 다운로드합니다.
+    다운로드에 실패한 URL의 자리에는 None이 반환됩니다.
+    """
+    if not urls:
+        return []
+
+    client = get_download_client()
+    cache = _get_download_cache(cache_dir)
+
+    if len(urls) == 1:
+        return [_download_file(client, cache, urls[0], timeout)]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as pool:
+        return list(pool.map(lambda url: _download_file(client, cache, url, timeout), urls))
+
+
+async def download_files_async(
+    urls: list[str],
+    cache_dir: Optional[Union[str, Path]] = None,
+    timeout: float = 5,
+    max_connections: Optional[int] = None,
+) -> list[Optional[Path]]:
+    """URL 목록의 파일들을 하나의 비동기 클라이언트로 동시에 다운로드하여 로컬 경로 목록을 반환합니다.
+
+    다운로드에 실패한 URL의 자리에는 None이 반환됩니다.
+    """
+    if not urls:
+        return []
+
+    if max_connections is None:
+        from pyhub.llm.settings import llm_settings
+
+        max_connections = llm_settings.download_max_connections
+
+    cache = _get_download_cache(cache_dir)
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+
+    async with httpx.AsyncClient(follow_redirects=True, limits=limits) as client:
+        return list(await asyncio.gather(*[_download_file_async(client, cache, url, timeout) for url in urls]))
+
+
+async def resolve_url_files_async(
+    files: Optional[list[Union[str, Path, File]]],
+) -> Optional[list[Union[str, Path, File]]]:
+    """파일 목록의 URL들을 동시에 다운로드하여 로컬 경로로 치환합니다. 실패한 URL은 제외됩니다."""
+    if not files:
+        return files
+
+    urls = [file for file in files if is_url(file)]
+    if not urls:
+        return files
+
+    downloaded = dict(zip(urls, await download_files_async(urls)))
+
+    resolved_files = []
+    for file in files:
+        if is_url(file):
+            if downloaded[file] is not None:
+                resolved_files.append(downloaded[file])
+        else:
+            resolved_files.append(file)
+    return resolved_files
+
+
+@contextmanager
+def _open_source_file(file: Union[Path, File]) -> Iterator[IO]:
+    """인코딩할 파일 객체를 반환합니다. 경로는 이때 열고 사용이 끝나면 닫습니다."""
+    if isinstance(file, Path):
+        with file.open("rb") as f:
+            yield f
+    else:
+        yield file.file
+
+
 def encode_files(
     files: Optional[list[Union[str, Path, File]]] = None,
     allowed_types: Union[FileType, list[FileType]] = FileType.IMAGE,
@@ -89,56 +356,35 @@ def encode_files(
     if not files:
         return []
 
-    django_files: list[File] = []
+    # 경로(다운로드 캐시 파일 포함)는 내용을 미리 읽지 않고, 허용된 타입인 경우에만 인코딩할 때 읽습니다.
+    source_files: list[Union[Path, File]] = []
+
+    urls = [file for file in files if is_url(file)]
+    downloaded_paths = dict(zip(urls, download_files(urls)))
 
     for file in files:
         if isinstance(file, Path):
-            try:
-                with file.open("rb") as f:
-                    django_file = ContentFile(f.read(), name=file.name)
-                    django_files.append(django_file)
-            except IOError as e:
-                raise ValueError(f"Failed to open file {file}: {e}")
+            if not file.is_file():
+                raise ValueError(f"Failed to open file {file}: no such file")
+            source_files.append(file)
         elif isinstance(file, File):
-            django_files.append(file)
+            source_files.append(file)
         elif isinstance(file, str):
-            if file.startswith(("http://", "https://")):
-                file_url: str = file
-
-                logger.debug("Downloading file from URL %s", file_url)
-
-                try:
-                    client = httpx.Client(timeout=5, follow_redirects=True)
-                    res = client.get(file_url)
-                    res.raise_for_status()
-
-                    # 파일명 추출
-                    file_name = file_url.split("?")[0].split("/")[-1]
-
-                    # 확장자가 없는 경우 Content-Type에서 추론
-                    if "." not in file_name:
-                        content_type = res.headers.get("Content-Type", "")
-                        ext = mimetypes.guess_extension(content_type)
-                        if ext:
-                            file_name += ext
-
-                    django_files.append(ContentFile(res.content, name=file_name))
-                except HTTPStatusError as e:
-                    logger.error("Error downloading file from URL %s: %s", file_url, e)
+            if is_url(file):
+                downloaded_path = downloaded_paths.get(file)
+                if downloaded_path is not None:
+                    source_files.append(downloaded_path)
             else:
                 file_path_str: str = file
 
                 logger.debug("Loading file from %s", file_path_str)
 
-                try:
-                    file_path = Path(file_path_str)
-                    with file_path.open("rb") as f:
-                        django_file = ContentFile(f.read(), name=file_path.name)
-                        django_files.append(django_file)
-                except IOError:
+                file_path = Path(file_path_str)
+                if not file_path.is_file():
                     raise ValueError(
                         f"String file must be a valid file path or a URL starting with http:// or https://: {file}"
                     )
+                source_files.append(file_path)
         else:
             raise ValueError(f"Unsupported file type: {type(file)}")
 
@@ -152,7 +398,7 @@ def encode_files(
     encoded_urls = []
 
     if convert_mode == "base64":
-        for file in django_files:
+        for file in source_files:
             content_type = mimetypes.guess_type(file.name)[0]
 
             if not content_type:
@@ -167,25 +413,26 @@ def encode_files(
                 continue
 
             try:
-                if content_type.startswith("image/"):
-                    optimized_image, content_type = optimize_image(
-                        file.file,
-                        max_size=image_max_size,
-                        optimize_jpeg=optimize_jpeg,
-                        quality=image_quality,
-                        resampling=image_resampling,
-                    )
-                    prefix = f"data:{content_type};base64,"
-                    b64_string = b64encode(optimized_image).decode("utf-8")
-                    encoded_urls.append(f"{prefix}{b64_string}")
-                else:
-                    # 이미지가 아닌 파일은 직접 base64 인코딩
-                    content = file.read()
-                    if isinstance(content, str):
-                        content = content.encode("utf-8")
-                    prefix = f"data:{content_type};base64,"
-                    b64_string = b64encode(content).decode("utf-8")
-                    encoded_urls.append(f"{prefix}{b64_string}")
+                with _open_source_file(file) as file_obj:
+                    if content_type.startswith("image/"):
+                        optimized_image, content_type = optimize_image(
+                            file_obj,
+                            max_size=image_max_size,
+                            optimize_jpeg=optimize_jpeg,
+                            quality=image_quality,
+                            resampling=image_resampling,
+                        )
+                        prefix = f"data:{content_type};base64,"
+                        b64_string = b64encode(optimized_image).decode("utf-8")
+                        encoded_urls.append(f"{prefix}{b64_string}")
+                    else:
+                        # 이미지가 아닌 파일은 직접 base64 인코딩
+                        content = file_obj.read()
+                        if isinstance(content, str):
+                            content = content.encode("utf-8")
+                        prefix = f"data:{content_type};base64,"
+                        b64_string = b64encode(content).decode("utf-8")
+                        encoded_urls.append(f"{prefix}{b64_string}")
             except Exception as e:
                 logger.error(f"Error processing file {file.name}: {str(e)}")
                 continue
@@ -204,6 +451,28 @@ def encode_files(
     return encoded_urls
 
 
+async def encode_files_async(
+    files: Optional[list[Union[str, Path, File]]] = None,
+    allowed_types: Union[FileType, list[FileType]] = FileType.IMAGE,
+    convert_mode: Literal["base64"] = "base64",
+    optimize_jpeg: bool = False,
+    image_max_size: int = 512,
+    image_quality: int = 60,
+    image_resampling: PILImage.Resampling = PILImage.Resampling.LANCZOS,
+) -> list[str]:
+    """encode_files의 비동기 버전. URL 파일들은 먼저 동시에 다운로드한 후 인코딩합니다."""
+    resolved_files = await resolve_url_files_async(files)
+    return encode_files(
+        files=resolved_files,
+        allowed_types=allowed_types,
+        convert_mode=convert_mode,
+        optimize_jpeg=optimize_jpeg,
+        image_max_size=image_max_size,
+        image_quality=image_quality,
+        image_resampling=image_resampling,
+    )
+
+
 def optimize_image(
     image_file: IO,
     max_size: int = 1024,
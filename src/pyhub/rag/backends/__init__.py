@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 _BACKENDS: Dict[str, str] = {
     "pgvector": "pyhub.rag.backends.pgvector.PgVectorStore",
     "sqlite-vec": "pyhub.rag.backends.sqlite_vec.SqliteVecStore",
+    "numpy": "pyhub.rag.backends.numpy_store.NumpyStore",
+    "hnsw": "pyhub.rag.backends.hnsw.HnswStore",
 }
 
 
@@ -1,9 +1,44 @@
 """Base abstract class for vector store backends."""
 
+import asyncio
+import functools
+import json
+import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from .hybrid import (
+    DEFAULT_HYBRID_FETCH_FACTOR,
+    DEFAULT_RRF_K,
+    FusionMethod,
+    fuse_rankings,
+)
+from .pipeline import (
+    ImportCheckpoint,
+    ImportProgress,
+    check_resume,
+    checkpoint_file_path,
+    checkpoint_source,
+    read_checkpoint_file,
+    run_import,
+    write_checkpoint_file,
+)
+from .snapshot import (
+    SnapshotBatch,
+    SnapshotWriter,
+    iter_snapshot_batches,
+    read_manifest,
+)
+
+logger = logging.getLogger(__name__)
+
+# search_many 기본 구현에서 search를 동시에 실행할 스레드 수
+DEFAULT_SEARCH_MANY_WORKERS = 4
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -108,6 +143,129 @@ class BaseVectorStore(ABC):
         """
         pass
 
+    def search_many(
+        self,
+        collection_name: str,
+        query_embeddings: List[List[float]],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        threshold: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[SearchResult]]:
+        """
+        여러 쿼리 임베딩으로 유사도 검색을 수행합니다.
+
+        기본 구현은 search를 스레드 풀(설정의 search_many_workers, 기본 4)에서 동시에 실행합니다.
+        한 번의 쿼리로 여러 벡터를 검색할 수 있는 백엔드는 이 메서드를 재정의합니다.
+
+        Args:
+            collection_name: 검색할 컬렉션
+            query_embeddings: 쿼리 임베딩 목록
+            k: 쿼리별 반환할 결과 수
+            filter: 메타데이터 필터 (모든 쿼리에 적용)
+            threshold: 최소 유사도 임계값
+            **kwargs: search에 전달할 백엔드별 검색 옵션
+
+        Returns:
+            쿼리 순서대로 각 쿼리의 검색 결과 리스트
+        """
+        if not query_embeddings:
+            return []
+
+        max_workers = min(len(query_embeddings), self.config.get("search_many_workers", DEFAULT_SEARCH_MANY_WORKERS))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda query_embedding: self.search(
+                        collection_name, query_embedding, k=k, filter=filter, threshold=threshold, **kwargs
+                    ),
+                    query_embeddings,
+                )
+            )
+
+    def lexical_search(
+        self,
+        collection_name: str,
+        query: str,
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[SearchResult]:
+        """
+        전문(full-text) 검색을 수행합니다.
+
+        Args:
+            collection_name: 검색할 컬렉션
+            query: 검색어. 단어 중 하나라도 포함된 문서를 찾습니다.
+            k: 반환할 결과 수
+            filter: 메타데이터 필터
+
+        Returns:
+            관련도 순 검색 결과. score는 백엔드별 관련도 점수입니다.
+        """
+        raise NotImplementedError(f"{self.backend_name} backend does not support lexical search")
+
+    def hybrid_search(
+        self,
+        collection_name: str,
+        query: str,
+        query_embedding: List[float],
+        k: int = 10,
+        alpha: float = 0.5,
+        filter: Optional[Dict[str, Any]] = None,
+        fusion: FusionMethod = "rrf",
+        fetch_k: Optional[int] = None,
+    ) -> List[SearchResult]:
+        """
+        전문 검색과 벡터 검색을 동시에 실행하고 두 순위를 결합합니다.
+
+        임베딩이 잘 표현하지 못하는 부품 번호, 코드 등은 전문 검색으로 찾고,
+        의미가 비슷한 문서는 벡터 검색으로 찾습니다.
+
+        Args:
+            collection_name: 검색할 컬렉션
+            query: 전문 검색어
+            query_embedding: 쿼리 임베딩
+            k: 반환할 결과 수
+            alpha: 벡터 검색 가중치 (0 ~ 1). 1이면 벡터 검색만, 0이면 전문 검색만 사용
+            filter: 메타데이터 필터
+            fusion: rrf (Reciprocal Rank Fusion) 또는 weighted (정규화한 점수의 가중 합)
+            fetch_k: 각 검색에서 가져올 후보 수 (기본값 k × hybrid_fetch_factor)
+
+        Returns:
+            결합 점수(0 ~ 1) 순 검색 결과
+        """
+        if not 0 <= alpha <= 1:
+            raise ValueError(f"alpha must be between 0 and 1: {alpha}")
+        fetch_k = fetch_k or k * self.config.get("hybrid_fetch_factor", DEFAULT_HYBRID_FETCH_FACTOR)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            vector_future = (
+                executor.submit(self.search, collection_name, query_embedding, k=fetch_k, filter=filter)
+                if alpha > 0
+                else None
+            )
+            lexical_future = (
+                executor.submit(self.lexical_search, collection_name, query, k=fetch_k, filter=filter)
+                if alpha < 1
+                else None
+            )
+            vector_results = vector_future.result() if vector_future else []
+            lexical_results = lexical_future.result() if lexical_future else []
+
+        fused = fuse_rankings(
+            vector_results,
+            lexical_results,
+            key=lambda result: (
+                result.document.page_content,
+                json.dumps(result.document.metadata, sort_keys=True, ensure_ascii=False),
+            ),
+            alpha=alpha,
+            method=fusion,
+            rrf_k=self.config.get("rrf_k", DEFAULT_RRF_K),
+            score=lambda result: result.score,
+        )
+        return [SearchResult(document=result.document, score=score) for result, score in fused[:k]]
+
     @abstractmethod
     def delete(self, collection_name: str, filter: Dict[str, Any]) -> int:
         """
@@ -123,8 +281,14 @@ class BaseVectorStore(ABC):
         pass
 
     @abstractmethod
-    def count(self, collection_name: str) -> int:
-        """컬렉션의 문서 수를 반환합니다."""
+    def count(self, collection_name: str, filter: Optional[Dict[str, Any]] = None) -> int:
+        """
+        컬렉션의 문서 수를 반환합니다.
+
+        Args:
+            collection_name: 대상 컬렉션
+            filter: 메타데이터 필터 (지정하면 매칭되는 문서 수)
+        """
         pass
 
     @abstractmethod
@@ -138,62 +302,299 @@ class BaseVectorStore(ABC):
         pass
 
     def import_jsonl(
-        self, collection_name: str, file_path: Path, batch_size: int = 1000, clear_existing: bool = False
+        self,
+        collection_name: str,
+        file_path: Path,
+        batch_size: int = 1000,
+        clear_existing: bool = False,
+        workers: Optional[int] = None,
+        progress: Optional[Callable[[ImportProgress], None]] = None,
+        resume: bool = False,
     ) -> int:
         """
         JSONL 파일에서 데이터를 임포트합니다.
 
+        JSON 디코딩과 벡터 변환은 workers개 프로세스에서 병렬로 처리하고,
+        삽입은 현재 스레드에서 batch_size개씩 insert로 실행합니다.
+        배치를 커밋할 때마다 파일 위치를 체크포인트로 기록하므로, 중단되면 resume=True로 이어서 임포트할 수 있습니다.
+
         Args:
             collection_name: 대상 컬렉션
             file_path: JSONL 파일 경로
             batch_size: 배치 크기
-            clear_existing: 기존 데이터 삭제 여부
+            clear_existing: 기존 데이터 삭제 여부 (이어서 임포트할 때는 무시)
+            workers: JSON 디코딩 프로세스 수 (기본값: CPU 코어 수 - 1, 최대 4. 1 이하면 디코딩도 현재 프로세스에서 실행)
+            progress: 배치를 삽입할 때마다 ImportProgress로 호출할 함수
+            resume: 체크포인트가 있으면 마지막으로 커밋한 배치 다음 줄부터 임포트
 
         Returns:
-            임포트된 문서 수
+            이번에 임포트된 문서 수
+        """
+        file_path = Path(file_path)
+        checkpoint = self._begin_import(collection_name, file_path, clear_existing, resume)
+        if checkpoint.completed:
+            return 0
+
+        def write(chunk) -> int:
+            nonlocal checkpoint
+            checkpoint = checkpoint.advance(chunk)
+            return self._insert_import_batch(collection_name, self._to_documents(chunk), batch_size, checkpoint)
+
+        stats = run_import(
+            file_path,
+            write,
+            chunk_size=batch_size,
+            workers=workers,
+            progress=progress,
+            name=collection_name,
+            checkpoint=checkpoint,
+        )
+        self._save_import_checkpoint(collection_name, checkpoint.complete())
+        return stats.rows
+
+    def _begin_import(
+        self, collection_name: str, file_path: Path, clear_existing: bool, resume: bool
+    ) -> ImportCheckpoint:
         """
-        import json
+        임포트를 시작할 위치를 반환합니다.
 
+        이어서 임포트할 체크포인트가 있으면 기존 데이터를 지우지 않고 그 위치를 반환하며,
+        없으면 기존 체크포인트를 지우고 (clear_existing이면 데이터도 지우고) 파일 처음을 반환합니다.
+        """
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        checkpoint = self.get_import_checkpoint(collection_name, file_path) if resume else None
+        if checkpoint is not None:
+            check_resume(collection_name, file_path, checkpoint, clear_existing)
+            return checkpoint
+
+        if resume:
+            logger.info(f"No checkpoint found for '{file_path}', importing from the beginning")
         if clear_existing and self.collection_exists(collection_name):
             self.clear_collection(collection_name)
 
-        documents = []
-        total_imported = 0
+        checkpoint = ImportCheckpoint.start(file_path)
+        self._delete_import_checkpoint(collection_name, checkpoint.source)
+        return checkpoint
+
+    def get_import_checkpoint(self, collection_name: str, file_path: Path) -> Optional[ImportCheckpoint]:
+        """
+        파일을 컬렉션에 임포트하다 마지막으로 커밋한 위치를 반환합니다. 없으면 None
+
+        기본 구현은 JSONL 파일 옆의 사이드카 파일(<파일>.<컬렉션>.checkpoint)에 기록합니다.
+        """
+        return read_checkpoint_file(checkpoint_file_path(checkpoint_source(file_path), collection_name))
+
+    def _save_import_checkpoint(self, collection_name: str, checkpoint: ImportCheckpoint) -> None:
+        write_checkpoint_file(checkpoint_file_path(checkpoint.source, collection_name), checkpoint)
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                try:
-                    data = json.loads(line.strip())
+    def _delete_import_checkpoint(self, collection_name: str, source: str) -> None:
+        checkpoint_file_path(source, collection_name).unlink(missing_ok=True)
 
-                    # 데이터 검증
-                    if "page_content" not in data:
-                        raise ValueError(f"Missing 'page_content' at line {line_num}")
-                    if "embedding" not in data:
-                        raise ValueError(f"Missing 'embedding' at line {line_num}")
+    def _insert_import_batch(
+        self, collection_name: str, documents: List[Document], batch_size: int, checkpoint: ImportCheckpoint
+    ) -> int:
+        """
+        임포트 배치를 삽입하고 체크포인트를 기록합니다.
+
+        기본 구현은 삽입을 커밋한 뒤 체크포인트를 기록하므로 그 사이에 중단되면 이어서 임포트할 때
+        마지막 배치가 한 번 더 삽입될 수 있습니다. 트랜잭션을 지원하는 백엔드는 같은 트랜잭션에서
+        기록하도록 재정의하여 중복 삽입을 막습니다.
+        """
+        inserted = self.insert(collection_name, documents, batch_size) if documents else 0
+        self._save_import_checkpoint(collection_name, checkpoint)
+        return inserted
+
+    def export(self, collection_name: str, path: Path, batch_size: int = 10000) -> int:
+        """
+        컬렉션을 스냅샷 디렉토리로 내보냅니다.
+
+        벡터는 float32 행렬 그대로 vectors.npy에, 문서는 documents.jsonl에 쓰므로
+        텍스트로 인코딩한 벡터를 다시 파싱하는 JSONL 임포트보다 작고 빠르게 옮길 수 있습니다.
+        행은 batch_size개씩 스트리밍하므로 컬렉션 전체를 메모리에 올리지 않습니다.
+
+        Args:
+            collection_name: 내보낼 컬렉션
+            path: 스냅샷 디렉토리 (없으면 만들고, 있으면 덮어씁니다)
+            batch_size: 한 번에 읽을 행 수
+
+        Returns:
+            내보낸 문서 수
+        """
+        info = self.get_collection_info(collection_name)
+        if info.get("dimension") is None:
+            raise ValueError(f"Cannot detect embedding dimension of '{collection_name}'")
+
+        with SnapshotWriter(
+            path,
+            collection_name,
+            backend=self.backend_name,
+            dimension=info["dimension"],
+            distance_metric=info.get("distance_metric"),
+            collection_info=info,
+        ) as writer:
+            for batch in self._iter_snapshot_batches(collection_name, batch_size):
+                writer.write(batch)
+
+        logger.info(f"Exported {writer.count} documents of '{collection_name}' to '{path}'")
+        return writer.count
+
+    def restore(
+        self, collection_name: str, path: Path, batch_size: int = 1000, clear_existing: bool = False, **kwargs
+    ) -> int:
+        """
+        export로 만든 스냅샷을 컬렉션으로 복원합니다.
+
+        컬렉션이 없으면 스냅샷의 차원과 거리 메트릭으로 만들며, kwargs는 create_collection에 전달합니다.
+        다른 백엔드에서 내보낸 스냅샷도 복원할 수 있습니다.
+
+        Args:
+            collection_name: 대상 컬렉션
+            path: 스냅샷 디렉토리
+            batch_size: 배치 크기
+            clear_existing: 컬렉션이 이미 있으면 기존 데이터 삭제
+
+        Returns:
+            복원한 문서 수
+        """
+        manifest = read_manifest(path)
+        if not self.collection_exists(collection_name):
+            self.create_collection(
+                collection_name, manifest["dimension"], manifest.get("distance_metric") or "cosine", **kwargs
+            )
+        elif clear_existing:
+            self.clear_collection(collection_name)
+
+        total = self._restore_batches(collection_name, iter_snapshot_batches(path, batch_size), batch_size)
+        logger.info(f"Restored {total} documents from '{path}' to '{collection_name}'")
+        return total
+
+    def _iter_snapshot_batches(self, collection_name: str, batch_size: int) -> Iterator[SnapshotBatch]:
+        """컬렉션의 모든 문서를 batch_size개씩 (page_content, metadata, float32 벡터) 묶음으로 읽습니다."""
+        raise NotImplementedError(f"{self.backend_name} backend does not support export")
+
+    def _restore_batches(self, collection_name: str, batches: Iterator[SnapshotBatch], batch_size: int) -> int:
+        """스냅샷 배치를 삽입합니다. 기본 구현은 배치마다 insert를 호출합니다."""
+        return sum(self.insert(collection_name, self._to_documents(batch), batch_size) for batch in batches)
+
+    @staticmethod
+    def _to_documents(batch) -> List[Document]:
+        """임포트 청크나 스냅샷 배치의 (page_content, metadata, embedding) 행을 Document로 변환합니다."""
+        return [
+            Document(page_content=page_content, metadata=metadata, embedding=embedding)
+            for page_content, metadata, embedding in batch.rows()
+        ]
+
+    def promote_metadata_keys(self, collection_name: str, metadata_columns: Dict[str, Any]) -> Dict[str, str]:
+        """
+        자주 필터링하는 메타데이터 키를 인덱스가 있는 컬럼으로 승격합니다.
+
+        승격된 키는 search, delete, count의 필터에서 자동으로 사용됩니다.
+
+        Args:
+            collection_name: 대상 컬렉션
+            metadata_columns: {메타데이터 키: 타입} 사전
+
+        Returns:
+            승격된 전체 메타데이터 컬럼 {키: 타입}
+        """
+        raise NotImplementedError(f"{self.backend_name} backend does not support promoted metadata keys")
+
+    def create_lexical_index(self, collection_name: str) -> None:
+        """
+        전문 검색 인덱스를 만들고 기존 문서를 색인합니다. 이후 삽입/삭제 시 함께 갱신됩니다.
+
+        Args:
+            collection_name: 대상 컬렉션
+        """
+        raise NotImplementedError(f"{self.backend_name} backend does not support lexical search")
+
+    def _get_async_executor(self) -> Optional[Executor]:
+        """
+        비동기 메서드의 기본 구현이 동기 메서드를 실행할 실행기를 반환합니다.
+        None이면 이벤트 루프의 기본 실행기를 사용합니다.
+        """
+        return None
+
+    async def _run_async(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """동기 메서드를 비동기 실행기에서 실행합니다."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_async_executor(), functools.partial(func, *args, **kwargs))
+
+    async def search_async(
+        self,
+        collection_name: str,
+        query_embedding: List[float],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        threshold: Optional[float] = None,
+        **kwargs,
+    ) -> List[SearchResult]:
+        """search의 비동기 버전"""
+        return await self._run_async(
+            self.search, collection_name, query_embedding, k=k, filter=filter, threshold=threshold, **kwargs
+        )
+
+    async def search_many_async(
+        self,
+        collection_name: str,
+        query_embeddings: List[List[float]],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        threshold: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[SearchResult]]:
+        """search_many의 비동기 버전"""
+        return await self._run_async(
+            self.search_many, collection_name, query_embeddings, k=k, filter=filter, threshold=threshold, **kwargs
+        )
+
+    async def insert_async(self, collection_name: str, documents: List[Document], batch_size: int = 1000) -> int:
+        """insert의 비동기 버전"""
+        return await self._run_async(self.insert, collection_name, documents, batch_size)
+
+    async def delete_async(self, collection_name: str, filter: Dict[str, Any]) -> int:
+        """delete의 비동기 버전"""
+        return await self._run_async(self.delete, collection_name, filter)
+
+    async def count_async(self, collection_name: str, filter: Optional[Dict[str, Any]] = None) -> int:
+        """count의 비동기 버전"""
+        return await self._run_async(self.count, collection_name, filter)
+
+    async def import_jsonl_async(
+        self, collection_name: str, file_path: Path, batch_size: int = 1000, clear_existing: bool = False, **kwargs
+    ) -> int:
+        """import_jsonl의 비동기 버전"""
+        return await self._run_async(
+            self.import_jsonl,
+            collection_name,
+            file_path,
+            batch_size=batch_size,
+            clear_existing=clear_existing,
+            **kwargs,
+        )
+
+    def close(self) -> None:
+        """백엔드가 보유한 연결 등의 자원을 해제합니다."""
+        pass
 
-                    doc = Document(
-                        page_content=data["page_content"],
-                        metadata=data.get("metadata", {}),
-                        embedding=data["embedding"],
-                    )
-                    documents.append(doc)
+    async def close_async(self) -> None:
+        """close의 비동기 버전"""
+        # 전용 실행기를 닫는 백엔드도 있으므로 기본 실행기에서 실행합니다.
+        await asyncio.to_thread(self.close)
 
-                    # 배치 처리
-                    if len(documents) >= batch_size:
-                        total_imported += self.insert(collection_name, documents, batch_size)
-                        documents = []
+    def __enter__(self):
+        return self
 
-                except (json.JSONDecodeError, ValueError) as e:
-                    raise ValueError(f"Error at line {line_num}: {e}")
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
-        # 남은 문서 처리
-        if documents:
-            total_imported += self.insert(collection_name, documents, batch_size)
+    async def __aenter__(self):
+        return self
 
-        return total_imported
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close_async()
 
     def clear_collection(self, name: str) -> None:
         """컬렉션의 모든 데이터를 삭제합니다."""
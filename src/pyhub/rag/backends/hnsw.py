@@ -0,0 +1,955 @@
+"""Embedded HNSW (hnswlib) backend implementation."""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
+
+from ..utils import serialize_f32_batch
+from .base import BaseVectorStore, Document, SearchResult
+from .pipeline import (
+    ImportCheckpoint,
+    checkpoint_source,
+    delete_checkpoint,
+    load_checkpoint,
+    save_checkpoint,
+)
+from .planner import json_filter_param
+from .snapshot import SnapshotBatch
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+# 거리 메트릭 → hnswlib space
+HNSW_SPACES = {"cosine": "cosine", "l2": "l2", "inner_product": "ip"}
+
+# 그래프의 노드별 이웃 수. 클수록 재현율이 높아지고 메모리와 생성 시간이 늘어납니다.
+DEFAULT_HNSW_M = 16
+
+# 그래프 생성 시 후보 수
+DEFAULT_HNSW_EF_CONSTRUCTION = 200
+
+# 검색 시 후보 수 (k보다 작으면 k를 사용)
+DEFAULT_HNSW_EF_SEARCH = 64
+
+# 삭제 표시된 노드의 비율이 이 값을 넘으면 delete 후 그래프를 다시 만듭니다.
+DEFAULT_REBUILD_THRESHOLD = 0.2
+
+# 필터에 매칭되는 문서 수가 이 값 이하이면 그래프 대신 매칭 문서 전체와 거리를 계산합니다.
+DEFAULT_EXACT_SEARCH_ROWS = 20000
+
+# check_recall 결과가 이 값보다 낮으면 경고를 남깁니다.
+DEFAULT_MIN_RECALL = 0.9
+
+# 그래프 생성과 정확 검색 시 SQLite에서 한 번에 읽을 행 수
+_FETCH_SIZE = 10000
+
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class _ReadWriteLock:
+    """검색끼리는 동시에 실행하고, 그래프를 바꾸는 작업은 단독으로 실행하는 잠금. 쓰기 잠금은 재진입할 수 있습니다."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer: Optional[int] = None
+        self._writer_depth = 0
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Generator[None, None, None]:
+        me = threading.get_ident()
+        with self._condition:
+            # 쓰기를 기다리는 스레드가 있으면 새 검색은 뒤로 미룹니다.
+            while self._writer != me and (self._writer is not None or self._writers_waiting):
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Generator[None, None, None]:
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writer_depth += 1
+            else:
+                self._writers_waiting += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._condition.wait()
+                finally:
+                    self._writers_waiting -= 1
+                self._writer, self._writer_depth = me, 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer_depth -= 1
+                if not self._writer_depth:
+                    self._writer = None
+                    self._condition.notify_all()
+
+
+def _to_distance(distance_metric: str, distances):
+    """hnswlib 거리를 pgvector/sqlite-vec와 같은 거리로 변환합니다. (l2는 제곱 거리, ip는 1 - 내적)"""
+    if distance_metric == "l2":
+        return np.sqrt(np.maximum(distances, 0))
+    if distance_metric == "inner_product":
+        return distances - 1
+    return distances
+
+
+def _exact_distances(distance_metric: str, vectors, queries):
+    """(행 × 쿼리) 정확한 거리 행렬"""
+    if distance_metric == "cosine":
+        vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+        return 1 - vectors @ queries.T
+    if distance_metric == "l2":
+        return np.sqrt(
+            np.maximum((vectors**2).sum(axis=1)[:, None] - 2 * vectors @ queries.T + (queries**2).sum(axis=1), 0)
+        )
+    return -(vectors @ queries.T)
+
+
+@dataclass
+class _HnswIndex:
+    """메모리에 올린 컬렉션 그래프와 설정"""
+
+    index: Any
+    dimension: int
+    distance_metric: str
+    m: int
+    ef_construction: int
+    ef_search: int
+    # 그래프에 있는(삭제 표시되지 않은) 문서 수와 삭제 표시된 문서 수
+    live: int = 0
+    deleted: int = 0
+    # 마지막으로 읽거나 저장한 인덱스 파일의 (st_mtime_ns, st_size)
+    file_id: Optional[Tuple[int, int]] = None
+    # 저장하지 않은 변경이 있는지 여부
+    dirty: bool = False
+    # 마지막으로 반영한 hnsw_collections.version. 쓰기마다 1씩 늘어납니다.
+    version: int = 0
+    lock: _ReadWriteLock = field(default_factory=_ReadWriteLock)
+
+
+class HnswStore(BaseVectorStore):
+    """
+    SQLite 메타데이터 DB와 디스크에 저장한 HNSW 그래프(hnswlib)를 사용하는 근사 최근접 이웃 검색 백엔드.
+
+    sqlite-vec의 vec0는 전수 검색이므로 컬렉션 크기에 비례해 느려집니다.
+    이 백엔드는 문서, 메타데이터, 원본 벡터를 SQLite 테이블에 두고 그래프는 DB 옆의
+    `{DB 이름}.{컬렉션}.hnsw` 파일에 저장합니다. 행의 id가 그래프의 label입니다.
+
+    - insert: SQLite에 행을 추가하고 같은 id로 그래프에 노드를 추가합니다.
+    - delete: 행에 deleted 표시를 하고 그래프 노드도 삭제 표시합니다 (soft delete).
+      삭제 표시 비율이 rebuild_threshold를 넘으면 남은 행으로 그래프를 다시 만들고 행을 지웁니다.
+    - 그래프 파일이 DB보다 오래되었으면 (저장 전에 종료된 경우) 불러올 때 빠진 행과 삭제 표시를 반영합니다.
+    - 쓰기(insert, delete, rebuild, 저장)는 그래프 파일 옆 `.lock` 파일로 프로세스 사이에서 직렬화합니다.
+      잠금을 잡은 뒤 다른 프로세스가 쓴 변경이 있으면 그래프를 다시 불러온 다음 씁니다.
+      Windows에서는 프로세스 사이 잠금이 없으므로 쓰는 프로세스는 하나여야 합니다.
+    """
+
+    def _validate_config(self) -> None:
+        """설정을 검증합니다."""
+        if "db_path" not in self.config:
+            self.config["db_path"] = Path.home() / ".pyhub" / "hnsw.db"
+        else:
+            self.config["db_path"] = Path(self.config["db_path"]).expanduser()
+
+        self.config["db_path"].parent.mkdir(parents=True, exist_ok=True)
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+
+        self.rebuild_threshold = float(self.config.get("rebuild_threshold", DEFAULT_REBUILD_THRESHOLD))
+        self.exact_search_rows = int(self.config.get("exact_search_rows", DEFAULT_EXACT_SEARCH_ROWS))
+        # 거짓이면 insert/delete 후 그래프를 저장하지 않습니다. flush() 또는 close()에서 저장합니다.
+        self.autosave = bool(self.config.get("autosave", True))
+
+        # 스레드마다 하나의 연결을 열어 스토어가 닫힐 때까지 재사용합니다.
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._pid = os.getpid()
+
+        # 컬렉션 이름 → 그래프
+        self._indexes: Dict[str, _HnswIndex] = {}
+        self._index_lock = threading.Lock()
+        # fcntl이 없을 때 같은 프로세스의 쓰기를 직렬화합니다.
+        self._write_mutex = threading.Lock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """현재 스레드의 데이터베이스 연결을 반환합니다. 없으면 새로 엽니다."""
+        if self._pid != os.getpid():
+            # fork된 자식 프로세스에서는 부모의 연결을 공유하지 않습니다.
+            self._local = threading.local()
+            self._connections = []
+            self._pid = os.getpid()
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            from pyhub.init import get_sqlite_pragmas
+
+            conn = sqlite3.connect(str(self.config["db_path"]), check_same_thread=False)
+            for name, value in {**get_sqlite_pragmas(), **self.config.get("pragmas", {})}.items():
+                conn.execute(f"PRAGMA {name} = {value}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS hnsw_collections ("
+                "name TEXT PRIMARY KEY, dimension INTEGER NOT NULL, distance_metric TEXT NOT NULL, "
+                "m INTEGER NOT NULL, ef_construction INTEGER NOT NULL, ef_search INTEGER NOT NULL, "
+                "version INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _cursor(self) -> Generator[sqlite3.Cursor, None, None]:
+        """재사용 연결의 커서를 반환합니다. 성공하면 커밋하고, 예외가 발생하면 롤백합니다."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def is_available(self) -> bool:
+        """백엔드가 사용 가능한지 확인합니다."""
+        return hnswlib is not None and np is not None
+
+    def index_path(self, collection_name: str) -> Path:
+        """컬렉션 그래프 파일 경로"""
+        if not _IDENTIFIER_PATTERN.match(collection_name):
+            raise ValueError(f"Invalid collection name: {collection_name}")
+        db_path = self.config["db_path"]
+        return db_path.with_name(f"{db_path.stem}.{collection_name}.hnsw")
+
+    def create_collection(self, name: str, dimension: int, distance_metric: str = "cosine", **kwargs) -> None:
+        """
+        벡터 컬렉션을 생성합니다.
+
+        Args:
+            name: 컬렉션 이름
+            dimension: 벡터 차원
+            distance_metric: 거리 메트릭 (cosine, l2, inner_product)
+            m: 노드별 이웃 수 (기본값은 설정의 m 또는 16)
+            ef_construction: 그래프 생성 시 후보 수 (기본값은 설정의 ef_construction 또는 200)
+            ef_search: 검색 시 후보 수 (기본값은 설정의 ef_search 또는 64)
+        """
+        if distance_metric not in HNSW_SPACES:
+            raise ValueError(f"Unsupported distance metric for hnsw: {distance_metric}. Available: {list(HNSW_SPACES)}")
+        self.index_path(name)
+
+        params = {
+            key: int(kwargs.get(key) or self.config.get(key, default))
+            for key, default in (
+                ("m", DEFAULT_HNSW_M),
+                ("ef_construction", DEFAULT_HNSW_EF_CONSTRUCTION),
+                ("ef_search", DEFAULT_HNSW_EF_SEARCH),
+            )
+        }
+
+        with self._cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {name} ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, page_content TEXT NOT NULL, metadata TEXT NOT NULL, "
+                "embedding BLOB NOT NULL, deleted INTEGER NOT NULL DEFAULT 0)"
+            )
+            cursor.execute(
+                "INSERT OR IGNORE INTO hnsw_collections "
+                "(name, dimension, distance_metric, m, ef_construction, ef_search) VALUES (?, ?, ?, ?, ?, ?)",
+                (name, dimension, distance_metric, params["m"], params["ef_construction"], params["ef_search"]),
+            )
+
+    def drop_collection(self, name: str) -> None:
+        """컬렉션과 그래프 파일을 삭제합니다."""
+        with self._cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {name}")
+            cursor.execute("DELETE FROM hnsw_collections WHERE name = ?", (name,))
+            delete_checkpoint(cursor, name)
+
+        self._indexes.pop(name, None)
+        self.index_path(name).unlink(missing_ok=True)
+        self._lock_path(name).unlink(missing_ok=True)
+
+    def collection_exists(self, name: str) -> bool:
+        """컬렉션이 존재하는지 확인합니다."""
+        with self._cursor() as cursor:
+            cursor.execute("SELECT 1 FROM hnsw_collections WHERE name = ?", (name,))
+            return cursor.fetchone() is not None
+
+    def _new_index(self, state: _HnswIndex, max_elements: int):
+        index = hnswlib.Index(space=HNSW_SPACES[state.distance_metric], dim=state.dimension)
+        index.init_index(max_elements=max(max_elements, 1), M=state.m, ef_construction=state.ef_construction)
+        index.set_ef(state.ef_search)
+        return index
+
+    @staticmethod
+    def _add_items(state: _HnswIndex, rows: Iterable[Tuple[int, bytes]]) -> int:
+        """(id, float32 blob) 행을 그래프에 추가합니다. 용량이 모자라면 두 배씩 늘립니다."""
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        ids = np.fromiter((row_id for row_id, __ in rows), dtype=np.int64, count=len(rows))
+        vectors = np.frombuffer(b"".join(blob for __, blob in rows), dtype="<f4").reshape(len(rows), state.dimension)
+
+        index = state.index
+        required = index.get_current_count() + len(rows)
+        if required > index.get_max_elements():
+            index.resize_index(max(required, index.get_max_elements() * 2))
+        index.add_items(vectors, ids)
+        return len(rows)
+
+    def _load_index(self, name: str) -> _HnswIndex:
+        """그래프 파일을 불러오고 파일 저장 이후 DB에 반영된 추가/삭제를 적용합니다. 파일이 없으면 새로 만듭니다."""
+        with self._cursor() as cursor:
+            cursor.execute(
+                "SELECT dimension, distance_metric, m, ef_construction, ef_search, version "
+                "FROM hnsw_collections WHERE name = ?",
+                (name,),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                raise ValueError(f"Collection not found: {name}")
+
+            state = _HnswIndex(None, *row[:5], version=row[5])
+            path = self.index_path(name)
+            if not path.exists():
+                return self._build_index(cursor, name, state)
+
+            state.index = hnswlib.Index(space=HNSW_SPACES[state.distance_metric], dim=state.dimension)
+            stat = path.stat()
+            state.index.load_index(str(path))
+            state.index.set_ef(state.ef_search)
+            state.file_id = (stat.st_mtime_ns, stat.st_size)
+
+            labels = state.index.get_ids_list()
+            max_label = max(labels) if len(labels) else 0
+
+            cursor.execute(f"SELECT id, embedding FROM {name} WHERE id > ? AND deleted = 0", (max_label,))
+            while rows := cursor.fetchmany(_FETCH_SIZE):
+                state.dirty |= self._add_items(state, rows) > 0
+
+            cursor.execute(f"SELECT id FROM {name} WHERE deleted = 1 AND id <= ?", (max_label,))
+            for (row_id,) in cursor.fetchall():
+                try:
+                    state.index.mark_deleted(row_id)
+                    state.dirty = True
+                except RuntimeError:
+                    # 이미 삭제 표시되어 저장된 노드
+                    pass
+
+            cursor.execute(f"SELECT COUNT(*), COALESCE(SUM(deleted), 0) FROM {name}")
+            total, state.deleted = cursor.fetchone()
+            state.live = total - state.deleted
+
+        if state.dirty:
+            logger.info(f"Applied changes made after the last save to the '{name}' HNSW index")
+        return state
+
+    def _build_index(self, cursor: sqlite3.Cursor, name: str, state: _HnswIndex) -> _HnswIndex:
+        """삭제되지 않은 행으로 새 그래프를 만들고 저장합니다."""
+        cursor.execute(f"SELECT COUNT(*) FROM {name} WHERE deleted = 0")
+        state.live = cursor.fetchone()[0]
+        state.deleted = 0
+        state.index = self._new_index(state, state.live)
+
+        cursor.execute(f"SELECT id, embedding FROM {name} WHERE deleted = 0")
+        while rows := cursor.fetchmany(_FETCH_SIZE):
+            self._add_items(state, rows)
+
+        self._save(name, state)
+        return state
+
+    def _get_index(self, name: str) -> _HnswIndex:
+        """
+        컬렉션 그래프를 반환합니다.
+
+        다른 프로세스가 그래프 파일을 새로 저장했으면 (저장하지 않은 변경이 없을 때) 다시 불러옵니다.
+        """
+        state = self._indexes.get(name)
+        if state is not None and not state.dirty:
+            try:
+                stat = self.index_path(name).stat()
+                file_id = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                file_id = None
+            if file_id != state.file_id:
+                state = None
+
+        if state is None:
+            with self._index_lock:
+                state = self._indexes[name] = self._load_index(name)
+        return state
+
+    def _lock_path(self, name: str) -> Path:
+        return self.index_path(name).with_suffix(".hnsw.lock")
+
+    @contextmanager
+    def _write_lock(self, name: str) -> Generator[_HnswIndex, None, None]:
+        """
+        컬렉션 쓰기 잠금을 잡고 최신 그래프를 반환합니다.
+
+        잠금을 잡은 뒤 DB의 컬렉션 version이 그래프와 다르면 다른 프로세스가 쓴 것이므로
+        그래프 파일과 DB로 다시 불러옵니다. 같은 스레드에서 중첩해 잡으면 교착되므로 주의합니다.
+        """
+        # 없는 컬렉션이면 잠금 파일을 만들기 전에 ValueError를 발생시킵니다.
+        self._get_index(name)
+
+        with self._write_mutex, open(self._lock_path(name), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                state = self._get_index(name)
+                with self._cursor() as cursor:
+                    cursor.execute("SELECT version FROM hnsw_collections WHERE name = ?", (name,))
+                    row = cursor.fetchone()
+                if row is None:
+                    raise ValueError(f"Collection not found: {name}")
+                if row[0] != state.version:
+                    with self._index_lock:
+                        state = self._indexes[name] = self._load_index(name)
+
+                with state.lock.write():
+                    yield state
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _bump_version(cursor: sqlite3.Cursor, name: str, state: _HnswIndex) -> None:
+        """쓰기 트랜잭션에서 컬렉션 version을 올려 다른 프로세스가 그래프를 다시 불러오게 합니다."""
+        cursor.execute("UPDATE hnsw_collections SET version = version + 1 WHERE name = ?", (name,))
+        state.version += 1
+
+    def _save(self, name: str, state: _HnswIndex) -> None:
+        """그래프를 임시 파일에 저장한 뒤 교체합니다."""
+        path = self.index_path(name)
+        tmp_path = path.with_suffix(".hnsw.tmp")
+        with state.lock.write():
+            state.index.save_index(str(tmp_path))
+            os.replace(tmp_path, path)
+            stat = path.stat()
+            state.file_id = (stat.st_mtime_ns, stat.st_size)
+            state.dirty = False
+
+    def flush(self, collection_name: Optional[str] = None) -> None:
+        """저장하지 않은 그래프 변경을 파일에 저장합니다. collection_name이 없으면 모든 컬렉션을 저장합니다."""
+        names = [collection_name] if collection_name else list(self._indexes)
+        for name in names:
+            state = self._indexes.get(name)
+            if state is None or not state.dirty:
+                continue
+            with self._write_lock(name) as state:
+                if state.dirty:
+                    self._save(name, state)
+
+    def insert(self, collection_name: str, documents: List[Document], batch_size: int = 1000) -> int:
+        """문서들을 DB에 삽입하고 같은 id로 그래프에 추가합니다."""
+        return self._insert(collection_name, documents, batch_size)
+
+    def _insert(
+        self,
+        collection_name: str,
+        documents: List[Document],
+        batch_size: int,
+        checkpoint: Optional[ImportCheckpoint] = None,
+    ) -> int:
+        """checkpoint가 있으면 마지막 배치와 같은 트랜잭션에서 기록합니다."""
+        if not documents:
+            if checkpoint is not None:
+                self._save_import_checkpoint(collection_name, checkpoint)
+            return 0
+
+        embeddings = serialize_f32_batch(doc.embedding for doc in documents)
+
+        with self._write_lock(collection_name) as state:
+            for embedding in embeddings:
+                if len(embedding) != state.dimension * 4:
+                    raise ValueError(
+                        f"Embedding dimension mismatch: expected {state.dimension}, got {len(embedding) // 4}"
+                    )
+
+            try:
+                for start in range(0, len(documents), batch_size):
+                    batch = documents[start : start + batch_size]
+                    batch_embeddings = embeddings[start : start + batch_size]
+                    with self._cursor() as cursor:
+                        cursor.executemany(
+                            f"INSERT INTO {collection_name} (page_content, metadata, embedding) VALUES (?, ?, ?)",
+                            [
+                                (doc.page_content, json.dumps(doc.metadata, ensure_ascii=False), embedding)
+                                for doc, embedding in zip(batch, batch_embeddings)
+                            ],
+                        )
+                        # 같은 트랜잭션에서 삽입한 행의 id는 연속입니다.
+                        cursor.execute("SELECT last_insert_rowid()")
+                        last_id = cursor.fetchone()[0]
+                        state.dirty = True
+                        self._add_items(state, zip(range(last_id - len(batch) + 1, last_id + 1), batch_embeddings))
+                        self._bump_version(cursor, collection_name, state)
+                        if checkpoint is not None and start + batch_size >= len(documents):
+                            save_checkpoint(cursor, collection_name, checkpoint)
+                    state.live += len(batch)
+            except BaseException:
+                # 그래프와 DB가 어긋났을 수 있으므로 다음 요청에서 파일과 DB로 다시 불러옵니다.
+                self._indexes.pop(collection_name, None)
+                raise
+
+            if self.autosave:
+                self._save(collection_name, state)
+
+        return len(documents)
+
+    def get_import_checkpoint(self, collection_name: str, file_path: Path) -> Optional[ImportCheckpoint]:
+        """메타데이터 DB의 체크포인트 테이블에서 읽습니다."""
+        with self._cursor() as cursor:
+            return load_checkpoint(cursor, collection_name, checkpoint_source(file_path))
+
+    def _save_import_checkpoint(self, collection_name: str, checkpoint: ImportCheckpoint) -> None:
+        with self._cursor() as cursor:
+            save_checkpoint(cursor, collection_name, checkpoint)
+
+    def _delete_import_checkpoint(self, collection_name: str, source: str) -> None:
+        with self._cursor() as cursor:
+            delete_checkpoint(cursor, collection_name, source)
+
+    def _insert_import_batch(
+        self, collection_name: str, documents: List[Document], batch_size: int, checkpoint: ImportCheckpoint
+    ) -> int:
+        """
+        배치 삽입과 체크포인트 기록을 한 트랜잭션으로 커밋합니다.
+
+        그래프는 다음에 불러올 때 DB 기준으로 맞추므로 저장 전에 중단되어도 행이 중복되지 않습니다.
+        """
+        return self._insert(collection_name, documents, batch_size, checkpoint)
+
+    def import_jsonl(
+        self, collection_name: str, file_path: Path, batch_size: int = 1000, clear_existing: bool = False, **kwargs
+    ) -> int:
+        """JSONL 파일에서 데이터를 임포트합니다. 그래프는 임포트가 끝난 뒤 한 번만 저장합니다."""
+        autosave, self.autosave = self.autosave, False
+        try:
+            total = super().import_jsonl(collection_name, file_path, batch_size, clear_existing, **kwargs)
+        finally:
+            self.autosave = autosave
+        self.flush(collection_name)
+        return total
+
+    def _iter_snapshot_batches(self, collection_name: str, batch_size: int) -> Iterator[SnapshotBatch]:
+        """삭제 표시되지 않은 행을 id 순서로 batch_size행씩 읽습니다. 그래프는 사용하지 않습니다."""
+        with self._cursor() as cursor:
+            cursor.execute("SELECT dimension FROM hnsw_collections WHERE name = ?", (collection_name,))
+            row = cursor.fetchone()
+        if row is None:
+            raise ValueError(f"Collection not found: {collection_name}")
+
+        cursor = self._get_connection().cursor()
+        try:
+            cursor.execute(
+                f"SELECT page_content, metadata, embedding FROM {collection_name} WHERE deleted = 0 ORDER BY id"
+            )
+            while rows := cursor.fetchmany(batch_size):
+                yield SnapshotBatch(
+                    [page_content for page_content, __, __ in rows],
+                    [json.loads(metadata) for __, metadata, __ in rows],
+                    np.frombuffer(b"".join(blob for __, __, blob in rows), dtype="<f4").reshape(len(rows), row[0]),
+                )
+        finally:
+            cursor.close()
+
+    def _restore_batches(self, collection_name: str, batches: Iterator[SnapshotBatch], batch_size: int) -> int:
+        """스냅샷 배치를 삽입합니다. 그래프는 복원이 끝난 뒤 한 번만 저장합니다."""
+        autosave, self.autosave = self.autosave, False
+        try:
+            total = super()._restore_batches(collection_name, batches, batch_size)
+        finally:
+            self.autosave = autosave
+        self.flush(collection_name)
+        return total
+
+    def _filter_conditions(self, filter: Dict[str, Any]) -> tuple[List[str], List[Any]]:
+        """필터를 WHERE 조건으로 변환합니다."""
+        conditions, params = ["deleted = 0"], []
+        for key, value in (filter or {}).items():
+            conditions.append(f"json_extract(metadata, '$.{key}') = ?")
+            params.append(json_filter_param(value))
+        return conditions, params
+
+    def _knn_query(self, state: _HnswIndex, queries, k: int, ef_search: Optional[int] = None, filter=None):
+        """
+        그래프 검색. 결과가 k개보다 적으면 hnswlib가 RuntimeError를 발생시킵니다.
+
+        검색끼리는 동시에 실행합니다. ef_search가 컬렉션 기본값과 다르면 그래프의 ef를 잠시 바꾸므로
+        단독으로 실행합니다.
+        """
+        custom_ef = ef_search is not None and ef_search != state.ef_search
+        with state.lock.write() if custom_ef else state.lock.read():
+            if custom_ef:
+                state.index.set_ef(ef_search)
+            try:
+                # 필터 함수는 GIL을 잡아야 하므로 단일 스레드로 탐색합니다.
+                labels, distances = state.index.knn_query(
+                    queries, k=k, num_threads=1 if filter is not None else -1, filter=filter
+                )
+            finally:
+                if custom_ef:
+                    state.index.set_ef(state.ef_search)
+        return labels, _to_distance(state.distance_metric, distances)
+
+    def _exact_search(self, state: _HnswIndex, cursor: sqlite3.Cursor, queries, k: int, sql: str, params):
+        """sql로 조회한 (id, embedding) 행 전체와 거리를 계산합니다. 쿼리별 (id 목록, 거리 목록)을 반환합니다."""
+        best_ids = np.empty((0, len(queries)), dtype=np.int64)
+        best_distances = np.empty((0, len(queries)), dtype=np.float32)
+
+        cursor.execute(sql, params)
+        while rows := cursor.fetchmany(_FETCH_SIZE):
+            ids = np.fromiter((row_id for row_id, __ in rows), dtype=np.int64, count=len(rows))
+            vectors = np.frombuffer(b"".join(blob for __, blob in rows), dtype="<f4").reshape(len(rows), -1)
+            distances = _exact_distances(state.distance_metric, vectors, queries)
+
+            best_ids = np.concatenate([best_ids, np.broadcast_to(ids[:, None], distances.shape)])
+            best_distances = np.concatenate([best_distances, distances])
+            if len(best_ids) > k:
+                part = np.argpartition(best_distances, k - 1, axis=0)[:k]
+                best_ids = np.take_along_axis(best_ids, part, axis=0)
+                best_distances = np.take_along_axis(best_distances, part, axis=0)
+
+        order = np.argsort(best_distances, axis=0, kind="stable")
+        return (
+            np.take_along_axis(best_ids, order, axis=0).T,
+            np.take_along_axis(best_distances, order, axis=0).T,
+        )
+
+    def _search_ids(
+        self,
+        state: _HnswIndex,
+        collection_name: str,
+        queries,
+        k: int,
+        filter: Optional[Dict[str, Any]],
+        ef_search: Optional[int],
+    ):
+        """쿼리별 (id 목록, 거리 목록)"""
+        conditions, params = self._filter_conditions(filter)
+        exact_sql = f"SELECT id, embedding FROM {collection_name} WHERE {' AND '.join(conditions)}"
+
+        with self._cursor() as cursor:
+            if not filter:
+                matched, allowed = state.live, None
+            else:
+                cursor.execute(f"SELECT id FROM {collection_name} WHERE {' AND '.join(conditions)}", params)
+                allowed = {row_id for (row_id,) in cursor.fetchall()}
+                matched = len(allowed)
+
+            k = min(k, matched)
+            if k == 0:
+                return np.empty((len(queries), 0), dtype=np.int64), np.empty((len(queries), 0))
+
+            if filter and matched <= max(self.exact_search_rows, k):
+                # 매칭 문서가 적으면 그래프를 탐색하는 것보다 전부 계산하는 편이 빠르고 정확합니다.
+                return self._exact_search(state, cursor, queries, k, exact_sql, params)
+
+            try:
+                return self._knn_query(
+                    state, queries, k, ef_search, filter=None if allowed is None else allowed.__contains__
+                )
+            except RuntimeError:
+                # 삭제 표시나 필터로 그래프 탐색에서 k개를 찾지 못한 경우
+                logger.debug(f"HNSW search returned fewer than {k} results. Falling back to exact search.")
+                return self._exact_search(state, cursor, queries, k, exact_sql, params)
+
+    def _to_results(self, collection_name: str, ids, distances, threshold: Optional[float]) -> List[List[SearchResult]]:
+        all_ids = sorted({int(row_id) for row_id in np.ravel(ids)})
+        documents = {}
+        with self._cursor() as cursor:
+            for start in range(0, len(all_ids), 900):
+                chunk = all_ids[start : start + 900]
+                cursor.execute(
+                    f"SELECT id, page_content, metadata FROM {collection_name} "
+                    f"WHERE deleted = 0 AND id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for row_id, content, metadata in cursor.fetchall():
+                    documents[row_id] = Document(page_content=content, metadata=json.loads(metadata))
+
+        results = []
+        for query_ids, query_distances in zip(ids, distances):
+            query_results = []
+            for row_id, distance in zip(query_ids, query_distances):
+                doc = documents.get(int(row_id))
+                similarity = 1 - float(distance)
+                if doc is None or (threshold is not None and similarity < threshold):
+                    continue
+                query_results.append(SearchResult(document=doc, score=similarity))
+            results.append(query_results)
+        return results
+
+    def search(
+        self,
+        collection_name: str,
+        query_embedding: List[float],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        threshold: Optional[float] = None,
+        ef_search: Optional[int] = None,
+    ) -> List[SearchResult]:
+        """
+        HNSW 그래프로 유사도 검색을 수행합니다.
+
+        필터가 있으면 매칭되는 id만 그래프 탐색에 사용하고, 매칭 문서가 exact_search_rows개 이하이면
+        매칭 문서 전체와 거리를 계산합니다.
+
+        Args:
+            ef_search: 이번 검색에만 적용할 후보 수. 클수록 정확하지만 느립니다.
+        """
+        return self.search_many(
+            collection_name, [query_embedding], k=k, filter=filter, threshold=threshold, ef_search=ef_search
+        )[0]
+
+    def search_many(
+        self,
+        collection_name: str,
+        query_embeddings: List[List[float]],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        threshold: Optional[float] = None,
+        ef_search: Optional[int] = None,
+    ) -> List[List[SearchResult]]:
+        """여러 쿼리를 hnswlib의 일괄 검색(knn_query)으로 한 번에 검색합니다."""
+        if not query_embeddings:
+            return []
+
+        state = self._get_index(collection_name)
+        queries = np.asarray(query_embeddings, dtype=np.float32).reshape(len(query_embeddings), -1)
+        if queries.shape[1] != state.dimension:
+            raise ValueError(f"Query dimension mismatch: expected {state.dimension}, got {queries.shape[1]}")
+
+        ids, distances = self._search_ids(state, collection_name, queries, k, filter, ef_search)
+        return self._to_results(collection_name, ids, distances, threshold)
+
+    def delete(self, collection_name: str, filter: Dict[str, Any]) -> int:
+        """
+        필터에 매칭되는 문서에 삭제 표시를 하고 그래프 노드도 삭제 표시합니다.
+
+        삭제 표시 비율이 rebuild_threshold를 넘으면 rebuild_index()로 그래프를 다시 만듭니다.
+        필터가 비어 있으면 모든 문서를 지우고 빈 그래프로 바꿉니다.
+        """
+        with self._write_lock(collection_name) as state:
+            with self._cursor() as cursor:
+                if not filter:
+                    cursor.execute(f"DELETE FROM {collection_name}")
+                    deleted_count = cursor.rowcount
+                    self._bump_version(cursor, collection_name, state)
+                    self._indexes[collection_name] = self._build_index(cursor, collection_name, state)
+                    return deleted_count
+
+                conditions, params = self._filter_conditions(filter)
+                cursor.execute(f"SELECT id FROM {collection_name} WHERE {' AND '.join(conditions)}", params)
+                ids = [row_id for (row_id,) in cursor.fetchall()]
+                cursor.executemany(f"UPDATE {collection_name} SET deleted = 1 WHERE id = ?", [(i,) for i in ids])
+                for row_id in ids:
+                    state.index.mark_deleted(row_id)
+                if ids:
+                    self._bump_version(cursor, collection_name, state)
+
+            state.dirty |= bool(ids)
+            state.live -= len(ids)
+            state.deleted += len(ids)
+
+            if state.deleted > (state.live + state.deleted) * self.rebuild_threshold:
+                self._rebuild_index(collection_name, state)
+            elif self.autosave and ids:
+                self._save(collection_name, state)
+
+        return len(ids)
+
+    def rebuild_index(
+        self, collection_name: str, m: Optional[int] = None, ef_construction: Optional[int] = None
+    ) -> int:
+        """
+        삭제되지 않은 행으로 그래프를 다시 만들고 삭제 표시된 행을 지웁니다.
+
+        새 그래프를 저장한 뒤 행을 지우므로, 중간에 실패해도 다음에 불러올 때 DB와 그래프가 어긋나지 않습니다.
+
+        Args:
+            collection_name: 대상 컬렉션
+            m: 새 노드별 이웃 수 (지정하면 컬렉션 설정도 바꿉니다)
+            ef_construction: 새 그래프 생성 시 후보 수 (지정하면 컬렉션 설정도 바꿉니다)
+
+        Returns:
+            그래프의 문서 수
+        """
+        with self._write_lock(collection_name) as state:
+            return self._rebuild_index(collection_name, state, m, ef_construction)
+
+    def _rebuild_index(
+        self, collection_name: str, state: _HnswIndex, m: Optional[int] = None, ef_construction: Optional[int] = None
+    ) -> int:
+        """쓰기 잠금 안에서 그래프를 다시 만듭니다."""
+        with self._cursor() as cursor:
+            if m or ef_construction:
+                state.m = int(m or state.m)
+                state.ef_construction = int(ef_construction or state.ef_construction)
+                cursor.execute(
+                    "UPDATE hnsw_collections SET m = ?, ef_construction = ? WHERE name = ?",
+                    (state.m, state.ef_construction, collection_name),
+                )
+
+            state = self._build_index(cursor, collection_name, state)
+            cursor.execute(f"DELETE FROM {collection_name} WHERE deleted = 1")
+            self._bump_version(cursor, collection_name, state)
+            self._indexes[collection_name] = state
+
+        logger.info(f"Rebuilt '{collection_name}' HNSW index with {state.live:,} documents")
+        return state.live
+
+    def set_ef_search(self, collection_name: str, ef_search: int) -> None:
+        """컬렉션의 기본 검색 후보 수를 바꿉니다."""
+        with self._write_lock(collection_name) as state, self._cursor() as cursor:
+            cursor.execute("UPDATE hnsw_collections SET ef_search = ? WHERE name = ?", (ef_search, collection_name))
+            self._bump_version(cursor, collection_name, state)
+            state.ef_search = ef_search
+            state.index.set_ef(ef_search)
+
+    def check_recall(
+        self, collection_name: str, k: int = 10, sample_size: int = 100, ef_search: Optional[int] = None
+    ) -> float:
+        """
+        그래프 검색의 재현율(recall@k)을 측정합니다.
+
+        무작위로 고른 문서 벡터를 쿼리로 사용해 그래프 검색 결과와 전체 문서에 대한 정확한 검색 결과를 비교합니다.
+        결과가 설정의 min_recall(기본 0.9)보다 낮으면 경고를 남깁니다. ef_search나 m을 늘려 재현율을 높일 수 있습니다.
+
+        Returns:
+            쿼리별 재현율의 평균 (0 ~ 1)
+        """
+        state = self._get_index(collection_name)
+
+        with self._cursor() as cursor:
+            cursor.execute(
+                f"SELECT embedding FROM {collection_name} WHERE deleted = 0 ORDER BY RANDOM() LIMIT ?", (sample_size,)
+            )
+            blobs = [blob for (blob,) in cursor.fetchall()]
+            if not blobs:
+                return 1.0
+
+            queries = np.frombuffer(b"".join(blobs), dtype="<f4").reshape(len(blobs), state.dimension)
+            k = min(k, state.live)
+            expected, __ = self._exact_search(
+                state, cursor, queries, k, f"SELECT id, embedding FROM {collection_name} WHERE deleted = 0", []
+            )
+
+        try:
+            found, __ = self._knn_query(state, queries, k, ef_search)
+        except RuntimeError:
+            found = np.empty((len(queries), 0), dtype=np.int64)
+
+        recall = float(np.mean([len(set(a.tolist()) & set(b.tolist())) / k for a, b in zip(found, expected)]))
+        min_recall = float(self.config.get("min_recall", DEFAULT_MIN_RECALL))
+        if recall < min_recall:
+            logger.warning(
+                f"HNSW recall@{k} of '{collection_name}' is {recall:.3f} (< {min_recall}). "
+                f"Increase ef_search (current: {ef_search or state.ef_search}) or rebuild with a larger m."
+            )
+        return recall
+
+    def count(self, collection_name: str, filter: Optional[Dict[str, Any]] = None) -> int:
+        """컬렉션의 (삭제 표시되지 않은) 문서 수를 반환합니다."""
+        conditions, params = self._filter_conditions(filter)
+        with self._cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {collection_name} WHERE {' AND '.join(conditions)}", params)
+            return cursor.fetchone()[0]
+
+    def get_collection_info(self, collection_name: str) -> Dict[str, Any]:
+        """컬렉션 정보를 반환합니다."""
+        state = self._get_index(collection_name)
+        path = self.index_path(collection_name)
+
+        info = {
+            "name": collection_name,
+            "backend": self.backend_name,
+            "db_path": str(self.config["db_path"]),
+            "index_path": str(path),
+            "count": state.live,
+            "deleted": state.deleted,
+            "dimension": state.dimension,
+            "distance_metric": state.distance_metric,
+            "m": state.m,
+            "ef_construction": state.ef_construction,
+            "ef_search": state.ef_search,
+            "max_elements": state.index.get_max_elements(),
+        }
+
+        if path.exists():
+            size_bytes = path.stat().st_size
+            for unit in ["B", "KB", "MB", "GB"]:
+                if size_bytes < 1024.0:
+                    info["size"] = f"{size_bytes:.1f} {unit}"
+                    break
+                size_bytes /= 1024.0
+            else:
+                info["size"] = f"{size_bytes:.1f} TB"
+
+        return info
+
+    def close(self) -> None:
+        """저장하지 않은 그래프를 저장하고 열려 있는 모든 연결을 닫습니다."""
+        try:
+            self.flush()
+        finally:
+            self._indexes = {}
+            with self._lock:
+                connections, self._connections = self._connections, []
+            for conn in connections:
+                try:
+                    conn.close()
+                except sqlite3.Error as e:
+                    logger.debug(f"Error closing sqlite connection: {e}")
+            self._local = threading.local()
+
+    @property
+    def backend_name(self) -> str:
+        """백엔드 이름을 반환합니다."""
+        return "hnsw"
+
+    @property
+    def required_dependencies(self) -> List[str]:
+        """필요한 의존성 패키지 목록을 반환합니다."""
+        return ["hnswlib", "numpy"]
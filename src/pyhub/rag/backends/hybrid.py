@@ -0,0 +1,122 @@
+"""어휘(lexical) 검색과 벡터 검색의 순위 결합."""
+
+import re
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+FusionMethod = Literal["rrf", "weighted"]
+
+# Reciprocal Rank Fusion 상수. 클수록 하위 순위의 영향이 커집니다.
+DEFAULT_RRF_K = 60
+
+# 하이브리드 검색에서 각 검색이 가져올 후보 수 = k × 이 값
+DEFAULT_HYBRID_FETCH_FACTOR = 4
+
+# 부품 번호(AB-1234, v2.1 등)가 쪼개지지 않도록 하이픈, 점, 밑줄은 단어에 포함
+_TERM_PATTERN = re.compile(r"[\w][\w.\-]*[\w]|[\w]")
+
+
+def tokenize_query(query: str, min_length: int = 1) -> List[str]:
+    """
+    검색어를 중복 없이 단어 목록으로 나눕니다.
+
+    min_length보다 짧은 단어는 다음(마지막 단어는 이전) 단어와 공백으로 이어 구(phrase)로 만듭니다.
+    trigram 토크나이저는 3글자 미만을 검색할 수 없으므로,
+    "엔진 오일"처럼 두 글자 단어가 많은 한국어 검색어도 찾을 수 있게 합니다.
+    """
+    words = _TERM_PATTERN.findall(query or "")
+    terms = []
+    for i, word in enumerate(words):
+        if len(word) < min_length:
+            if i + 1 < len(words):
+                word = f"{word} {words[i + 1]}"
+            elif i > 0:
+                word = f"{words[i - 1]} {word}"
+            if len(word) < min_length:
+                continue
+        if word not in terms:
+            terms.append(word)
+    return terms
+
+
+def _normalize_scores(scores: List[float]) -> List[float]:
+    """점수를 0 ~ 1 범위로 min-max 정규화합니다."""
+    if not scores:
+        return []
+    low, high = min(scores), max(scores)
+    if high == low:
+        return [1.0] * len(scores)
+    return [(score - low) / (high - low) for score in scores]
+
+
+def fuse_rankings(
+    vector_items: Sequence[T],
+    lexical_items: Sequence[T],
+    key: Callable[[T], Hashable],
+    alpha: float = 0.5,
+    method: FusionMethod = "rrf",
+    rrf_k: int = DEFAULT_RRF_K,
+    score: Optional[Callable[[T], float]] = None,
+) -> List[Tuple[T, float]]:
+    """
+    벡터 검색과 어휘 검색 결과를 하나의 순위로 결합합니다.
+
+    - rrf: 각 목록의 순위 r에 대해 1 / (rrf_k + r)을 더합니다. 점수의 척도가 달라도 그대로 결합할 수 있습니다.
+    - weighted: 각 목록의 점수를 0 ~ 1로 정규화한 뒤 가중 합을 구합니다. score 함수가 필요합니다.
+
+    두 방식 모두 두 목록에서 1위인 항목이 1.0이 되도록 맞춥니다.
+
+    Args:
+        vector_items: 벡터 검색 결과 (가까운 순)
+        lexical_items: 어휘 검색 결과 (관련도 높은 순)
+        key: 두 목록에서 같은 문서를 식별할 키 함수
+        alpha: 벡터 검색 가중치 (0 ~ 1). 1이면 벡터 검색만, 0이면 어휘 검색만 사용
+        method: rrf 또는 weighted
+        rrf_k: RRF 상수
+        score: weighted 방식에서 사용할 항목 점수 함수 (클수록 관련도 높음)
+
+    Returns:
+        (항목, 결합 점수) 목록. 점수 내림차순
+    """
+    if not 0 <= alpha <= 1:
+        raise ValueError(f"alpha must be between 0 and 1: {alpha}")
+
+    if method == "rrf":
+        # 1위의 점수가 1이 되도록 (rrf_k + 1)을 곱합니다.
+        vector_scores = [(rrf_k + 1) / (rrf_k + rank) for rank in range(1, len(vector_items) + 1)]
+        lexical_scores = [(rrf_k + 1) / (rrf_k + rank) for rank in range(1, len(lexical_items) + 1)]
+    elif method == "weighted":
+        if score is None:
+            raise ValueError("score function is required for weighted fusion")
+        vector_scores = _normalize_scores([score(item) for item in vector_items])
+        lexical_scores = _normalize_scores([score(item) for item in lexical_items])
+    else:
+        raise ValueError(f"Unsupported fusion method: {method}")
+
+    fused: Dict[Hashable, List] = {}
+    for items, scores, weight in ((vector_items, vector_scores, alpha), (lexical_items, lexical_scores, 1 - alpha)):
+        for item, item_score in zip(items, scores):
+            entry = fused.setdefault(key(item), [item, 0.0])
+            entry[1] += weight * item_score
+
+    return sorted(((item, value) for item, value in fused.values()), key=lambda pair: pair[1], reverse=True)
+
+
+__all__ = [
+    "DEFAULT_HYBRID_FETCH_FACTOR",
+    "DEFAULT_RRF_K",
+    "FusionMethod",
+    "fuse_rankings",
+    "tokenize_query",
+]
@@ -0,0 +1,233 @@
+"""IVF(inverted file) 파티션 학습과 탐색."""
+
+import math
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 탐색할 파티션 수 기본값
+DEFAULT_IVF_NPROBE = 8
+
+# k-means 학습 표본 수 = 파티션 수 × 이 값
+DEFAULT_IVF_SAMPLES_PER_LIST = 256
+
+# k-means 반복 횟수
+DEFAULT_IVF_ITERATIONS = 20
+
+# 파티션 크기가 평균의 이 배수를 넘으면 rebalance에서 나눕니다.
+DEFAULT_IVF_MAX_LIST_RATIO = 2.0
+
+# 파티션 크기가 평균의 이 배수보다 작으면 rebalance에서 없애고 다른 파티션에 합칩니다.
+DEFAULT_IVF_MIN_LIST_RATIO = 0.1
+
+# 거리 행렬을 계산할 때 한 번에 처리할 행 수
+_CHUNK_ROWS = 8192
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("IVF partitioning requires numpy. Install with: pip install numpy")
+
+
+def from_blobs(blobs: Sequence[bytes], dimension: int):
+    """little-endian float32 blob 목록을 (행 × 차원) 행렬로 변환합니다."""
+    _require_numpy()
+    return np.frombuffer(b"".join(blobs), dtype="<f4").reshape(len(blobs), dimension)
+
+
+def default_n_lists(total: int) -> int:
+    """문서 수에 맞는 파티션 수 (√N)"""
+    return max(1, int(math.sqrt(total)))
+
+
+def prepare_vectors(vectors, distance_metric: str):
+    """float32 행렬로 변환합니다. cosine은 정규화하여 내적으로 비교합니다."""
+    _require_numpy()
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    if distance_metric == "cosine":
+        vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+    return vectors
+
+
+def _centroid_distances(vectors, centroids, distance_metric: str):
+    """(행 × 파티션) 거리 행렬. 행마다 같은 값(|v|²)은 생략하므로 순위 비교에만 사용합니다."""
+    if distance_metric == "cosine":
+        return -(vectors @ centroids.T)
+    # l2, l1 모두 유클리드 거리로 분할합니다.
+    return (centroids**2).sum(axis=1) - 2 * (vectors @ centroids.T)
+
+
+def assign_lists(vectors, centroids, distance_metric: str):
+    """각 벡터를 가장 가까운 중심점의 파티션 번호에 할당합니다."""
+    vectors = prepare_vectors(vectors, distance_metric)
+    labels = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), _CHUNK_ROWS):
+        chunk = vectors[start : start + _CHUNK_ROWS]
+        labels[start : start + len(chunk)] = _centroid_distances(chunk, centroids, distance_metric).argmin(axis=1)
+    return labels
+
+
+def nearest_lists(query, centroids, distance_metric: str, nprobe: int) -> List[int]:
+    """쿼리 벡터와 가까운 파티션 번호 nprobe개를 가까운 순으로 반환합니다."""
+    distances = _centroid_distances(prepare_vectors(query, distance_metric), centroids, distance_metric)[0]
+    nprobe = min(nprobe, len(distances))
+    nearest = np.argpartition(distances, nprobe - 1)[:nprobe]
+    return [int(i) for i in nearest[np.argsort(distances[nearest], kind="stable")]]
+
+
+def _kmeans_plus_plus(vectors, n_lists: int, distance_metric: str, rng):
+    """k-means++ 초기화: 이미 고른 중심점에서 먼 벡터일수록 높은 확률로 다음 중심점으로 고릅니다."""
+    centroids = np.empty((n_lists, vectors.shape[1]), dtype=np.float32)
+    centroids[0] = vectors[rng.integers(len(vectors))]
+    closest = np.full(len(vectors), np.inf)
+    for i in range(1, n_lists):
+        if distance_metric == "cosine":
+            distances = 1 - vectors @ centroids[i - 1]
+        else:
+            distances = ((vectors - centroids[i - 1]) ** 2).sum(axis=1)
+        closest = np.minimum(closest, np.maximum(distances, 0))
+        total = closest.sum()
+        centroids[i] = vectors[rng.choice(len(vectors), p=closest / total) if total > 0 else rng.integers(len(vectors))]
+    return centroids
+
+
+def train_kmeans(
+    vectors,
+    n_lists: int,
+    distance_metric: str = "cosine",
+    iterations: int = DEFAULT_IVF_ITERATIONS,
+    centroids=None,
+    seed: int = 0,
+):
+    """
+    k-means로 파티션 중심점을 학습합니다.
+
+    cosine은 정규화한 벡터로 학습하고 중심점도 정규화합니다 (spherical k-means).
+    초기 중심점은 k-means++로 고르며, 비어 있는 파티션은 무작위 표본으로 다시 초기화합니다.
+
+    Args:
+        vectors: 학습 표본 (행 × 차원)
+        n_lists: 파티션 수 (표본 수보다 많으면 표본 수로 줄입니다)
+        distance_metric: cosine, l2, l1
+        iterations: 최대 반복 횟수
+        centroids: 초기 중심점 (없으면 k-means++로 표본에서 고릅니다)
+        seed: 난수 시드
+
+    Returns:
+        (파티션 × 차원) float32 중심점
+    """
+    vectors = prepare_vectors(vectors, distance_metric)
+    if len(vectors) == 0:
+        raise ValueError("Cannot train IVF partitions without vectors")
+
+    rng = np.random.default_rng(seed)
+    if centroids is None:
+        centroids = _kmeans_plus_plus(vectors, min(n_lists, len(vectors)), distance_metric, rng)
+    centroids = prepare_vectors(centroids, distance_metric).copy()
+
+    for __ in range(iterations):
+        labels = assign_lists(vectors, centroids, distance_metric)
+
+        order = np.argsort(labels, kind="stable")
+        present, starts, counts = np.unique(labels[order], return_index=True, return_counts=True)
+        updated = centroids.copy()
+        updated[present] = np.add.reduceat(vectors[order], starts, axis=0) / counts[:, None]
+
+        empty = np.setdiff1d(np.arange(len(centroids)), present)
+        if len(empty):
+            updated[empty] = vectors[rng.choice(len(vectors), len(empty), replace=len(empty) > len(vectors))]
+        updated = prepare_vectors(updated, distance_metric)
+
+        converged = np.allclose(updated, centroids, atol=1e-6)
+        centroids = updated
+        if converged:
+            break
+
+    return centroids.astype(np.float32)
+
+
+def rebalance_centroids(
+    vectors,
+    centroids,
+    sizes: Sequence[int],
+    distance_metric: str = "cosine",
+    n_lists: Optional[int] = None,
+    iterations: int = 5,
+    max_list_ratio: float = DEFAULT_IVF_MAX_LIST_RATIO,
+    min_list_ratio: float = DEFAULT_IVF_MIN_LIST_RATIO,
+    seed: int = 0,
+):
+    """
+    데이터 분포가 바뀌어 크기가 치우친 파티션을 다시 나눕니다.
+
+    평균의 min_list_ratio배보다 작은 파티션은 없애고, 파티션 수가 n_lists가 될 때까지
+    가장 큰 파티션(또는 평균의 max_list_ratio배를 넘는 파티션)을 2-means로 나눈 뒤,
+    기존 중심점에서 시작해 iterations번 k-means를 반복합니다. 처음부터 학습하는 것보다 빠르고
+    대부분의 파티션이 그대로 유지됩니다.
+
+    Args:
+        vectors: 학습 표본 (행 × 차원)
+        centroids: 현재 중심점
+        sizes: 현재 파티션별 문서 수
+        n_lists: 새 파티션 수 (기본값은 현재 파티션 수)
+
+    Returns:
+        새 중심점
+    """
+    vectors = prepare_vectors(vectors, distance_metric)
+    centroids = prepare_vectors(centroids, distance_metric)
+    sizes = np.asarray(sizes, dtype=np.float64)
+    n_lists = n_lists or len(centroids)
+
+    mean_size = sizes.sum() / max(len(sizes), 1)
+    keep = sizes >= mean_size * min_list_ratio
+    if not keep.any():
+        keep[:] = True
+    centroids, sizes = centroids[keep], sizes[keep]
+
+    labels = assign_lists(vectors, centroids, distance_metric)
+    parts = [vectors[labels == i] for i in range(len(centroids))]
+    centroids, sizes = list(centroids), list(sizes)
+
+    while True:
+        largest = int(np.argmax(sizes))
+        if len(centroids) >= n_lists and sizes[largest] <= mean_size * max_list_ratio:
+            break
+        if len(parts[largest]) < 2:
+            break
+
+        split = train_kmeans(parts[largest], 2, distance_metric, iterations=10, seed=seed)
+        split_labels = assign_lists(parts[largest], split, distance_metric)
+        ratio = np.bincount(split_labels, minlength=2) / len(split_labels)
+        if ratio.min() == 0:
+            break
+
+        size = sizes[largest]
+        centroids[largest], sizes[largest], part = split[0], size * ratio[0], parts[largest]
+        parts[largest] = part[split_labels == 0]
+        centroids.append(split[1])
+        sizes.append(size * ratio[1])
+        parts.append(part[split_labels == 1])
+
+    return train_kmeans(vectors, len(centroids), distance_metric, iterations, centroids=np.array(centroids), seed=seed)
+
+
+__all__ = [
+    "DEFAULT_IVF_ITERATIONS",
+    "DEFAULT_IVF_MAX_LIST_RATIO",
+    "DEFAULT_IVF_MIN_LIST_RATIO",
+    "DEFAULT_IVF_NPROBE",
+    "DEFAULT_IVF_SAMPLES_PER_LIST",
+    "assign_lists",
+    "default_n_lists",
+    "from_blobs",
+    "nearest_lists",
+    "prepare_vectors",
+    "rebalance_centroids",
+    "train_kmeans",
+]
@@ -0,0 +1,708 @@
+"""NumPy memory-mapped brute-force backend implementation."""
+
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Generator, Iterator, List, Optional, Tuple
+
+from .base import BaseVectorStore, Document, SearchResult
+from .pipeline import ImportCheckpoint, checkpoint_source
+from .planner import matches_filter
+from .quantization import validate_quantization
+from .snapshot import NPY_HEADER_SIZE, SnapshotBatch, npy_header
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+# 지원하는 거리 메트릭. 거리 정의는 pgvector와 같습니다 (cosine: 1 - 코사인 유사도, inner_product: -내적).
+NUMPY_DISTANCE_METRICS = ("cosine", "l2", "inner_product")
+
+# 양자화 방식 → 벡터 파일 dtype. halfvec은 float16으로 저장하여 파일과 페이지 캐시 사용량을 절반으로 줄입니다.
+NUMPY_DTYPES = {None: "<f4", "halfvec": "<f2"}
+
+# 한 번에 거리를 계산할 행 수. (행 수 × 쿼리 수) 크기의 점수 행렬을 만듭니다.
+DEFAULT_SEARCH_CHUNK_ROWS = 65536
+
+# 삭제된 행의 비율이 이 값을 넘으면 delete 후 자동으로 압축합니다.
+DEFAULT_COMPACTION_THRESHOLD = 0.2
+
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _create_npy(path: Path, shape: Tuple[int, ...], dtype: str, data: bytes = b"") -> None:
+    with open(path, "wb") as f:
+        f.write(npy_header(shape, dtype))
+        f.write(data)
+
+
+def _append_npy(path: Path, rows: int, shape: Tuple[int, ...], dtype: str, data: bytes) -> None:
+    """
+    .npy 파일의 앞쪽 rows개 행 뒤에 data를 덧붙이고 헤더의 shape를 갱신합니다.
+
+    이전 쓰기가 중간에 실패해 남은 꼬리 데이터는 잘라냅니다.
+    """
+    row_size = int(np.prod(shape[1:], dtype=np.int64)) * np.dtype(dtype).itemsize
+    with open(path, "r+b") as f:
+        f.truncate(NPY_HEADER_SIZE + rows * row_size)
+        f.seek(0, os.SEEK_END)
+        f.write(data)
+        f.seek(0)
+        f.write(npy_header(shape, dtype))
+
+
+def _open_npy(path: Path, shape: Tuple[int, ...], dtype: str):
+    """.npy 파일의 앞쪽 shape[0]개 행을 읽기 전용으로 메모리 매핑합니다."""
+    if shape[0] == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=NPY_HEADER_SIZE, shape=shape)
+
+
+def _format_size(size_bytes: float) -> str:
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024.0
+    return f"{size_bytes:.1f} TB"
+
+
+@dataclass
+class _CollectionState:
+    """
+    컬렉션의 메모리 매핑 상태
+
+    meta.json의 count개 행까지만 보이므로, 다른 프로세스가 덧붙이는 중인 행은 meta.json이 교체될 때까지 보이지 않습니다.
+    """
+
+    meta: Dict[str, Any]
+    path: Path
+    file_id: Tuple[int, int]
+    vectors: Any
+    offsets: Any
+    deleted: Any
+    # 문서 파일 핸들. 압축으로 파일이 삭제되어도 열려 있는 핸들로 계속 읽을 수 있습니다.
+    documents: BinaryIO
+    documents_lock: threading.Lock = field(default_factory=threading.Lock)
+    # l2 거리 계산용 행별 제곱 노름 (처음 사용할 때 계산)
+    sq_norms: Any = None
+    # 필터 검색용 행별 메타데이터 (처음 사용할 때 읽음)
+    metadata: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def count(self) -> int:
+        return self.meta["count"]
+
+    @property
+    def live_count(self) -> int:
+        return self.meta["count"] - self.meta["deleted"]
+
+    def read_documents(self, rows: List[int]) -> List[Document]:
+        documents = []
+        with self.documents_lock:
+            for row in rows:
+                self.documents.seek(int(self.offsets[row]))
+                data = json.loads(self.documents.readline())
+                documents.append(Document(page_content=data["page_content"], metadata=data["metadata"]))
+        return documents
+
+    def read_metadata(self, start_row: int) -> Iterator[Dict[str, Any]]:
+        """start_row번째 행부터 마지막 행까지의 메타데이터"""
+        if start_row >= self.count:
+            return
+        with self.documents_lock:
+            self.documents.seek(int(self.offsets[start_row]))
+            for __ in range(self.count - start_row):
+                yield json.loads(self.documents.readline())["metadata"]
+
+
+class NumpyStore(BaseVectorStore):
+    """
+    NumPy 메모리 매핑 기반 전수(brute-force) 검색 백엔드.
+
+    수백만 개 이하의 컬렉션은 인덱스 없이 행렬-벡터 곱 한 번(BLAS)으로 정확한 k-NN을 구하는 편이
+    SQL 왕복보다 빠릅니다. 컬렉션은 data_dir 아래 디렉토리에 다음 파일로 저장됩니다.
+
+    - meta.json: 차원, 거리 메트릭, dtype, 행 수, 삭제된 행 수, 세대(generation)
+    - g{세대}/vectors.npy: (행 수, 차원) float32 또는 float16 벡터. cosine은 정규화하여 저장합니다.
+    - g{세대}/documents.jsonl: 행마다 {"page_content", "metadata"} 한 줄
+    - g{세대}/offsets.npy: 행별 documents.jsonl 바이트 위치 (int64)
+    - g{세대}/deleted.npy: 삭제된 행 번호 (int64)
+
+    모든 파일은 덧붙이기만 하고(append-only), 삭제는 행 번호만 기록합니다.
+    compact()는 남은 행으로 새 세대의 파일을 쓰고 meta.json을 교체합니다.
+    벡터 파일은 읽기 전용으로 메모리 매핑하므로 같은 파일을 여는 여러 워커 프로세스가 OS 페이지 캐시를 공유합니다.
+    쓰기는 컬렉션별 파일 잠금으로 직렬화되고, 다른 프로세스의 쓰기는 meta.json이 바뀌면 다음 요청에서 반영됩니다.
+    """
+
+    def _validate_config(self) -> None:
+        """설정을 검증합니다."""
+        if "data_dir" not in self.config:
+            self.config["data_dir"] = Path.home() / ".pyhub" / "vectors"
+        else:
+            self.config["data_dir"] = Path(self.config["data_dir"]).expanduser()
+
+        self.config["data_dir"].mkdir(parents=True, exist_ok=True)
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+
+        self.search_chunk_rows = int(self.config.get("search_chunk_rows", DEFAULT_SEARCH_CHUNK_ROWS))
+        self.compaction_threshold = float(self.config.get("compaction_threshold", DEFAULT_COMPACTION_THRESHOLD))
+
+        # 컬렉션 이름 → 메모리 매핑 상태
+        self._collections: Dict[str, _CollectionState] = {}
+        self._collections_lock = threading.Lock()
+        # 같은 프로세스의 쓰기를 직렬화합니다 (_write_lock).
+        self._lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        """백엔드가 사용 가능한지 확인합니다."""
+        return np is not None
+
+    def _collection_path(self, name: str) -> Path:
+        if not _IDENTIFIER_PATTERN.match(name):
+            raise ValueError(f"Invalid collection name: {name}")
+        return self.config["data_dir"] / name
+
+    @staticmethod
+    def _write_meta(path: Path, meta: Dict[str, Any]) -> None:
+        """meta.json을 원자적으로 교체합니다."""
+        tmp_path = path / "meta.json.tmp"
+        tmp_path.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp_path, path / "meta.json")
+
+    @contextmanager
+    def _write_lock(self, name: str) -> Generator[Dict[str, Any], None, None]:
+        """컬렉션 쓰기 잠금을 잡고 디스크의 최신 meta를 반환합니다."""
+        path = self._collection_path(name)
+        if not (path / "meta.json").exists():
+            raise ValueError(f"Collection not found: {name}")
+
+        with self._lock, open(path / ".lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield json.loads((path / "meta.json").read_text(encoding="utf-8"))
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _get_collection(self, name: str) -> _CollectionState:
+        """
+        컬렉션 상태를 반환합니다. meta.json이 바뀌었으면 파일을 다시 매핑합니다.
+
+        같은 세대에서 행이 늘어난 경우 메타데이터와 제곱 노름은 늘어난 행만 읽어 이어 붙이고
+        문서 파일 핸들을 그대로 씁니다.
+        세대가 바뀌었으면 이전 세대의 문서 파일 핸들을 닫습니다.
+        """
+        path = self._collection_path(name)
+        try:
+            stat = os.stat(path / "meta.json")
+        except FileNotFoundError:
+            with self._collections_lock:
+                state = self._collections.pop(name, None)
+            if state is not None:
+                self._close_documents(state)
+            raise ValueError(f"Collection not found: {name}")
+
+        file_id = (stat.st_ino, stat.st_mtime_ns)
+        state = self._collections.get(name)
+        if state is not None and state.file_id == file_id:
+            return state
+
+        with self._collections_lock:
+            state = self._collections.get(name)
+            if state is not None and state.file_id == file_id:
+                return state
+            new_state = self._load_collection(path, file_id, state)
+            self._collections[name] = new_state
+
+        if state is not None and state.documents is not new_state.documents:
+            self._close_documents(state)
+        return new_state
+
+    def _load_collection(
+        self, path: Path, file_id: Tuple[int, int], state: Optional[_CollectionState]
+    ) -> _CollectionState:
+        """meta.json으로 컬렉션 파일을 매핑합니다. state는 교체할 이전 상태입니다."""
+        meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        generation_path = path / f"g{meta['generation']}"
+        count, dtype = meta["count"], meta["dtype"]
+        deleted = np.zeros(count, dtype=bool)
+        deleted[_open_npy(generation_path / "deleted.npy", (meta["deleted"],), "<i8")] = True
+
+        same_generation = state is not None and state.meta["generation"] == meta["generation"]
+        new_state = _CollectionState(
+            meta=meta,
+            path=generation_path,
+            file_id=file_id,
+            vectors=_open_npy(generation_path / "vectors.npy", (count, meta["dimension"]), dtype),
+            offsets=_open_npy(generation_path / "offsets.npy", (count,), "<i8"),
+            deleted=deleted,
+            # 같은 세대의 문서 파일은 덧붙이기만 하므로 열려 있는 핸들로 늘어난 행도 읽을 수 있습니다.
+            documents=state.documents if same_generation else open(generation_path / "documents.jsonl", "rb"),
+        )
+        if same_generation:
+            new_state.documents_lock = state.documents_lock
+
+        if same_generation and state.count <= count:
+            if state.metadata is not None:
+                new_state.metadata = state.metadata + list(new_state.read_metadata(state.count))
+            if state.sq_norms is not None:
+                new_state.sq_norms = np.concatenate([state.sq_norms, self._sq_norms(new_state, state.count)])
+
+        return new_state
+
+    @staticmethod
+    def _close_documents(state: _CollectionState) -> None:
+        """읽는 중인 스레드가 끝나기를 기다린 뒤 문서 파일 핸들을 닫습니다."""
+        with state.documents_lock:
+            state.documents.close()
+
+    def _sq_norms(self, state: _CollectionState, start: int = 0):
+        """start번째 행부터의 제곱 노름 (l2 거리 계산용)"""
+        norms = [
+            np.einsum("ij,ij->i", block, block)
+            for block in (
+                np.asarray(state.vectors[i : i + self.search_chunk_rows], dtype=np.float32)
+                for i in range(start, state.count, self.search_chunk_rows)
+            )
+        ]
+        return np.concatenate(norms) if norms else np.empty(0, dtype=np.float32)
+
+    def create_collection(self, name: str, dimension: int, distance_metric: str = "cosine", **kwargs) -> None:
+        """
+        벡터 컬렉션을 생성합니다.
+
+        Args:
+            name: 컬렉션 이름
+            dimension: 벡터 차원
+            distance_metric: 거리 메트릭 (cosine, l2, inner_product)
+            quantization: halfvec이면 벡터를 float16으로 저장합니다 (1/2 크기).
+                원본 벡터를 따로 보관하지 않으므로 점수는 float16 정밀도로 계산됩니다.
+        """
+        if distance_metric not in NUMPY_DISTANCE_METRICS:
+            raise ValueError(
+                f"Unsupported distance metric for numpy: {distance_metric}. Available: {list(NUMPY_DISTANCE_METRICS)}"
+            )
+        quantization = validate_quantization(kwargs.get("quantization"), dimension, supported=("halfvec",))
+
+        path = self._collection_path(name)
+        if (path / "meta.json").exists():
+            return
+
+        meta = {
+            "dimension": dimension,
+            "distance_metric": distance_metric,
+            "dtype": NUMPY_DTYPES[quantization],
+            "quantization": quantization,
+            "generation": 0,
+            "count": 0,
+            "deleted": 0,
+            "documents_size": 0,
+        }
+        path.mkdir(parents=True, exist_ok=True)
+        self._create_generation(path, meta)
+        self._write_meta(path, meta)
+
+    @staticmethod
+    def _create_generation(path: Path, meta: Dict[str, Any]) -> Path:
+        """meta의 세대 디렉토리에 빈 파일들을 만듭니다."""
+        generation_path = path / f"g{meta['generation']}"
+        generation_path.mkdir()
+        _create_npy(generation_path / "vectors.npy", (0, meta["dimension"]), meta["dtype"])
+        _create_npy(generation_path / "offsets.npy", (0,), "<i8")
+        _create_npy(generation_path / "deleted.npy", (0,), "<i8")
+        (generation_path / "documents.jsonl").touch()
+        return generation_path
+
+    def drop_collection(self, name: str) -> None:
+        """컬렉션을 삭제합니다."""
+        with self._collections_lock:
+            state = self._collections.pop(name, None)
+        if state is not None:
+            self._close_documents(state)
+        shutil.rmtree(self._collection_path(name), ignore_errors=True)
+
+    def collection_exists(self, name: str) -> bool:
+        """컬렉션이 존재하는지 확인합니다."""
+        return (self._collection_path(name) / "meta.json").exists()
+
+    def _prepare_vectors(self, meta: Dict[str, Any], embeddings: List[List[float]]):
+        """벡터 차원을 확인하고 cosine 컬렉션이면 정규화하여 저장 dtype으로 변환합니다."""
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape[1] != meta["dimension"]:
+            raise ValueError(f"Embedding dimension mismatch: expected {meta['dimension']}, got {vectors.shape[1:]}")
+        if meta["distance_metric"] == "cosine":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1, norms)
+        return vectors.astype(meta["dtype"])
+
+    def insert(self, collection_name: str, documents: List[Document], batch_size: int = 1000) -> int:
+        """문서들을 컬렉션 파일 끝에 덧붙입니다."""
+        return self._append(collection_name, documents, batch_size)
+
+    def _append(
+        self,
+        collection_name: str,
+        documents: List[Document],
+        batch_size: int,
+        checkpoint: Optional[ImportCheckpoint] = None,
+    ) -> int:
+        """checkpoint가 있으면 마지막 배치의 meta.json에 함께 기록합니다."""
+        if not documents:
+            if checkpoint is not None:
+                self._save_import_checkpoint(collection_name, checkpoint)
+            return 0
+
+        with self._write_lock(collection_name) as meta:
+            path = self._collection_path(collection_name) / f"g{meta['generation']}"
+
+            for start in range(0, len(documents), batch_size):
+                batch = documents[start : start + batch_size]
+                vectors = self._prepare_vectors(meta, [doc.embedding for doc in batch])
+
+                lines = [
+                    (
+                        json.dumps({"page_content": doc.page_content, "metadata": doc.metadata}, ensure_ascii=False)
+                        + "\n"
+                    ).encode("utf-8")
+                    for doc in batch
+                ]
+                offsets = meta["documents_size"] + np.cumsum([0] + [len(line) for line in lines[:-1]], dtype=np.int64)
+
+                with open(path / "documents.jsonl", "r+b") as f:
+                    f.truncate(meta["documents_size"])
+                    f.seek(0, os.SEEK_END)
+                    f.write(b"".join(lines))
+
+                count = meta["count"] + len(batch)
+                _append_npy(path / "offsets.npy", meta["count"], (count,), "<i8", offsets.astype("<i8").tobytes())
+                _append_npy(
+                    path / "vectors.npy",
+                    meta["count"],
+                    (count, meta["dimension"]),
+                    meta["dtype"],
+                    vectors.tobytes(),
+                )
+
+                # 데이터를 모두 쓴 뒤 meta.json을 교체해야 읽는 쪽에서 새 행이 보입니다.
+                meta["count"] = count
+                meta["documents_size"] += sum(len(line) for line in lines)
+                if checkpoint is not None and start + batch_size >= len(documents):
+                    meta.setdefault("import_checkpoints", {})[checkpoint.source] = asdict(checkpoint)
+                self._write_meta(self._collection_path(collection_name), meta)
+
+        return len(documents)
+
+    def get_import_checkpoint(self, collection_name: str, file_path: Path) -> Optional[ImportCheckpoint]:
+        """meta.json에 기록한 체크포인트를 읽습니다."""
+        with self._write_lock(collection_name) as meta:
+            checkpoint = meta.get("import_checkpoints", {}).get(checkpoint_source(file_path))
+        return ImportCheckpoint(**checkpoint) if checkpoint else None
+
+    def _save_import_checkpoint(self, collection_name: str, checkpoint: ImportCheckpoint) -> None:
+        with self._write_lock(collection_name) as meta:
+            meta.setdefault("import_checkpoints", {})[checkpoint.source] = asdict(checkpoint)
+            self._write_meta(self._collection_path(collection_name), meta)
+
+    def _delete_import_checkpoint(self, collection_name: str, source: str) -> None:
+        with self._write_lock(collection_name) as meta:
+            if meta.get("import_checkpoints", {}).pop(source, None) is not None:
+                self._write_meta(self._collection_path(collection_name), meta)
+
+    def _insert_import_batch(
+        self, collection_name: str, documents: List[Document], batch_size: int, checkpoint: ImportCheckpoint
+    ) -> int:
+        """
+        배치와 체크포인트를 meta.json 교체 한 번으로 커밋합니다.
+
+        meta.json을 교체하기 전에 중단되면 덧붙인 데이터는 다음 삽입에서 덮어쓰므로 행이 중복되지 않습니다.
+        """
+        return self._append(collection_name, documents, batch_size, checkpoint)
+
+    def _iter_snapshot_batches(self, collection_name: str, batch_size: int) -> Iterator[SnapshotBatch]:
+        """
+        삭제되지 않은 행을 파일 순서대로 batch_size행 범위씩 읽습니다.
+
+        cosine 컬렉션은 정규화하여 저장했으므로 정규화된 벡터를 내보냅니다.
+        """
+        state = self._get_collection(collection_name)
+        for start in range(0, state.count, batch_size):
+            end = min(start + batch_size, state.count)
+            live = ~state.deleted[start:end]
+            if not live.any():
+                continue
+
+            page_contents, metadatas = [], []
+            with state.documents_lock:
+                state.documents.seek(int(state.offsets[start]))
+                for is_live in live:
+                    line = state.documents.readline()
+                    if is_live:
+                        data = json.loads(line)
+                        page_contents.append(data["page_content"])
+                        metadatas.append(data["metadata"])
+
+            vectors = np.asarray(state.vectors[start:end], dtype=np.float32)
+            yield SnapshotBatch(page_contents, metadatas, vectors if live.all() else vectors[live])
+
+    def _live_rows(self, state: _CollectionState, filter: Optional[Dict[str, Any]]):
+        """필터에 매칭되는 삭제되지 않은 행 번호. filter가 없으면 None"""
+        if not filter:
+            return None
+        if state.metadata is None:
+            state.metadata = list(state.read_metadata(0))
+        mask = np.fromiter((matches_filter(metadata, filter) for metadata in state.metadata), bool, state.count)
+        return np.flatnonzero(mask & ~state.deleted)
+
+    def _iter_blocks(self, state: _CollectionState, rows) -> Iterator[Tuple[Any, Any, Any]]:
+        """(float32 벡터 블록, 행 번호, 삭제 여부) 블록. rows가 None이면 전체 행을 순서대로 읽습니다."""
+        chunk = self.search_chunk_rows
+        if rows is None:
+            for start in range(0, state.count, chunk):
+                end = min(start + chunk, state.count)
+                block = np.asarray(state.vectors[start:end], dtype=np.float32)
+                yield block, np.arange(start, end), state.deleted[start:end]
+        else:
+            for start in range(0, len(rows), chunk):
+                block_rows = rows[start : start + chunk]
+                yield np.asarray(state.vectors[block_rows], dtype=np.float32), block_rows, None
+
+    def _knn(self, state: _CollectionState, query_embeddings: List[List[float]], k: int, filter=None):
+        """
+        쿼리마다 가까운 k개의 (행 번호, 거리) 목록을 반환합니다.
+
+        블록마다 (블록 행 × 쿼리) 점수 행렬을 한 번의 행렬 곱으로 구하고 argpartition으로 상위 k개만 남깁니다.
+        점수는 클수록 가까우며, cosine과 inner_product는 내적, l2는 2·x·q - |x|² 입니다.
+        """
+        metric = state.meta["distance_metric"]
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.ndim != 2 or queries.shape[1] != state.meta["dimension"]:
+            raise ValueError(f"Query dimension mismatch: expected {state.meta['dimension']}, got {queries.shape[1:]}")
+        if metric == "cosine":
+            norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = queries / np.where(norms == 0, 1, norms)
+        elif metric == "l2" and state.sq_norms is None:
+            state.sq_norms = self._sq_norms(state)
+
+        rows = self._live_rows(state, filter)
+        top_scores, top_rows = [], []
+        for block, block_rows, block_deleted in self._iter_blocks(state, rows):
+            scores = block @ queries.T
+            if metric == "l2":
+                scores = 2 * scores - state.sq_norms[block_rows][:, None]
+            if block_deleted is not None and block_deleted.any():
+                scores[block_deleted] = -np.inf
+
+            if len(scores) > k:
+                part = np.argpartition(scores, len(scores) - k, axis=0)[len(scores) - k :]
+                scores = np.take_along_axis(scores, part, axis=0)
+                block_rows = block_rows[part]
+            else:
+                block_rows = np.broadcast_to(block_rows[:, None], scores.shape)
+            top_scores.append(scores)
+            top_rows.append(block_rows)
+
+        if not top_scores:
+            return [[] for __ in query_embeddings]
+
+        scores = np.concatenate(top_scores)
+        candidate_rows = np.concatenate(top_rows)
+        order = np.argsort(-scores, axis=0, kind="stable")[:k]
+
+        if metric == "cosine":
+            distances = 1 - scores
+        elif metric == "l2":
+            distances = np.sqrt(np.maximum((queries * queries).sum(axis=1) - scores, 0))
+        else:
+            distances = -scores
+
+        results = []
+        for j in range(len(queries)):
+            results.append(
+                [(int(candidate_rows[i, j]), float(distances[i, j])) for i in order[:, j] if np.isfinite(scores[i, j])]
+            )
+        return results
+
+    def _to_results(
+        self, state: _CollectionState, neighbors: List[Tuple[int, float]], threshold: Optional[float]
+    ) -> List[SearchResult]:
+        neighbors = [(row, 1 - distance) for row, distance in neighbors]
+        if threshold is not None:
+            neighbors = [(row, similarity) for row, similarity in neighbors if similarity >= threshold]
+        documents = state.read_documents([row for row, __ in neighbors])
+        return [SearchResult(document=doc, score=similarity) for doc, (__, similarity) in zip(documents, neighbors)]
+
+    def search(
+        self,
+        collection_name: str,
+        query_embedding: List[float],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        threshold: Optional[float] = None,
+    ) -> List[SearchResult]:
+        """
+        전체 벡터와의 거리를 계산하는 정확한 유사도 검색을 수행합니다.
+
+        필터가 있으면 매칭되는 행만 모아 거리를 계산합니다.
+        """
+        return self.search_many(collection_name, [query_embedding], k=k, filter=filter, threshold=threshold)[0]
+
+    def search_many(
+        self,
+        collection_name: str,
+        query_embeddings: List[List[float]],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        threshold: Optional[float] = None,
+    ) -> List[List[SearchResult]]:
+        """여러 쿼리를 (행 × 쿼리) 행렬 곱으로 한 번에 검색합니다."""
+        if not query_embeddings:
+            return []
+
+        state = self._get_collection(collection_name)
+        if k <= 0:
+            return [[] for __ in query_embeddings]
+
+        neighbors = self._knn(state, query_embeddings, k, filter)
+        return [self._to_results(state, query_neighbors, threshold) for query_neighbors in neighbors]
+
+    def delete(self, collection_name: str, filter: Dict[str, Any]) -> int:
+        """
+        필터에 매칭되는 문서의 행 번호를 삭제 목록에 덧붙입니다.
+
+        삭제된 행의 비율이 compaction_threshold를 넘으면 compact()로 파일을 다시 씁니다.
+        필터가 비어 있으면 빈 세대로 바꿔 모든 문서를 삭제합니다.
+        """
+        state = self._get_collection(collection_name)
+
+        if not filter:
+            deleted_count = state.live_count
+            self.compact(collection_name, rows=[])
+            return deleted_count
+
+        with self._write_lock(collection_name) as meta:
+            state = self._get_collection(collection_name)
+            rows = self._live_rows(state, filter)
+            if len(rows):
+                path = self._collection_path(collection_name) / f"g{meta['generation']}"
+                deleted = meta["deleted"] + len(rows)
+                _append_npy(path / "deleted.npy", meta["deleted"], (deleted,), "<i8", rows.astype("<i8").tobytes())
+                meta["deleted"] = deleted
+                self._write_meta(self._collection_path(collection_name), meta)
+
+        if meta["count"] and meta["deleted"] / meta["count"] > self.compaction_threshold:
+            self.compact(collection_name)
+
+        return len(rows)
+
+    def compact(self, collection_name: str, rows: Optional[List[int]] = None) -> int:
+        """
+        삭제되지 않은 행만으로 새 세대의 파일을 쓰고 meta.json을 교체합니다.
+
+        이전 세대 파일을 매핑하고 있는 다른 프로세스는 다음 요청에서 새 세대를 다시 매핑합니다.
+
+        Args:
+            collection_name: 대상 컬렉션
+            rows: 남길 행 번호. None이면 삭제되지 않은 모든 행
+
+        Returns:
+            남은 문서 수
+        """
+        path = self._collection_path(collection_name)
+
+        with self._write_lock(collection_name) as meta:
+            state = self._get_collection(collection_name)
+            if rows is None:
+                rows = np.flatnonzero(~state.deleted)
+            rows = np.asarray(rows, dtype=np.int64)
+
+            new_meta = dict(meta, generation=meta["generation"] + 1, count=len(rows), deleted=0, documents_size=0)
+            generation_path = self._create_generation(path, new_meta)
+
+            offsets = []
+            with (
+                open(generation_path / "documents.jsonl", "wb") as documents,
+                open(generation_path / "vectors.npy", "r+b") as vectors,
+            ):
+                vectors.seek(0, os.SEEK_END)
+                for start in range(0, len(rows), self.search_chunk_rows):
+                    block_rows = rows[start : start + self.search_chunk_rows]
+                    vectors.write(np.ascontiguousarray(state.vectors[block_rows]).tobytes())
+                    with state.documents_lock:
+                        for row in block_rows:
+                            state.documents.seek(int(state.offsets[row]))
+                            line = state.documents.readline()
+                            offsets.append(new_meta["documents_size"])
+                            new_meta["documents_size"] += len(line)
+                            documents.write(line)
+                vectors.seek(0)
+                vectors.write(npy_header((len(rows), meta["dimension"]), meta["dtype"]))
+
+            _append_npy(generation_path / "offsets.npy", 0, (len(rows),), "<i8", np.asarray(offsets, "<i8").tobytes())
+            self._write_meta(path, new_meta)
+
+        shutil.rmtree(state.path, ignore_errors=True)
+        logger.debug(f"Compacted '{collection_name}' to generation {new_meta['generation']} ({len(rows):,} rows)")
+        return len(rows)
+
+    def count(self, collection_name: str, filter: Optional[Dict[str, Any]] = None) -> int:
+        """컬렉션의 문서 수를 반환합니다."""
+        state = self._get_collection(collection_name)
+        if not filter:
+            return state.live_count
+        return len(self._live_rows(state, filter))
+
+    def get_collection_info(self, collection_name: str) -> Dict[str, Any]:
+        """컬렉션 정보를 반환합니다."""
+        state = self._get_collection(collection_name)
+        meta = state.meta
+
+        info = {
+            "name": collection_name,
+            "backend": self.backend_name,
+            "data_dir": str(self._collection_path(collection_name)),
+            "count": state.live_count,
+            "dimension": meta["dimension"],
+            "distance_metric": meta["distance_metric"],
+            "dtype": np.dtype(meta["dtype"]).name,
+            "deleted": meta["deleted"],
+            "generation": meta["generation"],
+        }
+        if meta.get("quantization"):
+            info["quantization"] = meta["quantization"]
+        info["size"] = _format_size(sum(f.stat().st_size for f in state.path.iterdir() if f.is_file()))
+        return info
+
+    def close(self) -> None:
+        """매핑한 파일과 문서 파일 핸들을 닫습니다."""
+        with self._collections_lock:
+            states, self._collections = self._collections, {}
+        for state in states.values():
+            self._close_documents(state)
+
+    @property
+    def backend_name(self) -> str:
+        """백엔드 이름을 반환합니다."""
+        return "numpy"
+
+    @property
+    def required_dependencies(self) -> List[str]:
+        """필요한 의존성 패키지 목록을 반환합니다."""
+        return ["numpy"]
@@ -0,0 +1,259 @@
+"""PostgreSQL 연결 풀."""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+def make_statement_name(prefix: str, sql: str) -> str:
+    """SQL 문장에서 서버 측 prepared statement 이름을 만듭니다."""
+    return f"pyhub_{prefix}_{hashlib.sha1(sql.encode('utf-8')).hexdigest()[:16]}"
+
+
+class _PooledConnection:
+    """풀에서 관리하는 연결과 연결별 prepared statement 목록"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.last_used = time.monotonic()
+        self.prepared: Set[str] = set()
+
+
+class PgConnectionPool:
+    """psycopg2 연결을 재사용하는 스레드 안전 연결 풀
+
+    - min_size개의 연결을 미리 열어 두고, 최대 max_size개까지 늘립니다.
+      모두 사용 중이면 timeout초 동안 반환을 기다립니다.
+    - pre_ping이 참이면 ping_interval초 이상 쉬었던 연결을 꺼낼 때 SELECT 1로 확인하고,
+      끊어졌으면 버리고 새로 연결합니다.
+    - 연결별로 PREPARE한 문장을 기억하여, 같은 SQL은 서버 측 prepared statement로 실행합니다.
+
+    fork된 자식 프로세스에서는 부모의 연결을 쓰지 않고 새로 연결합니다.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30,
+        pre_ping: bool = True,
+        ping_interval: float = 30,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if min_size > max_size:
+            raise ValueError("min_size must not be greater than max_size")
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.pre_ping = pre_ping
+        self.ping_interval = ping_interval
+
+        self._condition = threading.Condition()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._idle: Deque[_PooledConnection] = deque()
+        # id(연결) → 풀 연결 (prepared statement 조회용)
+        self._pooled: Dict[int, _PooledConnection] = {}
+        self._size = 0
+        self._closed = False
+        self._filled = False
+
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            # 부모 프로세스의 소켓을 닫으면 부모의 세션이 끊어지므로 버리기만 합니다.
+            logger.debug("Process forked. Discarding inherited PostgreSQL connections")
+            self._reset()
+
+    def _fill(self, count: int) -> None:
+        """미리 확보해 둔 count개의 자리에 연결을 엽니다. 잠금 밖에서 호출합니다."""
+        for reserved in range(count, 0, -1):
+            try:
+                pooled = self._open()
+            except BaseException:
+                # _open이 돌려준 자리 외에 아직 열지 않은 자리도 돌려줍니다.
+                with self._condition:
+                    self._size -= reserved - 1
+                    self._condition.notify_all()
+                raise
+            with self._condition:
+                self._idle.append(pooled)
+                self._condition.notify()
+
+    def _open(self) -> _PooledConnection:
+        """확보해 둔 자리에 새 연결을 엽니다. 잠금 밖에서 호출하며, 실패하면 자리를 돌려줍니다."""
+        try:
+            pooled = _PooledConnection(self._connect())
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._pooled[id(pooled.conn)] = pooled
+        return pooled
+
+    def _is_healthy(self, pooled: _PooledConnection) -> bool:
+        if pooled.conn.closed:
+            return False
+        if not self.pre_ping or time.monotonic() - pooled.last_used < self.ping_interval:
+            return True
+
+        try:
+            with pooled.conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            pooled.conn.rollback()
+            return True
+        except Exception as e:
+            logger.info(f"Discarding broken PostgreSQL connection: {e}")
+            return False
+
+    def _discard(self, pooled: _PooledConnection) -> None:
+        self._pooled.pop(id(pooled.conn), None)
+        try:
+            pooled.conn.close()
+        except Exception:
+            pass
+
+    def _drop(self, pooled: _PooledConnection) -> None:
+        """잠금 밖에서 꺼낸 연결을 버리고 자리를 돌려줍니다."""
+        with self._condition:
+            self._discard(pooled)
+            self._size -= 1
+            self._condition.notify()
+
+    def getconn(self) -> _PooledConnection:
+        deadline = time.monotonic() + self.timeout
+
+        with self._condition:
+            self._check_fork()
+            if self._closed:
+                raise RuntimeError("Connection pool is closed")
+            fill_count = 0
+            if not self._filled:
+                # min_size개의 자리를 먼저 확보하고, 연결은 잠금 밖에서 엽니다.
+                self._filled = True
+                fill_count = max(self.min_size - self._size, 0)
+                self._size += fill_count
+
+        if fill_count:
+            self._fill(fill_count)
+
+        # 잠금 안에서는 유휴 연결을 꺼내거나 새 연결 자리를 확보하기만 하고, ping과 연결은 잠금 밖에서 합니다.
+        while True:
+            with self._condition:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No PostgreSQL connection available within {self.timeout}s")
+                    self._condition.wait(remaining)
+
+                if self._idle:
+                    pooled = self._idle.pop()
+                else:
+                    # 연결하는 동안 다른 스레드가 기다리지 않도록 자리를 먼저 확보
+                    pooled = None
+                    self._size += 1
+
+            if pooled is None:
+                return self._open()
+
+            # 꺼낸 연결이 자리를 차지하고 있으므로 ping하는 동안 다른 스레드가 max_size를 넘겨 열지 않습니다.
+            try:
+                healthy = self._is_healthy(pooled)
+            except BaseException:
+                self._drop(pooled)
+                raise
+            if healthy:
+                return pooled
+            self._drop(pooled)
+
+    def putconn(self, pooled: _PooledConnection, discard: bool = False) -> None:
+        with self._condition:
+            if self._pid != os.getpid():
+                return
+
+            if discard or self._closed or pooled.conn.closed:
+                self._discard(pooled)
+                self._size -= 1
+            else:
+                pooled.last_used = time.monotonic()
+                self._idle.append(pooled)
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self):
+        """풀에서 연결을 빌려 사용합니다. 정상 종료 시 commit, 예외 발생 시 rollback합니다."""
+        pooled = self.getconn()
+        discard = False
+        try:
+            yield pooled.conn
+            pooled.conn.commit()
+        except BaseException:
+            try:
+                pooled.conn.rollback()
+            except Exception:
+                # 연결 자체가 끊어진 경우
+                discard = True
+            raise
+        finally:
+            self.putconn(pooled, discard=discard)
+
+    def close(self) -> None:
+        """유휴 연결을 모두 닫습니다. 사용 중인 연결은 반환될 때 닫힙니다."""
+        with self._condition:
+            if self._pid != os.getpid():
+                self._reset()
+                return
+
+            self._closed = True
+            while self._idle:
+                self._discard(self._idle.pop())
+                self._size -= 1
+            self._condition.notify_all()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {"size": self._size, "idle": len(self._idle), "max_size": self.max_size}
+
+    def prepare(self, cursor, prefix: str, sql: str, types: str) -> Optional[str]:
+        """
+        커서의 연결에 sql을 서버 측 prepared statement로 준비하고 이름을 반환합니다.
+
+        PREPARE는 트랜잭션과 무관하게 세션이 끝날 때까지 유지되므로 연결별로 한 번만 실행합니다.
+
+        Args:
+            cursor: 이 풀에서 빌린 연결의 커서
+            prefix: 문장 이름 접두사
+            sql: $1, $2 ... 위치 인자를 사용하는 SQL
+            types: 인자 타입 목록 (예: "vector, integer")
+
+        Returns:
+            prepared statement 이름. 이 풀의 연결이 아니면 None
+        """
+        pooled = self._pooled.get(id(getattr(cursor, "connection", None)))
+        if pooled is None:
+            return None
+
+        name = make_statement_name(prefix, sql)
+        if name not in pooled.prepared:
+            cursor.execute(f"PREPARE {name} ({types}) AS {sql}")
+            pooled.prepared.add(name)
+        return name
+
+
+__all__ = ["PgConnectionPool", "make_statement_name"]
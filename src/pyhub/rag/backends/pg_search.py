@@ -0,0 +1,113 @@
+"""pgvector 인덱스 검색 파라미터."""
+
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# hnsw.ef_search 최댓값
+PGVECTOR_MAX_EF_SEARCH = 1000
+
+# hnsw.ef_search 기본값. k가 이보다 크면 k에 맞춰 늘립니다.
+PGVECTOR_DEFAULT_EF_SEARCH = 40
+
+ITERATIVE_SCAN_MODES = ("off", "strict_order", "relaxed_order")
+
+
+@dataclass
+class PgSearchParams:
+    """
+    pgvector 인덱스 검색 파라미터
+
+    검색 트랜잭션 안에서 SET LOCAL로 적용되므로 다른 쿼리에 영향을 주지 않습니다.
+
+    Args:
+        ef_search: HNSW 검색 후보 수 (hnsw.ef_search). 클수록 정확하지만 느립니다.
+        probes: IVFFlat 검색 리스트 수 (ivfflat.probes). 클수록 정확하지만 느립니다.
+        iterative_scan: 반복 인덱스 스캔 (pgvector 0.8 이상). off, strict_order, relaxed_order 중 하나이며
+            True는 relaxed_order입니다. 켜면 WHERE 조건으로 걸러진 행이 많아도 LIMIT개를 채울 때까지 스캔을 이어갑니다.
+            IVFFlat은 strict_order를 지원하지 않으므로 relaxed_order로 적용합니다.
+        max_scan_tuples: 반복 스캔 시 HNSW가 방문할 최대 튜플 수 (hnsw.max_scan_tuples)
+        max_probes: 반복 스캔 시 IVFFlat이 확인할 최대 리스트 수 (ivfflat.max_probes)
+        rerank_factor: 양자화 인덱스 컬렉션에서 원본 벡터로 재정렬할 후보 수 배수 (k × rerank_factor)
+    """
+
+    ef_search: Optional[int] = None
+    probes: Optional[int] = None
+    iterative_scan: Optional[Union[str, bool]] = None
+    max_scan_tuples: Optional[int] = None
+    max_probes: Optional[int] = None
+    rerank_factor: Optional[float] = None
+
+    def __post_init__(self):
+        if self.iterative_scan is True:
+            self.iterative_scan = "relaxed_order"
+        elif self.iterative_scan is False:
+            self.iterative_scan = "off"
+
+        if self.iterative_scan is not None and self.iterative_scan not in ITERATIVE_SCAN_MODES:
+            raise ValueError(f"iterative_scan must be one of {ITERATIVE_SCAN_MODES}: {self.iterative_scan!r}")
+
+        if self.ef_search is not None and not 1 <= int(self.ef_search) <= PGVECTOR_MAX_EF_SEARCH:
+            raise ValueError(f"ef_search must be between 1 and {PGVECTOR_MAX_EF_SEARCH}: {self.ef_search}")
+
+        for name in ("ef_search", "probes", "max_scan_tuples", "max_probes"):
+            value = getattr(self, name)
+            if value is not None:
+                if int(value) < 1:
+                    raise ValueError(f"{name} must be a positive integer: {value}")
+                setattr(self, name, int(value))
+
+        if self.rerank_factor is not None:
+            if float(self.rerank_factor) < 1:
+                raise ValueError(f"rerank_factor must be at least 1: {self.rerank_factor}")
+            self.rerank_factor = float(self.rerank_factor)
+
+    @classmethod
+    def from_dict(cls, values: Optional[Dict[str, Any]]) -> "PgSearchParams":
+        """사전에서 검색 파라미터 항목만 골라 생성합니다."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in (values or {}).items() if key in names and value is not None})
+
+    def merge(self, other: Optional["PgSearchParams"]) -> "PgSearchParams":
+        """other에 지정된 값으로 덮어쓴 새 파라미터를 반환합니다."""
+        if other is None:
+            return self
+        values = asdict(self)
+        values.update({key: value for key, value in asdict(other).items() if value is not None})
+        return PgSearchParams(**values)
+
+    @property
+    def iterative(self) -> bool:
+        """반복 인덱스 스캔을 사용하는지 여부"""
+        return self.iterative_scan not in (None, "off")
+
+    def settings(self, k: Optional[int] = None) -> List[Tuple[str, str]]:
+        """
+        SET LOCAL로 적용할 (설정 이름, 값) 목록을 반환합니다.
+
+        HNSW는 ef_search개까지만 후보를 반환하므로 k가 주어지면 ef_search를 k 이상으로 맞춥니다.
+        """
+        settings = []
+
+        ef_search = max(self.ef_search or 0, k if k and k > PGVECTOR_DEFAULT_EF_SEARCH else 0)
+        if ef_search:
+            settings.append(("hnsw.ef_search", str(min(ef_search, PGVECTOR_MAX_EF_SEARCH))))
+        if self.probes is not None:
+            settings.append(("ivfflat.probes", str(self.probes)))
+        if self.iterative_scan is not None:
+            settings.append(("hnsw.iterative_scan", self.iterative_scan))
+            settings.append(("ivfflat.iterative_scan", "relaxed_order" if self.iterative else "off"))
+        if self.max_scan_tuples is not None:
+            settings.append(("hnsw.max_scan_tuples", str(self.max_scan_tuples)))
+        if self.max_probes is not None:
+            settings.append(("ivfflat.max_probes", str(self.max_probes)))
+
+        return settings
+
+
+def apply_search_settings(cursor, settings: List[Tuple[str, str]]) -> None:
+    """검색 파라미터를 현재 트랜잭션에 SET LOCAL로 적용합니다."""
+    for name, value in settings:
+        cursor.execute(f"SET LOCAL {name} = {value}")
+
+
+__all__ = ["ITERATIVE_SCAN_MODES", "PGVECTOR_MAX_EF_SEARCH", "PgSearchParams", "apply_search_settings"]
@@ -1,17 +1,174 @@
 """PostgreSQL pgvector backend implementation."""
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from .base import BaseVectorStore, Document, SearchResult
+from .hybrid import tokenize_query
+from .pg_copy import (
+    EMBEDDING_INDEXES_SQL,
+    CopyBinaryStream,
+    bulk_load,
+    copy_rows,
+    copy_sql,
+    decode_vectors,
+    get_embedding_indexes,
+)
+from .pg_pool import PgConnectionPool
+from .pg_search import PGVECTOR_MAX_EF_SEARCH, PgSearchParams, apply_search_settings
+from .pipeline import (
+    IMPORT_CHECKPOINT_TABLE_SQL,
+    ImportCheckpoint,
+    ImportProgress,
+    check_resume,
+    checkpoint_from_row,
+    checkpoint_source,
+    delete_checkpoint,
+    delete_checkpoint_sql,
+    iter_decoded_chunks,
+    iter_import_rows,
+    load_checkpoint,
+    load_checkpoint_sql,
+    save_checkpoint,
+    save_checkpoint_sql,
+)
+from .planner import CollectionStats, FilterPlan, FilterPlanner, matches_filter
+from .quantization import rerank_candidates, validate_quantization
+from .snapshot import SnapshotBatch
 
 logger = logging.getLogger(__name__)
 
+# 메타데이터 컬럼 타입 → PostgreSQL 타입 (jsonb는 GIN, 나머지는 B-tree 인덱스)
+PGVECTOR_COLUMN_TYPES = {
+    "text": "text",
+    "str": "text",
+    "integer": "bigint",
+    "int": "bigint",
+    "float": "double precision",
+    "boolean": "boolean",
+    "bool": "boolean",
+    "jsonb": "jsonb",
+    "list": "jsonb",
+    "dict": "jsonb",
+}
+
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# 인덱스에 사용할 수 있는 양자화 방식 (int8은 pgvector에 타입이 없음)
+PGVECTOR_QUANTIZATIONS = ("halfvec", "binary")
+
+# 비동기 COPY 적재 시 한 번에 전송할 바이트 수
+COPY_CHUNK_SIZE = 1 << 20
+
+# 전문 검색용 tsvector 생성 컬럼
+LEXICAL_COLUMN = "page_content_tsv"
+
+# 전문 검색 기본 텍스트 검색 구성. PostgreSQL에는 한국어 구성이 없으므로 공백 단위로 나누는 simple을 사용합니다.
+DEFAULT_TEXT_SEARCH_CONFIG = "simple"
+
+# 거리 메트릭 → 인덱스 연산자 클래스
+PGVECTOR_DISTANCE_OPS = {"cosine": "vector_cosine_ops", "l2": "vector_l2_ops", "inner_product": "vector_ip_ops"}
+
+
+def _normalize_metadata_columns(metadata_columns: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """{키: 타입} 사전을 검증하여 PostgreSQL 컬럼 타입으로 변환합니다."""
+    normalized = {}
+    for column, column_type in (metadata_columns or {}).items():
+        if not _IDENTIFIER_PATTERN.match(column) or column.lower() in ("id", "embedding", "page_content", "metadata"):
+            raise ValueError(f"Invalid metadata column name: {column}")
+
+        type_name = getattr(column_type, "__name__", column_type)
+        if type_name not in PGVECTOR_COLUMN_TYPES:
+            raise ValueError(f"Unsupported metadata column type for '{column}': {column_type}")
+        normalized[column] = PGVECTOR_COLUMN_TYPES[type_name]
+    return normalized
+
+
+def _generated_column_expression(key: str, pg_type: str) -> str:
+    """metadata JSONB에서 키 값을 꺼내는 생성 컬럼 식
+
+    타입이 맞지 않는 값은 삽입 오류 대신 NULL이 되도록 jsonb_typeof로 확인합니다.
+    """
+    value = f"metadata->'{key}'"
+    text = f"metadata->>'{key}'"
+    if pg_type == "jsonb":
+        return value
+    if pg_type == "text":
+        return f"CASE WHEN jsonb_typeof({value}) = 'string' THEN {text} END"
+    if pg_type == "bigint":
+        return f"CASE WHEN jsonb_typeof({value}) = 'number' AND {text} ~ '^-?[0-9]+$' THEN ({text})::bigint END"
+    if pg_type == "double precision":
+        return f"CASE WHEN jsonb_typeof({value}) = 'number' THEN ({text})::double precision END"
+    if pg_type == "boolean":
+        return f"CASE WHEN jsonb_typeof({value}) = 'boolean' THEN ({text})::boolean END"
+    raise ValueError(f"Unsupported column type: {pg_type}")
+
+
+def _quantized_expression(quantization: str, dimension: int, value: str = "embedding") -> str:
+    """양자화 인덱스 식. 인덱스와 검색 쿼리에서 같은 식을 사용해야 인덱스가 사용됩니다."""
+    if quantization == "halfvec":
+        return f"({value})::halfvec({dimension})"
+    return f"binary_quantize({value})::bit({dimension})"
+
+
+def _parse_quantization(index_def: str) -> Optional[Tuple[str, int]]:
+    """인덱스 정의에서 (양자화 방식, 차원)을 읽습니다. 양자화 인덱스가 아니면 None"""
+    match = re.search(r"binary_quantize\(.*?::bit\((\d+)\)", index_def)
+    if match:
+        return "binary", int(match.group(1))
+    match = re.search(r"::halfvec\((\d+)\)", index_def)
+    if match:
+        return "halfvec", int(match.group(1))
+    return None
+
 
 class PgVectorStore(BaseVectorStore):
     """PostgreSQL pgvector 벡터 스토어 백엔드."""
 
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+
+        # 필터 검색 플래너와 컬렉션별 통계 (HNSW 후보 수는 ef_search 최댓값으로 제한)
+        self.planner = FilterPlanner.from_config(self.config, max_fetch_k=PGVECTOR_MAX_EF_SEARCH)
+        self._stats: Dict[str, CollectionStats] = {}
+
+        # 컬렉션 이름 → 승격된 메타데이터 컬럼 {키: 타입}
+        self._metadata_columns: Dict[str, Dict[str, str]] = {}
+
+        # 컬렉션 이름 → 양자화 인덱스 (양자화 방식, 차원). 양자화 인덱스가 없으면 None
+        self._quantization: Dict[str, Optional[Tuple[str, int]]] = {}
+
+        # 컬렉션 이름 → 전문 검색 컬럼 존재 여부
+        self._lexical: Dict[str, bool] = {}
+
+        # 연결 풀 (pool_min_size, pool_max_size, pool_timeout, pool_pre_ping, pool_ping_interval)
+        self.pool = PgConnectionPool(
+            self._get_connection,
+            min_size=self.config.get("pool_min_size", 1),
+            max_size=self.config.get("pool_max_size", 10),
+            timeout=self.config.get("pool_timeout", 30),
+            pre_ping=self.config.get("pool_pre_ping", True),
+            ping_interval=self.config.get("pool_ping_interval", 30),
+        )
+        # 검색/삽입 SQL을 서버 측 prepared statement로 실행할지 여부
+        self.prepared_statements = self.config.get("prepared_statements", True)
+        # 이 개수 이상의 문서를 insert하면 COPY BINARY로 적재
+        self.copy_threshold = self.config.get("copy_threshold", 1000)
+        self._async_pool = None
+
+        # 인덱스 검색 파라미터: 설정의 ef_search 등은 기본값, collection_search_params는 컬렉션별 값
+        self.search_params = PgSearchParams.from_dict(self.config)
+        self._collection_search_params: Dict[str, PgSearchParams] = {
+            name: PgSearchParams.from_dict(params)
+            for name, params in self.config.get("collection_search_params", {}).items()
+        }
+
     def _validate_config(self) -> None:
         """설정을 검증합니다."""
         if "database_url" not in self.config:
@@ -46,7 +203,7 @@ class PgVectorStore(BaseVectorStore):
         return f"postgresql://{auth}{host}:{port}/{dbname}"
 
     def _get_connection(self):
-        """데이터베이스 연결을 반환합니다."""
+        """새 데이터베이스 연결을 엽니다. 연결 풀이 새 연결이 필요할 때 호출합니다."""
         try:
             import psycopg2
         except ImportError:
@@ -54,18 +211,30 @@ class PgVectorStore(BaseVectorStore):
 
         return psycopg2.connect(self.config["database_url"])
 
+    @contextmanager
+    def _cursor(self):
+        """풀에서 빌린 연결의 커서. 정상 종료 시 commit, 예외 발생 시 rollback 후 연결을 풀에 반환합니다."""
+        with self.pool.connection() as conn:
+            with conn.cursor() as cursor:
+                yield cursor
+
+    def _prepare(self, cursor, prefix: str, sql: str, types: str) -> Optional[str]:
+        """sql을 서버 측 prepared statement로 준비하고 이름을 반환합니다. 사용하지 않으면 None"""
+        if not self.prepared_statements:
+            return None
+        return self.pool.prepare(cursor, prefix, sql, types)
+
+    def close(self) -> None:
+        """연결 풀의 연결을 모두 닫습니다."""
+        self.pool.close()
+
     def is_available(self) -> bool:
         """백엔드가 사용 가능한지 확인합니다."""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # pgvector 확장 확인
-            cursor.execute("SELECT installed_version FROM pg_available_extensions WHERE name = 'vector'")
-            result = cursor.fetchone()
-
-            cursor.close()
-            conn.close()
+            with self._cursor() as cursor:
+                # pgvector 확장 확인
+                cursor.execute("SELECT installed_version FROM pg_available_extensions WHERE name = 'vector'")
+                result = cursor.fetchone()
 
             return result is not None and result[0] is not None
 
@@ -76,17 +245,27 @@ class PgVectorStore(BaseVectorStore):
     def create_collection(
         self, name: str, dimension: int, distance_metric: str = "cosine", index_type: str = "hnsw", **kwargs
     ) -> None:
-        """벡터 컬렉션(테이블)을 생성합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        # 거리 함수 매핑
-        distance_ops = {"cosine": "vector_cosine_ops", "l2": "vector_l2_ops", "inner_product": "vector_ip_ops"}
-
-        if distance_metric not in distance_ops:
+        """
+        벡터 컬렉션(테이블)을 생성합니다.
+
+        quantization을 지정하면 원본 embedding 대신 양자화한 식에 인덱스를 만듭니다.
+        검색은 양자화 인덱스로 후보를 가져온 뒤 원본 벡터로 다시 정렬합니다.
+
+        Args:
+            name: 컬렉션 이름
+            dimension: 벡터 차원
+            distance_metric: 거리 메트릭 (cosine, l2, inner_product)
+            index_type: hnsw 또는 ivfflat
+            quantization: halfvec (인덱스 크기 1/2) 또는 binary (1/32, 차원은 8의 배수)
+            lists: ivfflat 리스트 수
+            metadata_columns: 승격할 메타데이터 키 {키: 타입}
+            lexical_index: 참이면 전문 검색용 tsvector 생성 컬럼과 GIN 인덱스를 함께 만듭니다.
+        """
+        if distance_metric not in PGVECTOR_DISTANCE_OPS:
             raise ValueError(f"Invalid distance metric: {distance_metric}")
+        quantization = validate_quantization(kwargs.get("quantization"), dimension, supported=PGVECTOR_QUANTIZATIONS)
 
-        try:
+        with self._cursor() as cursor:
             # 테이블 생성
             create_sql = f"""
             CREATE TABLE IF NOT EXISTS {name} (
@@ -99,78 +278,303 @@ class PgVectorStore(BaseVectorStore):
             cursor.execute(create_sql)
 
             # 인덱스 생성
-            if index_type == "hnsw":
-                index_sql = f"""
-                CREATE INDEX IF NOT EXISTS {name}_embedding_idx 
-                ON {name} 
-                USING hnsw (embedding {distance_ops[distance_metric]})
-                """
-            else:  # ivfflat
-                lists = kwargs.get("lists", 100)
-                index_sql = f"""
-                CREATE INDEX IF NOT EXISTS {name}_embedding_idx 
-                ON {name} 
-                USING ivfflat (embedding {distance_ops[distance_metric]})
-                WITH (lists = {lists})
-                """
+            self._create_index(
+                cursor, name, dimension, distance_metric, index_type, quantization, lists=kwargs.get("lists", 100)
+            )
 
-            cursor.execute(index_sql)
-            conn.commit()
+            # 자주 필터링하는 메타데이터 키를 생성 컬럼으로 승격
+            self._add_metadata_columns(cursor, name, _normalize_metadata_columns(kwargs.get("metadata_columns")))
 
-        finally:
-            cursor.close()
-            conn.close()
+            if kwargs.get("lexical_index"):
+                self._add_lexical_column(cursor, name)
+
+        self._metadata_columns.pop(name, None)
+        self._quantization.pop(name, None)
+        self._lexical.pop(name, None)
+
+    def _create_index(
+        self,
+        cursor,
+        name: str,
+        dimension: int,
+        distance_metric: str,
+        index_type: str,
+        quantization: Optional[str],
+        lists: int = 100,
+    ) -> None:
+        """embedding(또는 양자화 식)에 HNSW/IVFFlat 인덱스를 생성합니다."""
+        if quantization is None:
+            column, opclass = "embedding", PGVECTOR_DISTANCE_OPS[distance_metric]
+        elif quantization == "halfvec":
+            column = f"({_quantized_expression(quantization, dimension)})"
+            opclass = PGVECTOR_DISTANCE_OPS[distance_metric].replace("vector_", "halfvec_")
+        else:
+            # 이진 양자화 벡터는 해밍 거리로 후보를 고릅니다.
+            column, opclass = f"({_quantized_expression(quantization, dimension)})", "bit_hamming_ops"
+
+        if index_type == "hnsw":
+            index_sql = f"""
+            CREATE INDEX IF NOT EXISTS {name}_embedding_idx 
+            ON {name} 
+            USING hnsw ({column} {opclass})
+            """
+        else:  # ivfflat
+            index_sql = f"""
+            CREATE INDEX IF NOT EXISTS {name}_embedding_idx 
+            ON {name} 
+            USING ivfflat ({column} {opclass})
+            WITH (lists = {lists})
+            """
+
+        cursor.execute(index_sql)
+
+    def quantize_collection(
+        self,
+        collection_name: str,
+        quantization: Optional[str],
+        distance_metric: Optional[str] = None,
+        index_type: str = "hnsw",
+        lists: int = 100,
+    ) -> None:
+        """
+        기존 컬렉션의 벡터 인덱스를 양자화 인덱스로 다시 만듭니다.
+
+        원본 embedding 컬럼은 그대로 두므로 재정렬 정확도는 유지되며, quantization이 None이면
+        원본 벡터 인덱스로 되돌립니다. 인덱스를 다시 만드는 동안 테이블 쓰기가 잠깁니다.
+        """
+        distance_metric = distance_metric or self.config.get("distance_metric", "cosine")
+        if distance_metric not in PGVECTOR_DISTANCE_OPS:
+            raise ValueError(f"Invalid distance metric: {distance_metric}")
+
+        with self._cursor() as cursor:
+            # vector(N) 컬럼의 atttypmod가 차원
+            cursor.execute(
+                "SELECT atttypmod FROM pg_attribute WHERE attrelid = %s::regclass AND attname = 'embedding'",
+                (collection_name,),
+            )
+            row = cursor.fetchone()
+            if row is None or row[0] <= 0:
+                raise ValueError(f"Cannot detect embedding dimension of '{collection_name}'")
+            dimension = row[0]
+            validate_quantization(quantization, dimension, supported=PGVECTOR_QUANTIZATIONS)
+
+            for index_name, __ in get_embedding_indexes(cursor, collection_name):
+                cursor.execute(f"DROP INDEX {index_name}")
+            if self.config.get("maintenance_work_mem"):
+                cursor.execute(
+                    "SELECT set_config('maintenance_work_mem', %s, true)", (self.config["maintenance_work_mem"],)
+                )
+            self._create_index(cursor, collection_name, dimension, distance_metric, index_type, quantization, lists)
+
+        self._quantization.pop(collection_name, None)
+        logger.info(f"Rebuilt vector index of '{collection_name}' (quantization={quantization})")
+
+    def get_quantization(self, collection_name: str) -> Optional[Tuple[str, int]]:
+        """컬렉션 벡터 인덱스의 (양자화 방식, 차원)을 반환합니다. 양자화 인덱스가 없으면 None"""
+        if collection_name not in self._quantization:
+            with self._cursor() as cursor:
+                return self._get_quantization(cursor, collection_name)
+        return self._quantization[collection_name]
+
+    def _get_quantization(self, cursor, collection_name: str) -> Optional[Tuple[str, int]]:
+        if collection_name not in self._quantization:
+            quantization = None
+            for __, index_def in get_embedding_indexes(cursor, collection_name):
+                quantization = _parse_quantization(index_def)
+                if quantization is not None:
+                    break
+            self._quantization[collection_name] = quantization
+        return self._quantization[collection_name]
 
     def drop_collection(self, name: str) -> None:
         """컬렉션을 삭제합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
+        with self._cursor() as cursor:
             cursor.execute(f"DROP TABLE IF EXISTS {name}")
-            conn.commit()
-        finally:
-            cursor.close()
-            conn.close()
+            delete_checkpoint(cursor, name, placeholder="%s")
+
+        self._stats.pop(name, None)
+        self._metadata_columns.pop(name, None)
+        self._quantization.pop(name, None)
+        self._lexical.pop(name, None)
 
     def collection_exists(self, name: str) -> bool:
         """컬렉션이 존재하는지 확인합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
+        with self._cursor() as cursor:
             cursor.execute("SELECT EXISTS (SELECT 1 FROM information_schema.tables WHERE table_name = %s)", (name,))
             return cursor.fetchone()[0]
-        finally:
-            cursor.close()
-            conn.close()
 
     def insert(self, collection_name: str, documents: List[Document], batch_size: int = 1000) -> int:
-        """문서들을 컬렉션에 삽입합니다."""
+        """문서들을 컬렉션에 삽입합니다. copy_threshold개 이상이면 COPY BINARY로 적재합니다."""
         import psycopg2.extras
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        if len(documents) >= self.copy_threshold:
+            return self.bulk_insert(collection_name, documents)
 
-        try:
-            data = [(doc.page_content, json.dumps(doc.metadata), doc.embedding) for doc in documents]
+        data = [(doc.page_content, json.dumps(doc.metadata), doc.embedding) for doc in documents]
 
-            psycopg2.extras.execute_batch(
+        with self._cursor() as cursor:
+            name = self._prepare(
                 cursor,
-                f"""
+                "insert",
+                f"INSERT INTO {collection_name} (page_content, metadata, embedding) VALUES ($1, $2, $3)",
+                "text, jsonb, vector",
+            )
+            if name is not None:
+                sql = f"EXECUTE {name} (%s, %s::jsonb, %s::vector)"
+            else:
+                sql = f"""
                 INSERT INTO {collection_name} (page_content, metadata, embedding)
                 VALUES (%s, %s::jsonb, %s::vector)
-                """,
-                data,
-                page_size=batch_size,
+                """
+
+            psycopg2.extras.execute_batch(cursor, sql, data, page_size=batch_size)
+
+        self._update_stats(collection_name, len(documents))
+        return len(documents)
+
+    def bulk_insert(self, collection_name: str, documents: Iterable[Document], rebuild_index: bool = False) -> int:
+        """
+        COPY ... FROM STDIN (FORMAT BINARY)로 문서를 적재합니다.
+
+        documents는 이터레이터여도 되며, 한 번에 하나씩 인코딩하여 스트리밍합니다.
+
+        Args:
+            collection_name: 대상 컬렉션
+            documents: 적재할 문서들
+            rebuild_index: 적재 전에 벡터 인덱스를 삭제하고 적재 후 다시 생성할지 여부.
+                수백만 건 이상을 적재할 때 사용하세요. 적재하는 동안 테이블이 잠깁니다.
+
+        Returns:
+            적재한 문서 수
+        """
+        rows = ((doc.page_content, doc.metadata, doc.embedding) for doc in documents)
+        return self._bulk_load(collection_name, rows, rebuild_index=rebuild_index)
+
+    def import_jsonl(
+        self,
+        collection_name: str,
+        file_path: Path,
+        batch_size: int = 1000,
+        clear_existing: bool = False,
+        rebuild_index: bool = False,
+        workers: Optional[int] = None,
+        progress: Optional[Callable[[ImportProgress], None]] = None,
+        resume: bool = False,
+    ) -> int:
+        """
+        JSONL 파일을 COPY BINARY로 임포트합니다.
+
+        JSON 디코딩은 workers개 프로세스에서 batch_size줄씩 병렬로 처리하고, 배치마다 COPY와
+        체크포인트 기록을 한 트랜잭션으로 커밋하므로 중단되면 resume=True로 이어서 임포트할 수 있습니다.
+
+        rebuild_index를 지정하면 인덱스를 한 번만 다시 만들도록 전체 임포트를 하나의 트랜잭션으로 실행합니다.
+        이때는 중단되면 모두 롤백되므로 처음부터 (또는 이전 체크포인트부터) 다시 임포트합니다.
+        """
+        if not rebuild_index:
+            return super().import_jsonl(
+                collection_name,
+                file_path,
+                batch_size,
+                clear_existing,
+                workers=workers,
+                progress=progress,
+                resume=resume,
             )
 
-            conn.commit()
-            return len(documents)
+        file_path = Path(file_path)
+        checkpoint = self._begin_import(collection_name, file_path, clear_existing, resume)
+        if checkpoint.completed:
+            return 0
+
+        stats = ImportProgress(
+            file_path, name=collection_name, start_offset=checkpoint.offset, start_line=checkpoint.line + 1
+        )
+        rows = iter_import_rows(file_path, stats, batch_size, workers=workers, progress=progress, checkpoint=checkpoint)
+        with self._cursor() as cursor:
+            total = bulk_load(
+                cursor,
+                collection_name,
+                rows,
+                rebuild_index=True,
+                maintenance_work_mem=self.config.get("maintenance_work_mem"),
+            )
+            checkpoint = replace(
+                checkpoint, offset=stats.offset, line=stats.line, rows=checkpoint.rows + total, completed=True
+            )
+            save_checkpoint(cursor, collection_name, checkpoint, placeholder="%s")
+
+        self._update_stats(collection_name, total)
+        return total
+
+    def get_import_checkpoint(self, collection_name: str, file_path: Path) -> Optional[ImportCheckpoint]:
+        """컬렉션과 같은 DB의 체크포인트 테이블에서 읽습니다."""
+        with self._cursor() as cursor:
+            return load_checkpoint(cursor, collection_name, checkpoint_source(file_path), placeholder="%s")
+
+    def _save_import_checkpoint(self, collection_name: str, checkpoint: ImportCheckpoint) -> None:
+        with self._cursor() as cursor:
+            save_checkpoint(cursor, collection_name, checkpoint, placeholder="%s")
+
+    def _delete_import_checkpoint(self, collection_name: str, source: str) -> None:
+        with self._cursor() as cursor:
+            delete_checkpoint(cursor, collection_name, source, placeholder="%s")
+
+    def _insert_import_batch(
+        self, collection_name: str, documents: List[Document], batch_size: int, checkpoint: ImportCheckpoint
+    ) -> int:
+        """배치를 COPY BINARY로 적재하고 같은 트랜잭션에서 체크포인트를 기록합니다."""
+        with self._cursor() as cursor:
+            copied = copy_rows(
+                cursor, collection_name, ((doc.page_content, doc.metadata, doc.embedding) for doc in documents)
+            )
+            save_checkpoint(cursor, collection_name, checkpoint, placeholder="%s")
 
-        finally:
-            cursor.close()
-            conn.close()
+        self._update_stats(collection_name, copied)
+        return copied
+
+    def _bulk_load(self, collection_name: str, rows, rebuild_index: bool = False, **kwargs) -> int:
+        with self._cursor() as cursor:
+            total = bulk_load(
+                cursor,
+                collection_name,
+                rows,
+                rebuild_index=rebuild_index,
+                maintenance_work_mem=self.config.get("maintenance_work_mem"),
+                **kwargs,
+            )
+
+        self._update_stats(collection_name, total)
+        return total
+
+    def _iter_snapshot_batches(self, collection_name: str, batch_size: int) -> Iterator[SnapshotBatch]:
+        """
+        서버 측 커서(named cursor)로 id 순서대로 batch_size행씩 읽습니다.
+
+        벡터는 텍스트 대신 vector_send의 바이너리 형식으로 받아 한 번에 float32 행렬로 변환합니다.
+        하나의 트랜잭션에서 읽으므로 내보내는 동안 삽입/삭제된 행은 포함되지 않습니다.
+        """
+        with self.pool.connection() as conn:
+            with conn.cursor(name=f"pyhub_export_{collection_name}") as cursor:
+                cursor.itersize = batch_size
+                cursor.execute(
+                    f"SELECT page_content, metadata, vector_send(embedding) FROM {collection_name} ORDER BY id"
+                )
+                while rows := cursor.fetchmany(batch_size):
+                    yield SnapshotBatch(
+                        [row[0] for row in rows],
+                        [row[1] or {} for row in rows],
+                        decode_vectors([row[2] for row in rows]),
+                    )
+
+    def _restore_batches(self, collection_name: str, batches: Iterator[SnapshotBatch], batch_size: int) -> int:
+        """모든 배치를 하나의 COPY BINARY 스트림으로 적재합니다."""
+        return self._bulk_load(collection_name, (row for batch in batches for row in batch.rows()))
+
+    def _update_stats(self, collection_name: str, inserted: int) -> None:
+        stats = self._stats.get(collection_name)
+        if stats is not None:
+            stats.total += inserted
+            stats.changed += inserted
 
     def search(
         self,
@@ -179,118 +583,1147 @@ class PgVectorStore(BaseVectorStore):
         k: int = 10,
         filter: Optional[Dict[str, Any]] = None,
         threshold: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        iterative_scan: Optional[Union[str, bool]] = None,
+        rerank_factor: Optional[float] = None,
     ) -> List[SearchResult]:
-        """유사도 검색을 수행합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        """
+        유사도 검색을 수행합니다.
+
+        필터가 있으면 플래너(plan_search)가 추정 선택도에 따라 검색 방식을 고릅니다.
+
+        - 선택적인 필터: 필터를 먼저 적용하고 남은 행과 정확한 거리를 계산합니다.
+        - 넓은 필터: 벡터 인덱스로 후보를 더 많이 가져와(over-fetch) 필터링하고,
+          k개가 되지 않으면 후보 수를 늘려 다시 조회합니다.
+          반복 인덱스 스캔(iterative_scan)을 켜면 필터를 SQL에 넣고 인덱스 스캔이 k개를 채우도록 합니다.
+
+        ef_search, probes, iterative_scan은 이 검색에만 SET LOCAL로 적용되며,
+        지정하지 않으면 set_search_params로 지정한 컬렉션별 값, 백엔드 설정 값 순서로 사용합니다.
+
+        양자화 인덱스가 있는 컬렉션은 양자화 벡터로 k × rerank_factor개의 후보를 가져온 뒤
+        원본 벡터와의 거리로 다시 정렬합니다. rerank_factor가 클수록 재현율이 높아집니다.
+        """
+        params = self.get_search_params(
+            collection_name,
+            PgSearchParams(
+                ef_search=ef_search, probes=probes, iterative_scan=iterative_scan, rerank_factor=rerank_factor
+            ),
+        )
+        plan = self.plan_search(collection_name, k, filter) if filter else None
+        distance_func = self._distance_func()
+
+        with self._cursor() as cursor:
+            if plan is None:
+                rows = self._ann_search(cursor, collection_name, distance_func, query_embedding, k, params=params)
+            elif plan.strategy == "exact":
+                rows = self._exact_search(cursor, collection_name, distance_func, query_embedding, k, filter)
+            elif params.iterative:
+                rows = self._filtered_ann_search(
+                    cursor, collection_name, distance_func, query_embedding, k, filter, params
+                )
+            else:
+                rows = self._overfetch_search(
+                    cursor, collection_name, distance_func, query_embedding, k, filter, plan.fetch_k, params=params
+                )
+
+        return self._to_results(rows, threshold)
+
+    def search_many(
+        self,
+        collection_name: str,
+        query_embeddings: List[List[float]],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        threshold: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        iterative_scan: Optional[Union[str, bool]] = None,
+        rerank_factor: Optional[float] = None,
+    ) -> List[List[SearchResult]]:
+        """
+        여러 쿼리 임베딩을 한 번의 쿼리로 검색합니다.
+
+        unnest(...) WITH ORDINALITY로 쿼리 벡터를 펼치고 LATERAL 조인으로 쿼리마다 k-NN 검색을 실행하므로
+        쿼리 수와 관계없이 데이터베이스 왕복은 한 번입니다. 필터 처리, 검색 파라미터, 양자화 재정렬은 search와 같습니다.
+        넓은 필터의 over-fetch 검색에서 k개를 채우지 못한 쿼리만 같은 트랜잭션에서 개별로 다시 조회합니다.
+        """
+        if not query_embeddings:
+            return []
+
+        params = self.get_search_params(
+            collection_name,
+            PgSearchParams(
+                ef_search=ef_search, probes=probes, iterative_scan=iterative_scan, rerank_factor=rerank_factor
+            ),
+        )
+        plan = self.plan_search(collection_name, k, filter) if filter else None
+        distance_func = self._distance_func()
+
+        with self._cursor() as cursor:
+            quantization = self._get_quantization(cursor, collection_name)
+            if plan is None:
+                rows = self._search_many_rows(
+                    cursor, collection_name, distance_func, query_embeddings, k, params, quantization
+                )
+            elif plan.strategy == "exact" or params.iterative:
+                conditions, filter_params = self._filter_conditions(cursor, collection_name, filter)
+                rows = self._search_many_rows(
+                    cursor,
+                    collection_name,
+                    distance_func,
+                    query_embeddings,
+                    k,
+                    params,
+                    quantization,
+                    conditions=conditions,
+                    filter_params=filter_params,
+                    exact=plan.strategy == "exact",
+                )
+            else:
+                candidates = self._search_many_rows(
+                    cursor, collection_name, distance_func, query_embeddings, plan.fetch_k, params, quantization
+                )
+                rows = []
+                for query_embedding, query_rows in zip(query_embeddings, candidates):
+                    matched = [row for row in query_rows if matches_filter(row[1], filter)]
+                    if len(matched) < k and len(query_rows) >= plan.fetch_k:
+                        fetch_k = self.planner.next_fetch_k(k, plan.fetch_k, len(matched))
+                        if fetch_k > self.planner.max_fetch_k:
+                            matched = self._exact_search(
+                                cursor, collection_name, distance_func, query_embedding, k, filter
+                            )
+                        else:
+                            matched = self._overfetch_search(
+                                cursor, collection_name, distance_func, query_embedding, k, filter, fetch_k, params
+                            )
+                    rows.append(matched[:k])
+
+        return [self._to_results(query_rows, threshold) for query_rows in rows]
+
+    def _search_many_rows(
+        self,
+        cursor,
+        collection_name: str,
+        distance_func: str,
+        query_embeddings: List[List[float]],
+        k: int,
+        params: PgSearchParams,
+        quantization: Optional[Tuple[str, int]] = None,
+        conditions: Optional[List[str]] = None,
+        filter_params: Optional[List[Any]] = None,
+        exact: bool = False,
+    ) -> List[List[tuple]]:
+        """LATERAL 조인 검색을 실행하고 결과를 쿼리별로 나눕니다."""
+        limits = [k]
+        if exact:
+            quantization = None
+        elif quantization is not None:
+            candidates = rerank_candidates(k, params.rerank_factor, PGVECTOR_MAX_EF_SEARCH)
+            limits = [candidates, k]
+            apply_search_settings(cursor, params.settings(candidates))
+        else:
+            apply_search_settings(cursor, params.settings(k))
+
+        vectors = ["[" + ",".join(str(float(value)) for value in embedding) + "]" for embedding in query_embeddings]
+        filter_params = list(filter_params or [])
+        sql_params = [*filter_params, vectors, *limits] if exact else [vectors, *filter_params, *limits]
+        cursor.execute(
+            self._search_many_sql(collection_name, distance_func, conditions, quantization, exact), sql_params
+        )
+
+        rows: List[List[tuple]] = [[] for __ in query_embeddings]
+        for ordinality, content, metadata, distance in cursor.fetchall():
+            rows[ordinality - 1].append((content, metadata, distance))
+        return rows
+
+    @staticmethod
+    def _search_many_sql(
+        collection_name: str,
+        distance_func: str,
+        conditions: Optional[List[str]] = None,
+        quantization: Optional[Tuple[str, int]] = None,
+        exact: bool = False,
+    ) -> str:
+        """
+        여러 쿼리 벡터의 LATERAL 조인 k-NN 검색 SQL
+
+        exact가 참이면 _exact_sql처럼 MATERIALIZED CTE로 필터 결과를 먼저 확정한 뒤 쿼리마다 정렬합니다.
+        """
+        source, where, with_clause = collection_name, "", ""
+        if exact:
+            source = "filtered"
+            with_clause = f"""
+            WITH filtered AS MATERIALIZED (
+                SELECT page_content, metadata, embedding FROM {collection_name}
+                WHERE {" AND ".join(conditions)}
+            )"""
+        elif conditions:
+            where = f"WHERE {' AND '.join(conditions)}"
+
+        if quantization is None:
+            lateral = f"""
+                SELECT page_content, metadata, embedding {distance_func} q.embedding AS distance
+                FROM {source}
+                {where}
+                ORDER BY embedding {distance_func} q.embedding
+                LIMIT %s"""
+        else:
+            quantization_type, dimension = quantization
+            quantized_column = _quantized_expression(quantization_type, dimension)
+            quantized_query = _quantized_expression(quantization_type, dimension, "q.embedding")
+            quantized_func = distance_func if quantization_type == "halfvec" else "<~>"
+            lateral = f"""
+                SELECT page_content, metadata, distance FROM (
+                    SELECT page_content, metadata, embedding {distance_func} q.embedding AS distance
+                    FROM {source}
+                    {where}
+                    ORDER BY {quantized_column} {quantized_func} {quantized_query}
+                    LIMIT %s
+                ) AS candidates
+                ORDER BY distance
+                LIMIT %s"""
+
+        return f"""{with_clause}
+            SELECT q.ordinality, r.page_content, r.metadata, r.distance
+            FROM unnest(%s::vector[]) WITH ORDINALITY AS q(embedding, ordinality)
+            CROSS JOIN LATERAL ({lateral}
+            ) AS r
+            ORDER BY q.ordinality, r.distance
+            """
+
+    def set_search_params(self, collection_name: str, **params) -> PgSearchParams:
+        """
+        컬렉션의 기본 인덱스 검색 파라미터를 지정합니다.
+
+        Args:
+            collection_name: 컬렉션 이름
+            **params: ef_search, probes, iterative_scan, max_scan_tuples, max_probes
 
-        # 거리 메트릭 가져오기
+        Returns:
+            컬렉션에 적용될 검색 파라미터
+        """
+        current = self._collection_search_params.get(collection_name, PgSearchParams())
+        self._collection_search_params[collection_name] = current.merge(PgSearchParams(**params))
+        return self.get_search_params(collection_name)
+
+    def get_search_params(self, collection_name: str, params: Optional[PgSearchParams] = None) -> PgSearchParams:
+        """백엔드 설정 < 컬렉션별 값 < params 순서로 합친 검색 파라미터를 반환합니다."""
+        return self.search_params.merge(self._collection_search_params.get(collection_name)).merge(params)
+
+    def _distance_func(self) -> str:
+        """설정된 거리 메트릭의 pgvector 연산자"""
         distance_metric = self.config.get("distance_metric", "cosine")
         distance_funcs = {"cosine": "<=>", "l2": "<->", "inner_product": "<#>"}
-        distance_func = distance_funcs.get(distance_metric, "<=>")
+        return distance_funcs.get(distance_metric, "<=>")
 
-        try:
-            # 기본 검색 쿼리
-            search_sql = f"""
-            SELECT 
-                page_content,
-                metadata,
-                1 - (embedding {distance_func} %s::vector) as similarity
+    def _to_results(self, rows: List[tuple], threshold: Optional[float]) -> List[SearchResult]:
+        results = []
+        for content, metadata, distance in rows:
+            similarity = 1 - distance
+            if threshold is not None and similarity < threshold:
+                continue
+
+            doc = Document(page_content=content, metadata=metadata or {})
+            results.append(SearchResult(document=doc, score=similarity))
+
+        return results
+
+    def _ann_search(
+        self,
+        cursor,
+        collection_name: str,
+        distance_func: str,
+        query_embedding,
+        k: int,
+        params: Optional[PgSearchParams] = None,
+    ) -> List[tuple]:
+        """벡터 인덱스를 사용하는 k-NN 검색"""
+        params = params or PgSearchParams()
+        quantization = self._get_quantization(cursor, collection_name)
+        if quantization is not None:
+            return self._quantized_search(
+                cursor, collection_name, distance_func, query_embedding, k, quantization, params
+            )
+
+        # HNSW는 ef_search개까지만 후보를 반환하므로 ef_search를 k 이상으로 맞춥니다.
+        apply_search_settings(cursor, params.settings(k))
+
+        name = self._prepare(cursor, "search", self._ann_sql(collection_name, distance_func), "vector, integer")
+        if name is not None:
+            cursor.execute(f"EXECUTE {name} (%s::vector, %s)", [query_embedding, k])
+        else:
+            cursor.execute(
+                self._ann_sql(collection_name, distance_func, prepared=False), [query_embedding, query_embedding, k]
+            )
+        return cursor.fetchall()
+
+    @staticmethod
+    def _ann_sql(collection_name: str, distance_func: str, prepared: bool = True) -> str:
+        """k-NN 검색 SQL. prepared가 참이면 PREPARE용 위치 인자($1, $2)를 사용합니다."""
+        embedding, limit = ("$1", "$2") if prepared else ("%s::vector", "%s")
+        return f"""
+            SELECT page_content, metadata, embedding {distance_func} {embedding} AS distance
             FROM {collection_name}
-            WHERE 1 = 1
+            ORDER BY embedding {distance_func} {embedding}
+            LIMIT {limit}
             """
 
-            params = [query_embedding]
-
-            # 메타데이터 필터 추가
-            if filter:
-                for key, value in filter.items():
-                    search_sql += " AND metadata->%s = %s"
-                    params.extend([key, json.dumps(value)])
+    def _quantized_search(
+        self,
+        cursor,
+        collection_name: str,
+        distance_func: str,
+        query_embedding,
+        k: int,
+        quantization: Tuple[str, int],
+        params: PgSearchParams,
+        conditions: Optional[List[str]] = None,
+        filter_params: Optional[List[Any]] = None,
+    ) -> List[tuple]:
+        """양자화 인덱스로 후보를 가져와 원본 벡터와의 거리로 재정렬"""
+        candidates = rerank_candidates(k, params.rerank_factor, PGVECTOR_MAX_EF_SEARCH)
+        apply_search_settings(cursor, params.settings(candidates))
+
+        if not conditions:
+            name = self._prepare(
+                cursor,
+                "qsearch",
+                self._quantized_sql(collection_name, distance_func, quantization),
+                "vector, integer, integer",
+            )
+            if name is not None:
+                cursor.execute(f"EXECUTE {name} (%s::vector, %s, %s)", [query_embedding, candidates, k])
+                return cursor.fetchall()
+
+        cursor.execute(
+            self._quantized_sql(collection_name, distance_func, quantization, conditions, prepared=False),
+            [query_embedding, *(filter_params or []), query_embedding, candidates, k],
+        )
+        return cursor.fetchall()
+
+    @staticmethod
+    def _quantized_sql(
+        collection_name: str,
+        distance_func: str,
+        quantization: Tuple[str, int],
+        conditions: Optional[List[str]] = None,
+        prepared: bool = True,
+    ) -> str:
+        """양자화 인덱스 검색 후 재정렬 SQL. prepared가 참이면 $1(벡터), $2(후보 수), $3(k)를 사용합니다."""
+        embedding, candidates, limit = ("$1", "$2", "$3") if prepared else ("%s::vector", "%s", "%s")
+        quantization_type, dimension = quantization
+        quantized_column = _quantized_expression(quantization_type, dimension)
+        quantized_query = _quantized_expression(quantization_type, dimension, "$1" if prepared else "%s::vector")
+        quantized_func = distance_func if quantization_type == "halfvec" else "<~>"
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return f"""
+            SELECT page_content, metadata, distance FROM (
+                SELECT page_content, metadata, embedding {distance_func} {embedding} AS distance
+                FROM {collection_name}
+                {where}
+                ORDER BY {quantized_column} {quantized_func} {quantized_query}
+                LIMIT {candidates}
+            ) AS candidates
+            ORDER BY distance
+            LIMIT {limit}
+            """
 
-            # 임계값 조건 추가
-            if threshold is not None:
-                search_sql += f" AND 1 - (embedding {distance_func} %s::vector) >= %s"
-                params.extend([query_embedding, threshold])
+    def _filtered_ann_search(
+        self,
+        cursor,
+        collection_name: str,
+        distance_func: str,
+        query_embedding,
+        k: int,
+        filter: Dict[str, Any],
+        params: PgSearchParams,
+    ) -> List[tuple]:
+        """반복 인덱스 스캔으로 필터를 만족하는 k개를 채울 때까지 벡터 인덱스를 탐색
+
+        relaxed_order는 결과 순서가 조금 어긋날 수 있으므로 거리로 다시 정렬합니다.
+        """
+        conditions, filter_params = self._filter_conditions(cursor, collection_name, filter)
+
+        quantization = self._get_quantization(cursor, collection_name)
+        if quantization is not None:
+            return self._quantized_search(
+                cursor,
+                collection_name,
+                distance_func,
+                query_embedding,
+                k,
+                quantization,
+                params,
+                conditions=conditions,
+                filter_params=filter_params,
+            )
 
-            search_sql += f"""
+        apply_search_settings(cursor, params.settings(k))
+        cursor.execute(
+            self._filtered_ann_sql(collection_name, distance_func, conditions),
+            [query_embedding, *filter_params, query_embedding, k],
+        )
+        return sorted(cursor.fetchall(), key=lambda row: row[2])
+
+    @staticmethod
+    def _filtered_ann_sql(collection_name: str, distance_func: str, conditions: List[str]) -> str:
+        return f"""
+            SELECT page_content, metadata, embedding {distance_func} %s::vector AS distance
+            FROM {collection_name}
+            WHERE {" AND ".join(conditions)}
             ORDER BY embedding {distance_func} %s::vector
             LIMIT %s
             """
-            params.extend([query_embedding, k])
 
-            cursor.execute(search_sql, params)
-            results = []
+    def _exact_search(
+        self, cursor, collection_name: str, distance_func: str, query_embedding, k: int, filter: Dict[str, Any]
+    ) -> List[tuple]:
+        """필터를 먼저 적용한 뒤 남은 행만 정확한 거리로 정렬
+
+        MATERIALIZED CTE로 필터 결과를 먼저 확정하여 벡터 인덱스 스캔이 끼어들지 않도록 합니다.
+        """
+        conditions, filter_params = self._filter_conditions(cursor, collection_name, filter)
+        cursor.execute(
+            self._exact_sql(collection_name, distance_func, conditions), [query_embedding, *filter_params, k]
+        )
+        return cursor.fetchall()
+
+    @staticmethod
+    def _exact_sql(collection_name: str, distance_func: str, conditions: List[str]) -> str:
+        return f"""
+            WITH filtered AS MATERIALIZED (
+                SELECT page_content, metadata, embedding {distance_func} %s::vector AS distance
+                FROM {collection_name}
+                WHERE {" AND ".join(conditions)}
+            )
+            SELECT page_content, metadata, distance FROM filtered
+            ORDER BY distance
+            LIMIT %s
+            """
+
+    def _overfetch_search(
+        self,
+        cursor,
+        collection_name: str,
+        distance_func: str,
+        query_embedding,
+        k: int,
+        filter: Dict[str, Any],
+        fetch_k: int,
+        params: Optional[PgSearchParams] = None,
+    ) -> List[tuple]:
+        """ANN으로 fetch_k개 후보를 가져와 필터링하고, k개가 안 되면 후보를 늘려 다시 조회
+
+        후보 수가 max_fetch_k를 넘으면 정확 검색으로 전환하므로,
+        필터를 만족하는 문서가 k개 이상 있으면 항상 k개를 반환합니다.
+        """
+        while True:
+            rows = self._ann_search(cursor, collection_name, distance_func, query_embedding, fetch_k, params=params)
+            matched = [row for row in rows if matches_filter(row[1], filter)]
+
+            # k개를 채웠거나 더 가져올 후보가 없음
+            if len(matched) >= k or len(rows) < fetch_k:
+                return matched[:k]
+
+            fetch_k = self.planner.next_fetch_k(k, fetch_k, len(matched))
+            if fetch_k > self.planner.max_fetch_k:
+                logger.debug(f"Over-fetch limit exceeded for '{collection_name}'. Falling back to exact search.")
+                return self._exact_search(cursor, collection_name, distance_func, query_embedding, k, filter)
+
+            logger.debug(f"Only {len(matched)} of {k} matched. Re-querying with fetch_k={fetch_k}")
+
+    async def _get_async_pool(self):
+        """psycopg 3 비동기 연결 풀을 반환합니다. 처음 호출될 때 현재 이벤트 루프에서 엽니다."""
+        if self._async_pool is None:
+            try:
+                from psycopg_pool import AsyncConnectionPool
+            except ImportError:
+                raise ImportError(
+                    "psycopg 3 is required for async pgvector access. Install with: pip install 'psycopg[binary,pool]'"
+                )
+
+            self._async_pool = AsyncConnectionPool(
+                self.config["database_url"],
+                min_size=self.pool.min_size,
+                max_size=self.pool.max_size,
+                timeout=self.pool.timeout,
+                check=AsyncConnectionPool.check_connection if self.pool.pre_ping else None,
+                open=False,
+            )
+            await self._async_pool.open()
+        return self._async_pool
+
+    @asynccontextmanager
+    async def async_cursor(self):
+        """비동기 연결 풀에서 빌린 연결의 커서. 정상 종료 시 commit, 예외 발생 시 rollback합니다."""
+        pool = await self._get_async_pool()
+        async with pool.connection() as conn:
+            async with conn.cursor() as cursor:
+                yield cursor
+
+    async def search_async(
+        self,
+        collection_name: str,
+        query_embedding: List[float],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        threshold: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        iterative_scan: Optional[Union[str, bool]] = None,
+        rerank_factor: Optional[float] = None,
+    ) -> List[SearchResult]:
+        """search의 비동기 버전. psycopg 3 비동기 연결 풀을 사용합니다."""
+        params = self.get_search_params(
+            collection_name,
+            PgSearchParams(
+                ef_search=ef_search, probes=probes, iterative_scan=iterative_scan, rerank_factor=rerank_factor
+            ),
+        )
+        plan = await asyncio.to_thread(self.plan_search, collection_name, k, filter) if filter else None
+        if collection_name in self._quantization:
+            quantization = self._quantization[collection_name]
+        else:
+            quantization = await asyncio.to_thread(self.get_quantization, collection_name)
+        distance_func = self._distance_func()
+
+        async with self.async_cursor() as cursor:
+            if plan is None:
+                rows = await self._ann_search_async(
+                    cursor, collection_name, distance_func, query_embedding, k, params, quantization
+                )
+            elif plan.strategy == "exact":
+                rows = await self._exact_search_async(
+                    cursor, collection_name, distance_func, query_embedding, k, filter
+                )
+            elif params.iterative:
+                metadata_columns = await self._get_metadata_columns_async(cursor, collection_name)
+                conditions, filter_params = self._filter_conditions(None, collection_name, filter, metadata_columns)
+                rows = await self._ann_search_async(
+                    cursor,
+                    collection_name,
+                    distance_func,
+                    query_embedding,
+                    k,
+                    params,
+                    quantization,
+                    conditions=conditions,
+                    filter_params=filter_params,
+                )
+            else:
+                fetch_k = plan.fetch_k
+                while True:
+                    candidates = await self._ann_search_async(
+                        cursor, collection_name, distance_func, query_embedding, fetch_k, params, quantization
+                    )
+                    rows = [row for row in candidates if matches_filter(row[1], filter)][:k]
+                    if len(rows) >= k or len(candidates) < fetch_k:
+                        break
+
+                    fetch_k = self.planner.next_fetch_k(k, fetch_k, len(rows))
+                    if fetch_k > self.planner.max_fetch_k:
+                        rows = await self._exact_search_async(
+                            cursor, collection_name, distance_func, query_embedding, k, filter
+                        )
+                        break
+
+        return self._to_results(rows, threshold)
+
+    async def _ann_search_async(
+        self,
+        cursor,
+        collection_name: str,
+        distance_func: str,
+        query_embedding,
+        k: int,
+        params: PgSearchParams,
+        quantization: Optional[Tuple[str, int]] = None,
+        conditions: Optional[List[str]] = None,
+        filter_params: Optional[List[Any]] = None,
+    ) -> List[tuple]:
+        """k-NN 검색. conditions가 있으면 반복 인덱스 스캔으로 필터를 함께 적용합니다."""
+        if quantization is not None:
+            candidates = rerank_candidates(k, params.rerank_factor, PGVECTOR_MAX_EF_SEARCH)
+            sql = self._quantized_sql(collection_name, distance_func, quantization, conditions, prepared=False)
+            sql_params = [query_embedding, *(filter_params or []), query_embedding, candidates, k]
+            settings = params.settings(candidates)
+        elif conditions:
+            sql = self._filtered_ann_sql(collection_name, distance_func, conditions)
+            sql_params = [query_embedding, *(filter_params or []), query_embedding, k]
+            settings = params.settings(k)
+        else:
+            sql = self._ann_sql(collection_name, distance_func, prepared=False)
+            sql_params = [query_embedding, query_embedding, k]
+            settings = params.settings(k)
+
+        for name, value in settings:
+            await cursor.execute(f"SET LOCAL {name} = {value}")
+
+        # psycopg 3는 prepare=True이면 연결별로 서버 측 prepared statement를 만들어 재사용합니다.
+        await cursor.execute(sql, sql_params, prepare=self.prepared_statements)
+        rows = await cursor.fetchall()
+        # relaxed_order 반복 스캔은 순서가 조금 어긋날 수 있으므로 거리로 다시 정렬
+        return sorted(rows, key=lambda row: row[2]) if conditions else rows
+
+    async def _exact_search_async(
+        self, cursor, collection_name: str, distance_func: str, query_embedding, k: int, filter: Dict[str, Any]
+    ) -> List[tuple]:
+        # plan_search 이후 컬럼 승격 등으로 캐시가 비워졌을 수 있으므로 조회 결과를 직접 넘깁니다.
+        metadata_columns = await self._get_metadata_columns_async(cursor, collection_name)
+        conditions, filter_params = self._filter_conditions(None, collection_name, filter, metadata_columns)
+        await cursor.execute(
+            self._exact_sql(collection_name, distance_func, conditions), [query_embedding, *filter_params, k]
+        )
+        return await cursor.fetchall()
+
+    async def _get_metadata_columns_async(self, cursor, collection_name: str) -> Dict[str, str]:
+        """_get_metadata_columns의 비동기 버전. 조회한 컬럼은 동기 메서드와 같은 캐시에 저장합니다."""
+        columns = self._metadata_columns.get(collection_name)
+        if columns is None:
+            await cursor.execute(
+                """
+                SELECT column_name, data_type FROM information_schema.columns
+                WHERE table_name = %s AND is_generated = 'ALWAYS' AND column_name <> %s
+                """,
+                (collection_name, LEXICAL_COLUMN),
+            )
+            columns = self._metadata_columns[collection_name] = dict(await cursor.fetchall())
+        return columns
 
-            for content, metadata, similarity in cursor.fetchall():
-                doc = Document(page_content=content, metadata=metadata or {})
-                results.append(SearchResult(document=doc, score=similarity))
+    async def search_many_async(
+        self,
+        collection_name: str,
+        query_embeddings: List[List[float]],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        threshold: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        iterative_scan: Optional[Union[str, bool]] = None,
+        rerank_factor: Optional[float] = None,
+    ) -> List[List[SearchResult]]:
+        """search_many의 비동기 버전. LATERAL 조인 쿼리 한 번으로 검색합니다."""
+        if not query_embeddings:
+            return []
+
+        search_options = dict(ef_search=ef_search, probes=probes, iterative_scan=iterative_scan)
+        params = self.get_search_params(collection_name, PgSearchParams(rerank_factor=rerank_factor, **search_options))
+        plan = await asyncio.to_thread(self.plan_search, collection_name, k, filter) if filter else None
+        if collection_name in self._quantization:
+            quantization = self._quantization[collection_name]
+        else:
+            quantization = await asyncio.to_thread(self.get_quantization, collection_name)
+        distance_func = self._distance_func()
+
+        filtered, exact, fetch_k = False, False, k
+        if plan is not None and (plan.strategy == "exact" or params.iterative):
+            filtered, exact = True, plan.strategy == "exact"
+        elif plan is not None:
+            fetch_k = plan.fetch_k
+
+        limits = [fetch_k]
+        if exact:
+            quantization = None
+            settings = []
+        elif quantization is not None:
+            candidates = rerank_candidates(fetch_k, params.rerank_factor, PGVECTOR_MAX_EF_SEARCH)
+            limits = [candidates, fetch_k]
+            settings = params.settings(candidates)
+        else:
+            settings = params.settings(fetch_k)
+
+        vectors = ["[" + ",".join(str(float(value)) for value in embedding) + "]" for embedding in query_embeddings]
+
+        async with self.async_cursor() as cursor:
+            conditions, filter_params = None, []
+            if filtered:
+                metadata_columns = await self._get_metadata_columns_async(cursor, collection_name)
+                conditions, filter_params = self._filter_conditions(None, collection_name, filter, metadata_columns)
+            sql_params = [*filter_params, vectors, *limits] if exact else [vectors, *filter_params, *limits]
+
+            for name, value in settings:
+                await cursor.execute(f"SET LOCAL {name} = {value}")
+            await cursor.execute(
+                self._search_many_sql(collection_name, distance_func, conditions, quantization, exact), sql_params
+            )
+            rows: List[List[tuple]] = [[] for __ in query_embeddings]
+            for ordinality, content, metadata, distance in await cursor.fetchall():
+                rows[ordinality - 1].append((content, metadata, distance))
 
+        results = [self._to_results(query_rows, threshold) for query_rows in rows]
+        if plan is None or conditions is not None:
             return results
 
+        # over-fetch: 필터링 후 k개를 채우지 못한 쿼리만 개별로 다시 검색합니다.
+        for index, (query_embedding, query_rows) in enumerate(zip(query_embeddings, rows)):
+            matched = [row for row in query_rows if matches_filter(row[1], filter)]
+            if len(matched) < k and len(query_rows) >= fetch_k:
+                results[index] = await self.search_async(
+                    collection_name,
+                    query_embedding,
+                    k=k,
+                    filter=filter,
+                    threshold=threshold,
+                    rerank_factor=rerank_factor,
+                    **search_options,
+                )
+            else:
+                results[index] = self._to_results(matched[:k], threshold)
+        return results
+
+    async def insert_async(self, collection_name: str, documents: List[Document], batch_size: int = 1000) -> int:
+        """
+        insert의 비동기 버전. copy_threshold개 이상이면 COPY BINARY로 적재합니다.
+
+        psycopg 3의 executemany는 파이프라인 모드로 실행되므로 문서마다 왕복하지 않습니다.
+        """
+        if len(documents) >= self.copy_threshold:
+            rows = ((doc.page_content, doc.metadata, doc.embedding) for doc in documents)
+            return await self._bulk_load_async(collection_name, rows)
+
+        sql = f"INSERT INTO {collection_name} (page_content, metadata, embedding) VALUES (%s, %s::jsonb, %s::vector)"
+        data = [(doc.page_content, json.dumps(doc.metadata), doc.embedding) for doc in documents]
+
+        async with self.async_cursor() as cursor:
+            for start in range(0, len(data), batch_size):
+                await cursor.executemany(sql, data[start : start + batch_size])
+
+        self._update_stats(collection_name, len(documents))
+        return len(documents)
+
+    async def import_jsonl_async(
+        self,
+        collection_name: str,
+        file_path: Path,
+        batch_size: int = 1000,
+        clear_existing: bool = False,
+        rebuild_index: bool = False,
+        workers: Optional[int] = None,
+        progress: Optional[Callable[[ImportProgress], None]] = None,
+        resume: bool = False,
+    ) -> int:
+        """import_jsonl의 비동기 버전. 파일 읽기와 디코딩은 스레드에서, COPY 전송은 비동기 연결로 실행합니다."""
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        source = checkpoint_source(file_path)
+        checkpoint = None
+        if resume:
+            async with self.async_cursor() as cursor:
+                await cursor.execute(IMPORT_CHECKPOINT_TABLE_SQL)
+                await cursor.execute(*load_checkpoint_sql(collection_name, source, placeholder="%s"))
+                checkpoint = checkpoint_from_row(source, await cursor.fetchone())
+
+        if checkpoint is not None:
+            check_resume(collection_name, file_path, checkpoint, clear_existing)
+            if checkpoint.completed:
+                return 0
+        else:
+            if clear_existing:
+                await self.delete_async(collection_name, {})
+            async with self.async_cursor() as cursor:
+                await cursor.execute(IMPORT_CHECKPOINT_TABLE_SQL)
+                await cursor.execute(*delete_checkpoint_sql(collection_name, source, placeholder="%s"))
+            checkpoint = ImportCheckpoint(source=source)
+
+        stats = ImportProgress(
+            file_path, name=collection_name, start_offset=checkpoint.offset, start_line=checkpoint.line + 1
+        )
+
+        if rebuild_index:
+            rows = iter_import_rows(
+                file_path, stats, batch_size, workers=workers, progress=progress, checkpoint=checkpoint
+            )
+            start = checkpoint
+
+            def finalize(total: int) -> Tuple[str, tuple]:
+                done = replace(start, offset=stats.offset, line=stats.line, rows=start.rows + total, completed=True)
+                return save_checkpoint_sql(collection_name, done, placeholder="%s")
+
+            return await self._bulk_load_async(collection_name, rows, rebuild_index=True, finalize=finalize)
+
+        chunks = iter_decoded_chunks(
+            file_path,
+            batch_size,
+            workers=workers,
+            start_offset=checkpoint.offset,
+            start_line=checkpoint.line + 1,
+        )
+        try:
+            # 디코딩과 인코딩이 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+            while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                data = await asyncio.to_thread(CopyBinaryStream(chunk.rows()).read)
+                checkpoint = checkpoint.advance(chunk)
+                async with self.async_cursor() as cursor:
+                    async with cursor.copy(copy_sql(collection_name)) as copy:
+                        await copy.write(data)
+                    await cursor.execute(*save_checkpoint_sql(collection_name, checkpoint, placeholder="%s"))
+
+                self._update_stats(collection_name, len(chunk))
+                stats.advance(chunk, len(chunk))
+                if progress is not None:
+                    progress(stats)
         finally:
-            cursor.close()
-            conn.close()
+            await asyncio.to_thread(chunks.close)
+
+        async with self.async_cursor() as cursor:
+            await cursor.execute(*save_checkpoint_sql(collection_name, checkpoint.complete(), placeholder="%s"))
+        return stats.rows
+
+    async def _bulk_load_async(
+        self,
+        collection_name: str,
+        rows,
+        rebuild_index: bool = False,
+        progress=None,
+        progress_every: int = 10000,
+        finalize: Optional[Callable[[int], Tuple[str, tuple]]] = None,
+    ) -> int:
+        """
+        bulk_load의 비동기 버전
+
+        finalize가 있으면 적재한 행 수로 호출하여 반환한 (SQL, 파라미터)를 커밋 전에 같은 트랜잭션에서 실행합니다.
+        """
+        stream = CopyBinaryStream(rows, progress=progress, progress_every=progress_every)
+
+        async with self.async_cursor() as cursor:
+            indexes = []
+            if rebuild_index:
+                await cursor.execute(EMBEDDING_INDEXES_SQL, (collection_name,))
+                indexes = await cursor.fetchall()
+            for index_name, __ in indexes:
+                logger.info(f"Dropping index '{index_name}' before bulk load")
+                await cursor.execute(f"DROP INDEX {index_name}")
+
+            async with cursor.copy(copy_sql(collection_name)) as copy:
+                # 파일 읽기와 인코딩이 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+                while chunk := await asyncio.to_thread(stream.read, COPY_CHUNK_SIZE):
+                    await copy.write(chunk)
+
+            maintenance_work_mem = self.config.get("maintenance_work_mem")
+            if indexes and maintenance_work_mem:
+                await cursor.execute("SELECT set_config('maintenance_work_mem', %s, true)", (maintenance_work_mem,))
+            for index_name, index_def in indexes:
+                logger.info(f"Rebuilding index '{index_name}'")
+                await cursor.execute(index_def)
+
+            if finalize is not None:
+                await cursor.execute(*finalize(stream.count))
+
+        self._update_stats(collection_name, stream.count)
+        return stream.count
+
+    async def delete_async(self, collection_name: str, filter: Dict[str, Any]) -> int:
+        """delete의 비동기 버전"""
+        async with self.async_cursor() as cursor:
+            if not filter:
+                await cursor.execute(f"DELETE FROM {collection_name}")
+            else:
+                metadata_columns = await self._get_metadata_columns_async(cursor, collection_name)
+                conditions, params = self._filter_conditions(None, collection_name, filter, metadata_columns)
+                await cursor.execute(f"DELETE FROM {collection_name} WHERE {' AND '.join(conditions)}", params)
+            deleted_count = cursor.rowcount
+
+        self._stats.pop(collection_name, None)
+        return deleted_count
+
+    async def count_async(self, collection_name: str, filter: Optional[Dict[str, Any]] = None) -> int:
+        """count의 비동기 버전"""
+        async with self.async_cursor() as cursor:
+            sql = f"SELECT COUNT(*) FROM {collection_name}"
+            params = []
+            if filter:
+                metadata_columns = await self._get_metadata_columns_async(cursor, collection_name)
+                conditions, params = self._filter_conditions(None, collection_name, filter, metadata_columns)
+                sql += f" WHERE {' AND '.join(conditions)}"
+
+            await cursor.execute(sql, params)
+            return (await cursor.fetchone())[0]
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close_async()
+        await asyncio.to_thread(self.close)
+
+    async def close_async(self) -> None:
+        """비동기 연결 풀을 닫습니다."""
+        if self._async_pool is not None:
+            await self._async_pool.close()
+            self._async_pool = None
+
+    def get_stats(self, collection_name: str, refresh: bool = False) -> CollectionStats:
+        """
+        플래너가 사용하는 컬렉션 통계(문서 수, 메타데이터 표본)를 반환합니다.
+
+        문서 수는 pg_class의 추정치를 우선 사용하고, 표본은 TABLESAMPLE로 수집합니다.
+        """
+        stats = self._stats.get(collection_name)
+        if not (refresh or stats is None or stats.is_stale(self.planner.stats_ttl)):
+            return stats
+
+        with self._cursor() as cursor:
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", (collection_name,))
+            row = cursor.fetchone()
+            total = row[0] if row else -1
+            if total is None or total <= 0:
+                # ANALYZE 전에는 추정치가 없으므로 직접 계산
+                cursor.execute(f"SELECT COUNT(*) FROM {collection_name}")
+                total = cursor.fetchone()[0]
+
+            sample_size = self.planner.sample_size
+            if total > sample_size * 10:
+                percent = min(100.0, sample_size / total * 100 * 2)
+                cursor.execute(
+                    f"SELECT metadata FROM {collection_name} TABLESAMPLE BERNOULLI (%s) LIMIT %s",
+                    (percent, sample_size),
+                )
+            else:
+                cursor.execute(f"SELECT metadata FROM {collection_name} ORDER BY random() LIMIT %s", (sample_size,))
+            sample = [metadata or {} for (metadata,) in cursor.fetchall()]
+
+        stats = self._stats[collection_name] = CollectionStats(total=total, sample=sample)
+        return stats
+
+    def plan_search(self, collection_name: str, k: int, filter: Optional[Dict[str, Any]] = None) -> FilterPlan:
+        """필터 검색에 사용할 검색 계획을 반환합니다."""
+        filter = filter or {}
+        stats = self.get_stats(collection_name)
+
+        metadata_columns = self._metadata_columns.get(collection_name)
+        if metadata_columns is None:
+            with self._cursor() as cursor:
+                metadata_columns = self._get_metadata_columns(cursor, collection_name)
+
+        # 모든 필터 키가 인덱스가 있는 컬럼이면 정확 검색 비용이 매칭 문서 수에 비례
+        indexed = bool(filter) and all(key in metadata_columns for key in filter)
+        return self.planner.plan(k, stats, filter, indexed=indexed)
+
+    def _get_metadata_columns(self, cursor, collection_name: str) -> Dict[str, str]:
+        """승격된 메타데이터 컬럼(생성 컬럼) {키: 타입}을 반환합니다."""
+        columns = self._metadata_columns.get(collection_name)
+        if columns is None:
+            cursor.execute(
+                """
+                SELECT column_name, data_type FROM information_schema.columns
+                WHERE table_name = %s AND is_generated = 'ALWAYS' AND column_name <> %s
+                """,
+                (collection_name, LEXICAL_COLUMN),
+            )
+            columns = self._metadata_columns[collection_name] = dict(cursor.fetchall())
+        return columns
+
+    def _add_metadata_columns(self, cursor, collection_name: str, metadata_columns: Dict[str, str]) -> None:
+        """생성 컬럼과 인덱스(jsonb는 GIN, 나머지는 B-tree)를 추가합니다."""
+        for key, pg_type in metadata_columns.items():
+            cursor.execute(f"""
+                ALTER TABLE {collection_name}
+                ADD COLUMN IF NOT EXISTS {key} {pg_type}
+                GENERATED ALWAYS AS ({_generated_column_expression(key, pg_type)}) STORED
+                """)
+            using = "gin" if pg_type == "jsonb" else "btree"
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {collection_name}_{key}_idx ON {collection_name} USING {using} ({key})"
+            )
+
+    def _filter_conditions(
+        self,
+        cursor,
+        collection_name: str,
+        filter: Dict[str, Any],
+        metadata_columns: Optional[Dict[str, str]] = None,
+    ) -> tuple[List[str], List[Any]]:
+        """
+        필터를 WHERE 조건으로 변환합니다. 승격된 키는 인덱스가 있는 생성 컬럼을 직접 비교합니다.
+
+        metadata_columns를 넘기지 않으면 cursor로 승격된 메타데이터 컬럼을 조회합니다.
+        """
+        if metadata_columns is None:
+            metadata_columns = self._get_metadata_columns(cursor, collection_name)
+        conditions = []
+        params = []
+
+        for key, value in filter.items():
+            pg_type = metadata_columns.get(key)
+            if pg_type == "jsonb":
+                # GIN 인덱스로 후보를 좁힌 뒤 값이 같은지 다시 확인
+                conditions.append(f"{key} @> %s::jsonb AND {key} = %s::jsonb")
+                params.extend([json.dumps(value)] * 2)
+            elif pg_type is not None:
+                conditions.append(f"{key} = %s")
+                params.append(value)
+            else:
+                conditions.append("metadata->%s = %s")
+                params.extend([key, json.dumps(value)])
+
+        return conditions, params
+
+    def _text_search_config(self) -> str:
+        config = self.config.get("text_search_config", DEFAULT_TEXT_SEARCH_CONFIG)
+        if not _IDENTIFIER_PATTERN.match(config):
+            raise ValueError(f"Invalid text search config: {config}")
+        return config
+
+    def _add_lexical_column(self, cursor, collection_name: str) -> None:
+        """page_content의 tsvector 생성 컬럼과 GIN 인덱스를 추가합니다. 삽입/수정 시 PostgreSQL이 갱신합니다."""
+        cursor.execute(f"""
+            ALTER TABLE {collection_name}
+            ADD COLUMN IF NOT EXISTS {LEXICAL_COLUMN} tsvector
+            GENERATED ALWAYS AS (to_tsvector('{self._text_search_config()}'::regconfig, page_content)) STORED
+            """)
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {collection_name}_{LEXICAL_COLUMN}_idx "
+            f"ON {collection_name} USING gin ({LEXICAL_COLUMN})"
+        )
+
+    def create_lexical_index(self, collection_name: str) -> None:
+        """
+        전문 검색용 tsvector 생성 컬럼과 GIN 인덱스를 추가합니다.
+
+        기존 문서는 컬럼을 추가할 때 색인되며(테이블을 다시 씁니다), 이후 삽입되는 문서는 자동으로 색인됩니다.
+        텍스트 검색 구성은 설정의 text_search_config(기본 simple)를 사용합니다.
+        """
+        with self._cursor() as cursor:
+            self._add_lexical_column(cursor, collection_name)
+            cursor.execute(f"ANALYZE {collection_name}")
+
+        self._lexical.pop(collection_name, None)
+
+    def _has_lexical_index(self, cursor, collection_name: str) -> bool:
+        if collection_name not in self._lexical:
+            cursor.execute(
+                "SELECT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name = %s AND column_name = %s)",
+                (collection_name, LEXICAL_COLUMN),
+            )
+            self._lexical[collection_name] = cursor.fetchone()[0]
+        return self._lexical[collection_name]
+
+    def lexical_search(
+        self,
+        collection_name: str,
+        query: str,
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[SearchResult]:
+        """
+        tsvector 전문 검색을 수행합니다. score는 ts_rank_cd 점수(클수록 관련도 높음)입니다.
+
+        create_collection(lexical_index=True) 또는 create_lexical_index()로 전문 검색 컬럼을 먼저 만들어야 합니다.
+        """
+        terms = tokenize_query(query)
+        if not terms:
+            return []
+
+        with self._cursor() as cursor:
+            if not self._has_lexical_index(cursor, collection_name):
+                raise ValueError(f"Lexical index not found for '{collection_name}'. Run create_lexical_index() first.")
+
+            conditions, filter_params = self._filter_conditions(cursor, collection_name, filter or {})
+            cursor.execute(
+                self._lexical_sql(collection_name, conditions),
+                [self._text_search_config(), " ".join(terms), *filter_params, k],
+            )
+            rows = cursor.fetchall()
+
+        return [
+            SearchResult(document=Document(page_content=content, metadata=metadata or {}), score=rank)
+            for content, metadata, rank in rows
+        ]
+
+    @staticmethod
+    def _lexical_sql(collection_name: str, conditions: List[str]) -> str:
+        """검색어의 단어 중 하나라도 포함된 문서를 찾도록 plainto_tsquery의 AND(&)를 OR(|)로 바꿉니다."""
+        where = "".join(f" AND {condition}" for condition in conditions)
+        return f"""
+            SELECT page_content, metadata, ts_rank_cd({LEXICAL_COLUMN}, query) AS rank
+            FROM {collection_name},
+                replace(plainto_tsquery(%s::regconfig, %s)::text, '&', '|')::tsquery AS query
+            WHERE {LEXICAL_COLUMN} @@ query{where}
+            ORDER BY rank DESC
+            LIMIT %s
+            """
 
     def delete(self, collection_name: str, filter: Dict[str, Any]) -> int:
         """필터에 매칭되는 문서들을 삭제합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
+        with self._cursor() as cursor:
             if not filter:
                 # 모든 문서 삭제
                 cursor.execute(f"DELETE FROM {collection_name}")
             else:
                 # 메타데이터 필터로 삭제
-                conditions = []
-                params = []
-
-                for key, value in filter.items():
-                    conditions.append("metadata->%s = %s")
-                    params.extend([key, json.dumps(value)])
-
+                conditions, params = self._filter_conditions(cursor, collection_name, filter)
                 where_clause = " AND ".join(conditions)
                 cursor.execute(f"DELETE FROM {collection_name} WHERE {where_clause}", params)
 
             deleted_count = cursor.rowcount
-            conn.commit()
-            return deleted_count
 
-        finally:
-            cursor.close()
-            conn.close()
+        self._stats.pop(collection_name, None)
+        return deleted_count
 
-    def count(self, collection_name: str) -> int:
-        """컬렉션의 문서 수를 반환합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+    def count(self, collection_name: str, filter: Optional[Dict[str, Any]] = None) -> int:
+        """컬렉션의 문서 수를 반환합니다. filter를 지정하면 매칭되는 문서 수를 반환합니다."""
+        with self._cursor() as cursor:
+            sql = f"SELECT COUNT(*) FROM {collection_name}"
+            params = []
+            if filter:
+                conditions, params = self._filter_conditions(cursor, collection_name, filter)
+                sql += f" WHERE {' AND '.join(conditions)}"
 
-        try:
-            cursor.execute(f"SELECT COUNT(*) FROM {collection_name}")
+            cursor.execute(sql, params)
             return cursor.fetchone()[0]
-        finally:
-            cursor.close()
-            conn.close()
+
+    def promote_metadata_keys(self, collection_name: str, metadata_columns: Dict[str, Any]) -> Dict[str, str]:
+        """
+        자주 필터링하는 메타데이터 키를 타입이 있는 생성 컬럼으로 승격합니다.
+
+        metadata JSONB에서 값을 꺼내는 STORED 생성 컬럼과 인덱스를 추가하며,
+        이후 search, delete, count의 필터에서 자동으로 사용됩니다.
+
+        Args:
+            collection_name: 컬렉션 이름
+            metadata_columns: {메타데이터 키: 타입} 사전 (text, integer, float, boolean, jsonb)
+
+        Returns:
+            승격된 전체 메타데이터 컬럼 {키: 타입}
+        """
+        metadata_columns = _normalize_metadata_columns(metadata_columns)
+
+        with self._cursor() as cursor:
+            existing = self._get_metadata_columns(cursor, collection_name)
+            for key, pg_type in metadata_columns.items():
+                if existing.get(key, pg_type) != pg_type:
+                    raise ValueError(f"'{key}' is already promoted as {existing[key]} in '{collection_name}'")
+
+            self._add_metadata_columns(cursor, collection_name, metadata_columns)
+
+            # 플래너 통계 갱신
+            cursor.execute(f"ANALYZE {collection_name}")
+
+        self._metadata_columns.pop(collection_name, None)
+
+        logger.info(f"Promoted metadata keys of '{collection_name}': {', '.join(metadata_columns)}")
+        return {**existing, **metadata_columns}
 
     def get_collection_info(self, collection_name: str) -> Dict[str, Any]:
         """컬렉션 정보를 반환합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
+        with self._cursor() as cursor:
             info = {"name": collection_name, "backend": self.backend_name}
 
             # 문서 수
             cursor.execute(f"SELECT COUNT(*) FROM {collection_name}")
             info["count"] = cursor.fetchone()[0]
 
-            # 벡터 차원
-            if info["count"] > 0:
+            # 벡터 차원 (vector(N) 컬럼의 typmod가 차원입니다)
+            cursor.execute(
+                "SELECT atttypmod FROM pg_attribute WHERE attrelid = %s::regclass AND attname = 'embedding'",
+                (collection_name,),
+            )
+            row = cursor.fetchone()
+            info["dimension"] = row[0] if row and row[0] > 0 else None
+            if info["dimension"] is None and info["count"] > 0:
                 cursor.execute(f"SELECT dimension(embedding) FROM {collection_name} LIMIT 1")
                 info["dimension"] = cursor.fetchone()[0]
-            else:
-                info["dimension"] = None
+            info["distance_metric"] = self.config.get("distance_metric", "cosine")
 
             # 테이블 크기
             cursor.execute("SELECT pg_size_pretty(pg_total_relation_size(%s::regclass))", (collection_name,))
@@ -316,12 +1749,13 @@ class PgVectorStore(BaseVectorStore):
                 indexes.append(index_info)
 
             info["indexes"] = indexes
+            info["metadata_columns"] = self._get_metadata_columns(cursor, collection_name)
 
-            return info
+            quantization = self._get_quantization(cursor, collection_name)
+            info["quantization"] = quantization[0] if quantization else None
+            info["lexical_index"] = self._has_lexical_index(cursor, collection_name)
 
-        finally:
-            cursor.close()
-            conn.close()
+            return info
 
     @property
     def backend_name(self) -> str:
@@ -0,0 +1,562 @@
+"""JSONL 대량 임포트 파이프라인.
+
+읽기 → JSON 디코딩(프로세스 풀) → float32 벡터 변환 → 단일 쓰기 순서로 처리합니다.
+디코딩 중인 청크 수를 제한하므로 쓰기가 느려도 읽기가 앞서 나가며 메모리를 채우지 않습니다.
+"""
+
+import itertools
+import json
+import logging
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# 디코딩 프로세스 수 기본값의 상한
+MAX_DEFAULT_IMPORT_WORKERS = 4
+
+# 프로세스마다 동시에 처리 중일 수 있는 청크 수
+IMPORT_CHUNKS_PER_WORKER = 2
+
+JsonlRow = Tuple[str, Dict[str, Any], Any]
+
+
+def default_import_workers() -> int:
+    """디코딩 프로세스 수 기본값. 쓰기 단계를 위해 코어 하나를 남겨 둡니다."""
+    return max(1, min(MAX_DEFAULT_IMPORT_WORKERS, (os.cpu_count() or 1) - 1))
+
+
+def json_loads(data: bytes) -> Any:
+    """orjson이 설치되어 있으면 orjson으로, 없으면 표준 json으로 디코딩합니다."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass
+class LineChunk:
+    """파일에서 읽은 연속된 줄 묶음"""
+
+    start_line: int  # 첫 줄 번호 (1부터)
+    start_offset: int  # 첫 줄의 바이트 위치
+    end_offset: int  # 마지막 줄 다음의 바이트 위치
+    lines: List[bytes]
+
+    @property
+    def end_line(self) -> int:
+        """마지막 줄 번호"""
+        return self.start_line + len(self.lines) - 1
+
+
+@dataclass
+class DecodedChunk:
+    """디코딩과 벡터 변환을 마친 청크
+
+    vectors는 numpy가 있으면 (행 × 차원) float32 행렬, 없으면 float 리스트의 리스트입니다.
+    """
+
+    start_line: int
+    end_line: int
+    start_offset: int
+    end_offset: int
+    page_contents: List[str] = field(default_factory=list)
+    metadatas: List[Dict[str, Any]] = field(default_factory=list)
+    vectors: Any = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.page_contents)
+
+    def rows(self) -> Iterator[JsonlRow]:
+        """(page_content, metadata, embedding) 이터레이터"""
+        return zip(self.page_contents, self.metadatas, self.vectors)
+
+
+def iter_line_chunks(
+    file_path: Path, chunk_size: int, start_offset: int = 0, start_line: int = 1
+) -> Iterator[LineChunk]:
+    """
+    파일을 바이너리로 읽어 빈 줄이 아닌 줄이 chunk_size개가 될 때마다 묶어 반환합니다.
+
+    빈 줄도 청크에 포함하므로 줄 번호와 바이트 위치가 파일과 그대로 일치합니다.
+    start_offset, start_line을 지정하면 그 위치부터 읽습니다.
+    """
+    chunk_size = max(chunk_size, 1)
+    with open(file_path, "rb") as f:
+        f.seek(start_offset)
+        chunk = LineChunk(start_line=start_line, start_offset=start_offset, end_offset=start_offset, lines=[])
+        count = 0
+        for line in f:
+            chunk.lines.append(line)
+            chunk.end_offset += len(line)
+            if not line.strip():
+                continue
+
+            count += 1
+            if count >= chunk_size:
+                yield chunk
+                chunk = LineChunk(
+                    start_line=chunk.end_line + 1, start_offset=chunk.end_offset, end_offset=chunk.end_offset, lines=[]
+                )
+                count = 0
+
+        if count:
+            yield chunk
+
+
+def _pack_vectors(embeddings: List[Any]):
+    """임베딩 목록을 float32 행렬로 변환합니다. 차원이 다르면 ValueError가 발생합니다."""
+    if np is None:
+        return [[float(value) for value in embedding] for embedding in embeddings]
+    if not embeddings:
+        return np.empty((0, 0), dtype=np.float32)
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    if vectors.ndim != 2:
+        raise ValueError(f"Embeddings must be 1-dimensional lists of numbers: ndim={vectors.ndim - 1}")
+    return vectors
+
+
+def _parse_line(line: bytes, line_num: int) -> JsonlRow:
+    data = json_loads(line)
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a JSON object at line {line_num}")
+    if "page_content" not in data:
+        raise ValueError(f"Missing 'page_content' at line {line_num}")
+    if not data.get("embedding"):
+        raise ValueError(f"Missing 'embedding' at line {line_num}")
+    return data["page_content"], data.get("metadata") or {}, data["embedding"]
+
+
+def _pack_valid_vectors(decoded: DecodedChunk, line_nums: List[int], embeddings: List[Any], skip_invalid: bool):
+    """
+    숫자가 아닌 값이 섞였거나 차원이 다른 줄을 찾아 처리하고 나머지 줄의 행렬을 반환합니다.
+
+    청크에서 가장 많은 줄의 차원을 기준으로 삼습니다.
+    """
+    vectors, errors = {}, {}
+    for i, embedding in enumerate(embeddings):
+        try:
+            vectors[i] = _pack_vectors([embedding])[0]
+        except (TypeError, ValueError) as e:
+            errors[i] = f"Invalid 'embedding': {e}"
+
+    dimensions = Counter(len(vector) for vector in vectors.values())
+    dimension = dimensions.most_common(1)[0][0] if dimensions else None
+    for i, vector in vectors.items():
+        if len(vector) != dimension:
+            errors[i] = f"Embedding dimension mismatch: expected {dimension}, got {len(vector)}"
+
+    for i in sorted(errors):
+        if not skip_invalid:
+            raise ValueError(f"Error at line {line_nums[i]}: {errors[i]}")
+        decoded.skipped.append(f"line {line_nums[i]}: {errors[i]}")
+
+    keep = [i for i in range(len(embeddings)) if i not in errors]
+    decoded.page_contents = [decoded.page_contents[i] for i in keep]
+    decoded.metadatas = [decoded.metadatas[i] for i in keep]
+    return _pack_vectors([vectors[i] for i in keep])
+
+
+def decode_chunk(chunk: LineChunk, skip_invalid: bool = False) -> DecodedChunk:
+    """
+    청크의 줄을 디코딩하고 임베딩을 float32 행렬로 변환합니다.
+
+    프로세스 풀에서 실행되므로 모듈 최상위 함수로 둡니다.
+    skip_invalid가 참이면 잘못된 줄은 건너뛰고 사유를 skipped에 담으며,
+    거짓이면 줄 번호와 함께 ValueError를 발생시킵니다.
+    """
+    decoded = DecodedChunk(
+        start_line=chunk.start_line,
+        end_line=chunk.end_line,
+        start_offset=chunk.start_offset,
+        end_offset=chunk.end_offset,
+    )
+    line_nums, embeddings = [], []
+    for line_num, line in enumerate(chunk.lines, chunk.start_line):
+        if not line.strip():
+            continue
+        try:
+            page_content, metadata, embedding = _parse_line(line, line_num)
+        except ValueError as e:
+            # json.JSONDecodeError, orjson.JSONDecodeError 모두 ValueError의 하위 클래스
+            if not skip_invalid:
+                raise ValueError(f"Error at line {line_num}: {e}") from None
+            decoded.skipped.append(f"line {line_num}: {e}")
+        else:
+            decoded.page_contents.append(page_content)
+            decoded.metadatas.append(metadata)
+            line_nums.append(line_num)
+            embeddings.append(embedding)
+
+    try:
+        decoded.vectors = _pack_vectors(embeddings)
+    except (TypeError, ValueError):
+        decoded.vectors = _pack_valid_vectors(decoded, line_nums, embeddings, skip_invalid)
+
+    return decoded
+
+
+def iter_decoded_chunks(
+    file_path: Path,
+    chunk_size: int = 1000,
+    workers: Optional[int] = None,
+    skip_invalid: bool = False,
+    start_offset: int = 0,
+    start_line: int = 1,
+) -> Iterator[DecodedChunk]:
+    """
+    JSONL 파일을 chunk_size줄씩 디코딩하여 파일 순서대로 반환합니다.
+
+    workers개 프로세스에서 디코딩하며, 처리 중인 청크가 workers × IMPORT_CHUNKS_PER_WORKER개에
+    이르면 가장 먼저 제출한 청크를 받아 갈 때까지 더 읽지 않습니다.
+    workers가 1 이하이거나 파일이 한 청크뿐이면 현재 프로세스에서 디코딩합니다.
+
+    Args:
+        file_path: JSONL 파일 경로
+        chunk_size: 청크당 줄 수 (쓰기 배치 크기)
+        workers: 디코딩 프로세스 수 (기본값: default_import_workers())
+        skip_invalid: 잘못된 줄을 건너뛸지 여부
+        start_offset: 읽기 시작할 바이트 위치
+        start_line: start_offset 위치의 줄 번호
+    """
+    if workers is None:
+        workers = default_import_workers()
+
+    chunks = iter_line_chunks(file_path, chunk_size, start_offset=start_offset, start_line=start_line)
+    head = list(itertools.islice(chunks, 2))
+    chunks = itertools.chain(head, chunks)
+
+    if workers <= 1 or len(head) < 2:
+        for chunk in chunks:
+            yield decode_chunk(chunk, skip_invalid)
+        return
+
+    max_pending = workers * IMPORT_CHUNKS_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for chunk in chunks:
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(decode_chunk, chunk, skip_invalid))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # 쓰기 단계에서 실패하면 아직 시작하지 않은 디코딩은 취소
+            for future in pending:
+                future.cancel()
+
+
+@dataclass(frozen=True)
+class ImportCheckpoint:
+    """마지막으로 커밋한 배치까지의 위치
+
+    offset부터 다시 읽으면 커밋한 줄을 건너뛰고 이어서 임포트할 수 있습니다.
+    """
+
+    source: str  # JSONL 파일의 절대 경로
+    offset: int = 0  # 다음에 읽을 바이트 위치
+    line: int = 0  # 마지막으로 커밋한 줄 번호
+    rows: int = 0  # 지금까지 커밋한 행 수
+    completed: bool = False
+
+    @classmethod
+    def start(cls, file_path: Path) -> "ImportCheckpoint":
+        return cls(source=checkpoint_source(file_path))
+
+    def advance(self, chunk: DecodedChunk, rows: Optional[int] = None) -> "ImportCheckpoint":
+        """청크를 커밋한 뒤의 위치. rows는 청크에서 저장한 행 수 (기본값: 청크의 행 수)"""
+        rows = len(chunk) if rows is None else rows
+        return replace(self, offset=chunk.end_offset, line=chunk.end_line, rows=self.rows + rows)
+
+    def complete(self) -> "ImportCheckpoint":
+        return replace(self, completed=True)
+
+
+def checkpoint_source(file_path: Path) -> str:
+    """체크포인트에 기록할 파일 식별자 (절대 경로)"""
+    return str(Path(file_path).resolve())
+
+
+def check_resume(name: str, file_path: Path, checkpoint: ImportCheckpoint, clear_existing: bool = False) -> None:
+    """이어서 임포트할 체크포인트가 파일과 맞는지 확인하고 로그를 남깁니다."""
+    if checkpoint.offset > Path(file_path).stat().st_size:
+        raise ValueError(
+            f"Checkpoint offset {checkpoint.offset} is beyond the end of '{file_path}'. "
+            "Was the file changed since the last import?"
+        )
+    if checkpoint.completed:
+        logger.info(f"'{file_path}' has already been imported into '{name}'")
+        return
+    if clear_existing:
+        logger.warning("Keeping existing data because the import is resumed from a checkpoint")
+    logger.info(
+        f"Resuming import into '{name}' from line {checkpoint.line + 1:,} "
+        f"({checkpoint.rows:,} records already imported)"
+    )
+
+
+def checkpoint_file_path(source: str, collection_name: str) -> Path:
+    """체크포인트 사이드카 파일 경로: <JSONL 파일>.<컬렉션>.checkpoint"""
+    path = Path(source)
+    return path.with_name(f"{path.name}.{collection_name}.checkpoint")
+
+
+def read_checkpoint_file(path: Path) -> Optional[ImportCheckpoint]:
+    try:
+        return ImportCheckpoint(**json.loads(path.read_text(encoding="utf-8")))
+    except FileNotFoundError:
+        return None
+
+
+def write_checkpoint_file(path: Path, checkpoint: ImportCheckpoint) -> None:
+    """임시 파일에 쓴 뒤 교체하므로 중간에 중단되어도 이전 체크포인트가 남습니다."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(asdict(checkpoint)), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+# 데이터와 같은 트랜잭션에서 체크포인트를 기록하는 테이블 (SQLite, PostgreSQL 공용)
+IMPORT_CHECKPOINT_TABLE = "pyhub_import_checkpoints"
+
+IMPORT_CHECKPOINT_TABLE_SQL = f"""
+    CREATE TABLE IF NOT EXISTS {IMPORT_CHECKPOINT_TABLE} (
+        collection TEXT NOT NULL,
+        source TEXT NOT NULL,
+        byte_offset BIGINT NOT NULL,
+        line BIGINT NOT NULL,
+        row_count BIGINT NOT NULL,
+        completed BOOLEAN NOT NULL,
+        PRIMARY KEY (collection, source)
+    )
+    """
+
+
+def load_checkpoint_sql(collection_name: str, source: str, placeholder: str = "?") -> Tuple[str, tuple]:
+    return (
+        f"SELECT byte_offset, line, row_count, completed FROM {IMPORT_CHECKPOINT_TABLE} "
+        f"WHERE collection = {placeholder} AND source = {placeholder}",
+        (collection_name, source),
+    )
+
+
+def save_checkpoint_sql(
+    collection_name: str, checkpoint: ImportCheckpoint, placeholder: str = "?"
+) -> Tuple[str, tuple]:
+    values = ", ".join([placeholder] * 6)
+    return (
+        f"INSERT INTO {IMPORT_CHECKPOINT_TABLE} (collection, source, byte_offset, line, row_count, completed) "
+        f"VALUES ({values}) ON CONFLICT (collection, source) DO UPDATE SET "
+        "byte_offset = excluded.byte_offset, line = excluded.line, row_count = excluded.row_count, "
+        "completed = excluded.completed",
+        (
+            collection_name,
+            checkpoint.source,
+            checkpoint.offset,
+            checkpoint.line,
+            checkpoint.rows,
+            checkpoint.completed,
+        ),
+    )
+
+
+def delete_checkpoint_sql(
+    collection_name: str, source: Optional[str] = None, placeholder: str = "?"
+) -> Tuple[str, tuple]:
+    """source가 없으면 컬렉션의 모든 체크포인트를 삭제합니다."""
+    if source is None:
+        return f"DELETE FROM {IMPORT_CHECKPOINT_TABLE} WHERE collection = {placeholder}", (collection_name,)
+    return (
+        f"DELETE FROM {IMPORT_CHECKPOINT_TABLE} WHERE collection = {placeholder} AND source = {placeholder}",
+        (collection_name, source),
+    )
+
+
+def checkpoint_from_row(source: str, row: Optional[tuple]) -> Optional[ImportCheckpoint]:
+    if row is None:
+        return None
+    offset, line, rows, completed = row
+    return ImportCheckpoint(source=source, offset=offset, line=line, rows=rows, completed=bool(completed))
+
+
+def load_checkpoint(cursor, collection_name: str, source: str, placeholder: str = "?") -> Optional[ImportCheckpoint]:
+    """체크포인트 테이블에서 읽습니다. 테이블이 없으면 만듭니다."""
+    cursor.execute(IMPORT_CHECKPOINT_TABLE_SQL)
+    cursor.execute(*load_checkpoint_sql(collection_name, source, placeholder))
+    return checkpoint_from_row(source, cursor.fetchone())
+
+
+def save_checkpoint(cursor, collection_name: str, checkpoint: ImportCheckpoint, placeholder: str = "?") -> None:
+    """체크포인트를 기록합니다. 배치를 삽입한 트랜잭션 안에서 호출해야 중복 삽입이 생기지 않습니다."""
+    cursor.execute(*save_checkpoint_sql(collection_name, checkpoint, placeholder))
+
+
+def delete_checkpoint(cursor, collection_name: str, source: Optional[str] = None, placeholder: str = "?") -> None:
+    """체크포인트를 삭제합니다. 테이블이 없으면 만듭니다."""
+    cursor.execute(IMPORT_CHECKPOINT_TABLE_SQL)
+    cursor.execute(*delete_checkpoint_sql(collection_name, source, placeholder))
+
+
+class ImportProgress:
+    """
+    임포트 진행 상황
+
+    파일 크기 대비 읽은 바이트로 진행률을, 시작 이후 경과 시간으로 초당 행 수를 계산합니다.
+    """
+
+    def __init__(self, file_path: Path, name: str = "", start_offset: int = 0, start_line: int = 1):
+        self.name = name
+        self.total_bytes = Path(file_path).stat().st_size
+        self.offset = start_offset
+        self.line = start_line - 1  # 마지막으로 쓴 줄 번호
+        self.rows = 0
+        self.skipped = 0
+        self.started = time.monotonic()
+        self._start_offset = start_offset
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def percent(self) -> float:
+        if self.total_bytes <= self._start_offset:
+            return 100.0
+        return (self.offset - self._start_offset) / (self.total_bytes - self._start_offset) * 100
+
+    def advance(self, chunk: DecodedChunk, written: int) -> None:
+        """청크 하나를 쓴 뒤 호출합니다."""
+        for reason in chunk.skipped:
+            logger.warning(f"Skipping invalid data at {reason}")
+        self.rows += written
+        self.skipped += len(chunk.skipped)
+        self.offset = chunk.end_offset
+        self.line = chunk.end_line
+        logger.info(str(self))
+
+    def __str__(self) -> str:
+        target = f" into '{self.name}'" if self.name else ""
+        return f"Imported {self.rows:,} records{target} ({self.percent:.1f}%, {self.rows_per_second:,.0f} rows/s)"
+
+
+def run_import(
+    file_path: Path,
+    write: Callable[[DecodedChunk], int],
+    chunk_size: int = 1000,
+    workers: Optional[int] = None,
+    skip_invalid: bool = False,
+    progress: Optional[Callable[[ImportProgress], None]] = None,
+    name: str = "",
+    checkpoint: Optional[ImportCheckpoint] = None,
+) -> ImportProgress:
+    """
+    디코딩한 청크를 write에 차례로 넘깁니다. write는 호출한 스레드에서만 실행되는 유일한 쓰기 단계입니다.
+
+    Args:
+        file_path: JSONL 파일 경로
+        write: 청크를 저장하고 저장한 행 수를 반환하는 함수
+        chunk_size: 청크당 줄 수
+        workers: 디코딩 프로세스 수
+        skip_invalid: 잘못된 줄을 건너뛸지 여부
+        progress: 청크를 쓸 때마다 호출할 함수
+        name: 로그에 표시할 대상 이름
+        checkpoint: 이어서 임포트할 위치
+
+    Returns:
+        최종 진행 상황 (행 수, 건너뛴 줄 수, 초당 행 수)
+    """
+    start_offset, start_line = (checkpoint.offset, checkpoint.line + 1) if checkpoint else (0, 1)
+    stats = ImportProgress(file_path, name=name, start_offset=start_offset, start_line=start_line)
+    chunks = iter_decoded_chunks(
+        file_path,
+        chunk_size,
+        workers=workers,
+        skip_invalid=skip_invalid,
+        start_offset=start_offset,
+        start_line=start_line,
+    )
+    for chunk in chunks:
+        stats.advance(chunk, write(chunk))
+        if progress is not None:
+            progress(stats)
+    return stats
+
+
+def iter_import_rows(
+    file_path: Path,
+    stats: ImportProgress,
+    chunk_size: int = 1000,
+    workers: Optional[int] = None,
+    skip_invalid: bool = False,
+    progress: Optional[Callable[[ImportProgress], None]] = None,
+    checkpoint: Optional[ImportCheckpoint] = None,
+) -> Iterator[JsonlRow]:
+    """
+    디코딩한 (page_content, metadata, embedding) 행을 하나씩 반환합니다.
+
+    COPY처럼 행 스트림을 받는 쓰기 단계에서 사용하며, 청크의 마지막 행을 넘겨준 뒤 stats를 갱신합니다.
+    checkpoint가 있으면 그 위치부터 읽습니다.
+    """
+    start_offset, start_line = (checkpoint.offset, checkpoint.line + 1) if checkpoint else (0, 1)
+    chunks = iter_decoded_chunks(
+        file_path,
+        chunk_size,
+        workers=workers,
+        skip_invalid=skip_invalid,
+        start_offset=start_offset,
+        start_line=start_line,
+    )
+    for chunk in chunks:
+        yield from chunk.rows()
+        stats.advance(chunk, len(chunk))
+        if progress is not None:
+            progress(stats)
+
+
+__all__ = [
+    "IMPORT_CHECKPOINT_TABLE",
+    "IMPORT_CHECKPOINT_TABLE_SQL",
+    "DecodedChunk",
+    "ImportCheckpoint",
+    "ImportProgress",
+    "LineChunk",
+    "check_resume",
+    "checkpoint_file_path",
+    "checkpoint_from_row",
+    "checkpoint_source",
+    "decode_chunk",
+    "default_import_workers",
+    "delete_checkpoint",
+    "delete_checkpoint_sql",
+    "iter_decoded_chunks",
+    "iter_import_rows",
+    "iter_line_chunks",
+    "json_loads",
+    "load_checkpoint",
+    "load_checkpoint_sql",
+    "read_checkpoint_file",
+    "run_import",
+    "save_checkpoint",
+    "save_checkpoint_sql",
+    "write_checkpoint_file",
+]
@@ -0,0 +1,155 @@
+"""메타데이터 필터를 고려한 검색 계획 수립."""
+
+import json
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Literal, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def json_filter_param(value: Any) -> Any:
+    """SQLite json_extract() 결과와 비교할 파라미터
+
+    json_extract()는 문자열/숫자는 SQL 값으로, true/false는 1/0으로, 객체/배열은 JSON 문자열로 반환합니다.
+    """
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    return value
+
+
+def matches_filter(metadata: Optional[Dict[str, Any]], filter: Dict[str, Any]) -> bool:
+    """메타데이터가 필터의 모든 키/값과 일치하는지 확인합니다."""
+    metadata = metadata or {}
+    return all(key in metadata and metadata[key] == value for key, value in filter.items())
+
+
+@dataclass
+class CollectionStats:
+    """컬렉션별 필터 선택도 추정용 통계
+
+    전체 문서 수와 무작위로 뽑은 메타데이터 표본을 보관합니다.
+    """
+
+    total: int
+    sample: List[Dict[str, Any]] = field(default_factory=list)
+    collected_at: float = field(default_factory=time.monotonic)
+    # 통계 수집 이후 삽입된 문서 수
+    changed: int = 0
+
+    def is_stale(self, ttl: float, max_change_ratio: float = 0.2) -> bool:
+        if time.monotonic() - self.collected_at > ttl:
+            return True
+        return self.changed > max(self.total, 1) * max_change_ratio
+
+    def selectivity(self, filter: Dict[str, Any]) -> float:
+        """필터를 만족하는 문서 비율을 추정합니다 (0 ~ 1)."""
+        if not filter:
+            return 1.0
+        if not self.sample:
+            return 1.0
+
+        matched = sum(1 for metadata in self.sample if matches_filter(metadata, filter))
+        # 표본에 하나도 없더라도 0으로 단정하지 않도록 보정
+        return (matched + 0.5) / (len(self.sample) + 1)
+
+
+@dataclass
+class FilterPlan:
+    """검색 계획
+
+    - exact: 필터를 먼저 적용한 뒤 남은 문서 전체와 거리를 계산 (선택적인 필터)
+    - ann: 벡터 인덱스(KNN)로 fetch_k개를 먼저 가져온 뒤 필터 적용 (넓은 필터)
+    """
+
+    strategy: Literal["exact", "ann"]
+    selectivity: float
+    estimated_matches: int
+    fetch_k: int
+
+
+class FilterPlanner:
+    """필터 선택도에 따라 정확 검색과 over-fetch ANN 검색 중 하나를 고르는 플래너
+
+    Args:
+        exact_selectivity: 추정 선택도가 이 값 이하이면 필터를 먼저 적용하는 정확 검색 사용
+        overfetch_factor: ANN 검색 시 k / 선택도에 곱할 여유 배수
+        max_fetch_k: ANN 검색으로 가져올 최대 후보 수. 넘어서면 정확 검색으로 전환
+        sample_size: 통계 수집 시 표본 문서 수
+        stats_ttl: 통계 유효 시간 (초)
+        indexed_exact_rows: 모든 필터 키에 인덱스가 있을 때, 추정 매칭 문서 수가 이 값 이하이면 정확 검색 사용
+    """
+
+    def __init__(
+        self,
+        exact_selectivity: float = 0.05,
+        overfetch_factor: float = 2.0,
+        max_fetch_k: int = 10000,
+        sample_size: int = 1000,
+        stats_ttl: float = 300,
+        indexed_exact_rows: int = 20000,
+    ):
+        self.exact_selectivity = exact_selectivity
+        self.overfetch_factor = overfetch_factor
+        self.max_fetch_k = max_fetch_k
+        self.sample_size = sample_size
+        self.stats_ttl = stats_ttl
+        self.indexed_exact_rows = indexed_exact_rows
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], **defaults) -> "FilterPlanner":
+        """백엔드 설정의 planner_* 항목으로 플래너를 생성합니다."""
+        options = dict(defaults)
+        for name in (
+            "exact_selectivity",
+            "overfetch_factor",
+            "max_fetch_k",
+            "sample_size",
+            "stats_ttl",
+            "indexed_exact_rows",
+        ):
+            if f"planner_{name}" in config:
+                options[name] = config[f"planner_{name}"]
+        return cls(**options)
+
+    def plan(self, k: int, stats: CollectionStats, filter: Dict[str, Any], indexed: bool = False) -> FilterPlan:
+        """검색 계획을 수립합니다.
+
+        indexed가 참이면 필터를 인덱스로 처리할 수 있으므로, 정확 검색 비용이 전체 문서 수가 아닌
+        매칭 문서 수에 비례한다고 보고 indexed_exact_rows 이하에서는 정확 검색을 고릅니다.
+        """
+        selectivity = stats.selectivity(filter)
+        estimated_matches = math.ceil(selectivity * stats.total)
+        fetch_k = self.initial_fetch_k(k, selectivity, stats.total)
+
+        if selectivity <= self.exact_selectivity or fetch_k > self.max_fetch_k:
+            strategy = "exact"
+        elif indexed and estimated_matches <= self.indexed_exact_rows:
+            strategy = "exact"
+        else:
+            strategy = "ann"
+
+        plan = FilterPlan(
+            strategy=strategy, selectivity=selectivity, estimated_matches=estimated_matches, fetch_k=fetch_k
+        )
+        logger.debug("Filter plan : %s", plan)
+        return plan
+
+    def initial_fetch_k(self, k: int, selectivity: float, total: int) -> int:
+        fetch_k = math.ceil(k / max(selectivity, 1e-9) * self.overfetch_factor)
+        return max(k, min(fetch_k, max(total, k)))
+
+    def next_fetch_k(self, k: int, fetch_k: int, found: int) -> int:
+        """후보 fetch_k개 중 found개만 필터를 통과했을 때 다음에 가져올 후보 수
+
+        관측된 통과 비율로 필요한 후보 수를 다시 계산하며, 최소 2배씩 늘립니다.
+        """
+        observed = max(found, 0.5) / fetch_k
+        return max(fetch_k * 2, math.ceil(k / observed * self.overfetch_factor))
+
+
+__all__ = ["CollectionStats", "FilterPlan", "FilterPlanner", "json_filter_param", "matches_filter"]
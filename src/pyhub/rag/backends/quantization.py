@@ -0,0 +1,48 @@
+"""벡터 양자화 검색 설정."""
+
+from typing import Dict, Optional, Tuple
+
+# 양자화 방식 → float32 대비 벡터 크기 축소 비율
+QUANTIZATION_RATIOS: Dict[str, int] = {"halfvec": 2, "int8": 4, "binary": 32}
+
+# 재정렬할 후보 수 = k × rerank_factor
+DEFAULT_RERANK_FACTOR = 4
+
+
+def validate_quantization(
+    quantization: Optional[str], dimension: int, supported: Tuple[str, ...] = tuple(QUANTIZATION_RATIOS)
+) -> Optional[str]:
+    """
+    양자화 방식을 검증합니다.
+
+    Args:
+        quantization: halfvec, int8, binary 또는 None (양자화하지 않음)
+        dimension: 벡터 차원
+        supported: 백엔드가 지원하는 양자화 방식
+
+    Returns:
+        검증된 양자화 방식
+    """
+    if quantization is None:
+        return None
+    if quantization not in supported:
+        raise ValueError(f"Unsupported quantization: {quantization}. Available: {list(supported)}")
+    if quantization == "binary" and dimension % 8 != 0:
+        raise ValueError(f"Binary quantization requires a dimension divisible by 8: {dimension}")
+    return quantization
+
+
+def rerank_candidates(k: int, rerank_factor: Optional[float], max_candidates: int) -> int:
+    """
+    양자화 벡터로 가져올 재정렬 후보 수를 반환합니다.
+
+    후보가 많을수록 재현율이 높아지고, 원본 벡터와의 거리 계산이 늘어납니다.
+    """
+    if rerank_factor is None:
+        rerank_factor = DEFAULT_RERANK_FACTOR
+    if rerank_factor < 1:
+        raise ValueError(f"rerank_factor must be at least 1: {rerank_factor}")
+    return max(k, min(int(k * rerank_factor), max_candidates))
+
+
+__all__ = ["DEFAULT_RERANK_FACTOR", "QUANTIZATION_RATIOS", "rerank_candidates", "validate_quantization"]
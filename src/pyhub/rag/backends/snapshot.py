@@ -0,0 +1,203 @@
+"""컬렉션 스냅샷 (float32 벡터 .npy + 문서 JSONL) 쓰기와 읽기."""
+
+import json
+import struct
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .pipeline import JsonlRow, json_loads
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# .npy 파일 헤더 크기. 행을 덧붙여 shape가 커져도 헤더 길이가 바뀌지 않도록 여유 있게 고정합니다.
+NPY_HEADER_SIZE = 128
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+SNAPSHOT_FORMAT = "pyhub-rag-snapshot"
+SNAPSHOT_VERSION = 1
+
+# 스냅샷 디렉토리의 파일 이름
+SNAPSHOT_MANIFEST = "manifest.json"
+SNAPSHOT_VECTORS = "vectors.npy"
+SNAPSHOT_DOCUMENTS = "documents.jsonl"
+
+# 벡터 dtype (little-endian float32)
+SNAPSHOT_DTYPE = "<f4"
+
+
+def npy_header(shape: Tuple[int, ...], dtype: str) -> bytes:
+    """NPY_HEADER_SIZE 바이트로 고정한 .npy (버전 1.0) 헤더"""
+    header = repr({"descr": dtype, "fortran_order": False, "shape": tuple(shape)})
+    header_len = NPY_HEADER_SIZE - len(NPY_MAGIC) - 2
+    if len(header) >= header_len:
+        raise ValueError(f"Array shape too large for npy header: {shape}")
+    return NPY_MAGIC + struct.pack("<H", header_len) + (header.ljust(header_len - 1) + "\n").encode("latin1")
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Collection snapshots require numpy. Install with: pip install numpy")
+
+
+@dataclass
+class SnapshotBatch:
+    """스냅샷에 쓰거나 스냅샷에서 읽은 문서 묶음. vectors는 (행 수 × 차원) float32 행렬입니다."""
+
+    page_contents: List[str]
+    metadatas: List[Dict[str, Any]]
+    vectors: Any
+
+    def __len__(self) -> int:
+        return len(self.page_contents)
+
+    def rows(self) -> Iterator[JsonlRow]:
+        """(page_content, metadata, embedding) 이터레이터"""
+        return zip(self.page_contents, self.metadatas, self.vectors)
+
+
+class SnapshotWriter:
+    """
+    컬렉션 스냅샷 디렉토리를 씁니다.
+
+    - vectors.npy: (행 수 × 차원) float32 벡터. 배치마다 덧붙이고 닫을 때 헤더의 행 수를 갱신합니다.
+    - documents.jsonl: 행마다 {"page_content", "metadata"} 한 줄 (vectors.npy와 같은 순서)
+    - manifest.json: 형식 버전, 원본 백엔드, 차원, 거리 메트릭, 행 수, 컬렉션 정보
+
+    manifest.json은 모든 데이터를 쓴 뒤 마지막에 쓰므로, 중간에 실패한 스냅샷은 복원할 수 없습니다.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        collection_name: str,
+        backend: str,
+        dimension: int,
+        distance_metric: Optional[str],
+        collection_info: Optional[Dict[str, Any]] = None,
+    ):
+        _require_numpy()
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        # 이전 스냅샷을 덮어쓰는 동안 남은 manifest.json으로 복원하지 않도록 먼저 지웁니다.
+        (self.path / SNAPSHOT_MANIFEST).unlink(missing_ok=True)
+
+        self.manifest = {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_VERSION,
+            "collection": collection_name,
+            "backend": backend,
+            "dimension": dimension,
+            "distance_metric": distance_metric,
+            "dtype": SNAPSHOT_DTYPE,
+            "count": 0,
+            "collection_info": collection_info or {},
+        }
+        self.dimension = dimension
+        self.count = 0
+        self._vectors = open(self.path / SNAPSHOT_VECTORS, "wb")
+        self._vectors.write(npy_header((0, dimension), SNAPSHOT_DTYPE))
+        self._documents = open(self.path / SNAPSHOT_DOCUMENTS, "wb")
+
+    def write(self, batch: SnapshotBatch) -> int:
+        """배치를 파일 끝에 덧붙이고 쓴 행 수를 반환합니다."""
+        vectors = np.ascontiguousarray(batch.vectors, dtype=SNAPSHOT_DTYPE)
+        if vectors.shape != (len(batch), self.dimension):
+            raise ValueError(f"Embedding dimension mismatch: expected {self.dimension}, got {vectors.shape[1:]}")
+
+        lines = [
+            json.dumps({"page_content": page_content, "metadata": metadata}, ensure_ascii=False) + "\n"
+            for page_content, metadata in zip(batch.page_contents, batch.metadatas)
+        ]
+        self._vectors.write(vectors.tobytes())
+        self._documents.write("".join(lines).encode("utf-8"))
+        self.count += len(batch)
+        return len(batch)
+
+    def close(self) -> None:
+        """벡터 파일 헤더의 행 수를 갱신하고 manifest.json을 씁니다."""
+        self._documents.close()
+        self._vectors.seek(0)
+        self._vectors.write(npy_header((self.count, self.dimension), SNAPSHOT_DTYPE))
+        self._vectors.close()
+
+        self.manifest["count"] = self.count
+        self.manifest["created_at"] = datetime.now(timezone.utc).isoformat()
+        (self.path / SNAPSHOT_MANIFEST).write_text(
+            json.dumps(self.manifest, ensure_ascii=False, indent=2, default=str), encoding="utf-8"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._documents.close()
+            self._vectors.close()
+
+
+def read_manifest(path: Path) -> Dict[str, Any]:
+    """스냅샷 디렉토리의 manifest.json을 읽고 형식을 확인합니다."""
+    manifest_path = Path(path) / SNAPSHOT_MANIFEST
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"Snapshot manifest not found: {manifest_path}")
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if manifest.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"Not a collection snapshot: {path}")
+    if manifest.get("version", 0) > SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {manifest['version']}: {path}")
+    return manifest
+
+
+def iter_snapshot_batches(path: Path, batch_size: int = 1000) -> Iterator[SnapshotBatch]:
+    """
+    스냅샷을 batch_size행씩 읽습니다.
+
+    벡터 파일은 메모리 매핑하여 배치만큼만 읽으므로 컬렉션 크기와 관계없이 메모리 사용량이 일정합니다.
+    """
+    _require_numpy()
+    path = Path(path)
+    manifest = read_manifest(path)
+    if manifest["count"] == 0:
+        return
+
+    vectors = np.load(path / SNAPSHOT_VECTORS, mmap_mode="r")
+    if vectors.shape != (manifest["count"], manifest["dimension"]):
+        raise ValueError(
+            f"Snapshot vectors shape {vectors.shape} does not match manifest "
+            f"({manifest['count']}, {manifest['dimension']})"
+        )
+
+    with open(path / SNAPSHOT_DOCUMENTS, "rb") as f:
+        for start in range(0, manifest["count"], batch_size):
+            end = min(start + batch_size, manifest["count"])
+            page_contents, metadatas = [], []
+            for __ in range(end - start):
+                line = f.readline()
+                if not line:
+                    raise ValueError(f"Snapshot documents end at row {start + len(page_contents)}: {path}")
+                data = json_loads(line)
+                page_contents.append(data["page_content"])
+                metadatas.append(data.get("metadata") or {})
+            yield SnapshotBatch(page_contents, metadatas, np.asarray(vectors[start:end], dtype=np.float32))
+
+
+__all__ = [
+    "NPY_HEADER_SIZE",
+    "NPY_MAGIC",
+    "SNAPSHOT_DOCUMENTS",
+    "SNAPSHOT_MANIFEST",
+    "SNAPSHOT_VECTORS",
+    "SnapshotBatch",
+    "SnapshotWriter",
+    "iter_snapshot_batches",
+    "npy_header",
+    "read_manifest",
+]
@@ -2,15 +2,243 @@
 
 import json
 import logging
+import os
+import re
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Generator, Iterator, List, Optional
 
+from ..utils import serialize_f32, serialize_f32_batch
+from . import ivf
 from .base import BaseVectorStore, Document, SearchResult
+from .hybrid import tokenize_query
+from .pipeline import (
+    ImportCheckpoint,
+    checkpoint_source,
+    delete_checkpoint,
+    load_checkpoint,
+    save_checkpoint,
+)
+from .planner import (
+    CollectionStats,
+    FilterPlan,
+    FilterPlanner,
+    json_filter_param,
+    matches_filter,
+)
+from .quantization import rerank_candidates, validate_quantization
+from .snapshot import SnapshotBatch
 
 logger = logging.getLogger(__name__)
 
 
+# create_collection의 distance_metric 값 → vec0 distance_metric 옵션
+VEC0_DISTANCE_METRICS = {"cosine": "cosine", "l2": "l2", "l1": "l1"}
+
+# 필터를 먼저 적용하는 정확 검색에서 사용하는 거리 함수
+VEC0_DISTANCE_FUNCTIONS = {"cosine": "vec_distance_cosine", "l2": "vec_distance_L2", "l1": "vec_distance_L1"}
+
+# vec0 KNN 쿼리의 최대 k
+VEC0_MAX_K = 4096
+
+# 양자화 방식 → 양자화 벡터 컬럼(embedding_q) 타입
+VEC0_QUANTIZATION_TYPES = {"int8": "int8", "binary": "bit"}
+
+# 양자화 방식 → float32 벡터를 양자화하는 SQL 식
+# int8은 각 성분이 [-1, 1] 범위인 정규화된 임베딩을 가정합니다.
+VEC0_QUANTIZE_EXPRESSIONS = {"int8": "vec_quantize_int8(?, 'unit')", "binary": "vec_quantize_binary(?)"}
+
+# IVF 파티션 번호를 저장하는 vec0 partition key 컬럼
+IVF_PARTITION_COLUMN = "ivf_list"
+
+# SQLite 복합 SELECT(UNION ALL)의 최대 항 수 (SQLITE_MAX_COMPOUND_SELECT)
+SQLITE_MAX_COMPOUND_SELECT = 500
+
+# 비동기 메서드 전용 실행기의 기본 스레드 수
+DEFAULT_ASYNC_WORKERS = 4
+
+# 전문 검색(FTS5) 기본 토크나이저. trigram은 띄어쓰기와 조사에 관계없이 부분 문자열로 찾으므로
+# 한국어 문서와 부품 번호 검색에 적합하지만, 3글자 미만의 검색어는 무시됩니다.
+DEFAULT_FTS_TOKENIZER = "trigram"
+
+# vec0 메타데이터 컬럼 타입
+VEC0_COLUMN_TYPES = {
+    "text": "text",
+    "str": "text",
+    "integer": "integer",
+    "int": "integer",
+    "float": "float",
+    "boolean": "boolean",
+    "bool": "boolean",
+}
+
+# vec0 메타데이터 컬럼은 NULL을 허용하지 않으므로 값이 없거나 타입이 다를 때 사용할 기본값
+VEC0_COLUMN_DEFAULTS = {"text": "", "integer": 0, "float": 0.0, "boolean": 0}
+
+# 일반 테이블에 추가하는 생성 컬럼의 SQL 타입 (메타데이터 컬럼 타입 → SQLite 타입)
+SQLITE_COLUMN_TYPES = {"text": "TEXT", "integer": "INTEGER", "float": "REAL", "boolean": "BOOLEAN"}
+SQLITE_GENERATED_COLUMN_TYPES = {sql_type.lower(): column_type for column_type, sql_type in SQLITE_COLUMN_TYPES.items()}
+
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _normalize_metadata_columns(metadata_columns: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """{키: 타입} 사전을 검증하여 vec0 컬럼 타입으로 변환합니다."""
+    normalized = {}
+    for column, column_type in (metadata_columns or {}).items():
+        if not _IDENTIFIER_PATTERN.match(column) or column.lower() in ("embedding", "page_content", "metadata"):
+            raise ValueError(f"Invalid metadata column name: {column}")
+
+        type_name = getattr(column_type, "__name__", column_type)
+        if type_name not in VEC0_COLUMN_TYPES:
+            raise ValueError(f"Unsupported metadata column type for '{column}': {column_type}")
+        normalized[column] = VEC0_COLUMN_TYPES[type_name]
+    return normalized
+
+
+def _metadata_column_value(column_type: str, value: Any) -> Any:
+    """vec0 메타데이터 컬럼에 저장할 값. 값이 없거나 JSON 타입이 컬럼 타입과 다르면 None
+
+    pgvector 생성 컬럼(jsonb_typeof 확인)과 같이 타입이 다른 값은 변환하지 않고 값이 없는 것으로 봅니다.
+    """
+    if column_type == "boolean":
+        return int(value) if isinstance(value, bool) else None
+    if isinstance(value, bool):
+        return None
+    if column_type == "integer":
+        return value if isinstance(value, int) else None
+    if column_type == "float":
+        return float(value) if isinstance(value, (int, float)) else None
+    return value if isinstance(value, str) else None
+
+
+def _column_filter_param(value: Any) -> Any:
+    """vec0 메타데이터 컬럼 비교에 사용할 파라미터"""
+    return int(value) if isinstance(value, bool) else value
+
+
+def _vec0_column_defs(
+    dimension: int,
+    distance_metric: str,
+    metadata_columns: Dict[str, str],
+    quantization: Optional[str] = None,
+    ivf: bool = False,
+) -> List[str]:
+    """vec0 테이블의 컬럼 정의 목록
+
+    양자화하면 원본 embedding과 함께 양자화 벡터 컬럼(embedding_q)을 두고, KNN은 embedding_q에서 수행합니다.
+    IVF 컬렉션은 파티션 번호를 partition key 컬럼(ivf_list)에 저장하여 파티션별로 벡터를 나눠 둡니다.
+    """
+    column_defs = [f"embedding float[{dimension}] distance_metric={distance_metric}"]
+    if quantization == "int8":
+        column_defs.append(f"embedding_q int8[{dimension}] distance_metric={distance_metric}")
+    elif quantization == "binary":
+        # bit 벡터는 해밍 거리만 지원
+        column_defs.append(f"embedding_q bit[{dimension}]")
+    if ivf:
+        column_defs.append(f"{IVF_PARTITION_COLUMN} integer partition key")
+    column_defs += [f"{column} {column_type}" for column, column_type in metadata_columns.items()]
+    column_defs += ["+page_content text", "+metadata text"]
+    return column_defs
+
+
+@dataclass
+class _CollectionSchema:
+    """sqlite_master의 CREATE 문에서 읽은 컬렉션 스키마"""
+
+    vec0: bool
+    dimension: Optional[int] = None
+    distance_metric: Optional[str] = None
+    metadata_columns: Dict[str, str] = field(default_factory=dict)
+    # 양자화 벡터 컬럼(embedding_q)의 양자화 방식 (int8, binary)
+    quantization: Optional[str] = None
+    # 전문 검색 테이블({name}_fts) 존재 여부
+    lexical: bool = False
+    # IVF 파티션 컬럼(ivf_list) 존재 여부와 파티션 중심점({name}_ivf 테이블)
+    ivf: bool = False
+    ivf_centroids: Any = None
+
+    @classmethod
+    def parse(cls, create_sql: str) -> "_CollectionSchema":
+        body = create_sql[create_sql.index("(") + 1 : create_sql.rindex(")")]
+
+        if not re.search(r"\bUSING\s+vec0\s*\(", create_sql, re.IGNORECASE):
+            # 이전 버전에서 만든 일반 테이블 (embedding FLOAT32[N])
+            match = re.search(r"\bembedding\s+float(?:32)?\[(\d+)\]", create_sql, re.IGNORECASE)
+            schema = cls(vec0=False, dimension=int(match.group(1)) if match else None)
+
+            # promote_metadata_keys()로 추가한 생성 컬럼
+            for column_def in _split_column_defs(body):
+                tokens = column_def.split()
+                if len(tokens) > 1 and "generated always" in column_def.lower():
+                    schema.metadata_columns[tokens[0]] = SQLITE_GENERATED_COLUMN_TYPES.get(tokens[1].lower(), "text")
+            return schema
+
+        schema = cls(vec0=True, distance_metric="l2")
+        for column_def in _split_column_defs(body):
+            tokens = column_def.split()
+            if not tokens or tokens[0].startswith("+"):
+                # 보조(auxiliary) 컬럼
+                continue
+            if "partition key" in column_def.lower():
+                schema.ivf = tokens[0] == IVF_PARTITION_COLUMN
+                continue
+
+            name, column_type = tokens[0], tokens[1].lower() if len(tokens) > 1 else ""
+            match = re.match(r"(?:float|int8|bit)\[(\d+)\]", column_type)
+            if match and name == "embedding_q":
+                schema.quantization = "int8" if column_type.startswith("int8") else "binary"
+            elif match:
+                schema.dimension = int(match.group(1))
+                metric = re.search(r"distance_metric\s*=\s*(\w+)", column_def, re.IGNORECASE)
+                if metric:
+                    schema.distance_metric = metric.group(1).lower()
+            elif column_type in VEC0_COLUMN_DEFAULTS and "primary key" not in column_def.lower():
+                schema.metadata_columns[name] = column_type
+        return schema
+
+    def split_filter(self, filter: Dict[str, Any]) -> tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        필터를 (메타데이터 컬럼으로 비교할 필터, JSON으로 비교할 필터)로 나눕니다.
+
+        vec0 메타데이터 컬럼에는 키가 없거나 타입이 다른 문서에도 기본값이 저장되므로,
+        기본값이나 컬럼 타입과 다른 값으로 비교하는 키는 이런 문서가 매칭되지 않도록 JSON으로 비교합니다.
+        """
+        column_filter, json_filter = {}, {}
+        for key, value in filter.items():
+            column_type = self.metadata_columns.get(key)
+            if column_type is None:
+                json_filter[key] = value
+            elif not self.vec0:
+                column_filter[key] = value
+            else:
+                column_value = _metadata_column_value(column_type, value)
+                if column_value is None or column_value == VEC0_COLUMN_DEFAULTS[column_type]:
+                    json_filter[key] = value
+                else:
+                    column_filter[key] = column_value
+        return column_filter, json_filter
+
+
+def _split_column_defs(body: str) -> List[str]:
+    """CREATE 문의 컬럼 정의를 괄호 안의 쉼표는 무시하고 나눕니다."""
+    column_defs, depth, start = [], 0, 0
+    for i, char in enumerate(body):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            column_defs.append(body[start:i].strip())
+            start = i + 1
+    column_defs.append(body[start:].strip())
+    return [column_def for column_def in column_defs if column_def]
+
+
 class SqliteVecStore(BaseVectorStore):
     """SQLite-vec 벡터 스토어 백엔드."""
 
@@ -25,13 +253,71 @@ class SqliteVecStore(BaseVectorStore):
         # 디렉토리 생성
         self.config["db_path"].parent.mkdir(parents=True, exist_ok=True)
 
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+
+        # 스레드마다 하나의 연결을 열어 스토어가 닫힐 때까지 재사용합니다.
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._pid = os.getpid()
+
+        # 비동기 메서드 전용 실행기 (처음 사용할 때 생성)
+        self._async_executor: Optional[ThreadPoolExecutor] = None
+
+        # 컬렉션 이름 → 스키마 캐시
+        self._schemas: Dict[str, _CollectionSchema] = {}
+
+        # 필터 검색 플래너와 컬렉션별 통계 (vec0 KNN의 k는 최대 4096)
+        self.planner = FilterPlanner.from_config(self.config, max_fetch_k=VEC0_MAX_K)
+        self._stats: Dict[str, CollectionStats] = {}
+
     def _get_connection(self) -> sqlite3.Connection:
-        """데이터베이스 연결을 반환합니다."""
-        conn = sqlite3.connect(str(self.config["db_path"]))
+        """현재 스레드의 데이터베이스 연결을 반환합니다. 없으면 새로 엽니다."""
+        if self._pid != os.getpid():
+            # fork된 자식 프로세스에서는 부모의 연결을 공유하지 않습니다.
+            self._local = threading.local()
+            self._connections = []
+            self._async_executor = None
+            self._pid = os.getpid()
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """sqlite-vec 확장과 PRAGMA 설정을 적용한 새 연결을 엽니다."""
+        # close()는 다른 스레드에서 호출될 수 있으므로 check_same_thread를 끕니다.
+        # 연결 자체는 스레드별로만 사용됩니다.
+        conn = sqlite3.connect(str(self.config["db_path"]), check_same_thread=False)
 
-        # sqlite-vec 확장 로드
         try:
-            conn.enable_load_extension(True)
+            self._load_extension(conn)
+            self._apply_pragmas(conn)
+        except Exception:
+            conn.close()
+            raise
+
+        return conn
+
+    @staticmethod
+    def _load_extension(conn: sqlite3.Connection) -> None:
+        """sqlite-vec 확장을 로드합니다."""
+        conn.enable_load_extension(True)
+        try:
+            try:
+                import sqlite_vec
+            except ImportError:
+                sqlite_vec = None
+
+            if sqlite_vec is not None:
+                sqlite_vec.load(conn)
+                return
+
             try:
                 # 일반적인 위치 시도
                 conn.load_extension("vec")
@@ -57,36 +343,87 @@ class SqliteVecStore(BaseVectorStore):
                         r"C:\sqlite\vec.dll",
                     ]
 
-                loaded = False
                 for path in paths:
                     try:
                         conn.load_extension(path)
-                        loaded = True
-                        break
+                        return
                     except sqlite3.OperationalError:
                         continue
 
-                if not loaded:
-                    raise ImportError("sqlite-vec extension not found. " "Install with: pip install sqlite-vec")
+                raise ImportError("sqlite-vec extension not found. " "Install with: pip install sqlite-vec")
+        finally:
+            conn.enable_load_extension(False)
 
-        except Exception as e:
-            conn.close()
-            raise e
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """Django 데이터베이스 설정(get_databases)과 같은 PRAGMA를 적용합니다.
 
-        return conn
+        config의 "pragmas" 항목으로 개별 값을 덮어쓸 수 있습니다.
+        """
+        from pyhub.init import get_sqlite_pragmas
 
-    def is_available(self) -> bool:
-        """백엔드가 사용 가능한지 확인합니다."""
+        pragmas = {**get_sqlite_pragmas(), **self.config.get("pragmas", {})}
+        for name, value in pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+
+    @contextmanager
+    def _cursor(self) -> Generator[sqlite3.Cursor, None, None]:
+        """재사용 연결의 커서를 반환합니다. 성공하면 커밋하고, 예외가 발생하면 롤백합니다."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            yield cursor
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
 
-            # vec_version() 함수 확인
-            cursor.execute("SELECT vec_version()")
-            version = cursor.fetchone()
+    def _get_async_executor(self) -> ThreadPoolExecutor:
+        """
+        비동기 메서드 전용 실행기를 반환합니다.
+
+        작업 스레드마다 연결을 따로 열고, sqlite3는 쿼리 실행 중 GIL을 해제하므로
+        WAL 모드에서 동시에 들어온 비동기 검색이 병렬로 실행됩니다. 스레드 수는 설정의 async_workers(기본 4)입니다.
+        """
+        if self._async_executor is None:
+            with self._lock:
+                if self._async_executor is None:
+                    self._async_executor = ThreadPoolExecutor(
+                        max_workers=self.config.get("async_workers", DEFAULT_ASYNC_WORKERS),
+                        thread_name_prefix="sqlite-vec",
+                    )
+        return self._async_executor
+
+    def close(self) -> None:
+        """비동기 실행기를 종료하고 열려 있는 모든 연결을 닫습니다."""
+        with self._lock:
+            executor, self._async_executor = self._async_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.debug(f"Error closing sqlite connection: {e}")
+        self._local = threading.local()
 
-            cursor.close()
-            conn.close()
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def is_available(self) -> bool:
+        """백엔드가 사용 가능한지 확인합니다."""
+        try:
+            with self._cursor() as cursor:
+                # vec_version() 함수 확인
+                cursor.execute("SELECT vec_version()")
+                version = cursor.fetchone()
 
             return version is not None
 
@@ -95,78 +432,225 @@ class SqliteVecStore(BaseVectorStore):
             return False
 
     def create_collection(self, name: str, dimension: int, distance_metric: str = "cosine", **kwargs) -> None:
-        """벡터 컬렉션(테이블)을 생성합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            # 테이블 생성
-            create_sql = f"""
-            CREATE TABLE IF NOT EXISTS {name} (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                page_content TEXT NOT NULL,
-                metadata TEXT,
-                embedding FLOAT32[{dimension}]
+        """
+        벡터 컬렉션(vec0 가상 테이블)을 생성합니다.
+
+        page_content와 metadata(JSON)는 보조(auxiliary) 컬럼으로 저장하고,
+        metadata_columns로 지정한 키는 vec0 메타데이터 컬럼으로 만들어 KNN 검색 중에 필터링합니다.
+
+        Args:
+            name: 컬렉션 이름
+            dimension: 벡터 차원
+            distance_metric: 거리 메트릭 (cosine, l2, l1)
+            metadata_columns: {메타데이터 키: 타입} 사전. 타입은 text, integer, float, boolean
+                또는 str, int, float, bool
+            quantization: int8 (1/4 크기, 정규화된 임베딩 전용) 또는 binary (1/32 크기, 차원은 8의 배수).
+                KNN은 양자화 벡터로 후보를 고르고 원본 float32 벡터로 다시 정렬합니다.
+            lexical_index: 참이면 전문 검색(FTS5) 테이블을 함께 만듭니다 (lexical_search, hybrid_search).
+        """
+        if distance_metric not in VEC0_DISTANCE_METRICS:
+            raise ValueError(
+                f"Unsupported distance metric for sqlite-vec: {distance_metric}. "
+                f"Available: {list(VEC0_DISTANCE_METRICS)}"
             )
-            """
-            cursor.execute(create_sql)
 
-            # 벡터 인덱스 생성 (sqlite-vec는 자동으로 처리)
-            conn.commit()
+        metadata_columns = _normalize_metadata_columns(kwargs.get("metadata_columns"))
+        quantization = validate_quantization(
+            kwargs.get("quantization"), dimension, supported=tuple(VEC0_QUANTIZATION_TYPES)
+        )
+        column_defs = _vec0_column_defs(
+            dimension, VEC0_DISTANCE_METRICS[distance_metric], metadata_columns, quantization
+        )
 
-        finally:
-            cursor.close()
-            conn.close()
+        with self._cursor() as cursor:
+            cursor.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING vec0({', '.join(column_defs)})")
+            if kwargs.get("lexical_index"):
+                self._create_fts_table(cursor, name)
+
+        self._schemas.pop(name, None)
+        self._stats.pop(name, None)
 
     def drop_collection(self, name: str) -> None:
         """컬렉션을 삭제합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
+        with self._cursor() as cursor:
             cursor.execute(f"DROP TABLE IF EXISTS {name}")
-            conn.commit()
-        finally:
-            cursor.close()
-            conn.close()
+            cursor.execute(f"DROP TABLE IF EXISTS {name}_fts")
+            cursor.execute(f"DROP TABLE IF EXISTS {name}_ivf")
+            delete_checkpoint(cursor, name)
+
+        self._schemas.pop(name, None)
+        self._stats.pop(name, None)
 
     def collection_exists(self, name: str) -> bool:
         """컬렉션이 존재하는지 확인합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
+        with self._cursor() as cursor:
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (name,))
             return cursor.fetchone() is not None
-        finally:
-            cursor.close()
-            conn.close()
+
+    def _get_schema(self, name: str) -> "_CollectionSchema":
+        """컬렉션 스키마(vec0 여부, 차원, 거리 메트릭, 메타데이터 컬럼)를 반환합니다."""
+        schema = self._schemas.get(name)
+        if schema is None:
+            with self._cursor() as cursor:
+                cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (name,))
+                row = cursor.fetchone()
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (f"{name}_fts",))
+                lexical = cursor.fetchone() is not None
+
+                if row is None:
+                    raise ValueError(f"Collection not found: {name}")
+
+                schema = _CollectionSchema.parse(row[0])
+                if schema.ivf:
+                    cursor.execute(f"SELECT centroid FROM {name}_ivf ORDER BY list_id")
+                    blobs = [blob for (blob,) in cursor.fetchall()]
+                    schema.ivf_centroids = ivf.from_blobs(blobs, schema.dimension)
+
+            schema.lexical = lexical
+            self._schemas[name] = schema
+        return schema
+
+    @staticmethod
+    def _vec0_insert_sql(name: str, schema: "_CollectionSchema", with_rowid: bool = False) -> str:
+        """_make_row()의 행을 삽입하는 SQL. 양자화 벡터는 원본 벡터를 SQL에서 양자화하여 저장합니다."""
+        columns = ["embedding"]
+        placeholders = ["?"]
+        if schema.quantization:
+            columns.append("embedding_q")
+            placeholders.append(VEC0_QUANTIZE_EXPRESSIONS[schema.quantization])
+        if schema.ivf:
+            columns.append(IVF_PARTITION_COLUMN)
+            placeholders.append("?")
+        columns += [*schema.metadata_columns, "page_content", "metadata"]
+        placeholders += ["?"] * (len(schema.metadata_columns) + 2)
+        if with_rowid:
+            columns.insert(0, "rowid")
+            placeholders.insert(0, "?")
+        return f"INSERT INTO {name} ({', '.join(columns)}) VALUES ({', '.join(placeholders)})"
+
+    def _make_row(
+        self, schema: "_CollectionSchema", doc: Document, embedding: bytes, ivf_list: Optional[int] = None
+    ) -> tuple:
+        """
+        vec0 테이블에 삽입할 행을 만듭니다.
+
+        (embedding, [embedding_q], [ivf_list], 메타데이터 컬럼..., page_content, metadata)
+        """
+        values = [embedding, embedding] if schema.quantization else [embedding]
+        if schema.ivf:
+            values.append(int(ivf_list or 0))
+        for column, column_type in schema.metadata_columns.items():
+            value = _metadata_column_value(column_type, (doc.metadata or {}).get(column))
+            # vec0 메타데이터 컬럼은 NULL을 허용하지 않으므로 값이 없거나 타입이 다르면 타입별 기본값 사용
+            # (기본값으로 비교하는 필터는 JSON으로 비교하므로 이런 문서는 매칭되지 않습니다)
+            values.append(VEC0_COLUMN_DEFAULTS[column_type] if value is None else value)
+        values += [doc.page_content, json.dumps(doc.metadata)]
+        return tuple(values)
 
     def insert(self, collection_name: str, documents: List[Document], batch_size: int = 1000) -> int:
         """문서들을 컬렉션에 삽입합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._cursor() as cursor:
+            self._insert_rows(cursor, collection_name, documents, batch_size)
 
-        try:
-            data = [
-                (doc.page_content, json.dumps(doc.metadata), json.dumps(doc.embedding))  # sqlite-vec는 JSON 형태로 저장
-                for doc in documents
-            ]
+        self._update_stats(collection_name, len(documents))
+        return len(documents)
 
-            cursor.executemany(
-                f"""
-                INSERT INTO {collection_name} (page_content, metadata, embedding)
-                VALUES (?, ?, vec_f32(?))
-                """,
-                data,
-            )
-
-            conn.commit()
-            return len(documents)
+    def _insert_rows(
+        self, cursor: sqlite3.Cursor, collection_name: str, documents: List[Document], batch_size: int
+    ) -> None:
+        """호출한 쪽의 트랜잭션에서 문서들을 batch_size개씩 삽입합니다."""
+        schema = self._get_schema(collection_name)
 
+        if schema.vec0:
+            insert_sql = self._vec0_insert_sql(collection_name, schema)
+        else:
+            insert_sql = f"INSERT INTO {collection_name} (page_content, metadata, embedding) VALUES (?, ?, ?)"
+
+        for start in range(0, len(documents), batch_size):
+            batch = documents[start : start + batch_size]
+
+            # 벡터는 JSON 대신 little-endian float32 blob으로 저장
+            embeddings = serialize_f32_batch(doc.embedding for doc in batch)
+            if schema.vec0:
+                ivf_lists = self._assign_ivf_lists(schema, embeddings)
+                data = [
+                    self._make_row(schema, doc, embedding, ivf_list)
+                    for doc, embedding, ivf_list in zip(batch, embeddings, ivf_lists)
+                ]
+            else:
+                data = [
+                    (doc.page_content, json.dumps(doc.metadata), embedding) for doc, embedding in zip(batch, embeddings)
+                ]
+
+            cursor.executemany(insert_sql, data)
+
+            if schema.lexical:
+                # 같은 트랜잭션에서 삽입한 행의 rowid는 연속이므로 마지막 len(batch)개를 색인
+                cursor.execute(
+                    f"INSERT INTO {collection_name}_fts (rowid, page_content) "
+                    f"SELECT rowid, page_content FROM {collection_name} "
+                    f"WHERE rowid > (SELECT MAX(rowid) FROM {collection_name}) - ?",
+                    (len(batch),),
+                )
+
+    def _update_stats(self, collection_name: str, inserted: int) -> None:
+        stats = self._stats.get(collection_name)
+        if stats is not None:
+            stats.total += inserted
+            stats.changed += inserted
+
+    def get_import_checkpoint(self, collection_name: str, file_path: Path) -> Optional[ImportCheckpoint]:
+        """컬렉션과 같은 DB의 체크포인트 테이블에서 읽습니다."""
+        with self._cursor() as cursor:
+            return load_checkpoint(cursor, collection_name, checkpoint_source(file_path))
+
+    def _save_import_checkpoint(self, collection_name: str, checkpoint: ImportCheckpoint) -> None:
+        with self._cursor() as cursor:
+            save_checkpoint(cursor, collection_name, checkpoint)
+
+    def _delete_import_checkpoint(self, collection_name: str, source: str) -> None:
+        with self._cursor() as cursor:
+            delete_checkpoint(cursor, collection_name, source)
+
+    def _insert_import_batch(
+        self, collection_name: str, documents: List[Document], batch_size: int, checkpoint: ImportCheckpoint
+    ) -> int:
+        """배치 삽입과 체크포인트 기록을 한 트랜잭션으로 커밋합니다."""
+        with self._cursor() as cursor:
+            self._insert_rows(cursor, collection_name, documents, batch_size)
+            save_checkpoint(cursor, collection_name, checkpoint)
+
+        self._update_stats(collection_name, len(documents))
+        return len(documents)
+
+    def _iter_snapshot_batches(self, collection_name: str, batch_size: int) -> Iterator[SnapshotBatch]:
+        """rowid 순서로 batch_size행씩 읽습니다. 벡터 blob은 배치마다 한 번에 float32 행렬로 변환합니다."""
+        schema = self._get_schema(collection_name)
+        # 이전 버전의 일반 테이블은 embedding을 JSON 텍스트로 저장했을 수 있으므로 blob으로 변환합니다.
+        embedding = "embedding" if schema.vec0 else "vec_f32(embedding)"
+
+        cursor = self._get_connection().cursor()
+        try:
+            cursor.execute(f"SELECT page_content, metadata, {embedding} FROM {collection_name} ORDER BY rowid")
+            while rows := cursor.fetchmany(batch_size):
+                yield SnapshotBatch(
+                    [page_content for page_content, __, __ in rows],
+                    [json.loads(metadata) if metadata else {} for __, metadata, __ in rows],
+                    ivf.from_blobs([blob for __, __, blob in rows], schema.dimension),
+                )
         finally:
             cursor.close()
-            conn.close()
+
+    def _restore_batches(self, collection_name: str, batches: Iterator[SnapshotBatch], batch_size: int) -> int:
+        """모든 배치를 한 트랜잭션으로 삽입합니다. 중간에 실패하면 아무것도 복원되지 않습니다."""
+        total = 0
+        with self._cursor() as cursor:
+            for batch in batches:
+                self._insert_rows(cursor, collection_name, self._to_documents(batch), batch_size)
+                total += len(batch)
+
+        self._update_stats(collection_name, total)
+        return total
 
     def search(
         self,
@@ -175,135 +659,887 @@ class SqliteVecStore(BaseVectorStore):
         k: int = 10,
         filter: Optional[Dict[str, Any]] = None,
         threshold: Optional[float] = None,
+        rerank_factor: Optional[float] = None,
+        nprobe: Optional[int] = None,
     ) -> List[SearchResult]:
-        """유사도 검색을 수행합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        """
+        유사도 검색을 수행합니다.
+
+        vec0 컬렉션은 `embedding MATCH ? AND k = ?` KNN 쿼리를 사용하며,
+        메타데이터 컬럼에 대한 필터는 KNN 쿼리 안에서 함께 처리합니다.
+        메타데이터 컬럼이 아닌 키로 필터링하면 플래너(plan_search)가 추정 선택도에 따라
+        필터를 먼저 적용하는 정확 검색 또는 KNN over-fetch 후 필터링 중 하나를 고릅니다.
+
+        양자화 컬렉션은 양자화 벡터로 k × rerank_factor개(기본값은 설정의 rerank_factor 또는 4)의
+        후보를 가져온 뒤 원본 벡터와의 거리로 다시 정렬합니다.
+
+        IVF 컬렉션(train_ivf)은 쿼리와 가까운 nprobe개(기본값은 설정의 nprobe 또는 8) 파티션에서만
+        KNN 검색을 수행하고 결과를 합칩니다.
+        """
+        schema = self._get_schema(collection_name)
+        if rerank_factor is None:
+            rerank_factor = self.config.get("rerank_factor")
+        query_vec = serialize_f32(query_embedding)
+        filter = filter or {}
+
+        column_filter, json_filter = schema.split_filter(filter)
+
+        with self._cursor() as cursor:
+            if not schema.vec0:
+                logger.debug(f"'{collection_name}' is a plain table. Run migrate_collection() to use vec0 KNN search.")
+                rows = self._exact_search(cursor, collection_name, schema, query_vec, k, column_filter, json_filter)
+            elif not json_filter:
+                rows = self._knn_search(
+                    cursor, collection_name, query_vec, k, column_filter, schema, rerank_factor, nprobe
+                )
+            else:
+                plan = self.plan_search(collection_name, k, filter)
+                if plan.strategy == "exact":
+                    rows = self._exact_search(cursor, collection_name, schema, query_vec, k, column_filter, json_filter)
+                else:
+                    rows = self._overfetch_search(
+                        cursor,
+                        collection_name,
+                        schema,
+                        query_vec,
+                        k,
+                        column_filter,
+                        json_filter,
+                        plan.fetch_k,
+                        rerank_factor=rerank_factor,
+                        nprobe=nprobe,
+                    )
+
+        results = []
+        for content, metadata, distance in rows:
+            # 거리를 유사도로 변환 (1 - distance)
+            similarity = 1 - distance
+            if threshold is not None and similarity < threshold:
+                continue
 
-        # 거리 함수 매핑
-        distance_metric = self.config.get("distance_metric", "cosine")
-        distance_funcs = {
-            "cosine": "vec_distance_cosine",
-            "l2": "vec_distance_L2",
-        }
-        distance_func = distance_funcs.get(distance_metric, "vec_distance_cosine")
+            doc = Document(page_content=content, metadata=metadata)
+            results.append(SearchResult(document=doc, score=similarity))
 
-        try:
-            # 기본 검색 쿼리
-            query_vec_json = json.dumps(query_embedding)
+        return results
 
-            # 거리를 유사도로 변환 (1 - distance)
+    def search_many(
+        self,
+        collection_name: str,
+        query_embeddings: List[List[float]],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        threshold: Optional[float] = None,
+        rerank_factor: Optional[float] = None,
+        nprobe: Optional[int] = None,
+    ) -> List[List[SearchResult]]:
+        """
+        여러 쿼리 임베딩을 한 번의 vec0 KNN 쿼리로 검색합니다.
+
+        json_each(?)로 쿼리 벡터를 펼치고 `embedding MATCH q.value AND k = ?`로 조인하므로
+        vec0가 쿼리마다 KNN 검색을 실행합니다. 필터 처리와 양자화 재정렬은 search와 같습니다.
+        넓은 필터의 over-fetch 검색에서 k개를 채우지 못한 쿼리만 개별로 다시 조회하며,
+        일반 테이블이거나 필터를 먼저 적용하는 정확 검색이면 search를 동시에 실행합니다.
+        IVF 컬렉션은 쿼리마다 탐색할 파티션이 다르므로 쿼리별로 KNN 검색을 실행합니다.
+        """
+        if not query_embeddings:
+            return []
+
+        schema = self._get_schema(collection_name)
+        if rerank_factor is None:
+            rerank_factor = self.config.get("rerank_factor")
+        filter = filter or {}
+
+        column_filter, json_filter = schema.split_filter(filter)
+
+        plan = self.plan_search(collection_name, k, filter) if schema.vec0 and json_filter else None
+        if not schema.vec0 or (plan is not None and plan.strategy == "exact"):
+            return super().search_many(
+                collection_name,
+                query_embeddings,
+                k=k,
+                filter=filter,
+                threshold=threshold,
+                rerank_factor=rerank_factor,
+                nprobe=nprobe,
+            )
+
+        with self._cursor() as cursor:
+            if plan is None:
+                rows = self._knn_search_many(
+                    cursor, collection_name, query_embeddings, k, column_filter, schema, rerank_factor, nprobe
+                )
+            else:
+                candidates = self._knn_search_many(
+                    cursor,
+                    collection_name,
+                    query_embeddings,
+                    plan.fetch_k,
+                    column_filter,
+                    schema,
+                    rerank_factor,
+                    nprobe,
+                )
+                rows = []
+                for query_embedding, query_rows in zip(query_embeddings, candidates):
+                    matched = [row for row in query_rows if matches_filter(row[1], json_filter)]
+                    if len(matched) < k and len(query_rows) >= plan.fetch_k:
+                        query_vec = serialize_f32(query_embedding)
+                        fetch_k = self.planner.next_fetch_k(k, plan.fetch_k, len(matched))
+                        if fetch_k > self.planner.max_fetch_k:
+                            matched = self._exact_search(
+                                cursor, collection_name, schema, query_vec, k, column_filter, json_filter
+                            )
+                        else:
+                            matched = self._overfetch_search(
+                                cursor,
+                                collection_name,
+                                schema,
+                                query_vec,
+                                k,
+                                column_filter,
+                                json_filter,
+                                fetch_k,
+                                rerank_factor=rerank_factor,
+                                nprobe=nprobe,
+                            )
+                    rows.append(matched[:k])
+
+        return [
+            [
+                SearchResult(document=Document(page_content=content, metadata=metadata), score=1 - distance)
+                for content, metadata, distance in query_rows
+                if threshold is None or 1 - distance >= threshold
+            ]
+            for query_rows in rows
+        ]
+
+    def _knn_search_many(
+        self,
+        cursor: sqlite3.Cursor,
+        collection_name: str,
+        query_embeddings: List[List[float]],
+        k: int,
+        column_filter: Dict[str, Any],
+        schema: "_CollectionSchema",
+        rerank_factor: Optional[float] = None,
+        nprobe: Optional[int] = None,
+    ) -> List[List[tuple]]:
+        """여러 쿼리 벡터의 vec0 KNN 검색 결과를 쿼리별로 나눠 반환합니다."""
+        if self._ivf_nprobe(schema, nprobe) is not None:
+            return [
+                self._knn_search(
+                    cursor, collection_name, serialize_f32(embedding), k, column_filter, schema, rerank_factor, nprobe
+                )
+                for embedding in query_embeddings
+            ]
+
+        conditions = "".join(f" AND t.{key} = ?" for key in column_filter)
+        filter_params = [_column_filter_param(value) for value in column_filter.values()]
+        vectors = json.dumps([[float(value) for value in embedding] for embedding in query_embeddings])
+
+        if schema.quantization:
+            distance_func = VEC0_DISTANCE_FUNCTIONS.get(schema.distance_metric, "vec_distance_L2")
+            quantized_query = VEC0_QUANTIZE_EXPRESSIONS[schema.quantization].replace("?", "q.value")
             search_sql = f"""
-            SELECT 
-                page_content,
-                metadata,
-                1 - {distance_func}(embedding, vec_f32(?)) as similarity
-            FROM {collection_name}
-            WHERE 1 = 1
+            SELECT q.key, t.page_content, t.metadata, {distance_func}(t.embedding, q.value) AS distance
+            FROM json_each(?) AS q
+            JOIN {collection_name} AS t ON t.embedding_q MATCH {quantized_query} AND t.k = ?{conditions}
+            ORDER BY q.key, distance
             """
+            limit = rerank_candidates(k, rerank_factor, VEC0_MAX_K)
+        else:
+            search_sql = f"""
+            SELECT q.key, t.page_content, t.metadata, t.distance
+            FROM json_each(?) AS q
+            JOIN {collection_name} AS t ON t.embedding MATCH q.value AND t.k = ?{conditions}
+            ORDER BY q.key, t.distance
+            """
+            limit = k
 
-            params = [query_vec_json]
-
-            # 메타데이터 필터 추가
-            if filter:
-                for key, value in filter.items():
-                    search_sql += f" AND json_extract(metadata, '$.{key}') = ?"
-                    params.append(json.dumps(value))
+        cursor.execute(search_sql, [vectors, limit, *filter_params])
 
-            # 임계값 조건 추가
-            if threshold is not None:
-                search_sql += f" AND 1 - {distance_func}(embedding, vec_f32(?)) >= ?"
-                params.extend([query_vec_json, threshold])
+        rows: List[List[tuple]] = [[] for __ in query_embeddings]
+        for index, content, metadata_str, distance in cursor.fetchall():
+            # 양자화 컬렉션은 후보 중 원본 벡터와 가까운 k개만 남깁니다.
+            if len(rows[index]) < k:
+                rows[index].append((content, json.loads(metadata_str) if metadata_str else {}, distance))
+        return rows
 
-            search_sql += f"""
-            ORDER BY {distance_func}(embedding, vec_f32(?))
+    def _knn_search(
+        self,
+        cursor: sqlite3.Cursor,
+        collection_name: str,
+        query_vec: bytes,
+        k: int,
+        column_filter: Dict[str, Any],
+        schema: Optional["_CollectionSchema"] = None,
+        rerank_factor: Optional[float] = None,
+        nprobe: Optional[int] = None,
+    ) -> List[tuple]:
+        """vec0 KNN 검색 (거리는 vec0에서 한 번만 계산)
+
+        양자화 컬렉션은 embedding_q로 후보를 고른 뒤 원본 embedding과의 거리로 다시 정렬합니다.
+        IVF 컬렉션은 가까운 파티션마다 KNN 쿼리를 실행하여 UNION ALL로 합친 뒤 거리순으로 k개를 고릅니다.
+        """
+        conditions = "".join(f" AND {key} = ?" for key in column_filter)
+        filter_params = [_column_filter_param(value) for value in column_filter.values()]
+
+        ivf_lists = self._probe_lists(schema, query_vec, nprobe) if schema is not None else None
+        if ivf_lists is not None:
+            conditions = f" AND {IVF_PARTITION_COLUMN} = ?{conditions}"
+
+        if schema is not None and schema.quantization:
+            distance_func = VEC0_DISTANCE_FUNCTIONS.get(schema.distance_metric, "vec_distance_L2")
+            knn_sql = (
+                f"SELECT rowid FROM {collection_name} "
+                f"WHERE embedding_q MATCH {VEC0_QUANTIZE_EXPRESSIONS[schema.quantization]} AND k = ?{conditions}"
+            )
+            knn_params = [query_vec, rerank_candidates(k, rerank_factor, VEC0_MAX_K)]
+            search_sql = f"""
+            WITH candidates AS (
+                {{knn_sql}}
+            )
+            SELECT page_content, metadata, {distance_func}(embedding, ?) AS distance
+            FROM {collection_name}
+            WHERE rowid IN (SELECT rowid FROM candidates)
+            ORDER BY distance
             LIMIT ?
             """
-            params.extend([query_vec_json, k])
+            tail_params = [query_vec, k]
+        else:
+            knn_sql = (
+                f"SELECT page_content, metadata, distance FROM {collection_name} "
+                f"WHERE embedding MATCH ? AND k = ?{conditions}"
+            )
+            knn_params = [query_vec, k]
+            search_sql = "{knn_sql} ORDER BY distance" if ivf_lists is None else "{knn_sql} ORDER BY distance LIMIT ?"
+            tail_params = [] if ivf_lists is None else [k]
 
-            cursor.execute(search_sql, params)
-            results = []
+        if ivf_lists is None:
+            params = [*knn_params, *filter_params, *tail_params]
+        else:
+            knn_sql = " UNION ALL ".join([f"SELECT * FROM ({knn_sql})"] * len(ivf_lists))
+            params = [param for ivf_list in ivf_lists for param in (*knn_params, ivf_list, *filter_params)]
+            params += tail_params
+
+        cursor.execute(search_sql.format(knn_sql=knn_sql), params)
+        return [
+            (content, json.loads(metadata_str) if metadata_str else {}, distance)
+            for content, metadata_str, distance in cursor.fetchall()
+        ]
+
+    def _ivf_nprobe(self, schema: "_CollectionSchema", nprobe: Optional[int] = None) -> Optional[int]:
+        """IVF 컬렉션에서 탐색할 파티션 수. 모든 파티션을 탐색하게 되면 None을 반환합니다."""
+        if not schema.ivf or schema.ivf_centroids is None:
+            return None
+        nprobe = int(nprobe or self.config.get("nprobe", ivf.DEFAULT_IVF_NPROBE))
+        if nprobe < 1:
+            raise ValueError(f"nprobe must be a positive integer: {nprobe}")
+        return min(nprobe, SQLITE_MAX_COMPOUND_SELECT) if nprobe < len(schema.ivf_centroids) else None
+
+    def _probe_lists(
+        self, schema: "_CollectionSchema", query_vec: bytes, nprobe: Optional[int] = None
+    ) -> Optional[List[int]]:
+        """쿼리와 가까운 순서의 탐색할 파티션 번호 목록. 모든 파티션을 탐색하면 None"""
+        nprobe = self._ivf_nprobe(schema, nprobe)
+        if nprobe is None:
+            return None
+        query = ivf.from_blobs([query_vec], schema.dimension)
+        return ivf.nearest_lists(query, schema.ivf_centroids, schema.distance_metric, nprobe)
+
+    @staticmethod
+    def _assign_ivf_lists(schema: "_CollectionSchema", embeddings: List[bytes]) -> List[Optional[int]]:
+        """삽입할 벡터의 파티션 번호 (IVF 컬렉션이 아니면 None)"""
+        if not schema.ivf or schema.ivf_centroids is None or not embeddings:
+            return [None] * len(embeddings)
+        vectors = ivf.from_blobs(embeddings, schema.dimension)
+        return ivf.assign_lists(vectors, schema.ivf_centroids, schema.distance_metric).tolist()
+
+    def _exact_search(
+        self,
+        cursor: sqlite3.Cursor,
+        collection_name: str,
+        schema: "_CollectionSchema",
+        query_vec: bytes,
+        k: int,
+        column_filter: Dict[str, Any],
+        json_filter: Dict[str, Any],
+    ) -> List[tuple]:
+        """필터를 먼저 적용한 뒤 남은 행만 정확한 거리로 정렬"""
+        distance_metric = schema.distance_metric or self.config.get("distance_metric", "cosine")
+        distance_func = VEC0_DISTANCE_FUNCTIONS.get(distance_metric, "vec_distance_cosine")
+        search_sql = f"""
+        SELECT page_content, metadata, {distance_func}(embedding, ?) AS distance
+        FROM {collection_name}
+        WHERE 1 = 1
+        """
+        conditions, filter_params = self._filter_conditions(schema, {**column_filter, **json_filter})
+        for condition in conditions:
+            search_sql += f" AND {condition}"
+        params = [query_vec, *filter_params]
+        search_sql += " ORDER BY distance LIMIT ?"
+        params.append(k)
+
+        cursor.execute(search_sql, params)
+        return [
+            (content, json.loads(metadata_str) if metadata_str else {}, distance)
+            for content, metadata_str, distance in cursor.fetchall()
+        ]
+
+    def _overfetch_search(
+        self,
+        cursor: sqlite3.Cursor,
+        collection_name: str,
+        schema: "_CollectionSchema",
+        query_vec: bytes,
+        k: int,
+        column_filter: Dict[str, Any],
+        json_filter: Dict[str, Any],
+        fetch_k: int,
+        rerank_factor: Optional[float] = None,
+        nprobe: Optional[int] = None,
+    ) -> List[tuple]:
+        """KNN으로 fetch_k개 후보를 가져와 필터링하고, k개가 안 되면 후보를 늘려 다시 조회
+
+        후보 수가 max_fetch_k를 넘으면 정확 검색으로 전환하므로,
+        필터를 만족하는 문서가 k개 이상 있으면 항상 k개를 반환합니다.
+        """
+        while True:
+            rows = self._knn_search(
+                cursor, collection_name, query_vec, fetch_k, column_filter, schema, rerank_factor, nprobe
+            )
+            matched = [row for row in rows if matches_filter(row[1], json_filter)]
+
+            # k개를 채웠거나 더 가져올 후보가 없음
+            if len(matched) >= k or len(rows) < fetch_k:
+                return matched[:k]
+
+            fetch_k = self.planner.next_fetch_k(k, fetch_k, len(matched))
+            if fetch_k > self.planner.max_fetch_k:
+                logger.debug(f"Over-fetch limit exceeded for '{collection_name}'. Falling back to exact search.")
+                return self._exact_search(cursor, collection_name, schema, query_vec, k, column_filter, json_filter)
+
+            logger.debug(f"Only {len(matched)} of {k} matched. Re-querying with fetch_k={fetch_k}")
+
+    def _create_fts_table(self, cursor: sqlite3.Cursor, name: str) -> None:
+        tokenizer = self.config.get("fts_tokenizer", DEFAULT_FTS_TOKENIZER)
+        if "'" in tokenizer:
+            raise ValueError(f"Invalid FTS5 tokenizer: {tokenizer}")
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {name}_fts USING fts5(page_content, tokenize='{tokenizer}')"
+        )
+
+    def create_lexical_index(self, collection_name: str) -> None:
+        """
+        전문 검색(FTS5) 테이블을 만들고 기존 문서를 색인합니다.
+
+        테이블은 `{collection_name}_fts`이며 rowid가 컬렉션의 rowid와 같습니다.
+        이미 있으면 다시 색인합니다. 토크나이저는 설정의 fts_tokenizer(기본 trigram)를 사용합니다.
+        """
+        self._get_schema(collection_name)
+
+        with self._cursor() as cursor:
+            self._create_fts_table(cursor, collection_name)
+            cursor.execute(f"DELETE FROM {collection_name}_fts")
+            cursor.execute(
+                f"INSERT INTO {collection_name}_fts (rowid, page_content) "
+                f"SELECT rowid, page_content FROM {collection_name}"
+            )
 
-            for content, metadata_str, similarity in cursor.fetchall():
-                metadata = json.loads(metadata_str) if metadata_str else {}
-                doc = Document(page_content=content, metadata=metadata)
-                results.append(SearchResult(document=doc, score=similarity))
+        self._schemas.pop(collection_name, None)
 
-            return results
+    def _fts_query(self, query: str) -> str:
+        """검색어의 단어 중 하나라도 포함된 문서를 찾는 FTS5 MATCH 식"""
+        tokenizer = self.config.get("fts_tokenizer", DEFAULT_FTS_TOKENIZER)
+        terms = tokenize_query(query, min_length=3 if tokenizer.startswith("trigram") else 1)
+        return " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
 
-        finally:
-            cursor.close()
-            conn.close()
+    def lexical_search(
+        self,
+        collection_name: str,
+        query: str,
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[SearchResult]:
+        """
+        FTS5 전문 검색을 수행합니다. score는 BM25 점수(클수록 관련도 높음)입니다.
+
+        create_collection(lexical_index=True) 또는 create_lexical_index()로 전문 검색 테이블을 먼저 만들어야 합니다.
+        """
+        schema = self._get_schema(collection_name)
+        if not schema.lexical:
+            raise ValueError(f"Lexical index not found for '{collection_name}'. Run create_lexical_index() first.")
+
+        match = self._fts_query(query)
+        if not match:
+            return []
+
+        fts_table = f"{collection_name}_fts"
+        search_sql = f"""
+        SELECT t.page_content, t.metadata, -bm25({fts_table}) AS score
+        FROM {fts_table} JOIN {collection_name} AS t ON t.rowid = {fts_table}.rowid
+        WHERE {fts_table} MATCH ?
+        """
+        conditions, params = self._filter_conditions(schema, filter or {})
+        for condition in conditions:
+            search_sql += f" AND {condition}"
+        search_sql += f" ORDER BY bm25({fts_table}) LIMIT ?"
+
+        with self._cursor() as cursor:
+            cursor.execute(search_sql, [match, *params, k])
+            rows = cursor.fetchall()
+
+        return [
+            SearchResult(
+                document=Document(page_content=content, metadata=json.loads(metadata_str) if metadata_str else {}),
+                score=score,
+            )
+            for content, metadata_str, score in rows
+        ]
+
+    def get_stats(self, collection_name: str, refresh: bool = False) -> CollectionStats:
+        """
+        플래너가 사용하는 컬렉션 통계(문서 수, 메타데이터 표본)를 반환합니다.
+
+        통계는 planner_stats_ttl 동안 캐시되며, 수집 이후 문서 수가 크게 변하면 다시 수집합니다.
+        """
+        stats = self._stats.get(collection_name)
+        if refresh or stats is None or stats.is_stale(self.planner.stats_ttl):
+            with self._cursor() as cursor:
+                cursor.execute(f"SELECT COUNT(*) FROM {collection_name}")
+                total = cursor.fetchone()[0]
+
+                cursor.execute(
+                    f"SELECT metadata FROM {collection_name} ORDER BY random() LIMIT ?", (self.planner.sample_size,)
+                )
+                sample = [json.loads(metadata_str) if metadata_str else {} for (metadata_str,) in cursor.fetchall()]
+
+            stats = self._stats[collection_name] = CollectionStats(total=total, sample=sample)
+        return stats
+
+    def plan_search(self, collection_name: str, k: int, filter: Optional[Dict[str, Any]] = None) -> FilterPlan:
+        """필터 검색에 사용할 검색 계획을 반환합니다."""
+        return self.planner.plan(k, self.get_stats(collection_name), filter or {})
+
+    def _filter_conditions(self, schema: "_CollectionSchema", filter: Dict[str, Any]) -> tuple[List[str], List[Any]]:
+        """필터를 WHERE 조건으로 변환합니다. 메타데이터 컬럼으로 승격된 키는 컬럼을 직접 비교합니다 (split_filter)."""
+        conditions = []
+        params = []
+
+        column_filter, json_filter = schema.split_filter(filter)
+        for key, value in column_filter.items():
+            conditions.append(f"{key} = ?")
+            params.append(_column_filter_param(value))
+        for key, value in json_filter.items():
+            conditions.append(f"json_extract(metadata, '$.{key}') = ?")
+            params.append(json_filter_param(value))
+
+        return conditions, params
 
     def delete(self, collection_name: str, filter: Dict[str, Any]) -> int:
         """필터에 매칭되는 문서들을 삭제합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        schema = self._get_schema(collection_name)
 
-        try:
+        with self._cursor() as cursor:
             if not filter:
                 # 모든 문서 삭제
+                if schema.lexical:
+                    cursor.execute(f"DELETE FROM {collection_name}_fts")
                 cursor.execute(f"DELETE FROM {collection_name}")
             else:
                 # 메타데이터 필터로 삭제
-                conditions = []
-                params = []
-
-                for key, value in filter.items():
-                    conditions.append(f"json_extract(metadata, '$.{key}') = ?")
-                    params.append(json.dumps(value))
-
+                conditions, params = self._filter_conditions(schema, filter)
                 where_clause = " AND ".join(conditions)
+                if schema.lexical:
+                    cursor.execute(
+                        f"DELETE FROM {collection_name}_fts "
+                        f"WHERE rowid IN (SELECT rowid FROM {collection_name} WHERE {where_clause})",
+                        params,
+                    )
                 cursor.execute(f"DELETE FROM {collection_name} WHERE {where_clause}", params)
 
             deleted_count = cursor.rowcount
-            conn.commit()
-            return deleted_count
 
-        finally:
-            cursor.close()
-            conn.close()
+        self._stats.pop(collection_name, None)
+        return deleted_count
+
+    def count(self, collection_name: str, filter: Optional[Dict[str, Any]] = None) -> int:
+        """컬렉션의 문서 수를 반환합니다. filter를 지정하면 매칭되는 문서 수를 반환합니다."""
+        sql = f"SELECT COUNT(*) FROM {collection_name}"
+        params = []
+        if filter:
+            conditions, params = self._filter_conditions(self._get_schema(collection_name), filter)
+            sql += f" WHERE {' AND '.join(conditions)}"
+
+        with self._cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone()[0]
+
+    def promote_metadata_keys(self, collection_name: str, metadata_columns: Dict[str, Any]) -> Dict[str, str]:
+        """
+        자주 필터링하는 메타데이터 키를 타입이 있는 컬럼으로 승격합니다.
+
+        승격된 키는 search, delete, count의 필터에서 JSON 대신 컬럼으로 비교합니다.
+
+        - vec0 컬렉션: 메타데이터 컬럼을 추가한 vec0 테이블로 다시 만듭니다 (KNN 검색 중 필터링).
+        - 일반 테이블 컬렉션: json_extract 생성(generated) 컬럼과 인덱스를 추가합니다.
+
+        Args:
+            collection_name: 컬렉션 이름
+            metadata_columns: {메타데이터 키: 타입} 사전 (text, integer, float, boolean)
+
+        Returns:
+            승격된 전체 메타데이터 컬럼 {키: 타입}
+        """
+        schema = self._get_schema(collection_name)
+        metadata_columns = _normalize_metadata_columns(metadata_columns)
+
+        for key, column_type in metadata_columns.items():
+            if schema.metadata_columns.get(key, column_type) != column_type:
+                raise ValueError(
+                    f"'{key}' is already promoted as {schema.metadata_columns[key]} in '{collection_name}'"
+                )
+
+        new_columns = {key: value for key, value in metadata_columns.items() if key not in schema.metadata_columns}
+        if not new_columns:
+            return dict(schema.metadata_columns)
+
+        if schema.vec0:
+            rebuild_name = f"{collection_name}_rebuild"
+            self._rebuild_as_vec0(
+                collection_name,
+                source_sql=[
+                    f"CREATE TABLE {rebuild_name} AS "
+                    f"SELECT rowid AS id, page_content, metadata, embedding FROM {collection_name}",
+                    f"DROP TABLE {collection_name}",
+                ],
+                source_table=rebuild_name,
+                dimension=schema.dimension,
+                distance_metric=schema.distance_metric,
+                metadata_columns={**schema.metadata_columns, **new_columns},
+                quantization=schema.quantization,
+                ivf_centroids=schema.ivf_centroids,
+            )
+        else:
+            with self._cursor() as cursor:
+                for key, column_type in new_columns.items():
+                    cursor.execute(
+                        f"ALTER TABLE {collection_name} ADD COLUMN {key} {SQLITE_COLUMN_TYPES[column_type]} "
+                        f"GENERATED ALWAYS AS (json_extract(metadata, '$.{key}')) VIRTUAL"
+                    )
+                    cursor.execute(
+                        f"CREATE INDEX IF NOT EXISTS {collection_name}_{key}_idx ON {collection_name} ({key})"
+                    )
+
+            self._schemas.pop(collection_name, None)
+
+        logger.info(f"Promoted metadata keys of '{collection_name}': {', '.join(new_columns)}")
+        return dict(self._get_schema(collection_name).metadata_columns)
+
+    def migrate_collection(
+        self,
+        name: str,
+        metadata_columns: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        quantization: Optional[str] = None,
+    ) -> int:
+        """
+        일반 테이블로 만든 기존 컬렉션을 vec0 가상 테이블로 변환합니다.
+
+        vec0 테이블은 이름을 변경할 수 없으므로 기존 테이블을 `{name}_legacy`로 옮긴 뒤
+        같은 이름의 vec0 테이블을 만들어 데이터를 복사하고, 복사가 끝나면 기존 테이블을 삭제합니다.
+        모든 과정은 하나의 트랜잭션으로 처리됩니다.
+
+        Returns:
+            복사한 문서 수 (이미 vec0 컬렉션이면 0)
+        """
+        schema = self._get_schema(name)
+        if schema.vec0:
+            return 0
+        if schema.dimension is None:
+            raise ValueError(f"Cannot detect embedding dimension of '{name}'")
+        validate_quantization(quantization, schema.dimension, supported=tuple(VEC0_QUANTIZATION_TYPES))
+
+        legacy_name = f"{name}_legacy"
+        copied = self._rebuild_as_vec0(
+            name,
+            source_sql=[f"ALTER TABLE {name} RENAME TO {legacy_name}"],
+            source_table=legacy_name,
+            dimension=schema.dimension,
+            distance_metric=VEC0_DISTANCE_METRICS[self.config.get("distance_metric", "cosine")],
+            # promote_metadata_keys()로 추가한 생성 컬럼은 vec0 메타데이터 컬럼으로 유지
+            metadata_columns={**schema.metadata_columns, **_normalize_metadata_columns(metadata_columns)},
+            batch_size=batch_size,
+            quantization=quantization,
+        )
+
+        logger.info(f"Migrated {copied} documents of '{name}' to vec0 virtual table")
+        return copied
+
+    def quantize_collection(self, name: str, quantization: Optional[str], batch_size: int = 1000) -> int:
+        """
+        vec0 컬렉션에 양자화 벡터 컬럼을 추가하거나 바꿉니다. quantization이 None이면 양자화 컬럼을 제거합니다.
+
+        원본 embedding은 그대로 유지되므로 재정렬 정확도는 변하지 않습니다.
+        vec0 테이블은 컬럼을 추가할 수 없으므로 테이블을 다시 만듭니다.
+
+        Returns:
+            복사한 문서 수 (변경 사항이 없으면 0)
+        """
+        schema = self._get_schema(name)
+        if not schema.vec0:
+            raise ValueError(f"'{name}' is a plain table. Use migrate_collection(quantization=...) instead.")
+        validate_quantization(quantization, schema.dimension, supported=tuple(VEC0_QUANTIZATION_TYPES))
+        if schema.quantization == quantization:
+            return 0
+
+        rebuild_name = f"{name}_rebuild"
+        copied = self._rebuild_as_vec0(
+            name,
+            source_sql=[
+                f"CREATE TABLE {rebuild_name} AS SELECT rowid AS id, page_content, metadata, embedding FROM {name}",
+                f"DROP TABLE {name}",
+            ],
+            source_table=rebuild_name,
+            dimension=schema.dimension,
+            distance_metric=schema.distance_metric,
+            metadata_columns=dict(schema.metadata_columns),
+            batch_size=batch_size,
+            quantization=quantization,
+            ivf_centroids=schema.ivf_centroids,
+        )
+
+        logger.info(f"Rebuilt '{name}' with quantization={quantization}")
+        return copied
+
+    def train_ivf(
+        self,
+        name: str,
+        n_lists: Optional[int] = None,
+        sample_size: Optional[int] = None,
+        iterations: int = ivf.DEFAULT_IVF_ITERATIONS,
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        IVF 파티션을 학습(또는 다시 학습)하고 모든 문서를 파티션에 다시 할당합니다.
+
+        무작위 표본으로 k-means 중심점을 학습하여 {name}_ivf 테이블에 저장하고,
+        각 문서를 가장 가까운 중심점의 파티션(vec0 partition key)에 할당합니다.
+        이후 검색은 쿼리와 가까운 nprobe개 파티션만 탐색하고, 새 문서는 삽입할 때 파티션에 할당됩니다.
+
+        Args:
+            name: 컬렉션 이름 (vec0 컬렉션)
+            n_lists: 파티션 수 (기본값은 기존 파티션 수 또는 √문서 수)
+            sample_size: 학습 표본 수 (기본값은 파티션 수 × 256)
+            iterations: k-means 반복 횟수
+
+        Returns:
+            파티션 수
+        """
+        schema = self._get_schema(name)
+        if not schema.vec0:
+            raise ValueError(f"'{name}' is a plain table. Run migrate_collection() before training IVF partitions.")
+
+        with self._cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {name}")
+            total = cursor.fetchone()[0]
+            if n_lists is None:
+                n_lists = len(schema.ivf_centroids) if schema.ivf_centroids is not None else ivf.default_n_lists(total)
+            sample = self._sample_embeddings(
+                cursor, name, schema, sample_size or n_lists * ivf.DEFAULT_IVF_SAMPLES_PER_LIST
+            )
+
+        centroids = ivf.train_kmeans(sample, n_lists, schema.distance_metric, iterations)
+        self._rebuild_ivf(name, schema, centroids, batch_size)
+
+        logger.info(f"Trained {len(centroids)} IVF partitions of '{name}' with {len(sample):,} samples")
+        return len(centroids)
+
+    def rebalance_ivf(
+        self,
+        name: str,
+        n_lists: Optional[int] = None,
+        sample_size: Optional[int] = None,
+        iterations: int = 5,
+        max_list_ratio: float = ivf.DEFAULT_IVF_MAX_LIST_RATIO,
+        min_list_ratio: float = ivf.DEFAULT_IVF_MIN_LIST_RATIO,
+        batch_size: int = 1000,
+    ) -> Dict[int, int]:
+        """
+        문서가 추가/삭제되어 크기가 치우친 IVF 파티션을 다시 나누고 문서를 다시 할당합니다.
+
+        평균보다 훨씬 작은 파티션(min_list_ratio)은 없애고, 큰 파티션(max_list_ratio)은 둘로 나눈 뒤
+        기존 중심점에서 시작해 k-means를 조금 더 반복합니다. 처음부터 학습하는 train_ivf보다 빠릅니다.
+
+        Returns:
+            새 파티션별 문서 수 {파티션 번호: 문서 수}
+        """
+        schema = self._get_schema(name)
+        if schema.ivf_centroids is None:
+            raise ValueError(f"'{name}' has no IVF partitions. Run train_ivf() first.")
+
+        sizes = self.get_ivf_list_sizes(name)
+        n_lists = n_lists or len(schema.ivf_centroids)
+        with self._cursor() as cursor:
+            sample = self._sample_embeddings(
+                cursor, name, schema, sample_size or n_lists * ivf.DEFAULT_IVF_SAMPLES_PER_LIST
+            )
+
+        centroids = ivf.rebalance_centroids(
+            sample,
+            schema.ivf_centroids,
+            [sizes.get(list_id, 0) for list_id in range(len(schema.ivf_centroids))],
+            schema.distance_metric,
+            n_lists=n_lists,
+            iterations=iterations,
+            max_list_ratio=max_list_ratio,
+            min_list_ratio=min_list_ratio,
+        )
+        self._rebuild_ivf(name, schema, centroids, batch_size)
+
+        sizes = self.get_ivf_list_sizes(name)
+        logger.info(
+            f"Rebalanced IVF partitions of '{name}': {len(centroids)} lists, "
+            f"sizes {min(sizes.values(), default=0):,} ~ {max(sizes.values(), default=0):,}"
+        )
+        return sizes
+
+    def get_ivf_list_sizes(self, name: str) -> Dict[int, int]:
+        """IVF 파티션별 문서 수 {파티션 번호: 문서 수}"""
+        if not self._get_schema(name).ivf:
+            return {}
+        with self._cursor() as cursor:
+            cursor.execute(f"SELECT {IVF_PARTITION_COLUMN}, COUNT(*) FROM {name} GROUP BY {IVF_PARTITION_COLUMN}")
+            return dict(cursor.fetchall())
+
+    @staticmethod
+    def _sample_embeddings(cursor: sqlite3.Cursor, name: str, schema: "_CollectionSchema", sample_size: int):
+        """IVF 학습에 사용할 무작위 표본 벡터"""
+        cursor.execute(f"SELECT embedding FROM {name} ORDER BY random() LIMIT ?", (sample_size,))
+        blobs = [blob for (blob,) in cursor.fetchall()]
+        if not blobs:
+            raise ValueError(f"Cannot train IVF partitions of '{name}': collection is empty")
+        return ivf.from_blobs(blobs, schema.dimension)
+
+    def _rebuild_ivf(self, name: str, schema: "_CollectionSchema", centroids, batch_size: int = 1000) -> int:
+        """중심점을 바꾸고 모든 문서를 파티션에 다시 할당합니다."""
+        rebuild_name = f"{name}_rebuild"
+        return self._rebuild_as_vec0(
+            name,
+            source_sql=[
+                f"CREATE TABLE {rebuild_name} AS SELECT rowid AS id, page_content, metadata, embedding FROM {name}",
+                f"DROP TABLE {name}",
+            ],
+            source_table=rebuild_name,
+            dimension=schema.dimension,
+            distance_metric=schema.distance_metric,
+            metadata_columns=dict(schema.metadata_columns),
+            batch_size=batch_size,
+            quantization=schema.quantization,
+            ivf_centroids=centroids,
+        )
+
+    def _rebuild_as_vec0(
+        self,
+        name: str,
+        source_sql: List[str],
+        source_table: str,
+        dimension: int,
+        distance_metric: str,
+        metadata_columns: Dict[str, str],
+        batch_size: int = 1000,
+        quantization: Optional[str] = None,
+        ivf_centroids=None,
+    ) -> int:
+        """
+        기존 데이터를 source_table로 옮긴 뒤(source_sql) 같은 이름의 vec0 테이블을 만들어 복사합니다.
+
+        vec0 테이블은 이름을 변경할 수 없고 컬럼을 추가할 수도 없으므로, 스키마를 바꾸려면 다시 만들어야 합니다.
+        partition key 컬럼도 UPDATE할 수 없으므로 IVF 파티션을 바꿀 때도 다시 만듭니다.
+        ivf_centroids를 지정하면 {name}_ivf 테이블에 중심점을 저장하고 각 행을 가까운 파티션에 할당합니다.
+        문서 id(rowid)는 그대로 유지되며, 모든 과정은 하나의 트랜잭션으로 처리됩니다.
+        """
+        column_defs = _vec0_column_defs(
+            dimension, distance_metric, metadata_columns, quantization, ivf=ivf_centroids is not None
+        )
+        new_schema = _CollectionSchema(
+            vec0=True,
+            dimension=dimension,
+            distance_metric=distance_metric,
+            metadata_columns=metadata_columns,
+            quantization=quantization,
+            ivf=ivf_centroids is not None,
+            ivf_centroids=ivf_centroids,
+        )
+        insert_sql = self._vec0_insert_sql(name, new_schema, with_rowid=True)
 
-    def count(self, collection_name: str) -> int:
-        """컬렉션의 문서 수를 반환합니다."""
         conn = self._get_connection()
         cursor = conn.cursor()
-
+        read_cursor = conn.cursor()
         try:
-            cursor.execute(f"SELECT COUNT(*) FROM {collection_name}")
-            return cursor.fetchone()[0]
+            cursor.execute("BEGIN")
+            for sql in source_sql:
+                cursor.execute(sql)
+            cursor.execute(f"CREATE VIRTUAL TABLE {name} USING vec0({', '.join(column_defs)})")
+
+            cursor.execute(f"DROP TABLE IF EXISTS {name}_ivf")
+            if ivf_centroids is not None:
+                cursor.execute(f"CREATE TABLE {name}_ivf (list_id INTEGER PRIMARY KEY, centroid BLOB NOT NULL)")
+                cursor.executemany(
+                    f"INSERT INTO {name}_ivf (list_id, centroid) VALUES (?, ?)",
+                    [(list_id, serialize_f32(centroid)) for list_id, centroid in enumerate(ivf_centroids.tolist())],
+                )
+
+            copied = 0
+            read_cursor.execute(f"SELECT id, page_content, metadata, embedding FROM {source_table} ORDER BY id")
+            while rows := read_cursor.fetchmany(batch_size):
+                data = []
+                ivf_lists = self._assign_ivf_lists(new_schema, [row[3] for row in rows])
+                for (row_id, page_content, metadata_str, embedding), ivf_list in zip(rows, ivf_lists):
+                    doc = Document(page_content=page_content, metadata=json.loads(metadata_str) if metadata_str else {})
+                    data.append((row_id, *self._make_row(new_schema, doc, embedding, ivf_list)))
+                cursor.executemany(insert_sql, data)
+                copied += len(data)
+
+            cursor.execute(f"DROP TABLE {source_table}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
         finally:
+            read_cursor.close()
             cursor.close()
-            conn.close()
+            self._schemas.pop(name, None)
+            self._stats.pop(name, None)
+
+        return copied
 
     def get_collection_info(self, collection_name: str) -> Dict[str, Any]:
         """컬렉션 정보를 반환합니다."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        schema = self._get_schema(collection_name)
 
-        try:
+        with self._cursor() as cursor:
             info = {"name": collection_name, "backend": self.backend_name, "db_path": str(self.config["db_path"])}
 
             # 문서 수
             cursor.execute(f"SELECT COUNT(*) FROM {collection_name}")
             info["count"] = cursor.fetchone()[0]
 
-            # 벡터 차원 (스키마에서 추출)
-            cursor.execute(f"PRAGMA table_info({collection_name})")
-            columns = cursor.fetchall()
-
-            for col in columns:
-                if col[1] == "embedding":  # column name
-                    # FLOAT32[1536] 형태에서 차원 추출
-                    col_type = col[2]
-                    if "[" in col_type and "]" in col_type:
-                        dim_str = col_type[col_type.index("[") + 1 : col_type.index("]")]
-                        info["dimension"] = int(dim_str)
-                    break
+            # 벡터 차원과 테이블 형식 (스키마에서 추출)
+            if schema.dimension is not None:
+                info["dimension"] = schema.dimension
+            info["table_type"] = "vec0" if schema.vec0 else "table"
+            info["distance_metric"] = schema.distance_metric
+            if schema.metadata_columns:
+                info["metadata_columns"] = dict(schema.metadata_columns)
+            if schema.quantization:
+                info["quantization"] = schema.quantization
+            info["lexical_index"] = schema.lexical
+            if schema.ivf_centroids is not None:
+                info["ivf_lists"] = len(schema.ivf_centroids)
+                info["nprobe"] = int(self.config.get("nprobe", ivf.DEFAULT_IVF_NPROBE))
 
             # 파일 크기
-            import os
-
             if self.config["db_path"].exists():
                 size_bytes = os.path.getsize(self.config["db_path"])
                 # 크기를 사람이 읽기 쉬운 형태로 변환
@@ -317,10 +1553,6 @@ class SqliteVecStore(BaseVectorStore):
 
             return info
 
-        finally:
-            cursor.close()
-            conn.close()
-
     @property
     def backend_name(self) -> str:
         """백엔드 이름을 반환합니다."""
@@ -1,6 +1,7 @@
 """Unified CLI for vector store operations."""
 
 import logging
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -81,6 +82,20 @@ def create_collection(
     backend: Optional[str] = typer.Option(None, "--backend", "-b", help="벡터 스토어 백엔드 (자동 감지)"),
     dimensions: int = typer.Option(1536, "--dimensions", "-d", help="벡터 차원"),
     distance_metric: str = typer.Option("cosine", "--distance-metric", help="거리 메트릭 (cosine, l2, inner_product)"),
+    metadata_columns: Optional[list[str]] = typer.Option(
+        None,
+        "--metadata-column",
+        "-m",
+        help="필터링용 메타데이터 컬럼 (키:타입, 예: category:text). sqlite-vec 전용",
+    ),
+    quantization: Optional[str] = typer.Option(
+        None,
+        "--quantization",
+        help="벡터 양자화 (pgvector: halfvec, binary / sqlite-vec: int8, binary). 검색 시 원본 벡터로 재정렬",
+    ),
+    lexical_index: bool = typer.Option(
+        False, "--lexical-index", help="하이브리드 검색용 전문 검색 인덱스 생성 (sqlite-vec: FTS5, pgvector: tsvector)"
+    ),
     database_url: Optional[str] = typer.Option(None, "--database-url", help="데이터베이스 URL (pgvector용)"),
     db_path: Optional[Path] = typer.Option(None, "--db-path", help="데이터베이스 파일 경로 (sqlite-vec용)"),
     toml_path: Optional[Path] = typer.Option(
@@ -108,28 +123,274 @@ def create_collection(
             config["db_path"] = str(db_path)
 
         # 백엔드 생성
-        store = get_vector_store(backend, **config)
+        store = get_vector_store(backend, toml_path=toml_path, **config)
 
         # 컬렉션 생성
-        store.create_collection(name, dimensions, distance_metric)
+        kwargs = {}
+        if metadata_columns:
+            kwargs["metadata_columns"] = parse_metadata_columns(metadata_columns)
+        if quantization:
+            kwargs["quantization"] = quantization
+        if lexical_index:
+            kwargs["lexical_index"] = True
+        store.create_collection(name, dimensions, distance_metric, **kwargs)
 
         console.print(f"[green]✓ '{name}' 컬렉션을 성공적으로 생성했습니다.[/green]")
         console.print(f"[dim]백엔드: {store.backend_name}[/dim]")
         console.print(f"[dim]차원: {dimensions}[/dim]")
         console.print(f"[dim]거리 메트릭: {distance_metric}[/dim]")
+        if quantization:
+            console.print(f"[dim]양자화: {quantization}[/dim]")
+        if lexical_index:
+            console.print("[dim]전문 검색 인덱스: 생성됨[/dim]")
 
     except Exception as e:
         console.print(f"[red]❌ 컬렉션 생성 실패: {e}[/red]")
         raise typer.Exit(code=1)
 
 
+@app.command(name="migrate-collection")
+def migrate_collection(
+    name: str = typer.Argument(..., help="변환할 컬렉션 이름"),
+    metadata_columns: Optional[list[str]] = typer.Option(
+        None,
+        "--metadata-column",
+        "-m",
+        help="필터링용 메타데이터 컬럼 (키:타입, 예: category:text)",
+    ),
+    db_path: Optional[Path] = typer.Option(None, "--db-path", help="데이터베이스 파일 경로 (sqlite-vec용)"),
+    toml_path: Optional[Path] = typer.Option(
+        DEFAULT_TOML_PATH,
+        "--toml-file",
+        help="toml 설정 파일 경로",
+    ),
+    env_path: Optional[Path] = typer.Option(
+        DEFAULT_ENV_PATH,
+        "--env-file",
+        help="환경 변수 파일(.env) 경로",
+    ),
+    is_verbose: bool = typer.Option(False, "--verbose"),
+):
+    """일반 테이블로 만든 sqlite-vec 컬렉션을 vec0 가상 테이블로 변환합니다."""
+    log_level = logging.DEBUG if is_verbose else logging.INFO
+    init(debug=True, log_level=log_level, toml_path=toml_path, env_path=env_path)
+
+    try:
+        config = {}
+        if db_path:
+            config["db_path"] = str(db_path)
+
+        store = get_vector_store("sqlite-vec", toml_path=toml_path, **config)
+        copied = store.migrate_collection(name, metadata_columns=parse_metadata_columns(metadata_columns or []))
+
+        if copied:
+            console.print(f"[green]✓ '{name}' 컬렉션의 문서 {copied:,}개를 vec0 테이블로 옮겼습니다.[/green]")
+        else:
+            console.print(f"[yellow]'{name}' 컬렉션은 이미 vec0 테이블이거나 비어 있습니다.[/yellow]")
+
+    except Exception as e:
+        console.print(f"[red]❌ 컬렉션 변환 실패: {e}[/red]")
+        raise typer.Exit(code=1)
+
+
+@app.command(name="promote-metadata")
+def promote_metadata(
+    name: str = typer.Argument(..., help="컬렉션 이름"),
+    metadata_columns: list[str] = typer.Option(
+        ...,
+        "--metadata-column",
+        "-m",
+        help="승격할 메타데이터 키 (키:타입, 예: category:text, year:integer)",
+    ),
+    backend: Optional[str] = typer.Option(None, "--backend", "-b", help="벡터 스토어 백엔드 (자동 감지)"),
+    database_url: Optional[str] = typer.Option(None, "--database-url", help="데이터베이스 URL (pgvector용)"),
+    db_path: Optional[Path] = typer.Option(None, "--db-path", help="데이터베이스 파일 경로 (sqlite-vec용)"),
+    toml_path: Optional[Path] = typer.Option(
+        DEFAULT_TOML_PATH,
+        "--toml-file",
+        help="toml 설정 파일 경로",
+    ),
+    env_path: Optional[Path] = typer.Option(
+        DEFAULT_ENV_PATH,
+        "--env-file",
+        help="환경 변수 파일(.env) 경로",
+    ),
+    is_verbose: bool = typer.Option(False, "--verbose"),
+):
+    """자주 필터링하는 메타데이터 키를 인덱스가 있는 컬럼으로 승격합니다."""
+    log_level = logging.DEBUG if is_verbose else logging.INFO
+    init(debug=True, log_level=log_level, toml_path=toml_path, env_path=env_path)
+
+    try:
+        config = {}
+        if database_url:
+            config["database_url"] = database_url
+        if db_path:
+            config["db_path"] = str(db_path)
+
+        store = get_vector_store(backend, toml_path=toml_path, **config)
+        columns = store.promote_metadata_keys(name, parse_metadata_columns(metadata_columns))
+
+        console.print(f"[green]✓ '{name}' 컬렉션의 메타데이터 컬럼을 갱신했습니다.[/green]")
+        for key, column_type in columns.items():
+            console.print(f"[dim]- {key}: {column_type}[/dim]")
+
+    except Exception as e:
+        console.print(f"[red]❌ 메타데이터 승격 실패: {e}[/red]")
+        raise typer.Exit(code=1)
+
+
+@app.command(name="check-recall")
+def check_recall(
+    name: str = typer.Argument(..., help="컬렉션 이름"),
+    k: int = typer.Option(10, "--k", "-k", help="재현율을 측정할 결과 개수"),
+    sample_size: int = typer.Option(100, "--sample-size", help="쿼리로 사용할 문서 수"),
+    ef_search: Optional[int] = typer.Option(None, "--ef-search", help="측정에 사용할 검색 후보 수 (기본: 컬렉션 설정)"),
+    rebuild: bool = typer.Option(False, "--rebuild", help="측정 전에 그래프를 다시 생성"),
+    backend: Optional[str] = typer.Option(None, "--backend", "-b", help="벡터 스토어 백엔드 (자동 감지)"),
+    db_path: Optional[Path] = typer.Option(None, "--db-path", help="데이터베이스 파일 경로 (hnsw용)"),
+    toml_path: Optional[Path] = typer.Option(
+        DEFAULT_TOML_PATH,
+        "--toml-file",
+        help="toml 설정 파일 경로",
+    ),
+    env_path: Optional[Path] = typer.Option(
+        DEFAULT_ENV_PATH,
+        "--env-file",
+        help="환경 변수 파일(.env) 경로",
+    ),
+    is_verbose: bool = typer.Option(False, "--verbose"),
+):
+    """근사 검색 인덱스(hnsw)의 재현율을 정확한 검색과 비교해 측정합니다."""
+    log_level = logging.DEBUG if is_verbose else logging.INFO
+    init(debug=True, log_level=log_level, toml_path=toml_path, env_path=env_path)
+
+    try:
+        config = {}
+        if db_path:
+            config["db_path"] = str(db_path)
+
+        store = get_vector_store(backend, toml_path=toml_path, **config)
+        if not hasattr(store, "check_recall"):
+            raise ValueError(f"{store.backend_name} backend does not support recall check")
+
+        if rebuild:
+            store.rebuild_index(name)
+        recall = store.check_recall(name, k=k, sample_size=sample_size, ef_search=ef_search)
+
+        color = "green" if recall >= float(store.config.get("min_recall", 0.9)) else "yellow"
+        console.print(f"[{color}]recall@{k}: {recall:.3f}[/{color}]")
+
+    except Exception as e:
+        console.print(f"[red]❌ 재현율 측정 실패: {e}[/red]")
+        raise typer.Exit(code=1)
+
+
+@app.command(name="train-ivf")
+def train_ivf(
+    name: str = typer.Argument(..., help="컬렉션 이름"),
+    n_lists: Optional[int] = typer.Option(None, "--lists", help="파티션 수 (기본: 기존 파티션 수 또는 √문서 수)"),
+    sample_size: Optional[int] = typer.Option(
+        None, "--sample-size", help="k-means 학습 표본 수 (기본: 파티션 수 × 256)"
+    ),
+    db_path: Optional[Path] = typer.Option(None, "--db-path", help="데이터베이스 파일 경로 (sqlite-vec용)"),
+    toml_path: Optional[Path] = typer.Option(
+        DEFAULT_TOML_PATH,
+        "--toml-file",
+        help="toml 설정 파일 경로",
+    ),
+    env_path: Optional[Path] = typer.Option(
+        DEFAULT_ENV_PATH,
+        "--env-file",
+        help="환경 변수 파일(.env) 경로",
+    ),
+    is_verbose: bool = typer.Option(False, "--verbose"),
+):
+    """sqlite-vec 컬렉션의 IVF 파티션을 학습(재학습)하고 모든 문서를 다시 할당합니다."""
+    log_level = logging.DEBUG if is_verbose else logging.INFO
+    init(debug=True, log_level=log_level, toml_path=toml_path, env_path=env_path)
+
+    try:
+        config = {}
+        if db_path:
+            config["db_path"] = str(db_path)
+
+        store = get_vector_store("sqlite-vec", toml_path=toml_path, **config)
+        lists = store.train_ivf(name, n_lists=n_lists, sample_size=sample_size)
+
+        console.print(f"[green]✓ '{name}' 컬렉션의 IVF 파티션 {lists}개를 학습했습니다.[/green]")
+
+    except Exception as e:
+        console.print(f"[red]❌ IVF 학습 실패: {e}[/red]")
+        raise typer.Exit(code=1)
+
+
+@app.command(name="rebalance-ivf")
+def rebalance_ivf(
+    name: str = typer.Argument(..., help="컬렉션 이름"),
+    n_lists: Optional[int] = typer.Option(None, "--lists", help="새 파티션 수 (기본: 현재 파티션 수)"),
+    sample_size: Optional[int] = typer.Option(None, "--sample-size", help="표본 수 (기본: 파티션 수 × 256)"),
+    db_path: Optional[Path] = typer.Option(None, "--db-path", help="데이터베이스 파일 경로 (sqlite-vec용)"),
+    toml_path: Optional[Path] = typer.Option(
+        DEFAULT_TOML_PATH,
+        "--toml-file",
+        help="toml 설정 파일 경로",
+    ),
+    env_path: Optional[Path] = typer.Option(
+        DEFAULT_ENV_PATH,
+        "--env-file",
+        help="환경 변수 파일(.env) 경로",
+    ),
+    is_verbose: bool = typer.Option(False, "--verbose"),
+):
+    """크기가 치우친 IVF 파티션을 나누거나 합치고 문서를 다시 할당합니다."""
+    log_level = logging.DEBUG if is_verbose else logging.INFO
+    init(debug=True, log_level=log_level, toml_path=toml_path, env_path=env_path)
+
+    try:
+        config = {}
+        if db_path:
+            config["db_path"] = str(db_path)
+
+        store = get_vector_store("sqlite-vec", toml_path=toml_path, **config)
+        sizes = store.rebalance_ivf(name, n_lists=n_lists, sample_size=sample_size)
+
+        console.print(f"[green]✓ '{name}' 컬렉션의 IVF 파티션을 {len(sizes)}개로 재분배했습니다.[/green]")
+        if sizes:
+            console.print(f"[dim]파티션 크기: {min(sizes.values()):,} ~ {max(sizes.values()):,}[/dim]")
+
+    except Exception as e:
+        console.print(f"[red]❌ IVF 재분배 실패: {e}[/red]")
+        raise typer.Exit(code=1)
+
+
+def parse_metadata_columns(values: list[str]) -> dict[str, str]:
+    """["category:text", "year:integer"] 형식의 옵션을 {키: 타입} 사전으로 변환합니다."""
+    columns = {}
+    for value in values:
+        key, __, column_type = value.partition(":")
+        columns[key.strip()] = column_type.strip() or "text"
+    return columns
+
+
 @app.command(name="import-jsonl")
 def import_jsonl(
     file_path: Path = typer.Argument(..., help="임포트할 JSONL 파일"),
     collection: str = typer.Option(..., "--collection", "-c", help="대상 컬렉션"),
     backend: Optional[str] = typer.Option(None, "--backend", "-b", help="벡터 스토어 백엔드 (자동 감지)"),
     batch_size: int = typer.Option(1000, "--batch-size", help="배치 크기"),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", help="JSON 디코딩 프로세스 수 (기본: CPU 코어 수 - 1, 최대 4. 1이면 병렬 처리 안 함)"
+    ),
     clear: bool = typer.Option(False, "--clear", help="기존 데이터 삭제"),
+    resume: bool = typer.Option(
+        False, "--resume", help="중단된 임포트를 마지막으로 커밋한 배치 다음 줄부터 이어서 진행 (--clear 무시)"
+    ),
+    rebuild_index: bool = typer.Option(
+        False,
+        "--rebuild-index",
+        help="적재 전 벡터 인덱스를 삭제하고 적재 후 다시 생성 (pgvector 대용량 적재용)",
+    ),
     database_url: Optional[str] = typer.Option(None, "--database-url", help="데이터베이스 URL (pgvector용)"),
     db_path: Optional[Path] = typer.Option(None, "--db-path", help="데이터베이스 파일 경로 (sqlite-vec용)"),
     toml_path: Optional[Path] = typer.Option(
@@ -161,7 +422,7 @@ def import_jsonl(
             config["db_path"] = str(db_path)
 
         # 백엔드 생성
-        store = get_vector_store(backend, **config)
+        store = get_vector_store(backend, toml_path=toml_path, **config)
 
         # 컬렉션 확인
         if not store.collection_exists(collection):
@@ -172,17 +433,146 @@ def import_jsonl(
         # 임포트 실행
         console.print(f"[dim]'{file_path}'에서 데이터를 임포트 중...[/dim]")
 
-        total = store.import_jsonl(collection, file_path, batch_size=batch_size, clear_existing=clear)
+        options = {}
+        if rebuild_index:
+            if store.backend_name != "pgvector":
+                console.print("[red]❌ --rebuild-index 옵션은 pgvector 백엔드에서만 사용할 수 있습니다.[/red]")
+                raise typer.Exit(code=1)
+            options["rebuild_index"] = True
+
+        started = time.monotonic()
+        total = store.import_jsonl(
+            collection,
+            file_path,
+            batch_size=batch_size,
+            clear_existing=clear,
+            workers=workers,
+            resume=resume,
+            **options,
+        )
+        elapsed = time.monotonic() - started
 
         console.print(f"[green]✓ {total}개의 레코드를 성공적으로 임포트했습니다.[/green]")
+        console.print(f"[dim]소요 시간: {elapsed:.1f}초 ({total / max(elapsed, 1e-9):,.0f} rows/s)[/dim]")
         console.print(f"[dim]컬렉션: {collection}[/dim]")
         console.print(f"[dim]백엔드: {store.backend_name}[/dim]")
 
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]❌ 임포트 실패: {e}[/red]")
         raise typer.Exit(code=1)
 
 
+@app.command(name="export")
+def export_collection(
+    collection: str = typer.Argument(..., help="내보낼 컬렉션"),
+    output_path: Path = typer.Option(..., "--output", "-o", help="스냅샷 디렉토리 (vectors.npy, documents.jsonl)"),
+    backend: Optional[str] = typer.Option(None, "--backend", "-b", help="벡터 스토어 백엔드 (자동 감지)"),
+    batch_size: int = typer.Option(10000, "--batch-size", help="한 번에 읽을 행 수"),
+    database_url: Optional[str] = typer.Option(None, "--database-url", help="데이터베이스 URL (pgvector용)"),
+    db_path: Optional[Path] = typer.Option(None, "--db-path", help="데이터베이스 파일 경로 (sqlite-vec용)"),
+    toml_path: Optional[Path] = typer.Option(
+        DEFAULT_TOML_PATH,
+        "--toml-file",
+        help="toml 설정 파일 경로",
+    ),
+    env_path: Optional[Path] = typer.Option(
+        DEFAULT_ENV_PATH,
+        "--env-file",
+        help="환경 변수 파일(.env) 경로",
+    ),
+    is_verbose: bool = typer.Option(False, "--verbose"),
+):
+    """컬렉션을 float32 벡터(.npy)와 문서(JSONL) 스냅샷으로 내보냅니다."""
+    log_level = logging.DEBUG if is_verbose else logging.INFO
+    init(debug=True, log_level=log_level, toml_path=toml_path, env_path=env_path)
+
+    try:
+        config = {}
+        if database_url:
+            config["database_url"] = database_url
+        if db_path:
+            config["db_path"] = str(db_path)
+
+        store = get_vector_store(backend, toml_path=toml_path, **config)
+
+        if not store.collection_exists(collection):
+            console.print(f"[red]❌ 컬렉션 '{collection}'이 존재하지 않습니다.[/red]")
+            raise typer.Exit(code=1)
+
+        console.print(f"[dim]'{collection}' 컬렉션을 '{output_path}'로 내보내는 중...[/dim]")
+
+        started = time.monotonic()
+        total = store.export(collection, output_path, batch_size=batch_size)
+        elapsed = time.monotonic() - started
+
+        console.print(f"[green]✓ {total}개의 문서를 내보냈습니다.[/green]")
+        console.print(f"[dim]소요 시간: {elapsed:.1f}초 ({total / max(elapsed, 1e-9):,.0f} rows/s)[/dim]")
+        console.print(f"[dim]백엔드: {store.backend_name}[/dim]")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]❌ 내보내기 실패: {e}[/red]")
+        raise typer.Exit(code=1)
+
+
+@app.command(name="restore")
+def restore_collection(
+    snapshot_path: Path = typer.Argument(..., help="export로 만든 스냅샷 디렉토리"),
+    collection: str = typer.Option(..., "--collection", "-c", help="대상 컬렉션 (없으면 스냅샷의 차원으로 생성)"),
+    backend: Optional[str] = typer.Option(None, "--backend", "-b", help="벡터 스토어 백엔드 (자동 감지)"),
+    batch_size: int = typer.Option(1000, "--batch-size", help="배치 크기"),
+    clear: bool = typer.Option(False, "--clear", help="기존 데이터 삭제"),
+    database_url: Optional[str] = typer.Option(None, "--database-url", help="데이터베이스 URL (pgvector용)"),
+    db_path: Optional[Path] = typer.Option(None, "--db-path", help="데이터베이스 파일 경로 (sqlite-vec용)"),
+    toml_path: Optional[Path] = typer.Option(
+        DEFAULT_TOML_PATH,
+        "--toml-file",
+        help="toml 설정 파일 경로",
+    ),
+    env_path: Optional[Path] = typer.Option(
+        DEFAULT_ENV_PATH,
+        "--env-file",
+        help="환경 변수 파일(.env) 경로",
+    ),
+    is_verbose: bool = typer.Option(False, "--verbose"),
+):
+    """export로 만든 스냅샷을 컬렉션으로 복원합니다."""
+    if not snapshot_path.is_dir():
+        console.print(f"[red]❌ 스냅샷 디렉토리를 찾을 수 없습니다: {snapshot_path}[/red]")
+        raise typer.Exit(code=1)
+
+    log_level = logging.DEBUG if is_verbose else logging.INFO
+    init(debug=True, log_level=log_level, toml_path=toml_path, env_path=env_path)
+
+    try:
+        config = {}
+        if database_url:
+            config["database_url"] = database_url
+        if db_path:
+            config["db_path"] = str(db_path)
+
+        store = get_vector_store(backend, toml_path=toml_path, **config)
+
+        console.print(f"[dim]'{snapshot_path}'에서 '{collection}' 컬렉션으로 복원 중...[/dim]")
+
+        started = time.monotonic()
+        total = store.restore(collection, snapshot_path, batch_size=batch_size, clear_existing=clear)
+        elapsed = time.monotonic() - started
+
+        console.print(f"[green]✓ {total}개의 문서를 복원했습니다.[/green]")
+        console.print(f"[dim]소요 시간: {elapsed:.1f}초 ({total / max(elapsed, 1e-9):,.0f} rows/s)[/dim]")
+        console.print(f"[dim]백엔드: {store.backend_name}[/dim]")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]❌ 복원 실패: {e}[/red]")
+        raise typer.Exit(code=1)
+
+
 @app.command(name="similarity-search")
 def similarity_search(
     ctx: typer.Context,
@@ -194,6 +584,18 @@ def similarity_search(
     ),
     limit: int = typer.Option(10, "--limit", "-l", help="결과 개수"),
     threshold: Optional[float] = typer.Option(None, "--threshold", help="유사도 임계값 (0-1)"),
+    ef_search: Optional[int] = typer.Option(None, "--ef-search", help="HNSW 검색 후보 수 (pgvector)"),
+    probes: Optional[int] = typer.Option(None, "--probes", help="IVFFlat 검색 리스트 수 (pgvector)"),
+    iterative_scan: Optional[str] = typer.Option(
+        None, "--iterative-scan", help="반복 인덱스 스캔: off, strict_order, relaxed_order (pgvector 0.8+)"
+    ),
+    rerank_factor: Optional[float] = typer.Option(
+        None, "--rerank-factor", help="양자화 컬렉션에서 원본 벡터로 재정렬할 후보 수 배수 (기본 4)"
+    ),
+    nprobe: Optional[int] = typer.Option(None, "--nprobe", help="IVF 컬렉션에서 탐색할 파티션 수 (sqlite-vec, 기본 8)"),
+    alpha: Optional[float] = typer.Option(
+        None, "--alpha", help="하이브리드 검색의 벡터 검색 가중치 (0-1). 지정하면 전문 검색과 결합합니다."
+    ),
     no_metadata: bool = typer.Option(False, "--no-metadata", help="메타데이터 숨김"),
     database_url: Optional[str] = typer.Option(None, "--database-url", help="데이터베이스 URL (pgvector용)"),
     db_path: Optional[Path] = typer.Option(None, "--db-path", help="데이터베이스 파일 경로 (sqlite-vec용)"),
@@ -227,7 +629,21 @@ def similarity_search(
             config["db_path"] = str(db_path)
 
         # 백엔드 생성
-        store = get_vector_store(backend, **config)
+        store = get_vector_store(backend, toml_path=toml_path, **config)
+
+        search_options = {
+            key: value
+            for key, value in {"ef_search": ef_search, "probes": probes, "iterative_scan": iterative_scan}.items()
+            if value is not None
+        }
+        if search_options and store.backend_name != "pgvector":
+            console.print(
+                "[red]❌ --ef-search, --probes, --iterative-scan 옵션은 pgvector 백엔드에서만 사용할 수 있습니다.[/red]"
+            )
+            raise typer.Exit(code=1)
+        if nprobe is not None and store.backend_name != "sqlite-vec":
+            console.print("[red]❌ --nprobe 옵션은 sqlite-vec 백엔드에서만 사용할 수 있습니다.[/red]")
+            raise typer.Exit(code=1)
 
         # 쿼리 임베딩 생성
         console.print("[dim]쿼리 임베딩 생성 중...[/dim]")
@@ -235,7 +651,17 @@ def similarity_search(
         query_embedding = llm.embed(query)
 
         # 검색 실행
-        results = store.search(collection, query_embedding, k=limit, threshold=threshold)
+        if alpha is not None:
+            if search_options or rerank_factor is not None or nprobe is not None or threshold is not None:
+                console.print("[red]❌ --alpha 옵션은 검색 파라미터, --threshold 옵션과 함께 사용할 수 없습니다.[/red]")
+                raise typer.Exit(code=1)
+            results = store.hybrid_search(collection, query, query_embedding, k=limit, alpha=alpha)
+        else:
+            if rerank_factor is not None:
+                search_options["rerank_factor"] = rerank_factor
+            if nprobe is not None:
+                search_options["nprobe"] = nprobe
+            results = store.search(collection, query_embedding, k=limit, threshold=threshold, **search_options)
 
         if not results:
             console.print("[yellow]검색 결과가 없습니다.[/yellow]")
@@ -255,6 +681,8 @@ def similarity_search(
                 if i < len(results) - 1:
                     console.print("\n" + "-" * 50 + "\n")
 
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]❌ 검색 실패: {e}[/red]")
         raise typer.Exit(code=1)
@@ -289,7 +717,7 @@ def stats(
             config["db_path"] = str(db_path)
 
         # 백엔드 생성
-        store = get_vector_store(backend, **config)
+        store = get_vector_store(backend, toml_path=toml_path, **config)
 
         # 컬렉션 정보 가져오기
         info = store.get_collection_info(collection)
@@ -332,7 +760,7 @@ def create_collection_simple(
 
     try:
         # 자동 감지된 백엔드로 스토어 생성
-        store = get_vector_store()
+        store = get_vector_store(toml_path=toml_path)
         
         # 컬렉션 생성
         store.create_collection(name, dimensions, "cosine")
@@ -369,7 +797,7 @@ def search_simple(
 
     try:
         # 자동 감지된 백엔드로 스토어 생성
-        store = get_vector_store()
+        store = get_vector_store(toml_path=toml_path)
         
         # 쿼리 임베딩 생성
         console.print("[dim]쿼리 임베딩 생성 중...[/dim]")
@@ -424,7 +852,7 @@ def load_simple(
 
     try:
         # 자동 감지된 백엔드로 스토어 생성
-        store = get_vector_store()
+        store = get_vector_store(toml_path=toml_path)
         
         # 컬렉션 확인
         if not store.collection_exists(collection):
@@ -319,8 +319,11 @@ def import_jsonl(
     ),
     database_alias: str = typer.Option("default", "--database", "-d", help="Django 데이터베이스 별칭"),
     table_name: str = typer.Option(..., "--table", "-t", help="대상 테이블 이름"),
-    batch_size: int = typer.Option(1000, "--batch-size", help="배치 크기"),
+    batch_size: int = typer.Option(1000, "--batch-size", help="진행 상황 출력 간격"),
     clear: bool = typer.Option(False, "--clear", "-c", help="기존 데이터 삭제"),
+    rebuild_index: bool = typer.Option(
+        False, "--rebuild-index", help="적재 전 벡터 인덱스를 삭제하고 적재 후 다시 생성 (대용량 적재용)"
+    ),
     toml_path: Optional[Path] = typer.Option(
         DEFAULT_TOML_PATH,
         "--toml-file",
@@ -343,14 +346,13 @@ def import_jsonl(
     init(debug=True, log_level=log_level, toml_path=toml_path, env_path=env_path)
 
     try:
-        import json
-
         import psycopg2
-        import psycopg2.extras
     except ImportError:
         console.print("[red]❌ psycopg2 패키지가 설치되어 있지 않습니다.[/red]")
         raise typer.Exit(code=1)
 
+    from pyhub.rag.backends.pg_copy import bulk_load, iter_jsonl_rows
+
     db_url = get_database_url(database_url, database_alias)
 
     try:
@@ -369,46 +371,18 @@ def import_jsonl(
             cursor.execute(f"TRUNCATE TABLE {table_name}")
             console.print("[yellow]기존 데이터를 삭제했습니다.[/yellow]")
 
-        # JSONL 파일 읽기 및 임포트
-        total = 0
-        batch = []
-
-        with jsonl_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                data = json.loads(line.strip())
-
-                # 데이터 검증
-                if "page_content" not in data or "embedding" not in data:
-                    console.print(f"[yellow]⚠️  Invalid data format at line {total + 1}[/yellow]")
-                    continue
-
-                batch.append((data["page_content"], json.dumps(data.get("metadata", {})), data["embedding"]))
-
-                # 배치 처리
-                if len(batch) >= batch_size:
-                    psycopg2.extras.execute_batch(
-                        cursor,
-                        f"""
-                        INSERT INTO {table_name} (page_content, metadata, embedding)
-                        VALUES (%s, %s::jsonb, %s::vector)
-                        """,
-                        batch,
-                    )
-                    total += len(batch)
-                    console.print(f"[dim]Imported {total} records...[/dim]")
-                    batch = []
-
-        # 남은 데이터 처리
-        if batch:
-            psycopg2.extras.execute_batch(
-                cursor,
-                f"""
-                INSERT INTO {table_name} (page_content, metadata, embedding)
-                VALUES (%s, %s::jsonb, %s::vector)
-                """,
-                batch,
-            )
-            total += len(batch)
+        if rebuild_index:
+            console.print("[dim]벡터 인덱스를 삭제하고 적재 후 다시 생성합니다.[/dim]")
+
+        # JSONL 파일을 한 줄씩 읽어 COPY BINARY로 스트리밍
+        total = bulk_load(
+            cursor,
+            table_name,
+            iter_jsonl_rows(jsonl_path, skip_invalid=True),
+            rebuild_index=rebuild_index,
+            progress=lambda count: console.print(f"[dim]Imported {count} records...[/dim]"),
+            progress_every=batch_size,
+        )
 
         conn.commit()
 
@@ -440,6 +414,11 @@ def similarity_search(
     limit: int = typer.Option(10, "--limit", "-l", help="결과 개수"),
     threshold: Optional[float] = typer.Option(None, "--threshold", help="유사도 임계값 (0-1)"),
     distance_metric: str = typer.Option("cosine", "--distance-metric", help="거리 메트릭 (cosine, l2, inner_product)"),
+    ef_search: Optional[int] = typer.Option(None, "--ef-search", help="HNSW 검색 후보 수 (hnsw.ef_search)"),
+    probes: Optional[int] = typer.Option(None, "--probes", help="IVFFlat 검색 리스트 수 (ivfflat.probes)"),
+    iterative_scan: Optional[str] = typer.Option(
+        None, "--iterative-scan", help="반복 인덱스 스캔: off, strict_order, relaxed_order (pgvector 0.8+)"
+    ),
     no_metadata: bool = typer.Option(False, "--no-metadata", help="메타데이터 숨김"),
     toml_path: Optional[Path] = typer.Option(
         DEFAULT_TOML_PATH,
@@ -473,6 +452,8 @@ def similarity_search(
         console.print(f"[red]❌ Required package not found: {e}[/red]")
         raise typer.Exit(code=1)
 
+    from pyhub.rag.backends.pg_search import PgSearchParams, apply_search_settings
+
     db_url = get_database_url(database_url, database_alias)
 
     # 거리 함수 매핑
@@ -482,6 +463,12 @@ def similarity_search(
         console.print(f"[red]❌ Invalid distance metric: {distance_metric}[/red]")
         raise typer.Exit(code=1)
 
+    try:
+        search_params = PgSearchParams(ef_search=ef_search, probes=probes, iterative_scan=iterative_scan)
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        raise typer.Exit(code=1)
+
     try:
         # 쿼리 임베딩 생성
         console.print("[dim]Generating embedding for query...[/dim]")
@@ -516,6 +503,8 @@ def similarity_search(
         """
         params.extend([query_embedding, limit])
 
+        # 검색 파라미터는 이 트랜잭션에만 적용
+        apply_search_settings(cursor, search_params.settings(limit))
         cursor.execute(search_sql, params)
         results = cursor.fetchall()
 
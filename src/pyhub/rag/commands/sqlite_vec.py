@@ -155,6 +155,13 @@ def command_import_jsonl(
     db_path: Path = typer.Option(Path("db.sqlite3"), "--db-path", "-d", help="SQLite DB 경로"),
     table_name: str = typer.Option(None, "--table", "-t", help="테이블 이름 (선택사항, 미지정시 자동 감지)"),
     clear: bool = typer.Option(False, "--clear", "-c", help="로딩 전 테이블의 기존 데이터 삭제"),
+    resume: bool = typer.Option(
+        False, "--resume", help="중단된 임포트를 마지막으로 커밋한 배치 다음 줄부터 이어서 진행 (--clear 무시)"
+    ),
+    batch_size: int = typer.Option(1000, "--batch-size", help="배치 크기"),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", help="JSON 디코딩 프로세스 수 (기본: CPU 코어 수 - 1, 최대 4. 1이면 병렬 처리 안 함)"
+    ),
     toml_path: Optional[Path] = typer.Option(
         DEFAULT_TOML_PATH,
         "--toml-file",
@@ -188,16 +195,24 @@ def command_import_jsonl(
     console.print(f"{db_path} 경로의 {table_name} 테이블에 {jsonl_path} 데이터를 임포트합니다.")
 
     try:
-        import_jsonl(
+        stats = import_jsonl(
             db_path=db_path,
             table_name=table_name,
             jsonl_path=jsonl_path,
             clear=clear,
+            batch_size=batch_size,
+            workers=workers,
+            resume=resume,
         )
     except SQLiteVecError as e:
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(code=1)
 
+    console.print(
+        f"[green]✓ {stats.rows}개의 레코드를 임포트했습니다. "
+        f"({stats.elapsed:.1f}초, {stats.rows_per_second:,.0f} rows/s)[/green]"
+    )
+
 
 @app.command(name="similarity-search")
 def command_similarity_search(
@@ -9,6 +9,18 @@ from typing import Generator, Optional, Union
 from pyhub.llm import LLM, LLMEmbeddingModelEnum
 from pyhub.llm.json import JSONDecodeError, json_dumps, json_loads
 from pyhub.llm.types import Embed, EmbeddingDimensionsEnum
+from pyhub.rag.backends.pipeline import (
+    DecodedChunk,
+    ImportCheckpoint,
+    ImportProgress,
+    check_resume,
+    checkpoint_source,
+    delete_checkpoint,
+    load_checkpoint,
+    run_import,
+    save_checkpoint,
+)
+from pyhub.rag.utils import serialize_f32, serialize_f32_batch
 
 try:
     import sqlite_vec
@@ -165,64 +177,92 @@ def import_jsonl(
     table_name: Optional[str],
     jsonl_path: Path,
     clear: bool,
-):
+    batch_size: int = 1000,
+    workers: Optional[int] = None,
+    resume: bool = False,
+) -> ImportProgress:
+    """
+    JSONL 파일을 한 번만 읽으며 batch_size개씩 삽입합니다.
+
+    JSON 디코딩과 float32 변환은 workers개 프로세스에서 병렬로 처리하고, 배치마다 파일 위치를
+    체크포인트 테이블에 기록하며 함께 커밋합니다. resume이 참이면 마지막으로 커밋한 배치 다음 줄부터 이어서 임포트하며,
+    이때 clear는 무시합니다. 잘못된 레코드는 경고를 남기고 건너뜁니다.
+    """
     with get_db_cursor(db_path) as cursor:
         # Auto-detect table with embedding column if table_name is not provided
         if table_name is None:
             table_name = detect_embedding_table(cursor)
             logger.info(f"Auto-detected table: '{table_name}'")
 
-        # Clear existing data if requested
-        if clear:
-            try:
-                cursor.execute(f"DELETE FROM {table_name}")
-                deleted_count = cursor.rowcount
-                logger.warning(f"Cleared {deleted_count} existing records from table '{table_name}'")
-            except sqlite3.Error as e:
-                raise SQLiteVecError(f"Error clearing table: {str(e)}")
-
-        # Read and insert data from JSONL
-        with jsonl_path.open("r", encoding="utf-8") as f:
-            total_lines = sum(1 for __ in f)
-            f.seek(0)
-
-            logger.info(f"Found {total_lines} records in JSONL file")
-
-            inserted_count = 0
-            for i, line in enumerate(f):
+        source = checkpoint_source(jsonl_path)
+        checkpoint = load_checkpoint(cursor, table_name, source) if resume else None
+        if checkpoint is not None:
+            check_resume(table_name, jsonl_path, checkpoint, clear)
+            if checkpoint.completed:
+                return ImportProgress(jsonl_path, name=table_name, start_offset=checkpoint.offset)
+        else:
+            # Clear existing data if requested
+            if clear:
                 try:
-                    data = json_loads(line.strip())
-
-                    # Check required fields
-                    if "page_content" not in data:
-                        logger.warning(f"Skipping record {i+1} - missing 'page_content' field")
-                        continue
-
-                    if "embedding" not in data or not data["embedding"]:
-                        logger.warning(f"Skipping record {i+1} - missing 'embedding' field")
-                        continue
-
-                    # Prepare metadata
-                    metadata = data.get("metadata", {})
-                    if not metadata:
-                        metadata = {}
-
-                    # Insert data
-                    cursor.execute(
-                        f"INSERT INTO {table_name} (page_content, metadata, embedding) VALUES (?, ?, ?)",
-                        (data["page_content"], json_dumps(metadata), str(data["embedding"])),
-                    )
-                    inserted_count += 1
-
-                    progress = (i + 1) / total_lines * 100
-                    logger.debug(f"Progress: {progress:.1f}% ({i+1}/{total_lines})")
-
-                except Exception as e:
-                    logger.warning(f"Error processing record {i+1}: {str(e)}")
-                    continue
+                    cursor.execute(f"DELETE FROM {table_name}")
+                    deleted_count = cursor.rowcount
+                    logger.warning(f"Cleared {deleted_count} existing records from table '{table_name}'")
+                except sqlite3.Error as e:
+                    raise SQLiteVecError(f"Error clearing table: {str(e)}")
+
+            checkpoint = ImportCheckpoint(source=source)
+            delete_checkpoint(cursor, table_name, source)
+            cursor.connection.commit()
+
+        insert_sql = f"INSERT INTO {table_name} (page_content, metadata, embedding) VALUES (?, ?, ?)"
+
+        def insert_batch(chunk: DecodedChunk) -> int:
+            nonlocal checkpoint
+
+            # 임베딩은 JSON 문자열 대신 float32 blob으로 한 번에 변환하여 전달
+            embeddings = serialize_f32_batch(chunk.vectors)
+            rows = [
+                (page_content, json_dumps(metadata), embedding)
+                for (page_content, metadata, __), embedding in zip(chunk.rows(), embeddings)
+            ]
+            try:
+                cursor.executemany(insert_sql, rows)
+                count = len(rows)
+            except sqlite3.Error:
+                # 배치 중 잘못된 레코드가 있으면 배치를 되돌리고 레코드 단위로 다시 삽입
+                cursor.connection.rollback()
+                count = 0
+                for row in rows:
+                    try:
+                        cursor.execute(insert_sql, row)
+                        count += 1
+                    except sqlite3.Error as e:
+                        logger.warning(f"Error inserting record in lines {chunk.start_line}-{chunk.end_line}: {e}")
+
+            # 삽입한 행과 체크포인트를 함께 커밋하므로 중단된 뒤 이어서 임포트해도 중복되지 않습니다.
+            checkpoint = checkpoint.advance(chunk, count)
+            save_checkpoint(cursor, table_name, checkpoint)
+            cursor.connection.commit()
+            return count
+
+        stats = run_import(
+            jsonl_path,
+            insert_batch,
+            chunk_size=batch_size,
+            workers=workers,
+            skip_invalid=True,
+            name=table_name,
+            checkpoint=checkpoint,
+        )
+        save_checkpoint(cursor, table_name, checkpoint.complete())
+        cursor.connection.commit()
 
         logger.info("✅ Data loading completed successfully")
-        logger.info(f"Inserted {inserted_count} of {total_lines} records into table '{table_name}'")
+        logger.info(
+            f"Inserted {stats.rows} records into table '{table_name}' "
+            f"({stats.skipped} skipped, {stats.elapsed:.1f}s, {stats.rows_per_second:,.0f} rows/s)"
+        )
+        return stats
 
 
 def similarity_search(
@@ -263,11 +303,11 @@ def similarity_search(
 
         sql = f"""
             SELECT page_content, metadata, distance FROM {table_name}
-            WHERE embedding MATCH vec_f32(?)
+            WHERE embedding MATCH ?
             ORDER BY distance
             LIMIT {limit}
         """
-        cursor.execute(sql, (str(query_embedding),))
+        cursor.execute(sql, (serialize_f32(query_embedding),))
         results = cursor.fetchall()
 
         document_list = []
@@ -1,7 +1,8 @@
 """단순화된 벡터 스토어 팩토리."""
 
 import logging
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Union
 
 from .backends import get_backend_class
 from .backends.base import BaseVectorStore
@@ -10,17 +11,49 @@ from .detection import create_backend_config, detect_vector_backend
 logger = logging.getLogger(__name__)
 
 
+def load_rag_config(toml_path: Optional[Union[str, Path]] = None) -> dict:
+    """
+    TOML 설정 파일의 [rag] 섹션을 읽습니다.
+    
+    Args:
+        toml_path: TOML 파일 경로 (None이면 기본 경로)
+        
+    Returns:
+        [rag] 섹션 딕셔너리 (파일이나 섹션이 없으면 빈 딕셔너리)
+    """
+    import toml
+
+    from pyhub.config import Config
+
+    toml_path = Path(Config.resolve_path(toml_path, Config.get_default_toml_path)).expanduser()
+    if not toml_path.is_file():
+        return {}
+
+    try:
+        with toml_path.open("r", encoding="utf-8") as f:
+            return toml.load(f).get("rag", {})
+    except Exception as e:
+        logger.warning(f"Failed to load TOML config: {e}")
+        return {}
+
+
 def get_vector_store(
     backend_name: Optional[str] = None,
     database_alias: str = "default",
+    toml_path: Optional[Union[str, Path]] = None,
     **override_config
 ) -> BaseVectorStore:
     """
     벡터 스토어 인스턴스를 생성합니다.
     
+    백엔드를 지정하지 않으면 TOML 설정의 [rag] default_backend를 사용하고,
+    없으면 Django 데이터베이스 설정에서 자동 감지합니다.
+    설정은 Django 설정 < TOML [rag.backends.<백엔드>] < override_config 순으로 덮어씁니다.
+    
     Args:
-        backend_name: 백엔드 이름 (None이면 자동 감지)
+        backend_name: 백엔드 이름 (None이면 TOML 설정 또는 자동 감지)
         database_alias: Django 데이터베이스 별칭
+        toml_path: TOML 설정 파일 경로 (None이면 기본 경로)
         **override_config: 추가 설정 오버라이드
         
     Returns:
@@ -33,11 +66,19 @@ def get_vector_store(
         # 특정 백엔드 지정
         store = get_vector_store('pgvector')
         
+        # TOML 설정 파일의 [rag] default_backend 사용
+        store = get_vector_store(toml_path='~/.pyhub-rag/config.toml')
+        
         # 설정 오버라이드
         store = get_vector_store(db_path='/custom/path.db')
     """
+    rag_config = load_rag_config(toml_path)
+    
     # 백엔드 자동 감지 또는 사용자 지정
-    if backend_name is None:
+    if backend_name is None and rag_config.get('default_backend'):
+        backend_name = rag_config['default_backend']
+        logger.debug(f"Using default backend from TOML config: {backend_name}")
+    elif backend_name is None:
         backend_name = detect_vector_backend(database_alias)
         logger.debug(f"Auto-detected backend: {backend_name}")
     else:
@@ -54,6 +95,12 @@ def get_vector_store(
         logger.warning(f"Could not create config from Django settings: {e}")
         config = {}
     
+    # TOML 백엔드 설정으로 오버라이드
+    toml_config = dict(rag_config.get('backends', {}).get(backend_name, {}))
+    if not toml_config.pop('enabled', True):
+        raise ValueError(f"Backend '{backend_name}' is disabled in TOML config")
+    config.update(toml_config)
+    
     # 사용자 설정으로 오버라이드
     config.update(override_config)
     
@@ -1,9 +1,10 @@
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, cast
 
 import tiktoken
-from asgiref.sync import async_to_sync
+from asgiref.sync import async_to_sync, sync_to_async
 from django.conf import settings
 from django.core import checks
 from django.db import models
@@ -14,6 +15,8 @@ from pyhub.llm.types import LLMEmbeddingModelType
 
 from ...llm.exceptions import RateLimitError
 from .. import django_lifecycle  # noqa
+from ..backends.hybrid import DEFAULT_HYBRID_FETCH_FACTOR, FusionMethod, fuse_rankings
+from ..decorators import warn_if_async
 from ..fields import BaseVectorField
 from ..utils import make_groups_by_length
 from ..validators import MaxTokenValidator
@@ -98,6 +101,152 @@ class BaseDocumentQuerySet(models.QuerySet):
     ) -> list["AbstractDocument"]:
         raise NotImplementedError
 
+    def similarity_search_by_vector(
+        self,
+        query_embedding: list[float],
+        k: int = 4,
+        distance_threshold: Optional[float] = None,
+    ) -> list["AbstractDocument"]:
+        """임베딩 벡터로 검색합니다. 각 문서에 distance 속성이 지정됩니다."""
+        raise NotImplementedError
+
+    def similarity_search_many_by_vector(
+        self,
+        query_embeddings: list[list[float]],
+        k: int = 4,
+        distance_threshold: Optional[float] = None,
+    ) -> list[list["AbstractDocument"]]:
+        """
+        여러 임베딩 벡터로 검색합니다. 기본 구현은 벡터마다 similarity_search_by_vector를 실행합니다.
+        한 번의 쿼리로 검색할 수 있는 데이터베이스는 이 메서드를 재정의합니다.
+        """
+        return [
+            list(self.similarity_search_by_vector(query_embedding, k=k, distance_threshold=distance_threshold))
+            for query_embedding in query_embeddings
+        ]
+
+    @warn_if_async
+    def similarity_search_many(
+        self,
+        queries: list[str],
+        k: int = 4,
+        distance_threshold: Optional[float] = None,
+    ) -> list[list["AbstractDocument"]]:
+        """
+        여러 검색어로 검색합니다. 검색어 임베딩은 한 번의 API 호출로 생성합니다.
+
+        Returns:
+            검색어 순서대로 각 검색어의 문서 목록
+        """
+        if not queries:
+            return []
+        query_embeddings = self.model.embed(list(queries))
+        return self.similarity_search_many_by_vector(query_embeddings, k=k, distance_threshold=distance_threshold)
+
+    async def similarity_search_many_async(
+        self,
+        queries: list[str],
+        k: int = 4,
+        distance_threshold: Optional[float] = None,
+    ) -> list[list["AbstractDocument"]]:
+        """similarity_search_many의 비동기 버전"""
+        if not queries:
+            return []
+        query_embeddings = await self.model.embed_async(list(queries))
+        return await sync_to_async(self.similarity_search_many_by_vector, thread_sensitive=True)(
+            query_embeddings, k=k, distance_threshold=distance_threshold
+        )
+
+    def lexical_search(self, query: str, k: int = 4) -> list["AbstractDocument"]:
+        """
+        전문(full-text) 검색으로 page_content에 검색어가 포함된 문서를 관련도 순으로 반환합니다.
+        각 문서에 lexical_score 속성(클수록 관련도 높음)이 지정됩니다.
+        """
+        raise NotImplementedError
+
+    @warn_if_async
+    def hybrid_search(
+        self,
+        query: str,
+        k: int = 4,
+        alpha: float = 0.5,
+        fusion: FusionMethod = "rrf",
+        fetch_k: Optional[int] = None,
+    ) -> list["AbstractDocument"]:
+        """
+        전문 검색과 벡터 검색 결과를 결합하여 반환합니다.
+
+        고유명사, 부품 번호처럼 임베딩으로 잘 구분되지 않는 검색어도 전문 검색으로 찾을 수 있습니다.
+        임베딩 API 호출은 별도 스레드에서 실행하고, 그동안 전문 검색 쿼리를 실행합니다.
+        각 문서에 hybrid_score 속성(0 ~ 1)이 지정됩니다.
+
+        Args:
+            query: 검색어
+            k: 반환할 문서 수
+            alpha: 벡터 검색 가중치 (0 ~ 1). 1이면 벡터 검색만, 0이면 전문 검색만 사용
+            fusion: rrf (Reciprocal Rank Fusion) 또는 weighted (정규화 점수 가중 합)
+            fetch_k: 각 검색에서 가져올 후보 수 (기본: k × 4)
+        """
+        if not 0 <= alpha <= 1:
+            raise ValueError(f"alpha must be between 0 and 1: {alpha}")
+        fetch_k = fetch_k or k * DEFAULT_HYBRID_FETCH_FACTOR
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # 데이터베이스 연결은 스레드별로 관리되므로 쿼리는 모두 현재 스레드에서 실행합니다.
+            embedding_future = executor.submit(self.model.embed, query) if alpha > 0 else None
+            lexical_docs = list(self.lexical_search(query, k=fetch_k)) if alpha < 1 else []
+            vector_docs = []
+            if embedding_future is not None:
+                vector_docs = list(self.similarity_search_by_vector(embedding_future.result(), k=fetch_k))
+
+        return self._fuse_documents(vector_docs, lexical_docs, k, alpha, fusion)
+
+    async def hybrid_search_async(
+        self,
+        query: str,
+        k: int = 4,
+        alpha: float = 0.5,
+        fusion: FusionMethod = "rrf",
+        fetch_k: Optional[int] = None,
+    ) -> list["AbstractDocument"]:
+        """비동기 하이브리드 검색 메서드. 임베딩 API 호출과 전문 검색 쿼리를 동시에 실행합니다."""
+        if not 0 <= alpha <= 1:
+            raise ValueError(f"alpha must be between 0 and 1: {alpha}")
+        fetch_k = fetch_k or k * DEFAULT_HYBRID_FETCH_FACTOR
+
+        async def vector_search() -> list["AbstractDocument"]:
+            if alpha == 0:
+                return []
+            query_embedding = await self.model.embed_async(query)
+            qs = self.similarity_search_by_vector(query_embedding, k=fetch_k)
+            return await sync_to_async(list, thread_sensitive=True)(qs)  # noqa
+
+        async def lexical_search() -> list["AbstractDocument"]:
+            if alpha == 1:
+                return []
+            return await sync_to_async(lambda: list(self.lexical_search(query, k=fetch_k)), thread_sensitive=True)()
+
+        vector_docs, lexical_docs = await asyncio.gather(vector_search(), lexical_search())
+        return self._fuse_documents(vector_docs, lexical_docs, k, alpha, fusion)
+
+    @staticmethod
+    def _fuse_documents(vector_docs, lexical_docs, k: int, alpha: float, fusion: FusionMethod):
+        fused = fuse_rankings(
+            vector_docs,
+            lexical_docs,
+            key=lambda doc: doc.pk,
+            alpha=alpha,
+            method=fusion,
+            # 벡터 검색은 거리가 가까울수록, 전문 검색은 점수가 클수록 관련도가 높습니다.
+            score=lambda doc: doc.lexical_score if hasattr(doc, "lexical_score") else -doc.distance,
+        )
+
+        docs = []
+        for doc, score in fused[:k]:
+            doc.hybrid_score = score
+            docs.append(doc)
+        return docs
+
     def __repr__(self):
         return repr(list(self))
 
@@ -1,13 +1,19 @@
 import logging
-from typing import List, Literal, Optional, Type
+from functools import reduce
+from operator import or_
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type, Union
 
 from asgiref.sync import sync_to_async
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
 from django.core import checks
 from django.core.exceptions import ImproperlyConfigured
-from django.db import connections
-from django.db.models import QuerySet
+from django.db import connections, transaction
+from django.db.models import QuerySet, Value
 from pgvector.django import CosineDistance, HnswIndex, IvfflatIndex, L2Distance
 
+from ..backends.hybrid import tokenize_query
+from ..backends.pg_search import PgSearchParams, apply_search_settings
 from ..decorators import warn_if_async
 from ..fields.postgres import PGVectorField
 from .base import AbstractDocument, BaseDocumentQuerySet
@@ -16,6 +22,49 @@ logger = logging.getLogger(__name__)
 
 
 class PGVectorDocumentQuerySet(BaseDocumentQuerySet):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 쿼리 실행 시 SET LOCAL로 적용할 인덱스 검색 설정
+        self._search_settings: List[Tuple[str, str]] = []
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._search_settings = self._search_settings
+        return clone
+
+    def _fetch_all(self):
+        if self._result_cache is None and self._search_settings:
+            # SET LOCAL은 트랜잭션 안에서만 유효하므로 같은 트랜잭션에서 조회합니다.
+            with transaction.atomic(using=self.db):
+                with connections[self.db].cursor() as cursor:
+                    apply_search_settings(cursor, self._search_settings)
+                super()._fetch_all()
+        else:
+            super()._fetch_all()
+
+    def with_search_params(
+        self,
+        k: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        iterative_scan: Optional[Union[str, bool]] = None,
+    ) -> "PGVectorDocumentQuerySet":
+        """
+        모델의 vector_search_params에 인자로 지정한 값을 덮어써서, 쿼리 실행 시 SET LOCAL로 적용합니다.
+
+        Args:
+            k: 가져올 문서 수. HNSW ef_search를 k 이상으로 맞추는 데 사용합니다.
+            ef_search: HNSW 검색 후보 수 (hnsw.ef_search)
+            probes: IVFFlat 검색 리스트 수 (ivfflat.probes)
+            iterative_scan: 반복 인덱스 스캔 (off, strict_order, relaxed_order)
+        """
+        params = PgSearchParams.from_dict(getattr(self.model, "vector_search_params", None)).merge(
+            PgSearchParams(ef_search=ef_search, probes=probes, iterative_scan=iterative_scan)
+        )
+        qs = self._chain()
+        qs._search_settings = params.settings(k)
+        return qs
+
     def _prepare_search_query(
         self,
         query_embedding: List[float],
@@ -51,38 +100,138 @@ class PGVectorDocumentQuerySet(BaseDocumentQuerySet):
             f"{self.model._meta.app_label}.{self.model.__name__} 모델의 embedding 필드에 대한 Vector 인덱스를 찾을 수 없습니다."
         )
 
+    def similarity_search_by_vector(
+        self,
+        query_embedding: List[float],
+        k: int = 4,
+        distance_threshold: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        iterative_scan: Optional[Union[str, bool]] = None,
+    ) -> QuerySet["AbstractDocument"]:
+        """임베딩 벡터로 검색하는 메서드"""
+        qs = self.with_search_params(k, ef_search=ef_search, probes=probes, iterative_scan=iterative_scan)
+        qs = qs._prepare_search_query(query_embedding, distance_threshold=distance_threshold)
+        return qs[:k]
+
+    def similarity_search_many_by_vector(
+        self,
+        query_embeddings: List[List[float]],
+        k: int = 4,
+        distance_threshold: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        iterative_scan: Optional[Union[str, bool]] = None,
+    ) -> List[List["AbstractDocument"]]:
+        """
+        여러 임베딩 벡터를 한 번의 쿼리로 검색합니다.
+
+        벡터마다 인덱스를 사용하는 (ORDER BY distance LIMIT k) 서브쿼리를 만들어 UNION ALL로 묶으므로
+        데이터베이스 왕복은 한 번입니다.
+        """
+        if not query_embeddings:
+            return []
+
+        qs = self.with_search_params(k, ef_search=ef_search, probes=probes, iterative_scan=iterative_scan)
+        subqueries = [
+            qs._prepare_search_query(query_embedding, distance_threshold=distance_threshold).annotate(
+                query_index=Value(index)
+            )[:k]
+            for index, query_embedding in enumerate(query_embeddings)
+        ]
+        combined = subqueries[0].union(*subqueries[1:], all=True) if len(subqueries) > 1 else subqueries[0]
+
+        results: List[List[AbstractDocument]] = [[] for __ in query_embeddings]
+        for doc in combined:
+            results[doc.query_index].append(doc)
+        # UNION ALL은 서브쿼리 사이의 순서만 보장하지 않으므로 쿼리별로 거리순 정렬
+        return [sorted(docs, key=lambda doc: doc.distance) for docs in results]
+
     @warn_if_async
     def similarity_search(
         self,
         query: str,
         k: int = 4,
         distance_threshold: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        iterative_scan: Optional[Union[str, bool]] = None,
     ) -> QuerySet["AbstractDocument"]:
-        """동기 검색 메서드"""
+        """동기 검색 메서드
+
+        ef_search, probes, iterative_scan을 지정하면 이 검색에만 SET LOCAL로 적용합니다.
+        iterative_scan을 켜면 filter()로 걸러지는 문서가 많아도 k개를 채울 때까지 인덱스를 탐색합니다.
+        """
         model_cls: Type[AbstractDocument] = self.model
         query_embedding = model_cls.embed(query)
 
-        qs = self._prepare_search_query(query_embedding, distance_threshold=distance_threshold)
-        return qs[:k]
+        return self.similarity_search_by_vector(
+            query_embedding,
+            k=k,
+            distance_threshold=distance_threshold,
+            ef_search=ef_search,
+            probes=probes,
+            iterative_scan=iterative_scan,
+        )
 
     async def similarity_search_async(
         self,
         query: str,
         k: int = 4,
         distance_threshold: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        iterative_scan: Optional[Union[str, bool]] = None,
     ) -> List["AbstractDocument"]:
         """비동기 검색 메서드"""
         model_cls: Type[AbstractDocument] = self.model
         query_embedding = await model_cls.embed_async(query)
 
-        qs = self._prepare_search_query(query_embedding, distance_threshold=distance_threshold)
+        qs = self.with_search_params(k, ef_search=ef_search, probes=probes, iterative_scan=iterative_scan)
+        qs = qs._prepare_search_query(query_embedding, distance_threshold=distance_threshold)
         return await sync_to_async(list, thread_sensitive=True)(qs[:k])  # noqa
 
+    def lexical_search(self, query: str, k: int = 4) -> QuerySet["AbstractDocument"]:
+        """
+        tsvector 전문 검색으로 검색어 중 하나라도 포함한 문서를 ts_rank 점수 순으로 반환합니다.
+
+        make_lexical_index()로 만든 GIN 인덱스와 같은 식(to_tsvector(config, page_content))으로 검색하므로
+        인덱스가 있으면 인덱스를 사용합니다.
+        """
+        terms = tokenize_query(query)
+        if not terms:
+            return self.none()
+
+        config = self.model.lexical_search_config
+        search_vector = SearchVector("page_content", config=config)
+        search_query = reduce(or_, (SearchQuery(term, config=config, search_type="plain") for term in terms))
+
+        embedding_field_name = self.model.get_embedding_field().name
+        qs = (
+            self.defer(embedding_field_name)
+            .alias(search=search_vector)
+            .annotate(lexical_score=SearchRank(search_vector, search_query))
+        )
+        return qs.filter(search=search_query).order_by("-lexical_score")[:k]
+
 
 class PGVectorDocument(AbstractDocument):
     embedding = PGVectorField(editable=False)
     objects = PGVectorDocumentQuerySet.as_manager()
 
+    # 모델(컬렉션)별 기본 인덱스 검색 파라미터 (ef_search, probes, iterative_scan, max_scan_tuples, max_probes)
+    vector_search_params: Dict[str, Any] = {}
+
+    # 전문 검색(lexical_search, hybrid_search)에 사용할 텍스트 검색 설정. 한국어 설정이 없으므로 simple을 사용합니다.
+    lexical_search_config: str = "simple"
+
+    @classmethod
+    def make_lexical_index(cls, index_name: str, config: str = "simple") -> GinIndex:
+        """
+        page_content 전문 검색을 위한 GIN 인덱스를 생성합니다. config는 lexical_search_config와 같아야 합니다.
+        """
+        return GinIndex(SearchVector("page_content", config=config), name=index_name)
+
     @classmethod
     def make_hnsw_index(
         cls,
@@ -3,9 +3,11 @@ from typing import List, Optional
 
 from asgiref.sync import sync_to_async
 from django.core import checks
-from django.db import connections
+from django.db import connections, transaction
 from django.db.models.query import QuerySet
+from django_lifecycle import AFTER_CREATE, AFTER_UPDATE, BEFORE_DELETE, hook
 
+from ..backends.hybrid import tokenize_query
 from ..decorators import warn_if_async
 from ..fields.sqlite import SQLiteVectorField
 from .base import AbstractDocument, BaseDocumentQuerySet
@@ -29,6 +31,15 @@ class SQLiteVectorDocumentQuerySet(BaseDocumentQuerySet):
             qs = qs.filter(distance__lt=distance_threshold)
         return qs.defer("embedding")
 
+    def similarity_search_by_vector(
+        self,
+        query_embedding: List[float],
+        k: int = 4,
+        distance_threshold: Optional[float] = None,
+    ) -> QuerySet["AbstractDocument"]:
+        qs = self._prepare_search_query(query_embedding, distance_threshold=distance_threshold)
+        return qs[:k]
+
     @warn_if_async
     def similarity_search(
         self,
@@ -37,8 +48,7 @@ class SQLiteVectorDocumentQuerySet(BaseDocumentQuerySet):
         distance_threshold: Optional[float] = None,
     ) -> QuerySet["AbstractDocument"]:
         query_embedding = self.model.embed(query)
-        qs = self._prepare_search_query(query_embedding, distance_threshold=distance_threshold)
-        return qs[:k]
+        return self.similarity_search_by_vector(query_embedding, k=k, distance_threshold=distance_threshold)
 
     async def similarity_search_async(
         self,
@@ -51,6 +61,115 @@ class SQLiteVectorDocumentQuerySet(BaseDocumentQuerySet):
         qs = self._prepare_search_query(query_embedding, distance_threshold=distance_threshold)
         return await sync_to_async(list, thread_sensitive=True)(qs[:k])  # noqa
 
+    @property
+    def _fts_table_name(self) -> str:
+        return f"{self.model._meta.db_table}_fts"
+
+    def _fts_table_exists(self, cursor) -> bool:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [self._fts_table_name])
+        return cursor.fetchone() is not None
+
+    def create_lexical_index(self) -> None:
+        """
+        page_content 전문 검색을 위한 FTS5 테이블({db_table}_fts)을 생성하고 기존 문서를 색인합니다.
+
+        모델의 lexical_index가 참이면 이후 문서 생성/수정/삭제 시 함께 갱신됩니다.
+        QuerySet.update()로 page_content를 수정한 경우에는 갱신되지 않으므로 이 메서드를 다시 호출해주세요.
+        """
+        table_name = self._fts_table_name
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE {table_name} USING fts5("
+                f"page_content, tokenize = '{self.model.lexical_tokenizer}')"
+            )
+            cursor.execute(
+                f"INSERT INTO {table_name} (rowid, page_content) "
+                f"SELECT id, page_content FROM {self.model._meta.db_table}"
+            )
+
+    def _update_lexical_index(self, objs, inserted_after: Optional[int] = None) -> None:
+        """
+        문서의 page_content를 FTS5 테이블에 반영합니다.
+
+        vec0 가상 테이블은 bulk_create 후 pk를 돌려주지 않으므로, pk가 없는 문서는
+        같은 트랜잭션에서 삽입 전에 기록한 최대 rowid(inserted_after) 이후의 행으로 찾아 색인합니다.
+        """
+        if not self.model.lexical_index or not objs:
+            return
+
+        table_name = self._fts_table_name
+        with connections[self.db].cursor() as cursor:
+            if not self._fts_table_exists(cursor):
+                self.create_lexical_index()
+                return
+
+            rows = [(obj.pk, obj.page_content) for obj in objs if obj.pk is not None]
+            cursor.executemany(f"DELETE FROM {table_name} WHERE rowid = %s", [(pk,) for pk, __ in rows])
+            cursor.executemany(f"INSERT INTO {table_name} (rowid, page_content) VALUES (%s, %s)", rows)
+
+            # 트랜잭션이 쓰기 잠금을 쥐고 있으므로 inserted_after 이후의 행은 모두 이번에 삽입한 행입니다.
+            if inserted_after is not None and len(rows) < len(objs):
+                cursor.execute(
+                    f"INSERT INTO {table_name} (rowid, page_content) "
+                    f"SELECT id, page_content FROM {self.model._meta.db_table} "
+                    f"WHERE id > %s AND id NOT IN (SELECT rowid FROM {table_name})",
+                    [inserted_after],
+                )
+
+    def _delete_lexical_index(self, pks) -> None:
+        if not self.model.lexical_index or not pks:
+            return
+
+        with connections[self.db].cursor() as cursor:
+            if self._fts_table_exists(cursor):
+                cursor.executemany(f"DELETE FROM {self._fts_table_name} WHERE rowid = %s", [(pk,) for pk in pks])
+
+    def bulk_create(self, objs, *args, **kwargs):
+        if not self.model.lexical_index:
+            return super().bulk_create(objs, *args, **kwargs)
+
+        with transaction.atomic(using=self.db):
+            with connections[self.db].cursor() as cursor:
+                cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {self.model._meta.db_table}")
+                inserted_after = cursor.fetchone()[0]
+            objs = super().bulk_create(objs, *args, **kwargs)
+            self._update_lexical_index(objs, inserted_after=inserted_after)
+        return objs
+
+    def delete(self):
+        pks = list(self.values_list("pk", flat=True)) if self.model.lexical_index else []
+        result = super().delete()
+        self._delete_lexical_index(pks)
+        return result
+
+    def lexical_search(self, query: str, k: int = 4) -> QuerySet["AbstractDocument"]:
+        """
+        FTS5 전문 검색으로 검색어 중 하나라도 포함한 문서를 bm25 점수 순으로 반환합니다.
+        FTS5 테이블이 없으면 먼저 생성합니다.
+        """
+        # trigram 토크나이저는 3글자 미만의 검색어를 찾을 수 없습니다.
+        min_length = 3 if self.model.lexical_tokenizer.startswith("trigram") else 1
+        terms = tokenize_query(query, min_length=min_length)
+        if not terms:
+            return self.none()
+
+        with connections[self.db].cursor() as cursor:
+            if not self._fts_table_exists(cursor):
+                self.create_lexical_index()
+
+        table_name = self._fts_table_name
+        db_table = self.model._meta.db_table
+        match = " OR ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+        qs = self.extra(
+            select={"lexical_score": f"-bm25({table_name})"},
+            tables=[table_name],
+            where=[f"{table_name}.rowid = {db_table}.id", f"{table_name} MATCH %s"],
+            params=[match],
+            order_by=["-lexical_score"],
+        )
+        return qs.defer("embedding")[:k]
+
 
 class SQLiteVectorDocument(AbstractDocument):
     """
@@ -60,6 +179,25 @@ class SQLiteVectorDocument(AbstractDocument):
     embedding = SQLiteVectorField(editable=False)
     objects = SQLiteVectorDocumentQuerySet.as_manager()
 
+    # 참이면 page_content를 FTS5 테이블에 함께 색인하여 lexical_search, hybrid_search에 사용합니다.
+    lexical_index: bool = False
+
+    # FTS5 토크나이저. trigram은 한국어와 부품 번호 등의 부분 일치 검색을 지원합니다.
+    lexical_tokenizer: str = "trigram"
+
+    @hook(AFTER_CREATE)
+    def on_after_create(self):
+        type(self).objects.using(self._state.db)._update_lexical_index([self])
+
+    @hook(AFTER_UPDATE, when="page_content", has_changed=True)
+    def on_after_update(self):
+        type(self).objects.using(self._state.db)._update_lexical_index([self])
+
+    @hook(BEFORE_DELETE)
+    def on_before_delete(self):
+        # 삭제 후에는 pk가 None이 되므로 삭제 전에 색인에서 제거합니다.
+        type(self).objects.using(self._state.db)._delete_lexical_index([self.pk])
+
     @classmethod
     def check(cls, **kwargs):
         errors = super().check(**kwargs)
@@ -1,4 +1,5 @@
 import sqlite3
+import struct
 from functools import lru_cache
 from logging import getLogger
 from typing import (
@@ -59,6 +60,60 @@ def load_sqlite_vec_extension(connection: sqlite3.Connection):
     logger.debug("sqlite-vec extension loaded")
 
 
+def serialize_f32(vector: Any) -> bytes:
+    """
+    벡터를 sqlite-vec가 그대로 읽는 little-endian float32 blob으로 변환합니다.
+
+    JSON 문자열 대신 blob을 전달하면 SQLite가 행/쿼리마다 JSON을 파싱하지 않습니다.
+
+    Args:
+        vector: float 리스트, numpy 배열, Embed 객체 또는 이미 변환된 bytes
+
+    Returns:
+        4 * 차원 바이트 길이의 blob
+    """
+    if isinstance(vector, (bytes, bytearray, memoryview)):
+        return bytes(vector)
+
+    # Embed 객체
+    vector = getattr(vector, "array", vector)
+
+    try:
+        import numpy as np
+    except ImportError:
+        return struct.pack(f"<{len(vector)}f", *vector)
+
+    return np.asarray(vector, dtype="<f4").tobytes()
+
+
+def serialize_f32_batch(vectors: Iterable[Any]) -> List[bytes]:
+    """
+    여러 벡터를 한 번에 float32 blob 리스트로 변환합니다.
+
+    numpy가 있으면 2차원 배열로 한 번에 변환한 뒤 행 단위로 잘라냅니다.
+    """
+    vectors = [getattr(vector, "array", vector) for vector in vectors]
+    if not vectors:
+        return []
+
+    try:
+        import numpy as np
+
+        matrix = np.asarray(vectors, dtype="<f4")
+    except (ImportError, ValueError):
+        # numpy가 없거나 차원이 서로 다른 경우 개별 변환
+        return [serialize_f32(vector) for vector in vectors]
+
+    if matrix.ndim != 2:
+        return [serialize_f32(vector) for vector in vectors]
+    return [row.tobytes() for row in matrix]
+
+
+def deserialize_f32(blob: bytes) -> List[float]:
+    """float32 blob을 float 리스트로 변환합니다."""
+    return list(struct.unpack(f"<{len(blob) // 4}f", blob))
+
+
 @lru_cache(maxsize=32)
 def get_literal_values(*type_hints: Any) -> Set[Any]:
     """
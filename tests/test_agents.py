@@ -268,6 +268,65 @@ class TestAsyncTools:
         assert async_result == "async: test"
 
 
+class TestToolResultCache:
+    """도구 결과 메모이제이션 테스트"""
+
+    def test_cacheable_tool_result_is_reused(self):
+        """cacheable 도구는 같은 인자에 대해 한 번만 실행"""
+        from pyhub.llm.agents.base import ToolExecutor, ToolResultCache
+
+        calls = []
+
+        def lookup(key: str) -> str:
+            calls.append(key)
+            return f"value-{key}"
+
+        tool = Tool(name="lookup_for_cache_test", description="Lookup", func=lookup, cacheable=True, cache_ttl=60)
+        result_cache = ToolResultCache()
+
+        with patch.object(ToolExecutor, "result_cache", result_cache):
+            assert ToolExecutor.execute_tool(tool, key="a") == "value-a"
+            assert ToolExecutor.execute_tool(tool, key="a") == "value-a"
+            assert ToolExecutor.execute_tool(tool, key="b") == "value-b"
+
+        assert calls == ["a", "b"]
+        assert result_cache.stats["lookup_for_cache_test"] == {"hits": 1, "misses": 2}
+
+    def test_cache_key_is_canonical(self):
+        """인자 순서와 무관하게 같은 캐시 키 생성"""
+        from pyhub.llm.agents.base import ToolResultCache
+
+        tool = Tool(name="t", description="t", func=lambda **kwargs: "", cacheable=True)
+
+        key1 = ToolResultCache.make_key(tool, kwargs={"a": 1, "b": {"x": 1, "y": 2}})
+        key2 = ToolResultCache.make_key(tool, kwargs={"b": {"y": 2, "x": 1}, "a": 1})
+        assert key1 == key2
+        assert key1 != ToolResultCache.make_key(tool, kwargs={"a": 2, "b": {"x": 1, "y": 2}})
+
+    @pytest.mark.asyncio
+    async def test_function_calling_executor_uses_cache(self):
+        """Function Calling 도구 실행기에서도 cacheable 도구의 결과 재사용"""
+        from pyhub.llm.agents.base import ToolResultCache
+        from pyhub.llm.tools import ToolExecutor
+
+        calls = []
+
+        async def fetch(url: str) -> str:
+            calls.append(url)
+            return f"fetched {url}"
+
+        not_cached_tool = Tool(name="fetch_not_cached", description="Fetch", func=fetch)
+        cached_tool = Tool(name="fetch_for_cache_test", description="Fetch", func=fetch, cacheable=True)
+        executor = ToolExecutor([not_cached_tool, cached_tool], result_cache=ToolResultCache())
+
+        for _ in range(2):
+            await executor.execute_tool_async("fetch_not_cached", {"url": "u1"})
+            await executor.execute_tool_async("fetch_for_cache_test", {"url": "u2"})
+
+        assert calls == ["u1", "u2", "u1"]
+        assert executor.result_cache.hits == 1
+
+
 class TestToolWithRealWorldScenarios:
     """실제 시나리오 기반 도구 테스트"""
 
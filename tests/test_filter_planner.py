@@ -0,0 +1,73 @@
+"""Tests for filter-aware search planner."""
+
+import pytest
+
+from pyhub.rag.backends.planner import CollectionStats, FilterPlanner, matches_filter
+
+
+@pytest.fixture
+def stats():
+    # 1000개 중 category=common 950개, category=rare 10개
+    sample = [{"category": "common"}] * 950 + [{"category": "rare"}] * 10 + [{}] * 40
+    return CollectionStats(total=100_000, sample=sample)
+
+
+class TestFilterPlanner:
+    """FilterPlanner 테스트"""
+
+    def test_matches_filter(self):
+        assert matches_filter({"a": 1, "b": "x"}, {"a": 1})
+        assert not matches_filter({"a": 1}, {"a": 2})
+        assert not matches_filter({}, {"a": None})
+        assert matches_filter(None, {})
+
+    def test_selectivity(self, stats):
+        assert stats.selectivity({}) == 1.0
+        assert stats.selectivity({"category": "common"}) == pytest.approx(0.95, abs=0.01)
+        assert stats.selectivity({"category": "missing"}) > 0
+
+    def test_selective_filter_uses_exact(self, stats):
+        plan = FilterPlanner().plan(10, stats, {"category": "rare"})
+        assert plan.strategy == "exact"
+        assert plan.estimated_matches == pytest.approx(1050, rel=0.1)
+
+    def test_broad_filter_uses_ann(self, stats):
+        plan = FilterPlanner(overfetch_factor=2.0).plan(10, stats, {"category": "common"})
+        assert plan.strategy == "ann"
+        assert 20 <= plan.fetch_k <= 30
+
+    def test_fetch_k_limit_switches_to_exact(self, stats):
+        plan = FilterPlanner(exact_selectivity=0.001, max_fetch_k=500).plan(10, stats, {"category": "rare"})
+        assert plan.strategy == "exact"
+
+    def test_indexed_filter_uses_exact(self, stats):
+        planner = FilterPlanner(indexed_exact_rows=5000)
+        # 인덱스가 있으면 매칭 문서가 적은 중간 선택도 필터도 정확 검색
+        medium = {"category": "rare"}
+        assert FilterPlanner(exact_selectivity=0.001).plan(10, stats, medium).strategy == "ann"
+        assert (
+            FilterPlanner(exact_selectivity=0.001, indexed_exact_rows=5000)
+            .plan(10, stats, medium, indexed=True)
+            .strategy
+            == "exact"
+        )
+        # 매칭 문서가 많으면 인덱스가 있어도 ANN
+        assert planner.plan(10, stats, {"category": "common"}, indexed=True).strategy == "ann"
+
+    def test_next_fetch_k_grows(self):
+        planner = FilterPlanner(overfetch_factor=1.0)
+        # 20개 중 1개만 통과 → 관측 비율 기준으로 200개
+        assert planner.next_fetch_k(k=10, fetch_k=20, found=1) == 200
+        # 통과한 후보가 없어도 최소 2배 이상 증가
+        assert planner.next_fetch_k(k=10, fetch_k=20, found=0) >= 40
+
+    def test_stats_staleness(self):
+        stats = CollectionStats(total=100)
+        assert not stats.is_stale(ttl=60)
+        stats.changed = 30
+        assert stats.is_stale(ttl=60)
+
+    def test_from_config(self):
+        planner = FilterPlanner.from_config({"planner_max_fetch_k": 100}, sample_size=10)
+        assert planner.max_fetch_k == 100
+        assert planner.sample_size == 10
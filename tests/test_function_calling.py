@@ -190,6 +190,119 @@ async def test_async_tools():
     print(f"   결과: {result2}")
 
 
+def test_parallel_tool_execution():
+    """여러 도구 호출 동시 실행 테스트"""
+    from pyhub.llm.tools import ToolExecutor
+
+    def slow_lookup(key: str) -> str:
+        """느린 조회 작업입니다."""
+        time.sleep(0.2)
+        return f"value-{key}"
+
+    executor = ToolExecutor(ToolAdapter.adapt_tools([slow_lookup]))
+    tool_calls = [{"name": "slow_lookup", "arguments": {"key": str(i)}} for i in range(4)]
+
+    start_time = time.time()
+    results = executor.execute_tools(tool_calls)
+    elapsed = time.time() - start_time
+
+    # 결과는 호출 순서를 유지하고, 총 소요 시간은 가장 느린 호출 수준
+    assert results == ["value-0", "value-1", "value-2", "value-3"]
+    assert elapsed < 0.6
+
+
+def test_tool_timeout_starts_after_concurrency_slot():
+    """동시 실행 슬롯을 기다린 시간은 도구 시간 제한에 포함하지 않는지 테스트"""
+    from pyhub.llm.agents.base import Tool
+    from pyhub.llm.tools import ToolExecutor
+
+    def slow(key: str) -> str:
+        time.sleep(0.3)
+        return f"done-{key}"
+
+    def hang() -> str:
+        time.sleep(1)
+        return "never"
+
+    executor = ToolExecutor(
+        [
+            Tool(name="slow", description="slow", func=slow, timeout=0.5, max_concurrency=1),
+            Tool(name="hang", description="hang", func=hang, timeout=0.1),
+        ]
+    )
+
+    # 두 번째 호출은 첫 번째 호출이 끝날 때까지 0.3초 슬롯을 기다린 뒤 0.3초 실행됩니다.
+    results = executor.execute_tools([{"name": "slow", "arguments": {"key": str(i)}} for i in range(2)])
+    assert results == ["done-0", "done-1"]
+
+    # 호출이 하나여도 시간 제한을 적용합니다.
+    start_time = time.time()
+    results = executor.execute_tools([{"name": "hang", "arguments": {}}])
+    assert "timed out" in results[0]
+    assert time.time() - start_time < 0.5
+
+
+def test_tool_slot_wait_is_bounded():
+    """슬롯을 차지한 도구가 멈춰도 슬롯을 기다리는 호출이 무한정 기다리지 않는지 테스트"""
+    from pyhub.llm.agents.base import Tool
+    from pyhub.llm.tools import ToolExecutor
+
+    calls = []
+
+    def hang(key: str) -> str:
+        calls.append(key)
+        time.sleep(1)
+        return "never"
+
+    executor = ToolExecutor([Tool(name="hang", description="hang", func=hang, timeout=0.1, max_concurrency=1)])
+
+    start_time = time.time()
+    results = executor.execute_tools([{"name": "hang", "arguments": {"key": str(i)}} for i in range(2)])
+
+    assert all("timed out" in result for result in results)
+    assert time.time() - start_time < 0.5
+    # 슬롯을 얻지 못하고 시간 초과된 호출은 나중에 슬롯을 얻어도 실행하지 않습니다.
+    time.sleep(1.1)
+    assert calls == ["0"]
+
+
+async def test_parallel_tool_execution_async():
+    """비동기 도구 동시 실행 시 도구별 동시 실행 제한과 시간 제한 테스트"""
+    from pyhub.llm.agents.base import Tool
+    from pyhub.llm.tools import ToolExecutor
+
+    running = 0
+    max_running = 0
+
+    async def fetch(key: str) -> str:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.1)
+        running -= 1
+        return f"fetched-{key}"
+
+    async def hang() -> str:
+        await asyncio.sleep(10)
+        return "never"
+
+    executor = ToolExecutor(
+        [
+            Tool(name="fetch", description="fetch", func=fetch, max_concurrency=2),
+            Tool(name="hang", description="hang", func=hang, timeout=0.1),
+        ]
+    )
+    tool_calls = [{"name": "fetch", "arguments": {"key": str(i)}} for i in range(4)]
+    tool_calls.insert(1, {"name": "hang", "arguments": {}})
+
+    results = await executor.execute_tools_async(tool_calls)
+
+    assert results[0] == "fetched-0"
+    assert "timed out" in results[1]
+    assert results[2:] == ["fetched-1", "fetched-2", "fetched-3"]
+    assert max_running == 2
+
+
 def test_provider_conversion():
     """Provider별 스키마 변환 테스트"""
     print("\n=== Provider 스키마 변환 테스트 ===\n")
@@ -222,6 +335,111 @@ def test_provider_conversion():
     print(f"  설명: {google_schema['description']}")
 
 
+def test_schema_compilation_cache():
+    """같은 함수/스키마에 대한 스키마 컴파일 결과 재사용 테스트"""
+    from pyhub.llm.agents.mcp.wrapper import create_pydantic_schema
+    from pyhub.llm.agents.tools import Calculator
+    from pyhub.llm.tools import ProviderToolConverter
+
+    def lookup(city: str, limit: int = 3) -> str:
+        """도시 정보를 조회합니다."""
+        return city
+
+    # 요청마다 새로 만들어지는 Tool 객체라도 스키마 모델과 provider 변환 결과는 재사용
+    tool1, tool2 = create_tool_from_function(lookup), create_tool_from_function(lookup)
+    assert tool1 is not tool2
+    assert tool1.args_schema is tool2.args_schema
+    assert ProviderToolConverter.to_openai_function(tool1) is ProviderToolConverter.to_openai_function(tool2)
+    assert ProviderToolConverter.to_anthropic_tool(tool1)["input_schema"]["required"] == ["city"]
+
+    # 바운드 메서드도 원본 함수 기준으로 캐시
+    calc_tool1, calc_tool2 = ToolAdapter.adapt_tool(Calculator()), ToolAdapter.adapt_tool(Calculator())
+    assert ProviderToolConverter.to_google_function(calc_tool1) is ProviderToolConverter.to_google_function(calc_tool2)
+    assert FunctionToolAdapter.extract_function_schema(calc_tool1.func)["callable"] == calc_tool1.func
+
+    # MCP 도구 스키마는 JSON Schema 내용 기준으로 캐시
+    parameters = {"properties": {"expression": {"type": "string"}}, "required": ["expression"]}
+    assert create_pydantic_schema(parameters) is create_pydantic_schema(dict(reversed(list(parameters.items()))))
+
+
+def test_schema_cache_separates_bound_methods():
+    """바운드 메서드와 원본 함수의 스키마가 캐시에서 섞이지 않는지 테스트"""
+
+    class Finder:
+        def find(this, query: str) -> str:
+            return query
+
+    # 원본 함수를 먼저 컴파일한 뒤 바운드 메서드를 컴파일
+    assert FunctionToolAdapter.extract_function_schema(Finder.find)["parameters"]["required"] == ["this", "query"]
+    assert FunctionToolAdapter.extract_function_schema(Finder().find)["parameters"]["required"] == ["query"]
+    assert "this" in FunctionToolAdapter.create_pydantic_schema_from_function(Finder.find).model_fields
+    assert "this" not in FunctionToolAdapter.create_pydantic_schema_from_function(Finder().find).model_fields
+
+    class Locator:
+        def locate(this, query: str) -> str:
+            return query
+
+    # 바운드 메서드를 먼저 컴파일한 뒤 원본 함수를 컴파일
+    assert FunctionToolAdapter.extract_function_schema(Locator().locate)["parameters"]["required"] == ["query"]
+    assert FunctionToolAdapter.extract_function_schema(Locator.locate)["parameters"]["required"] == ["this", "query"]
+    assert "this" not in FunctionToolAdapter.create_pydantic_schema_from_function(Locator().locate).model_fields
+    assert "this" in FunctionToolAdapter.create_pydantic_schema_from_function(Locator.locate).model_fields
+
+
+def test_stop_sequence_with_tools(monkeypatch):
+    """도구를 사용할 때도 stop sequence가 provider 요청에 전달되는지 테스트"""
+    from types import SimpleNamespace
+
+    from pyhub.llm import anthropic as anthropic_module
+    from pyhub.llm import openai as openai_module
+    from pyhub.llm.anthropic import AnthropicLLM
+    from pyhub.llm.openai import OpenAILLM
+
+    def lookup(city: str) -> str:
+        """도시 정보를 조회합니다."""
+        return city
+
+    requests = []
+    openai_response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="done", tool_calls=None), finish_reason="stop")],
+        usage=SimpleNamespace(prompt_tokens=1, completion_tokens=1),
+    )
+    anthropic_response = SimpleNamespace(
+        content=[SimpleNamespace(type="text", text="done")],
+        usage=SimpleNamespace(input_tokens=1, output_tokens=1),
+    )
+
+    def create(**params):
+        requests.append(params)
+        return anthropic_response if "stop_sequences" in params else openai_response
+
+    async def create_async(**params):
+        return create(**params)
+
+    class FakeClient:
+        def __init__(self, *args, **kwargs):
+            self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+            self.messages = SimpleNamespace(create=create)
+
+    class FakeAsyncClient:
+        def __init__(self, *args, **kwargs):
+            self.chat = SimpleNamespace(completions=SimpleNamespace(create=create_async))
+
+    monkeypatch.setattr(openai_module, "SyncOpenAI", FakeClient)
+    monkeypatch.setattr(openai_module, "AsyncOpenAI", FakeAsyncClient)
+    monkeypatch.setattr(anthropic_module, "SyncAnthropic", FakeClient)
+
+    llm = OpenAILLM(api_key="test")
+    assert llm.ask("서울", tools=[lookup], stop=["Observation:"], use_history=False).text == "done"
+    assert asyncio.run(llm.ask_async("서울", tools=[lookup], stop=["Observation:"], use_history=False)).text == "done"
+    anthropic_llm = AnthropicLLM(api_key="test")
+    assert anthropic_llm.ask("서울", tools=[lookup], stop=["Observation:"], use_history=False).text == "done"
+
+    assert [request["tools"][0]["function"]["name"] for request in requests[:2]] == ["lookup", "lookup"]
+    assert [request["stop"] for request in requests[:2]] == [["Observation:"], ["Observation:"]]
+    assert requests[2]["stop_sequences"] == ["Observation:"]
+
+
 def test_agent_compatibility():
     """Agent 도구 호환성 테스트"""
     print("\n=== Agent 도구 호환성 테스트 ===\n")
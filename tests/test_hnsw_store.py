@@ -0,0 +1,174 @@
+"""Tests for HnswStore backend."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyhub.rag.backends import get_backend_class, list_backends
+from pyhub.rag.backends.base import Document
+
+np = pytest.importorskip("numpy")
+hnswlib = pytest.importorskip("hnswlib")
+
+from pyhub.rag.backends.hnsw import HnswStore  # noqa: E402
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(0).normal(size=(300, 8)).astype(np.float32)
+
+
+def make_documents(vectors, start=0):
+    return [
+        Document(page_content=str(i), metadata={"group": i % 3}, embedding=vector.tolist())
+        for i, vector in enumerate(vectors, start)
+    ]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "vectors.db"
+
+
+@pytest.fixture
+def store(db_path, vectors):
+    with HnswStore({"db_path": db_path, "exact_search_rows": 0}) as store:
+        store.create_collection("docs", dimension=8)
+        store.insert("docs", make_documents(vectors), batch_size=100)
+        yield store
+
+
+class TestHnswStore:
+    """HNSW 백엔드 테스트"""
+
+    def test_registered(self):
+        assert "hnsw" in list_backends()
+        assert get_backend_class("hnsw") is HnswStore
+
+    @pytest.mark.parametrize("metric", ["cosine", "l2", "inner_product"])
+    def test_search_finds_nearest(self, db_path, vectors, metric):
+        with HnswStore({"db_path": db_path}) as store:
+            store.create_collection("docs", dimension=8, distance_metric=metric)
+            store.insert("docs", make_documents(vectors))
+
+            results = store.search("docs", vectors[7].tolist(), k=5)
+
+        assert len(results) == 5
+        if metric != "inner_product":
+            assert results[0].document.page_content == "7"
+        assert [r.score for r in results] == sorted((r.score for r in results), reverse=True)
+
+    def test_index_persisted_next_to_db(self, store, db_path, vectors):
+        index_path = store.index_path("docs")
+        assert index_path == db_path.with_name("vectors.docs.hnsw")
+        assert index_path.exists()
+
+        with HnswStore({"db_path": db_path}) as reopened:
+            assert reopened.count("docs") == 300
+            assert reopened.search("docs", vectors[11].tolist(), k=1)[0].document.page_content == "11"
+
+    def test_reconciles_unsaved_changes(self, db_path, vectors):
+        with HnswStore({"db_path": db_path, "autosave": False, "rebuild_threshold": 0.9}) as store:
+            store.create_collection("docs", dimension=8)
+            store.insert("docs", make_documents(vectors[:100]))
+            store.flush()
+
+            store.insert("docs", make_documents(vectors[100:], start=100))
+            store.delete("docs", {"group": 0})
+            # close()에서 저장하지 않고 종료된 경우
+            store._indexes = {}
+
+        with HnswStore({"db_path": db_path}) as store:
+            results = store.search("docs", vectors[151].tolist(), k=10)
+            info = store.get_collection_info("docs")
+
+        assert results[0].document.page_content == "151"
+        assert all(r.document.metadata["group"] != 0 for r in results)
+        assert info["count"] == 200
+
+    def test_writers_in_separate_stores_keep_all_rows(self, db_path, vectors):
+        # 같은 DB를 여는 두 스토어 (다른 프로세스의 경우와 같습니다)
+        with (
+            HnswStore({"db_path": db_path, "autosave": False}) as first,
+            HnswStore({"db_path": db_path, "rebuild_threshold": 0.9}) as second,
+        ):
+            first.create_collection("docs", dimension=8)
+            first.insert("docs", make_documents(vectors[:100]))
+            second.insert("docs", make_documents(vectors[100:200], start=100))
+            first.insert("docs", make_documents(vectors[200:], start=200))
+            second.delete("docs", {"group": 0})
+            first.flush()
+
+        index = hnswlib.Index(space="cosine", dim=8)
+        index.load_index(str(db_path.with_name("vectors.docs.hnsw")))
+        assert len(index.get_ids_list()) == 300
+
+        with HnswStore({"db_path": db_path}) as store:
+            state = store._get_index("docs")
+            assert not state.dirty
+            assert (state.live, state.deleted) == (200, 100)
+
+    def test_searches_share_index_lock(self, store, vectors):
+        state = store._get_index("docs")
+        with state.lock.read(), ThreadPoolExecutor(1) as executor:
+            # 다른 검색이 진행 중이어도 기본 ef_search 검색은 기다리지 않습니다.
+            results = executor.submit(store.search, "docs", vectors[3].tolist(), 1).result(timeout=5)
+        assert results[0].document.page_content == "3"
+
+    def test_filter(self, store, vectors):
+        results = store.search("docs", vectors[4].tolist(), k=3, filter={"group": 1})
+
+        assert results[0].document.page_content == "4"
+        assert all(r.document.metadata["group"] == 1 for r in results)
+
+    def test_search_many(self, store, vectors):
+        results = store.search_many("docs", vectors[:3].tolist(), k=2)
+
+        assert [r[0].document.page_content for r in results] == ["0", "1", "2"]
+
+    def test_soft_delete_and_rebuild(self, db_path, vectors):
+        with HnswStore({"db_path": db_path, "rebuild_threshold": 0.5}) as store:
+            store.create_collection("docs", dimension=8)
+            store.insert("docs", make_documents(vectors))
+
+            assert store.delete("docs", {"group": 0}) == 100
+            assert store.get_collection_info("docs")["deleted"] == 100
+            assert all(r.document.metadata["group"] != 0 for r in store.search("docs", vectors[0].tolist(), k=20))
+
+            # 삭제 표시 비율이 0.5를 넘으면 그래프를 다시 만들고 행을 지웁니다.
+            store.delete("docs", {"group": 1})
+            info = store.get_collection_info("docs")
+
+        assert info["count"] == 100
+        assert info["deleted"] == 0
+
+    def test_rebuild_with_new_parameters(self, store):
+        assert store.rebuild_index("docs", m=8, ef_construction=100) == 300
+
+        info = store.get_collection_info("docs")
+        assert (info["m"], info["ef_construction"]) == (8, 100)
+
+    def test_check_recall(self, store, caplog):
+        assert store.check_recall("docs", k=5, sample_size=20) >= 0.9
+
+        store.config["min_recall"] = 1.1
+        with caplog.at_level(logging.WARNING):
+            store.check_recall("docs", k=5, sample_size=20)
+        assert "recall@5" in caplog.text
+
+    def test_drop_collection_removes_index(self, store):
+        index_path = store.index_path("docs")
+        store.drop_collection("docs")
+
+        assert not store.collection_exists("docs")
+        assert not index_path.exists()
+
+    def test_export_and_restore(self, store, tmp_path, vectors):
+        store.delete("docs", {"group": 0})
+        assert store.export("docs", tmp_path / "snapshot", batch_size=64) == 200
+
+        assert store.restore("copy", tmp_path / "snapshot", batch_size=64) == 200
+        assert store.get_collection_info("copy")["count"] == 200
+        assert store.index_path("copy").exists()
+        assert store.search("copy", vectors[1].tolist(), k=1)[0].document.page_content == "1"
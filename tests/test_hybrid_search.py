@@ -0,0 +1,44 @@
+"""Tests for lexical + vector rank fusion."""
+
+import pytest
+
+from pyhub.rag.backends.hybrid import fuse_rankings, tokenize_query
+
+
+class TestTokenizeQuery:
+    """검색어 분리 테스트"""
+
+    def test_keep_part_numbers(self):
+        assert tokenize_query("AB-1234 교체, v2.1 AB-1234") == ["AB-1234", "교체", "v2.1"]
+
+    def test_join_short_terms(self):
+        assert tokenize_query("엔진 오일 교환", min_length=3) == ["엔진 오일", "오일 교환"]
+        assert tokenize_query("AB-1234 부품", min_length=3) == ["AB-1234", "AB-1234 부품"]
+        assert tokenize_query("a", min_length=3) == []
+
+
+class TestFuseRankings:
+    """순위 결합 테스트"""
+
+    def test_rrf(self):
+        fused = fuse_rankings(["a", "b", "c"], ["c", "d"], key=str)
+
+        assert [item for item, __ in fused] == ["c", "a", "b", "d"]
+        assert fused[0][1] == pytest.approx(0.5 + 0.5 * 61 / 63)
+
+    def test_alpha_bounds(self):
+        assert [item for item, __ in fuse_rankings(["a", "b"], ["b", "a"], key=str, alpha=1.0)] == ["a", "b"]
+        assert [item for item, __ in fuse_rankings(["a", "b"], ["b", "a"], key=str, alpha=0.0)] == ["b", "a"]
+        with pytest.raises(ValueError):
+            fuse_rankings([], [], key=str, alpha=1.5)
+
+    def test_weighted(self):
+        vector = [("a", 0.9), ("c", 0.5), ("b", 0.3), ("d", 0.1)]
+        lexical = [("c", 12.0), ("b", 2.0)]
+
+        fused = fuse_rankings(vector, lexical, key=lambda item: item[0], method="weighted", score=lambda item: item[1])
+
+        assert [item[0] for item, __ in fused] == ["c", "a", "b", "d"]
+        assert fused[0][1] == pytest.approx(0.75)
+        with pytest.raises(ValueError):
+            fuse_rankings(vector, lexical, key=lambda item: item[0], method="weighted")
@@ -0,0 +1,260 @@
+"""Tests for the parallel JSONL import pipeline."""
+
+import json
+import logging
+import sqlite3
+
+import pytest
+
+from pyhub.rag.backends.pipeline import (
+    ImportProgress,
+    decode_chunk,
+    iter_decoded_chunks,
+    iter_import_rows,
+    iter_line_chunks,
+    run_import,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def _sqlite_vec_loadable() -> bool:
+    try:
+        import sqlite_vec
+
+        conn = sqlite3.connect(":memory:")
+        conn.enable_load_extension(True)
+        sqlite_vec.load(conn)
+        conn.close()
+        return True
+    except Exception:
+        return False
+
+
+requires_sqlite_vec = pytest.mark.skipif(not _sqlite_vec_loadable(), reason="sqlite-vec 확장을 로드할 수 없습니다.")
+
+
+def write_jsonl(path, count, dimension=4, extra_lines=()):
+    lines = [
+        json.dumps({"page_content": str(i), "metadata": {"i": i}, "embedding": [float(i)] * dimension})
+        for i in range(count)
+    ]
+    lines.extend(extra_lines)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+class TestImportPipeline:
+    """JSONL 임포트 파이프라인 테스트"""
+
+    def test_line_chunks_track_offsets(self, tmp_path):
+        path = tmp_path / "docs.jsonl"
+        path.write_bytes(b'{"a": 1}\n\n{"a": 2}\n{"a": 3}\n')
+
+        chunks = list(iter_line_chunks(path, 2))
+
+        assert [(c.start_line, c.end_line) for c in chunks] == [(1, 3), (4, 4)]
+        assert chunks[0].end_offset == chunks[1].start_offset == len(b'{"a": 1}\n\n{"a": 2}\n')
+        assert chunks[1].end_offset == path.stat().st_size
+
+        resumed = list(iter_line_chunks(path, 2, start_offset=chunks[1].start_offset, start_line=4))
+        assert resumed[0].lines == chunks[1].lines
+
+    def test_decode_packs_float32(self, tmp_path):
+        path = write_jsonl(tmp_path / "docs.jsonl", 3)
+
+        decoded = decode_chunk(next(iter_line_chunks(path, 10)))
+
+        assert len(decoded) == 3
+        assert decoded.vectors.dtype == np.float32
+        assert decoded.vectors.shape == (3, 4)
+        assert [row[:2] for row in decoded.rows()] == [("0", {"i": 0}), ("1", {"i": 1}), ("2", {"i": 2})]
+
+    def test_decode_invalid_lines(self, tmp_path):
+        path = write_jsonl(
+            tmp_path / "docs.jsonl",
+            2,
+            extra_lines=['{"metadata": {}}', "not json", '{"page_content": "x", "embedding": [1.0, 2.0]}'],
+        )
+        chunk = next(iter_line_chunks(path, 10))
+
+        with pytest.raises(ValueError, match="Error at line 3"):
+            decode_chunk(chunk)
+
+        decoded = decode_chunk(chunk, skip_invalid=True)
+        assert [row[0] for row in decoded.rows()] == ["0", "1"]
+        assert [reason.split(":")[0] for reason in decoded.skipped] == ["line 3", "line 4", "line 5"]
+
+    def test_parallel_decoding_keeps_file_order(self, tmp_path):
+        path = write_jsonl(tmp_path / "docs.jsonl", 95)
+
+        chunks = list(iter_decoded_chunks(path, chunk_size=10, workers=2))
+
+        assert [len(c) for c in chunks] == [10] * 9 + [5]
+        assert [row[0] for c in chunks for row in c.rows()] == [str(i) for i in range(95)]
+
+    def test_parallel_error_reports_line(self, tmp_path):
+        path = write_jsonl(tmp_path / "docs.jsonl", 30, extra_lines=['{"page_content": "x"}'])
+
+        with pytest.raises(ValueError, match="Error at line 31"):
+            list(iter_decoded_chunks(path, chunk_size=10, workers=2))
+
+    def test_run_import_reports_progress(self, tmp_path, caplog):
+        path = write_jsonl(tmp_path / "docs.jsonl", 25)
+        written, reported = [], []
+
+        with caplog.at_level(logging.INFO):
+            stats = run_import(
+                path,
+                lambda chunk: written.append(len(chunk)) or len(chunk),
+                chunk_size=10,
+                workers=1,
+                progress=lambda stats: reported.append(stats.rows),
+                name="docs",
+            )
+
+        assert written == [10, 10, 5]
+        assert reported == [10, 20, 25]
+        assert (stats.rows, stats.line, stats.percent) == (25, 25, 100.0)
+        assert stats.rows_per_second > 0
+        assert "rows/s" in caplog.text
+
+    def test_iter_import_rows(self, tmp_path):
+        path = write_jsonl(tmp_path / "docs.jsonl", 12)
+        stats = ImportProgress(path)
+
+        rows = list(iter_import_rows(path, stats, chunk_size=5, workers=2))
+
+        assert [row[0] for row in rows] == [str(i) for i in range(12)]
+        assert stats.rows == 12
+
+    def test_store_import_jsonl(self, tmp_path):
+        from pyhub.rag.backends.numpy_store import NumpyStore
+
+        path = write_jsonl(tmp_path / "docs.jsonl", 50)
+        reported = []
+
+        with NumpyStore({"data_dir": tmp_path / "data"}) as store:
+            store.create_collection("docs", dimension=4, distance_metric="l2")
+            total = store.import_jsonl("docs", path, batch_size=8, workers=2, progress=reported.append)
+
+            assert total == 50
+            assert store.count("docs") == 50
+            assert store.search("docs", [7.0] * 4, k=1)[0].document.metadata == {"i": 7}
+        assert reported[-1].rows == 50
+
+
+class TestResumableImport:
+    """체크포인트와 이어서 임포트하기 테스트"""
+
+    @pytest.fixture(params=[pytest.param("sqlite-vec", marks=requires_sqlite_vec), "numpy"])
+    def store(self, request, tmp_path):
+        if request.param == "sqlite-vec":
+            from pyhub.rag.backends.sqlite_vec import SqliteVecStore
+
+            store = SqliteVecStore({"db_path": tmp_path / "vectors.db"})
+        else:
+            from pyhub.rag.backends.numpy_store import NumpyStore
+
+            store = NumpyStore({"data_dir": tmp_path / "data"})
+
+        with store:
+            store.create_collection("docs", dimension=4, distance_metric="l2")
+            yield store
+
+    @staticmethod
+    def fail_on_call(monkeypatch, store, n):
+        insert_batch = store._insert_import_batch
+        calls = []
+
+        def failing(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == n:
+                raise RuntimeError("interrupted")
+            return insert_batch(*args, **kwargs)
+
+        monkeypatch.setattr(store, "_insert_import_batch", failing)
+
+    def test_resume_after_failure(self, store, tmp_path, monkeypatch):
+        path = write_jsonl(tmp_path / "docs.jsonl", 50)
+        self.fail_on_call(monkeypatch, store, 4)
+
+        with pytest.raises(RuntimeError):
+            store.import_jsonl("docs", path, batch_size=10, workers=1)
+        checkpoint = store.get_import_checkpoint("docs", path)
+        assert (checkpoint.line, checkpoint.rows, checkpoint.completed) == (30, 30, False)
+
+        monkeypatch.undo()
+        # 이어서 임포트할 때는 --clear를 무시합니다.
+        assert store.import_jsonl("docs", path, batch_size=10, clear_existing=True, resume=True) == 20
+
+        assert store.count("docs") == 50
+        assert sorted(r.document.page_content for r in store.search("docs", [0.0] * 4, k=50)) == sorted(
+            str(i) for i in range(50)
+        )
+        assert store.get_import_checkpoint("docs", path).completed
+        assert store.import_jsonl("docs", path, resume=True) == 0
+
+    def test_fresh_import_resets_checkpoint(self, store, tmp_path):
+        path = write_jsonl(tmp_path / "docs.jsonl", 5)
+        store.import_jsonl("docs", path)
+
+        assert store.import_jsonl("docs", path, clear_existing=True) == 5
+        assert store.count("docs") == 5
+
+    @requires_sqlite_vec
+    def test_batch_and_checkpoint_commit_together(self, tmp_path, monkeypatch):
+        from pyhub.rag.backends import sqlite_vec
+
+        path = write_jsonl(tmp_path / "docs.jsonl", 30)
+        save_checkpoint = sqlite_vec.save_checkpoint
+        calls = []
+
+        def failing(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError("interrupted")
+            return save_checkpoint(*args, **kwargs)
+
+        with sqlite_vec.SqliteVecStore({"db_path": tmp_path / "vectors.db"}) as store:
+            store.create_collection("docs", dimension=4)
+            monkeypatch.setattr(sqlite_vec, "save_checkpoint", failing)
+            with pytest.raises(RuntimeError):
+                store.import_jsonl("docs", path, batch_size=10, workers=1)
+
+            # 체크포인트를 기록하지 못한 배치는 삽입도 롤백됩니다.
+            assert store.count("docs") == 10
+            monkeypatch.undo()
+            assert store.import_jsonl("docs", path, batch_size=10, resume=True) == 20
+            assert store.count("docs") == 30
+
+    def test_changed_file_is_rejected(self, store, tmp_path, monkeypatch):
+        path = write_jsonl(tmp_path / "docs.jsonl", 30)
+        self.fail_on_call(monkeypatch, store, 3)
+        with pytest.raises(RuntimeError):
+            store.import_jsonl("docs", path, batch_size=10, workers=1)
+
+        write_jsonl(path, 5)
+        with pytest.raises(ValueError, match="beyond the end"):
+            store.import_jsonl("docs", path, resume=True)
+
+    @requires_sqlite_vec
+    def test_legacy_sqlite_vec_import(self, tmp_path):
+        import sqlite_vec
+
+        from pyhub.rag.db.sqlite_vec import import_jsonl
+
+        db_path = tmp_path / "db.sqlite3"
+        conn = sqlite3.connect(db_path)
+        conn.enable_load_extension(True)
+        sqlite_vec.load(conn)
+        conn.execute("CREATE VIRTUAL TABLE docs USING vec0(embedding float[4], +page_content text, +metadata text)")
+        conn.commit()
+
+        path = write_jsonl(tmp_path / "docs.jsonl", 25, extra_lines=['{"page_content": "x"}'])
+        stats = import_jsonl(db_path, None, path, clear=False, batch_size=10, workers=2)
+        assert (stats.rows, stats.skipped) == (25, 1)
+
+        assert import_jsonl(db_path, "docs", path, clear=True, resume=True).rows == 0
+        assert conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0] == 25
+        conn.close()
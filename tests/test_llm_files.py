@@ -1,10 +1,20 @@
+from functools import partial
 from io import BytesIO
 from pathlib import Path
 
+import httpx
+import pytest
 from django.core.files.base import ContentFile, File
 from PIL import Image as PILImage
 
-from pyhub.llm.utils.files import FileType, encode_files
+from pyhub.llm.settings import llm_settings
+from pyhub.llm.utils import files as files_module
+from pyhub.llm.utils.files import (
+    FileType,
+    download_files,
+    download_files_async,
+    encode_files,
+)
 
 
 def create_test_png_image(width=100, height=100, color="white") -> File:
@@ -100,6 +110,28 @@ class TestEncodeFiles:
         assert len(encoded_urls) == 1
         assert encoded_urls[0].startswith("data:image/png;base64,")
 
+    def test_path_read_only_when_encoded(self, tmp_path, monkeypatch):
+        """경로 파일은 허용된 타입일 때만 인코딩 시점에 열고 닫는지 테스트"""
+        img_path = tmp_path / "test_img.png"
+        PILImage.new("RGB", (100, 100), "white").save(img_path)
+        text_path = tmp_path / "notes.txt"
+        text_path.write_text("skip me")
+
+        opened = []
+        path_open = Path.open
+
+        def recording_open(self, *args, **kwargs):
+            f = path_open(self, *args, **kwargs)
+            opened.append((self.name, f))
+            return f
+
+        monkeypatch.setattr(Path, "open", recording_open)
+        encoded_urls = encode_files(files=[text_path, img_path], allowed_types=FileType.IMAGE)
+
+        assert len(encoded_urls) == 1
+        assert [name for name, __ in opened] == ["test_img.png"]
+        assert all(f.closed for __, f in opened)
+
     def test_image_resizing(self):
         """이미지 리사이징 테스트"""
         # 큰 이미지 생성
@@ -164,3 +196,62 @@ class TestEncodeFiles:
         # 두 이미지 모두 올바른 형식인지 확인
         assert encoded_orig[0].startswith("data:image/png;base64,")
         assert encoded_optimized[0].startswith("data:image/jpeg;base64,")
+
+
+def create_png_bytes(color="white") -> bytes:
+    image = PILImage.new("RGB", (10, 10), color)
+    image_io = BytesIO()
+    image.save(image_io, format="PNG")
+    return image_io.getvalue()
+
+
+class TestDownloadFiles:
+    @pytest.fixture
+    def png_server(self, monkeypatch):
+        """ETag 재검증을 지원하는 가짜 이미지 서버"""
+        requests = []
+        bodies = {"/red.png": create_png_bytes("red"), "/blue": create_png_bytes("blue")}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            body = bodies[request.url.path]
+            etag = f'"{len(body)}"'
+            if request.headers.get("If-None-Match") == etag:
+                return httpx.Response(304, headers={"ETag": etag})
+            return httpx.Response(200, content=body, headers={"ETag": etag, "Content-Type": "image/png"})
+
+        transport = httpx.MockTransport(handler)
+        monkeypatch.setattr(files_module, "get_download_client", lambda: httpx.Client(transport=transport))
+        monkeypatch.setattr(files_module.httpx, "AsyncClient", partial(httpx.AsyncClient, transport=transport))
+        return requests
+
+    def test_download_cache_revalidation(self, png_server, tmp_path):
+        """두 번째 다운로드는 ETag 재검증(304) 후 캐시된 파일을 사용"""
+        url = "https://example.com/red.png"
+
+        [first_path] = download_files([url], cache_dir=tmp_path)
+        [second_path] = download_files([url], cache_dir=tmp_path)
+
+        assert first_path == second_path
+        assert first_path.read_bytes() == create_png_bytes("red")
+        assert "If-None-Match" not in png_server[0].headers
+        assert png_server[1].headers["If-None-Match"] == f'"{len(create_png_bytes("red"))}"'
+
+    async def test_download_files_async_keeps_order(self, png_server, tmp_path):
+        """비동기 동시 다운로드 결과는 요청 순서를 유지하고, 확장자는 Content-Type에서 추론"""
+        urls = ["https://example.com/blue", "https://example.com/red.png"]
+
+        paths = await download_files_async(urls, cache_dir=tmp_path)
+
+        assert paths[0].read_bytes() == create_png_bytes("blue")
+        assert paths[0].suffix == ".png"
+        assert paths[1].read_bytes() == create_png_bytes("red")
+
+    def test_encode_url_files(self, png_server, tmp_path, monkeypatch):
+        """URL 파일 인코딩 테스트"""
+        monkeypatch.setattr(llm_settings, "download_cache_dir", str(tmp_path))
+
+        encoded_urls = encode_files(files=["https://example.com/red.png"], allowed_types=FileType.IMAGE)
+
+        assert len(encoded_urls) == 1
+        assert encoded_urls[0].startswith("data:image/png;base64,")
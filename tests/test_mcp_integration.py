@@ -190,3 +190,18 @@ class TestMCPClient:
 
         assert result == "Result: 42"
         mock_session.call_tool.assert_called_once_with("calculator", {"expression": "21 * 2"})
+
+    @pytest.mark.asyncio
+    async def test_mcp_client_tools_changed_notification(self):
+        """tools/list_changed 알림 콜백 테스트"""
+        from mcp import types
+
+        on_tools_changed = AsyncMock()
+        client = MCPClient(None, on_tools_changed=on_tools_changed)
+
+        notification = types.ServerNotification(
+            types.ToolListChangedNotification(method="notifications/tools/list_changed")
+        )
+        await client._handle_message(notification)
+
+        on_tools_changed.assert_awaited_once()
@@ -0,0 +1,244 @@
+"""Tests for MCP session pool."""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+from pyhub.llm.agents.mcp import MCPSessionPool, PooledMCPClient, load_mcp_tools
+
+
+class FakeMCPClient:
+    """connect/list_tools/execute_tool 호출을 기록하는 가짜 MCPClient"""
+
+    connects = 0
+    closes = 0
+    connect_delay = 0.0
+    ping_delay = 0.0
+    list_calls = 0
+    active = 0
+    max_active = 0
+    healthy = True
+
+    def __init__(self, config, on_tools_changed=None):
+        self.config = config
+        self.on_tools_changed = on_tools_changed
+        self._session = None
+
+    @classmethod
+    def reset(cls):
+        cls.connects = cls.closes = cls.list_calls = cls.active = cls.max_active = 0
+        cls.connect_delay = cls.ping_delay = 0.0
+        cls.healthy = True
+
+    @asynccontextmanager
+    async def connect(self):
+        FakeMCPClient.connects += 1
+        await asyncio.sleep(FakeMCPClient.connect_delay)
+        self._session = object()
+        try:
+            yield self
+        finally:
+            self._session = None
+            FakeMCPClient.closes += 1
+
+    async def ping(self):
+        await asyncio.sleep(FakeMCPClient.ping_delay)
+        return FakeMCPClient.healthy
+
+    async def list_tools(self):
+        FakeMCPClient.list_calls += 1
+        return [{"name": "add", "description": "Add numbers", "parameters": {}}]
+
+    async def execute_tool(self, tool_name, arguments):
+        FakeMCPClient.active += 1
+        FakeMCPClient.max_active = max(FakeMCPClient.max_active, FakeMCPClient.active)
+        await asyncio.sleep(0.01)
+        FakeMCPClient.active -= 1
+        return f"{tool_name}:{arguments}"
+
+
+@pytest.fixture
+def fake_client():
+    FakeMCPClient.reset()
+    with patch("pyhub.llm.agents.mcp.pool.MCPClient", FakeMCPClient):
+        yield FakeMCPClient
+
+
+SERVER = {"command": "python", "args": ["math_server.py"]}
+
+
+class TestMCPSessionPool:
+    """MCPSessionPool 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_session_reused(self, fake_client):
+        pool = MCPSessionPool(cache_alias=None)
+
+        for _ in range(3):
+            assert await pool.execute_tool(SERVER, "add", {"a": 1}) == "add:{'a': 1}"
+
+        assert fake_client.connects == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_tools_cached_with_ttl(self, fake_client):
+        pool = MCPSessionPool(cache_alias=None, tools_ttl=60)
+
+        await pool.list_tools(SERVER)
+        await pool.list_tools(SERVER)
+        assert fake_client.list_calls == 1
+
+        await pool.list_tools(SERVER, refresh=True)
+        assert fake_client.list_calls == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_tools_cached_across_pools(self, fake_client):
+        server = {"command": "python", "args": ["cross_pool_server.py"]}
+
+        pool = MCPSessionPool(cache_alias="default")
+        await pool.list_tools(server)
+        await pool.close()
+
+        # 새 풀(새 프로세스)에서도 pyhub 캐시의 도구 목록을 사용하여 연결하지 않음
+        other_pool = MCPSessionPool(cache_alias="default")
+        tools = await other_pool.list_tools(server)
+
+        assert tools[0]["name"] == "add"
+        assert fake_client.connects == 1
+        await other_pool.invalidate_tools(server)
+
+    @pytest.mark.asyncio
+    async def test_tools_list_changed_invalidates_cache(self, fake_client):
+        pool = MCPSessionPool(cache_alias=None)
+
+        async with pool.session(SERVER) as client:
+            await pool.list_tools(SERVER)
+            # 서버가 tools/list_changed 알림을 보낸 상황
+            await client.on_tools_changed()
+
+        await pool.list_tools(SERVER)
+        assert fake_client.list_calls == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_max_sessions_per_server(self, fake_client):
+        pool = MCPSessionPool(cache_alias=None, max_sessions_per_server=1)
+
+        await asyncio.gather(*(pool.execute_tool(SERVER, "add", {"i": i}) for i in range(5)))
+
+        assert fake_client.connects == 1
+        assert fake_client.max_active == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_session_reconnects(self, fake_client):
+        pool = MCPSessionPool(cache_alias=None, health_check_interval=0)
+
+        await pool.execute_tool(SERVER, "add", {})
+        fake_client.healthy = False
+        await pool.execute_tool(SERVER, "add", {})
+
+        assert fake_client.connects == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_ping_releases_slot(self, fake_client):
+        pool = MCPSessionPool(cache_alias=None, max_sessions_per_server=1, health_check_interval=0)
+        await pool.execute_tool(SERVER, "add", {})
+        fake_client.ping_delay = 1.0
+
+        task = asyncio.create_task(pool.execute_tool(SERVER, "add", {}))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # ping 중에 취소된 세션은 닫히고, 자리가 반환되어 새 세션을 열 수 있습니다.
+        fake_client.ping_delay = 0.0
+        await asyncio.wait_for(pool.execute_tool(SERVER, "add", {}), timeout=1)
+        assert fake_client.connects == 2
+        assert fake_client.closes == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_connect_closes_session(self, fake_client):
+        pool = MCPSessionPool(cache_alias=None, max_sessions_per_server=1)
+        fake_client.connect_delay = 0.2
+
+        task = asyncio.create_task(pool.execute_tool(SERVER, "add", {}))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # 연결 중에 취소된 세션도 닫히고 자리가 반환됩니다.
+        assert fake_client.closes == 1
+        fake_client.connect_delay = 0.0
+        await asyncio.wait_for(pool.execute_tool(SERVER, "add", {}), timeout=1)
+        assert fake_client.connects == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_connect_does_not_block_idle_session(self, fake_client):
+        pool = MCPSessionPool(cache_alias=None, max_sessions_per_server=2)
+        await pool.execute_tool(SERVER, "add", {})
+        fake_client.connect_delay = 0.5
+
+        async def hold():
+            async with pool.session(SERVER):
+                await asyncio.sleep(0.05)
+
+        async def borrow_later():
+            await asyncio.sleep(0.1)
+            started = loop.time()
+            await pool.execute_tool(SERVER, "add", {})
+            return loop.time() - started
+
+        loop = asyncio.get_running_loop()
+        # 첫 세션을 빌린 동안 두 번째 세션을 천천히 연결하고, 반환된 첫 세션은 바로 다시 빌립니다.
+        __, __, elapsed = await asyncio.gather(hold(), pool.execute_tool(SERVER, "add", {}), borrow_later())
+
+        assert elapsed < 0.3
+        assert fake_client.connects == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_change_closes_sessions(self, fake_client):
+        pool = MCPSessionPool(cache_alias=None)
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(pool.execute_tool(SERVER, "add", {}), other_loop).result(timeout=5)
+
+            # 다른 루프에서 사용하면 이전 루프의 세션은 그 루프에서 닫습니다.
+            await pool.execute_tool(SERVER, "add", {})
+            for __ in range(100):
+                if fake_client.closes:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert fake_client.connects == 2
+            assert fake_client.closes == 1
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(timeout=5)
+            other_loop.close()
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_load_mcp_tools_uses_pool(self, fake_client):
+        pool = MCPSessionPool(cache_alias=None)
+
+        tools = await load_mcp_tools(SERVER, pool=pool)
+
+        # 로드 후에도 풀의 세션으로 도구 실행 가능
+        assert len(tools) == 1
+        assert await tools[0].func(a=1) == "add:{'a': 1}"
+        assert fake_client.connects == 1
+        assert isinstance(pool.client(SERVER), PooledMCPClient)
+        await pool.close()
@@ -0,0 +1,170 @@
+"""Tests for NumpyStore backend."""
+
+import pytest
+
+from pyhub.rag.backends import get_backend_class, list_backends
+from pyhub.rag.backends.base import Document
+from pyhub.rag.factory import get_vector_store
+
+np = pytest.importorskip("numpy")
+
+from pyhub.rag.backends.numpy_store import NumpyStore  # noqa: E402
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(0).normal(size=(300, 8)).astype(np.float32)
+
+
+@pytest.fixture
+def store(tmp_path, vectors):
+    with NumpyStore({"data_dir": tmp_path, "search_chunk_rows": 64}) as store:
+        store.create_collection("docs", dimension=8)
+        store.insert(
+            "docs",
+            [
+                Document(page_content=str(i), metadata={"group": i % 3}, embedding=vector.tolist())
+                for i, vector in enumerate(vectors)
+            ],
+            batch_size=100,
+        )
+        yield store
+
+
+def brute_force(vectors, query, metric):
+    if metric == "cosine":
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        return 1 - normalized @ (query / np.linalg.norm(query))
+    if metric == "l2":
+        return np.linalg.norm(vectors - query, axis=1)
+    return -(vectors @ query)
+
+
+class TestNumpyStore:
+    """NumPy 전수 검색 테스트"""
+
+    def test_registered(self):
+        assert "numpy" in list_backends()
+        assert get_backend_class("numpy") is NumpyStore
+
+    @pytest.mark.parametrize("metric", ["cosine", "l2", "inner_product"])
+    def test_search_same_as_brute_force(self, tmp_path, vectors, metric):
+        with NumpyStore({"data_dir": tmp_path, "search_chunk_rows": 50}) as store:
+            store.create_collection("docs", dimension=8, distance_metric=metric)
+            store.insert(
+                "docs", [Document(page_content=str(i), metadata={}, embedding=v) for i, v in enumerate(vectors)]
+            )
+
+            query = vectors[0] + 0.1
+            results = store.search("docs", query.tolist(), k=5)
+
+        distances = brute_force(vectors, query, metric)
+        expected = np.argsort(distances)[:5]
+        assert [int(r.document.page_content) for r in results] == expected.tolist()
+        assert [r.score for r in results] == pytest.approx((1 - distances[expected]).tolist(), abs=1e-5)
+
+    def test_filter_and_threshold(self, store, vectors):
+        results = store.search("docs", vectors[4].tolist(), k=3, filter={"group": 1})
+
+        assert results[0].document.page_content == "4"
+        assert all(r.document.metadata["group"] == 1 for r in results)
+        assert len(store.search("docs", vectors[4].tolist(), k=3, threshold=0.999)) == 1
+
+    def test_search_many_same_as_search(self, store, vectors):
+        queries = vectors[:4].tolist()
+        expected = [store.search("docs", query, k=3, filter={"group": 2}) for query in queries]
+        results = store.search_many("docs", queries, k=3, filter={"group": 2})
+
+        for query_results, query_expected in zip(results, expected):
+            assert [r.document for r in query_results] == [r.document for r in query_expected]
+            assert [r.score for r in query_results] == pytest.approx([r.score for r in query_expected], abs=1e-5)
+
+    def test_delete_and_compact(self, store, vectors):
+        generation = store.get_collection_info("docs")["generation"]
+
+        assert store.delete("docs", {"group": 0}) == 100
+        assert store.count("docs") == 200
+        assert store.count("docs", {"group": 0}) == 0
+        assert store.search("docs", vectors[0].tolist(), k=1)[0].document.page_content != "0"
+        # 삭제 비율이 compaction_threshold(0.2)를 넘으면 남은 행으로 다시 씁니다.
+        assert store.get_collection_info("docs")["generation"] == generation + 1
+        assert store.get_collection_info("docs")["deleted"] == 0
+        assert store.search("docs", vectors[1].tolist(), k=1)[0].document.page_content == "1"
+
+        assert store.delete("docs", {}) == 200
+        assert store.count("docs") == 0
+        assert store.search("docs", vectors[1].tolist(), k=1) == []
+
+    def test_other_instance_sees_appends(self, store, tmp_path, vectors):
+        assert store.count("docs", {"group": 1}) == 100
+
+        with NumpyStore({"data_dir": tmp_path}) as other:
+            other.insert("docs", [Document(page_content="new", metadata={"group": 1}, embedding=[1.0] * 8)])
+
+        assert store.count("docs", {"group": 1}) == 101
+        assert store.search("docs", [1.0] * 8, k=1)[0].document.page_content == "new"
+
+    def test_documents_handle_reused_within_generation(self, store, vectors):
+        documents = store._get_collection("docs").documents
+
+        for i in range(3):
+            store.insert("docs", [Document(page_content=f"new-{i}", metadata={"group": 1}, embedding=[1.0] * 8)])
+            assert store._get_collection("docs").documents is documents
+        assert store.search("docs", [1.0] * 8, k=1)[0].document.page_content.startswith("new-")
+
+        # 압축으로 세대가 바뀌면 이전 세대의 핸들을 닫습니다.
+        store.delete("docs", {"group": 0})
+        assert store.search("docs", vectors[1].tolist(), k=1)[0].document.page_content == "1"
+        assert documents.closed
+
+    def test_npy_file(self, store, tmp_path):
+        vectors = np.load(tmp_path / "docs" / "g0" / "vectors.npy", mmap_mode="r")
+
+        assert vectors.shape == (300, 8)
+        assert np.linalg.norm(vectors, axis=1) == pytest.approx(np.ones(300), abs=1e-5)
+
+    def test_halfvec(self, tmp_path, vectors):
+        with NumpyStore({"data_dir": tmp_path}) as store:
+            store.create_collection("docs", dimension=8, quantization="halfvec")
+            store.insert(
+                "docs", [Document(page_content=str(i), metadata={}, embedding=v) for i, v in enumerate(vectors)]
+            )
+
+            assert store.get_collection_info("docs")["dtype"] == "float16"
+            assert store.search("docs", vectors[7].tolist(), k=1)[0].document.page_content == "7"
+
+    def test_invalid_collection(self, store):
+        with pytest.raises(ValueError, match="Collection not found"):
+            store.search("missing", [0.0] * 8)
+        with pytest.raises(ValueError, match="Invalid collection name"):
+            store.create_collection("../docs", dimension=8)
+        with pytest.raises(ValueError, match="dimension mismatch"):
+            store.insert("docs", [Document(page_content="x", metadata={}, embedding=[1.0, 2.0])])
+
+    def test_selected_from_toml_config(self, tmp_path):
+        toml_path = tmp_path / "config.toml"
+        toml_path.write_text(
+            f"""
+[rag]
+default_backend = "numpy"
+
+[rag.backends.numpy]
+data_dir = "{tmp_path.as_posix()}/vectors"
+search_chunk_rows = 32
+
+[rag.backends.hnsw]
+enabled = false
+""",
+            encoding="utf-8",
+        )
+
+        with get_vector_store(toml_path=toml_path) as store:
+            assert isinstance(store, NumpyStore)
+            assert store.config["data_dir"] == tmp_path / "vectors"
+            assert store.config["search_chunk_rows"] == 32
+
+        with get_vector_store(toml_path=toml_path, search_chunk_rows=8) as store:
+            assert store.config["search_chunk_rows"] == 8
+
+        with pytest.raises(ValueError, match="disabled"):
+            get_vector_store("hnsw", toml_path=toml_path)
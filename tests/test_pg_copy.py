@@ -0,0 +1,120 @@
+"""Tests for PostgreSQL COPY BINARY bulk loading."""
+
+import json
+import struct
+
+import pytest
+
+from pyhub.rag.backends.pg_copy import (
+    PGCOPY_HEADER,
+    PGCOPY_TRAILER,
+    CopyBinaryStream,
+    bulk_load,
+    decode_vectors,
+    encode_row,
+    encode_vector,
+    iter_jsonl_rows,
+)
+
+
+class FakeCopyCursor:
+    """COPY로 받은 데이터와 실행한 SQL을 기록하는 커서"""
+
+    def __init__(self, indexes=()):
+        self.indexes = list(indexes)
+        self.executed = []
+        self.copied = b""
+
+    def execute(self, sql, params=None):
+        self.executed.append(" ".join(sql.split()))
+
+    def fetchall(self):
+        return self.indexes
+
+    def copy_expert(self, sql, file, size=8192):
+        self.executed.append(sql)
+        while chunk := file.read(size):
+            self.copied += chunk
+
+
+def decode_rows(data: bytes):
+    """COPY BINARY 데이터를 (text, jsonb, vector) 행 목록으로 복원"""
+    assert data.startswith(PGCOPY_HEADER) and data.endswith(PGCOPY_TRAILER)
+    data = data[len(PGCOPY_HEADER) : -len(PGCOPY_TRAILER)]
+
+    rows, offset = [], 0
+    while offset < len(data):
+        (field_count,) = struct.unpack_from("!h", data, offset)
+        offset += 2
+        fields = []
+        for __ in range(field_count):
+            (length,) = struct.unpack_from("!i", data, offset)
+            fields.append(data[offset + 4 : offset + 4 + length])
+            offset += 4 + length
+
+        dim, __ = struct.unpack_from("!hh", fields[2])
+        rows.append(
+            (
+                fields[0].decode("utf-8"),
+                json.loads(fields[1][1:]),
+                list(struct.unpack_from(f"!{dim}f", fields[2], 4)),
+            )
+        )
+    return rows
+
+
+class TestCopyBinary:
+    """COPY BINARY 인코딩 테스트"""
+
+    def test_encode_vector(self):
+        assert encode_vector([1.0, -2.5]) == struct.pack("!hhff", 2, 0, 1.0, -2.5)
+
+    def test_decode_vectors(self):
+        np = pytest.importorskip("numpy")
+
+        vectors = decode_vectors([encode_vector([1.0, -2.5]), memoryview(encode_vector([0.5, 3.0]))])
+
+        assert vectors.dtype == np.float32
+        assert vectors.tolist() == [[1.0, -2.5], [0.5, 3.0]]
+
+    def test_encode_row_jsonb_version(self):
+        row = encode_row("안녕", {"a": 1}, [0.5])
+        assert row[:2] == struct.pack("!h", 3)
+        assert b'\x01{"a": 1}' in row
+
+    def test_stream_in_small_chunks(self):
+        rows = [(f"doc {i}", {"i": i}, [float(i), 0.5]) for i in range(100)]
+        progress = []
+        cursor = FakeCopyCursor()
+
+        stream = CopyBinaryStream(iter(rows), progress=progress.append, progress_every=30)
+        cursor.copy_expert("COPY", stream, size=7)
+
+        assert decode_rows(cursor.copied) == [(text, metadata, vector) for text, metadata, vector in rows]
+        assert stream.count == 100
+        assert progress == [30, 60, 90]
+
+    def test_iter_jsonl_rows(self, tmp_path):
+        path = tmp_path / "data.jsonl"
+        path.write_text(
+            '{"page_content": "a", "metadata": {"x": 1}, "embedding": [1.0]}\n'
+            "\n"
+            '{"page_content": "b", "embedding": [2.0]}\n'
+            '{"metadata": {}}\n',
+            encoding="utf-8",
+        )
+
+        assert list(iter_jsonl_rows(path, skip_invalid=True)) == [("a", {"x": 1}, [1.0]), ("b", {}, [2.0])]
+        with pytest.raises(ValueError, match="line 4"):
+            list(iter_jsonl_rows(path))
+
+    def test_bulk_load_rebuilds_index(self):
+        index_def = "CREATE INDEX docs_embedding_idx ON public.docs USING hnsw (embedding vector_cosine_ops)"
+        cursor = FakeCopyCursor(indexes=[("docs_embedding_idx", index_def)])
+
+        total = bulk_load(cursor, "docs", [("a", {}, [1.0])], rebuild_index=True, maintenance_work_mem="1GB")
+
+        assert total == 1
+        assert cursor.executed[1] == "DROP INDEX docs_embedding_idx"
+        assert cursor.executed[2].startswith("COPY docs (page_content, metadata, embedding) FROM STDIN")
+        assert cursor.executed[-1] == index_def
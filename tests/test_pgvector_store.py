@@ -0,0 +1,536 @@
+"""Tests for PgVectorStore search planning."""
+
+import threading
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+from pyhub.rag.backends.base import Document
+from pyhub.rag.backends.pg_copy import PGCOPY_TRAILER, copy_sql
+from pyhub.rag.backends.pg_pool import PgConnectionPool
+from pyhub.rag.backends.pg_search import PgSearchParams
+from pyhub.rag.backends.pgvector import PgVectorStore, _parse_quantization
+from pyhub.rag.backends.planner import CollectionStats
+
+
+@pytest.fixture
+def store():
+    store = PgVectorStore({"database_url": "postgresql://localhost/test", "planner_overfetch_factor": 1.0})
+    # 질의에 가까운 순서. 앞쪽 20개는 rare, 나머지는 common
+    rows = [(str(i), {"category": "rare" if i < 20 else "common"}, i / 100) for i in range(100)]
+    store._stats["docs"] = CollectionStats(total=100, sample=[{"category": "common"}] * 100)
+    store._metadata_columns["docs"] = {}
+    store._quantization["docs"] = None
+    return store, rows
+
+
+class TestPgVectorOverfetch:
+    """over-fetch 후 재조회 테스트"""
+
+    def test_requery_until_k(self, store):
+        store, rows = store
+        fetch_sizes = []
+
+        def ann_search(cursor, collection_name, distance_func, query_embedding, k, params=None):
+            fetch_sizes.append(k)
+            return rows[:k]
+
+        with patch.object(store, "_ann_search", side_effect=ann_search):
+            matched = store._overfetch_search(None, "docs", "<=>", [1.0], 5, {"category": "common"}, fetch_k=5)
+
+        assert [row[0] for row in matched] == ["20", "21", "22", "23", "24"]
+        assert fetch_sizes[0] == 5
+        assert len(fetch_sizes) > 1
+
+    def test_fallback_to_exact(self, store):
+        store, rows = store
+        store.planner.max_fetch_k = 10
+
+        with (
+            patch.object(store, "_ann_search", side_effect=lambda *args, **kwargs: rows[: args[-1]]),
+            patch.object(store, "_exact_search", return_value=rows[20:25]) as exact_search,
+        ):
+            matched = store._overfetch_search(None, "docs", "<=>", [1.0], 5, {"category": "common"}, fetch_k=5)
+
+        exact_search.assert_called_once()
+        assert len(matched) == 5
+
+    def test_plan_uses_stats(self, store):
+        store, __ = store
+        assert store.plan_search("docs", 5, {"category": "common"}).strategy == "ann"
+        assert store.plan_search("docs", 5, {"category": "rare"}).strategy == "exact"
+
+
+class FakeCursor:
+    """실행한 SQL을 기록하는 커서"""
+
+    def __init__(self, rows=(), connection=None):
+        self.rows = list(rows)
+        self.executed = []
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, sql, params=None):
+        self.executed.append((" ".join(sql.split()), params))
+
+    def fetchall(self):
+        return self.rows
+
+
+class TestPgVectorPromotedMetadata:
+    """메타데이터 키 승격 테스트"""
+
+    def test_filter_conditions(self, store):
+        store, __ = store
+        store._metadata_columns["docs"] = {"category": "text", "tags": "jsonb"}
+
+        conditions, params = store._filter_conditions(None, "docs", {"category": "rare", "tags": ["a"], "year": 2021})
+
+        assert conditions == ["category = %s", "tags @> %s::jsonb AND tags = %s::jsonb", "metadata->%s = %s"]
+        assert params == ["rare", '["a"]', '["a"]', "year", "2021"]
+
+    def test_filter_conditions_with_fetched_columns(self, store):
+        store, __ = store
+        # 컬럼 승격 등으로 캐시가 비워져도 미리 조회한 컬럼으로 조건을 만듭니다.
+        store._metadata_columns.pop("docs", None)
+
+        conditions, params = store._filter_conditions(None, "docs", {"category": "rare"}, {"category": "text"})
+
+        assert conditions == ["category = %s"]
+        assert params == ["rare"]
+
+    def test_add_metadata_columns(self, store):
+        store, __ = store
+        cursor = FakeCursor()
+
+        store._add_metadata_columns(cursor, "docs", {"year": "bigint", "tags": "jsonb"})
+
+        sqls = [sql for sql, __ in cursor.executed]
+        assert "ADD COLUMN IF NOT EXISTS year bigint GENERATED ALWAYS AS" in sqls[0]
+        assert sqls[0].endswith("STORED")
+        assert sqls[1] == "CREATE INDEX IF NOT EXISTS docs_year_idx ON docs USING btree (year)"
+        assert sqls[3] == "CREATE INDEX IF NOT EXISTS docs_tags_idx ON docs USING gin (tags)"
+
+    def test_indexed_filter_prefers_exact(self, store):
+        store, __ = store
+        assert store.plan_search("docs", 5, {"category": "common"}).strategy == "ann"
+
+        store._metadata_columns["docs"] = {"category": "text"}
+        assert store.plan_search("docs", 5, {"category": "common"}).strategy == "exact"
+
+
+class FakeConnection:
+    """psycopg2 연결 흉내"""
+
+    def __init__(self):
+        self.closed = 0
+        self.broken = False
+        self.ping_delay = 0.0
+        self.commits = 0
+        self.rollbacks = 0
+        self.cursors = []
+
+    def cursor(self):
+        cursor = FakeCursor(connection=self)
+        if self.broken:
+            cursor.execute = lambda *args: (_ for _ in ()).throw(ConnectionError("server closed the connection"))
+        elif self.ping_delay:
+            cursor.execute = lambda *args: time.sleep(self.ping_delay)
+        self.cursors.append(cursor)
+        return cursor
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = 1
+
+
+class TestPgConnectionPool:
+    """연결 풀 테스트"""
+
+    @pytest.fixture
+    def connections(self):
+        return []
+
+    @pytest.fixture
+    def pool(self, connections):
+        def connect():
+            connections.append(FakeConnection())
+            return connections[-1]
+
+        return PgConnectionPool(connect, min_size=1, max_size=2, timeout=0.1, ping_interval=0)
+
+    def test_reuse(self, pool, connections):
+        with pool.connection() as conn:
+            pass
+        with pool.connection() as again:
+            pass
+
+        assert conn is again
+        assert len(connections) == 1
+        assert conn.commits == 2
+
+    def test_rollback_on_error(self, pool):
+        pool.pre_ping = False
+        with pytest.raises(ValueError):
+            with pool.connection() as conn:
+                raise ValueError("boom")
+
+        assert conn.rollbacks == 1
+        assert pool.stats["idle"] == 1
+
+    def test_max_size_and_timeout(self, pool, connections):
+        first = pool.getconn()
+        second = pool.getconn()
+        with pytest.raises(TimeoutError):
+            pool.getconn()
+
+        # 반환되면 기다리던 스레드가 가져감
+        acquired = []
+        thread = threading.Thread(target=lambda: acquired.append(pool.getconn()))
+        pool.timeout = 5
+        thread.start()
+        pool.putconn(first)
+        thread.join()
+
+        assert acquired[0] is first
+        assert len(connections) == 2
+        pool.putconn(second)
+
+    def test_pre_ping_discards_broken_connection(self, pool, connections):
+        with pool.connection():
+            pass
+        connections[0].broken = True
+
+        with pool.connection() as conn:
+            pass
+
+        assert conn is connections[1]
+        assert connections[0].closed
+        assert pool.stats["size"] == 1
+
+    def test_ping_does_not_block_other_threads(self, pool, connections):
+        with pool.connection():
+            pass
+        connections[0].ping_delay = 0.5
+        pool.timeout = 5
+
+        thread = threading.Thread(target=lambda: pool.putconn(pool.getconn()))
+        thread.start()
+        time.sleep(0.05)
+
+        # 첫 연결을 ping하는 동안에도 잠금을 기다리지 않고 새 연결을 엽니다.
+        started = time.monotonic()
+        other = pool.getconn()
+        assert time.monotonic() - started < 0.3
+        assert other.conn is connections[1]
+
+        pool.putconn(other)
+        thread.join()
+        assert pool.stats == {"size": 2, "idle": 2, "max_size": 2}
+
+    def test_prepare_once_per_connection(self, pool):
+        with pool.connection() as conn:
+            cursor = conn.cursor()
+            name = pool.prepare(cursor, "search", "SELECT $1", "integer")
+            assert pool.prepare(cursor, "search", "SELECT $1", "integer") == name
+
+        assert [sql for sql, __ in cursor.executed] == [f"PREPARE {name} (integer) AS SELECT $1"]
+        # 풀에서 빌리지 않은 연결은 준비하지 않음
+        assert pool.prepare(FakeCursor(), "search", "SELECT $1", "integer") is None
+
+    def test_store_uses_prepared_statement(self, store):
+        store, __ = store
+        connection = FakeConnection()
+        store.pool._connect = lambda: connection
+
+        with store._cursor() as cursor:
+            store._ann_search(cursor, "docs", "<=>", [1.0, 0.0], 5)
+
+        prepare_sql, execute_sql = [sql for sql, __ in connection.cursors[-1].executed]
+        name = prepare_sql.split()[1]
+        assert prepare_sql.startswith(f"PREPARE {name} (vector, integer) AS SELECT")
+        assert execute_sql == f"EXECUTE {name} (%s::vector, %s)"
+
+
+class TestPgVectorSearchParams:
+    """인덱스 검색 파라미터 테스트"""
+
+    def test_settings(self):
+        params = PgSearchParams(ef_search=100, probes=10, iterative_scan=True, max_scan_tuples=20000)
+        assert params.settings(k=5) == [
+            ("hnsw.ef_search", "100"),
+            ("ivfflat.probes", "10"),
+            ("hnsw.iterative_scan", "relaxed_order"),
+            ("ivfflat.iterative_scan", "relaxed_order"),
+            ("hnsw.max_scan_tuples", "20000"),
+        ]
+        # ef_search는 k 이상으로 맞춤
+        assert PgSearchParams(ef_search=50).settings(k=200) == [("hnsw.ef_search", "200")]
+        assert PgSearchParams().settings(k=10) == []
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            PgSearchParams(iterative_scan="always")
+        with pytest.raises(ValueError):
+            PgSearchParams(ef_search=5000)
+
+    def test_precedence(self, store):
+        store, __ = store
+        store.search_params = PgSearchParams(ef_search=64, probes=5)
+        store.set_search_params("docs", probes=20, iterative_scan="strict_order")
+
+        params = store.get_search_params("docs", PgSearchParams(ef_search=200))
+        assert (params.ef_search, params.probes, params.iterative_scan) == (200, 20, "strict_order")
+        assert store.get_search_params("other").probes == 5
+
+    def test_set_local_in_search_transaction(self, store):
+        store, rows = store
+        connection = FakeConnection()
+        store.pool._connect = lambda: connection
+        store.prepared_statements = False
+
+        store.search("docs", [1.0, 0.0], k=5, ef_search=80, probes=4)
+
+        executed = [sql for sql, __ in connection.cursors[-1].executed]
+        assert executed[:2] == ["SET LOCAL hnsw.ef_search = 80", "SET LOCAL ivfflat.probes = 4"]
+        assert executed[2].startswith("SELECT page_content")
+        assert connection.commits == 1
+
+    def test_iterative_scan_pushes_filter_into_index_scan(self, store):
+        store, rows = store
+        cursor = FakeCursor(rows=[("b", {"category": "common"}, 0.2), ("a", {"category": "common"}, 0.1)])
+
+        matched = store._filtered_ann_search(
+            cursor, "docs", "<=>", [1.0], 2, {"category": "common"}, PgSearchParams(iterative_scan="relaxed_order")
+        )
+
+        assert [row[0] for row in matched] == ["a", "b"]
+        sql = cursor.executed[-1][0]
+        assert "WHERE metadata->%s = %s ORDER BY embedding <=> %s::vector LIMIT %s" in sql
+
+
+class TestPgVectorQuantization:
+    """양자화 인덱스 검색 테스트"""
+
+    def test_parse_quantization(self):
+        assert _parse_quantization(
+            "CREATE INDEX docs_embedding_idx ON public.docs USING hnsw (((embedding)::halfvec(3)) halfvec_cosine_ops)"
+        ) == ("halfvec", 3)
+        assert _parse_quantization(
+            "CREATE INDEX docs_embedding_idx ON public.docs "
+            "USING hnsw (((binary_quantize(embedding))::bit(8)) bit_hamming_ops)"
+        ) == ("binary", 8)
+        assert _parse_quantization("CREATE INDEX i ON public.docs USING hnsw (embedding vector_cosine_ops)") is None
+
+    def test_create_quantized_index(self, store):
+        store, __ = store
+        cursor = FakeCursor()
+
+        store._create_index(cursor, "docs", 8, "cosine", "hnsw", "halfvec")
+        store._create_index(cursor, "docs", 8, "cosine", "ivfflat", "binary", lists=10)
+
+        sqls = [sql for sql, __ in cursor.executed]
+        assert sqls[0].endswith("USING hnsw (((embedding)::halfvec(8)) halfvec_cosine_ops)")
+        assert sqls[1].endswith(
+            "USING ivfflat ((binary_quantize(embedding)::bit(8)) bit_hamming_ops) WITH (lists = 10)"
+        )
+
+    def test_rerank_candidates(self, store):
+        store, __ = store
+        store._quantization["docs"] = ("binary", 8)
+        connection = FakeConnection()
+        store.pool._connect = lambda: connection
+
+        store.search("docs", [1.0] * 8, k=5, rerank_factor=10)
+
+        set_sql, prepare_sql, execute = connection.cursors[-1].executed
+        name = prepare_sql[0].split()[1]
+        assert set_sql[0] == "SET LOCAL hnsw.ef_search = 50"
+        assert "ORDER BY binary_quantize(embedding)::bit(8) <~> binary_quantize($1)::bit(8) LIMIT $2" in prepare_sql[0]
+        assert prepare_sql[0].endswith(") AS candidates ORDER BY distance LIMIT $3")
+        assert execute == (f"EXECUTE {name} (%s::vector, %s, %s)", [[1.0] * 8, 50, 5])
+
+    def test_filtered_rerank(self, store):
+        store, __ = store
+        store._quantization["docs"] = ("halfvec", 2)
+        cursor = FakeCursor(rows=[("a", {"category": "common"}, 0.1)])
+
+        store._filtered_ann_search(
+            cursor, "docs", "<=>", [1.0, 0.0], 2, {"category": "common"}, PgSearchParams(iterative_scan=True)
+        )
+
+        sql, params = cursor.executed[-1]
+        assert "WHERE metadata->%s = %s ORDER BY (embedding)::halfvec(2) <=> (%s::vector)::halfvec(2)" in sql
+        assert params == [[1.0, 0.0], "category", '"common"', [1.0, 0.0], 8, 2]
+
+
+class TestPgVectorLexicalSearch:
+    """tsvector 전문 검색 테스트"""
+
+    def test_add_lexical_column(self, store):
+        store, __ = store
+        cursor = FakeCursor()
+
+        store._add_lexical_column(cursor, "docs")
+
+        sqls = [sql for sql, __ in cursor.executed]
+        assert "GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, page_content)) STORED" in sqls[0]
+        assert sqls[1] == "CREATE INDEX IF NOT EXISTS docs_page_content_tsv_idx ON docs USING gin (page_content_tsv)"
+
+    def test_lexical_search_sql(self, store):
+        store, __ = store
+        store._lexical["docs"] = True
+        connection = FakeConnection()
+        store.pool._connect = lambda: connection
+
+        store.lexical_search("docs", "AB-1234 교체", k=3, filter={"category": "x"})
+
+        sql, params = connection.cursors[-1].executed[-1]
+        assert "replace(plainto_tsquery(%s::regconfig, %s)::text, '&', '|')::tsquery AS query" in sql
+        assert "WHERE page_content_tsv @@ query AND metadata->%s = %s ORDER BY rank DESC" in sql
+        assert params == ["simple", "AB-1234 교체", "category", '"x"', 3]
+
+    def test_lexical_search_requires_index(self, store):
+        store, __ = store
+        store._lexical["docs"] = False
+        store.pool._connect = FakeConnection
+
+        with pytest.raises(ValueError, match="create_lexical_index"):
+            store.lexical_search("docs", "AB-1234")
+
+
+class TestPgVectorSearchMany:
+    """LATERAL 조인 일괄 검색 테스트"""
+
+    def test_lateral_search(self, store):
+        store, __ = store
+        connection = FakeConnection()
+        store.pool._connect = lambda: connection
+        connection.cursor = self._cursor_factory(connection, [(1, "a", {}, 0.1), (2, "b", {}, 0.2), (2, "c", {}, 0.3)])
+
+        results = store.search_many("docs", [[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]], k=2)
+
+        sql, params = connection.cursors[-1].executed[-1]
+        assert "FROM unnest(%s::vector[]) WITH ORDINALITY AS q(embedding, ordinality) CROSS JOIN LATERAL" in sql
+        assert "ORDER BY embedding <=> q.embedding LIMIT %s ) AS r ORDER BY q.ordinality, r.distance" in sql
+        assert params == [["[1.0,0.0]", "[0.0,1.0]", "[0.5,0.5]"], 2]
+        assert [[r.document.page_content for r in query_results] for query_results in results] == [
+            ["a"],
+            ["b", "c"],
+            [],
+        ]
+
+    def test_exact_filter_materialized(self, store):
+        store, __ = store
+        sql = store._search_many_sql("docs", "<=>", ["metadata->%s = %s"], exact=True)
+
+        assert "WITH filtered AS MATERIALIZED ( SELECT page_content, metadata, embedding FROM docs" in " ".join(
+            sql.split()
+        )
+        assert "FROM filtered ORDER BY embedding <=> q.embedding" in " ".join(sql.split())
+
+    @staticmethod
+    def _cursor_factory(connection, rows):
+        def cursor():
+            connection.cursors.append(FakeCursor(rows=rows, connection=connection))
+            return connection.cursors[-1]
+
+        return cursor
+
+
+class FakeAsyncCursor:
+    """psycopg 3 비동기 커서 흉내. 실행한 SQL과 COPY로 받은 데이터를 기록합니다."""
+
+    def __init__(self, rows=(), results=()):
+        self.rows = list(rows)
+        # 앞쪽 조회부터 차례로 돌려줄 결과. 모두 사용하면 rows를 돌려줍니다.
+        self.results = list(results)
+        self.executed = []
+        self.copied = b""
+        self.rowcount = len(self.rows)
+
+    async def execute(self, sql, params=None, prepare=None):
+        self.executed.append((" ".join(sql.split()), params))
+
+    async def executemany(self, sql, params_seq):
+        self.executed.append((" ".join(sql.split()), list(params_seq)))
+
+    async def fetchall(self):
+        return self.results.pop(0) if self.results else self.rows
+
+    async def fetchone(self):
+        return (await self.fetchall())[0]
+
+    @asynccontextmanager
+    async def copy(self, sql):
+        self.executed.append((sql, None))
+        yield self
+
+    async def write(self, data):
+        self.copied += data
+
+
+class TestPgVectorAsync:
+    """psycopg 3 비동기 API 테스트"""
+
+    @staticmethod
+    def _patch_cursor(store, cursor):
+        @asynccontextmanager
+        async def async_cursor():
+            yield cursor
+
+        store.async_cursor = async_cursor
+
+    async def test_search_many_async(self, store):
+        store, __ = store
+        cursor = FakeAsyncCursor(rows=[(1, "a", {}, 0.1), (2, "b", {}, 0.2)])
+        self._patch_cursor(store, cursor)
+
+        results = await store.search_many_async("docs", [[1.0, 0.0], [0.0, 1.0]], k=2, ef_search=80)
+
+        assert cursor.executed[0] == ("SET LOCAL hnsw.ef_search = 80", None)
+        sql, params = cursor.executed[-1]
+        assert sql == " ".join(store._search_many_sql("docs", "<=>").split())
+        assert params == [["[1.0,0.0]", "[0.0,1.0]"], 2]
+        assert [[r.document.page_content for r in query_results] for query_results in results] == [["a"], ["b"]]
+
+    async def test_count_and_delete_async(self, store):
+        store, __ = store
+        del store._metadata_columns["docs"]
+        cursor = FakeAsyncCursor(rows=[(3,)], results=[[("category", "text")]])
+        self._patch_cursor(store, cursor)
+
+        assert await store.count_async("docs", {"category": "x"}) == 3
+        assert "information_schema.columns" in cursor.executed[0][0]
+        assert store._metadata_columns["docs"] == {"category": "text"}
+        assert cursor.executed[-1] == ("SELECT COUNT(*) FROM docs WHERE category = %s", ["x"])
+
+        assert await store.delete_async("docs", {"category": "x"}) == 1
+        assert cursor.executed[-1][0].startswith("DELETE FROM docs WHERE")
+        assert "docs" not in store._stats
+
+    async def test_insert_async_uses_copy(self, store):
+        store, __ = store
+        store.copy_threshold = 2
+        cursor = FakeAsyncCursor()
+        self._patch_cursor(store, cursor)
+        documents = [Document(page_content=str(i), metadata={}, embedding=[1.0, 0.0]) for i in range(3)]
+
+        assert await store.insert_async("docs", documents[:1]) == 1
+        assert cursor.executed[-1][0].startswith("INSERT INTO docs")
+
+        assert await store.insert_async("docs", documents) == 3
+        assert cursor.executed[-1][0] == copy_sql("docs")
+        assert cursor.copied.endswith(PGCOPY_TRAILER)
@@ -9,6 +9,8 @@ from pyhub.llm.agents import Tool
 from pyhub.llm.agents.react import (
     AsyncReactAgent,
     ReactAgent,
+    ReactScratchpad,
+    ReactStep,
     create_react_agent,
     parse_react_output,
 )
@@ -202,6 +204,94 @@ class TestReactAgent:
         second_call = str(mock_llm.ask.call_args_list[1][0][0])
         assert "validation" in second_call.lower() or "error" in second_call.lower()
 
+    def test_agent_uses_stop_sequence_without_history(self, mock_llm, calculator_tool):
+        """LLM history 미사용 및 stop sequence 전달 테스트"""
+        mock_llm.ask.side_effect = [
+            """
+            Thought: I need to calculate 15 + 25
+            Action: calculator
+            Action Input: {"expression": "15 + 25"}
+            Observation: 1000
+            """,
+            """
+            Thought: Done
+            Final Answer: 40
+            """,
+        ]
+
+        agent = ReactAgent(llm=mock_llm, tools=[calculator_tool])
+        agent.run("What is 15 + 25?")
+
+        kwargs = mock_llm.ask.call_args_list[0][1]
+        assert kwargs["use_history"] is False
+        assert kwargs["stop"] == ["Observation:"]
+
+        # LLM이 지어낸 Observation 대신 실제 도구 결과가 기록됨
+        second_call = str(mock_llm.ask.call_args_list[1][0][0])
+        assert "Observation: 40" in second_call
+        assert "1000" not in second_call
+
+
+class TestReactScratchpad:
+    """ReactScratchpad 테스트"""
+
+    def test_render_steps(self):
+        scratchpad = ReactScratchpad()
+        scratchpad.add(ReactStep(thought="calc", action="calculator", action_input={"expression": "1+1"}))
+        scratchpad.steps[-1].observation = "2"
+
+        assert scratchpad.render() == (
+            'Thought: calc\nAction: calculator\nAction Input: {"expression": "1+1"}\nObservation: 2'
+        )
+
+    def test_observation_truncation(self):
+        scratchpad = ReactScratchpad(max_observation_length=10)
+        step = scratchpad.add(ReactStep(thought="t", action="a", action_input={}, observation="x" * 50))
+
+        assert step.observation.startswith("x" * 10)
+        assert "truncated 40 chars" in step.observation
+
+    def test_token_budget_summarizes_older_steps(self):
+        scratchpad = ReactScratchpad(max_tokens=60, keep_recent_steps=1, token_counter=lambda text: len(text.split()))
+        for i in range(10):
+            scratchpad.add(
+                ReactStep(
+                    thought=f"step {i} " + "reasoning " * 10,
+                    action="search",
+                    action_input={"query": f"q{i}"},
+                    observation=f"result {i}",
+                )
+            )
+
+        text = scratchpad.render()
+
+        assert len(text.split()) <= 60
+        assert "Summary of earlier steps:" in text
+        # 최근 단계는 원문 유지, 가장 오래된 요약부터 제거
+        assert "Thought: step 9" in text
+        assert "Thought: step 0" not in text
+        assert 'search({"query": "q8"}) -> result 8' in text
+        assert 'search({"query": "q0"})' not in text
+
+    def test_custom_summarizer(self):
+        scratchpad = ReactScratchpad(
+            max_tokens=20,
+            keep_recent_steps=1,
+            token_counter=lambda text: len(text.split()),
+            summarizer=lambda steps: f"{len(steps)} steps done",
+        )
+        for i in range(3):
+            scratchpad.add(ReactStep(thought=f"step {i}", action="a", action_input={"i": i}, observation="ok"))
+
+        text = scratchpad.render()
+        assert text.startswith("2 steps done")
+        assert "Thought: step 2" in text
+
+    def test_agent_scratchpad_options(self):
+        agent = ReactAgent(llm=Mock(), tools=[], max_scratchpad_tokens=100, max_observation_length=50)
+
+        assert agent.scratchpad_options == {"max_tokens": 100, "max_observation_length": 50}
+
 
 class TestAsyncReactAgent:
     """비동기 ReactAgent 테스트"""
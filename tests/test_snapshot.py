@@ -0,0 +1,141 @@
+"""Tests for collection export/restore snapshots."""
+
+import json
+import sqlite3
+
+import pytest
+
+from pyhub.rag.backends.base import Document
+from pyhub.rag.backends.snapshot import (
+    SnapshotBatch,
+    SnapshotWriter,
+    iter_snapshot_batches,
+    read_manifest,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def _sqlite_vec_loadable() -> bool:
+    try:
+        import sqlite_vec
+
+        conn = sqlite3.connect(":memory:")
+        conn.enable_load_extension(True)
+        sqlite_vec.load(conn)
+        conn.close()
+        return True
+    except Exception:
+        return False
+
+
+requires_sqlite_vec = pytest.mark.skipif(not _sqlite_vec_loadable(), reason="sqlite-vec 확장을 로드할 수 없습니다.")
+
+
+def make_documents(count, dimension=4):
+    return [
+        Document(page_content=f"문서 {i}", metadata={"i": i, "even": i % 2 == 0}, embedding=[float(i)] * dimension)
+        for i in range(count)
+    ]
+
+
+class TestSnapshotFiles:
+    """스냅샷 파일 형식 테스트"""
+
+    def test_write_and_read(self, tmp_path):
+        path = tmp_path / "snapshot"
+        vectors = np.arange(20, dtype=np.float32).reshape(5, 4)
+
+        with SnapshotWriter(path, "docs", backend="numpy", dimension=4, distance_metric="l2") as writer:
+            writer.write(SnapshotBatch(["a", "b"], [{"i": 0}, {}], vectors[:2]))
+            writer.write(SnapshotBatch(["c", "d", "e"], [{}, {}, {"i": 4}], vectors[2:]))
+
+        # 표준 .npy 파일이므로 numpy로 바로 읽을 수 있습니다.
+        assert np.array_equal(np.load(path / "vectors.npy"), vectors)
+        assert read_manifest(path)["count"] == 5
+
+        batches = list(iter_snapshot_batches(path, batch_size=2))
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [row[0] for batch in batches for row in batch.rows()] == ["a", "b", "c", "d", "e"]
+        assert np.array_equal(np.concatenate([batch.vectors for batch in batches]), vectors)
+
+    def test_failed_export_is_not_restorable(self, tmp_path):
+        path = tmp_path / "snapshot"
+        with pytest.raises(ValueError, match="dimension mismatch"):
+            with SnapshotWriter(path, "docs", backend="numpy", dimension=4, distance_metric="l2") as writer:
+                writer.write(SnapshotBatch(["a"], [{}], np.zeros((1, 3), dtype=np.float32)))
+
+        with pytest.raises(FileNotFoundError):
+            read_manifest(path)
+
+    def test_rejects_other_directories(self, tmp_path):
+        (tmp_path / "manifest.json").write_text(json.dumps({"format": "other"}), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Not a collection snapshot"):
+            read_manifest(tmp_path)
+
+
+class TestExportRestore:
+    """백엔드 export/restore 테스트"""
+
+    @pytest.fixture(params=[pytest.param("sqlite-vec", marks=requires_sqlite_vec), "numpy"])
+    def store(self, request, tmp_path):
+        if request.param == "sqlite-vec":
+            from pyhub.rag.backends.sqlite_vec import SqliteVecStore
+
+            store = SqliteVecStore({"db_path": tmp_path / "vectors.db"})
+        else:
+            from pyhub.rag.backends.numpy_store import NumpyStore
+
+            store = NumpyStore({"data_dir": tmp_path / "data"})
+
+        with store:
+            store.create_collection("docs", dimension=4, distance_metric="l2")
+            store.insert("docs", make_documents(30))
+            yield store
+
+    def test_roundtrip(self, store, tmp_path):
+        path = tmp_path / "snapshot"
+        store.delete("docs", {"i": 3})
+
+        assert store.export("docs", path, batch_size=7) == 29
+        manifest = read_manifest(path)
+        assert (manifest["backend"], manifest["dimension"], manifest["distance_metric"]) == (
+            store.backend_name,
+            4,
+            "l2",
+        )
+        assert (path / "vectors.npy").stat().st_size == 128 + 29 * 4 * 4
+
+        assert store.restore("copy", path, batch_size=10) == 29
+        assert store.count("copy") == 29
+        result = store.search("copy", [5.0] * 4, k=1)[0]
+        assert (result.document.page_content, result.document.metadata) == ("문서 5", {"i": 5, "even": False})
+
+    def test_restore_into_existing_collection(self, store, tmp_path):
+        path = tmp_path / "snapshot"
+        store.export("docs", path)
+
+        assert store.restore("docs", path) == 30
+        assert store.count("docs") == 60
+
+        assert store.restore("docs", path, clear_existing=True) == 30
+        assert store.count("docs") == 30
+
+    def test_restore_to_other_backend(self, store, tmp_path):
+        from pyhub.rag.backends.numpy_store import NumpyStore
+
+        path = tmp_path / "snapshot"
+        store.export("docs", path)
+
+        with NumpyStore({"data_dir": tmp_path / "other"}) as other:
+            assert other.restore("docs", path) == 30
+            assert other.get_collection_info("docs")["distance_metric"] == "l2"
+            assert other.search("docs", [7.0] * 4, k=1)[0].document.page_content == "문서 7"
+
+    def test_export_empty_collection(self, store, tmp_path):
+        store.create_collection("empty", dimension=4, distance_metric="l2")
+
+        assert store.export("empty", tmp_path / "snapshot") == 0
+        assert store.restore("restored", tmp_path / "snapshot") == 0
+        assert store.collection_exists("restored")
@@ -0,0 +1,583 @@
+"""Tests for SqliteVecStore backend."""
+
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from pyhub.rag.backends.base import Document
+from pyhub.rag.backends.sqlite_vec import SqliteVecStore
+
+
+def _sqlite_vec_loadable() -> bool:
+    try:
+        import sqlite_vec
+
+        conn = sqlite3.connect(":memory:")
+        conn.enable_load_extension(True)
+        sqlite_vec.load(conn)
+        conn.close()
+        return True
+    except Exception:
+        return False
+
+
+pytestmark = pytest.mark.skipif(not _sqlite_vec_loadable(), reason="sqlite-vec 확장을 로드할 수 없습니다.")
+
+
+@pytest.fixture
+def store(tmp_path):
+    with SqliteVecStore({"db_path": tmp_path / "vector.db"}) as store:
+        store.create_collection("docs", dimension=3, metadata_columns={"category": str})
+        store.insert(
+            "docs",
+            [
+                Document(page_content="a", metadata={"category": "x", "year": 2020}, embedding=[1.0, 0.0, 0.0]),
+                Document(page_content="b", metadata={"category": "y", "year": 2021}, embedding=[0.0, 1.0, 0.0]),
+                Document(page_content="c", metadata={"year": 2021}, embedding=[0.9, 0.1, 0.0]),
+            ],
+        )
+        yield store
+
+
+class TestSqliteVecConnection:
+    """연결 재사용 테스트"""
+
+    def test_connection_reused_per_thread(self, store):
+        conn = store._get_connection()
+        assert store._get_connection() is conn
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(store._get_connection()))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not conn
+        assert len(store._connections) == 2
+
+    def test_pragmas_applied(self, store):
+        conn = store._get_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    def test_close_and_reopen(self, store):
+        store._get_connection()
+        store.close()
+        assert store._connections == []
+
+        # 닫힌 뒤에도 다시 연결하여 사용 가능
+        assert store.count("docs") == 3
+
+    def test_failed_statement_rolls_back(self, store):
+        with pytest.raises(sqlite3.Error):
+            # 두 번째 문서의 차원이 달라 배치 도중 실패
+            store.insert(
+                "docs",
+                [
+                    Document(page_content="d", metadata={}, embedding=[0.0, 0.0, 1.0]),
+                    Document(page_content="e", metadata={}, embedding=[0.0, 1.0]),
+                ],
+            )
+
+        assert store.count("docs") == 3
+        assert not store._get_connection().in_transaction
+
+    def test_embedding_stored_as_float32_blob(self, store):
+        conn = store._get_connection()
+        rows = conn.execute("SELECT typeof(embedding), length(embedding) FROM docs").fetchall()
+        assert rows == [("blob", 12)] * 3
+
+
+class TestSqliteVecSearch:
+    """vec0 컬렉션 검색 테스트"""
+
+    def test_vec0_collection(self, store):
+        info = store.get_collection_info("docs")
+        assert info["table_type"] == "vec0"
+        assert info["dimension"] == 3
+        assert info["metadata_columns"] == {"category": "text"}
+
+    def test_knn_search(self, store):
+        results = store.search("docs", [1.0, 0.0, 0.0], k=2)
+        assert [r.document.page_content for r in results] == ["a", "c"]
+        assert results[0].score == pytest.approx(1.0)
+        assert results[0].document.metadata == {"category": "x", "year": 2020}
+
+    def test_metadata_column_filter(self, store):
+        results = store.search("docs", [1.0, 0.0, 0.0], k=2, filter={"category": "y"})
+        assert [r.document.page_content for r in results] == ["b"]
+
+    def test_json_metadata_filter(self, store):
+        results = store.search("docs", [1.0, 0.0, 0.0], k=3, filter={"year": 2021})
+        assert [r.document.page_content for r in results] == ["c", "b"]
+
+    def test_threshold(self, store):
+        results = store.search("docs", [1.0, 0.0, 0.0], k=3, threshold=0.5)
+        assert [r.document.page_content for r in results] == ["a", "c"]
+
+    def test_delete(self, store):
+        assert store.delete("docs", {"category": "x"}) == 1
+        assert store.delete("docs", {"year": 2021}) == 2
+        assert store.count("docs") == 0
+
+    def test_migrate_plain_table(self, tmp_path):
+        store = SqliteVecStore({"db_path": tmp_path / "legacy.db"})
+        conn = store._get_connection()
+        # 이전 버전의 create_collection이 만든 일반 테이블
+        conn.execute(
+            "CREATE TABLE legacy (id INTEGER PRIMARY KEY AUTOINCREMENT, page_content TEXT NOT NULL, "
+            "metadata TEXT, embedding FLOAT32[3])"
+        )
+        conn.commit()
+        store.insert(
+            "legacy",
+            [
+                Document(page_content="a", metadata={"category": "x"}, embedding=[1.0, 0.0, 0.0]),
+                Document(page_content="b", metadata={}, embedding=[0.0, 1.0, 0.0]),
+            ],
+        )
+        assert store.search("legacy", [1.0, 0.0, 0.0], k=1)[0].document.page_content == "a"
+
+        assert store.migrate_collection("legacy", metadata_columns={"category": "text"}) == 2
+
+        info = store.get_collection_info("legacy")
+        assert info["table_type"] == "vec0"
+        assert info["count"] == 2
+        assert not store.collection_exists("legacy_legacy")
+        results = store.search("legacy", [1.0, 0.0, 0.0], k=2, filter={"category": "x"})
+        assert [r.document.page_content for r in results] == ["a"]
+
+        # 이미 vec0이면 아무 것도 하지 않음
+        assert store.migrate_collection("legacy") == 0
+        store.close()
+
+
+class TestSqliteVecFilterPlanner:
+    """필터 검색 플래너 테스트"""
+
+    @pytest.fixture
+    def planned_store(self, tmp_path):
+        with SqliteVecStore({"db_path": tmp_path / "planner.db", "planner_exact_selectivity": 0.1}) as store:
+            store.create_collection("docs", dimension=2)
+            documents = []
+            for i in range(300):
+                # 질의 벡터 [1, 0]에서 멀어질수록 i가 큼. rare 문서는 가장 먼 곳에 위치
+                category = "rare" if i >= 295 else "common"
+                documents.append(
+                    Document(page_content=str(i), metadata={"category": category}, embedding=[1.0, i / 100])
+                )
+            store.insert("docs", documents)
+            yield store
+
+    def test_plan_strategy(self, planned_store):
+        assert planned_store.plan_search("docs", 5, {"category": "rare"}).strategy == "exact"
+        assert planned_store.plan_search("docs", 5, {"category": "common"}).strategy == "ann"
+
+    @pytest.mark.parametrize("category", ["rare", "common"])
+    def test_returns_k_results(self, planned_store, category):
+        results = planned_store.search("docs", [1.0, 0.0], k=5, filter={"category": category})
+        assert len(results) == 5
+        assert all(r.document.metadata["category"] == category for r in results)
+        scores = [r.score for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_requery_when_overfetch_is_not_enough(self, planned_store):
+        # 통계상 거의 모든 문서가 common이지만, 질의 근처에는 rare 문서만 모여 있는 상황
+        planned_store.planner.overfetch_factor = 1.0
+        planned_store.get_stats("docs").sample = [{"category": "common"}] * 100
+        plan = planned_store.plan_search("docs", 5, {"category": "common"})
+        assert plan.strategy == "ann"
+        assert plan.fetch_k == 6
+
+        results = planned_store.search("docs", [1.0, 3.0], k=5, filter={"category": "common"})
+        assert [r.document.page_content for r in results] == ["294", "293", "292", "291", "290"]
+
+    def test_stats_updated_on_insert(self, planned_store):
+        assert planned_store.get_stats("docs").total == 300
+        planned_store.insert("docs", [Document(page_content="x", metadata={}, embedding=[0.0, 1.0])])
+        assert planned_store.get_stats("docs").total == 301
+
+
+class TestSqliteVecPromotedMetadata:
+    """메타데이터 키 승격 테스트"""
+
+    def test_count_with_filter(self, store):
+        assert store.count("docs", {"category": "x"}) == 1
+        assert store.count("docs", {"year": 2021}) == 2
+
+    def test_missing_and_mistyped_values(self, tmp_path):
+        with SqliteVecStore({"db_path": tmp_path / "vector.db"}) as store:
+            store.create_collection("docs", dimension=2, metadata_columns={"page": int, "score": float, "draft": bool})
+            store.insert(
+                "docs",
+                [
+                    Document(page_content="zero", metadata={"page": 0, "score": 0.0, "draft": False}, embedding=[1, 0]),
+                    Document(page_content="empty", metadata={}, embedding=[1, 0]),
+                    Document(page_content="text", metadata={"page": "3", "score": "high"}, embedding=[0, 1]),
+                    Document(page_content="three", metadata={"page": 3, "score": 1, "draft": True}, embedding=[0, 1]),
+                ],
+            )
+
+            # 키가 없거나 타입이 다른 문서는 컬럼 기본값과 매칭되지 않습니다.
+            assert store.count("docs", {"page": 0}) == 1
+            assert store.count("docs", {"score": 0.0}) == 1
+            assert store.count("docs", {"draft": False}) == 1
+            assert store.count("docs", {"page": 3}) == 1
+            assert store.count("docs", {"page": "3"}) == 1
+            assert store.count("docs", {"score": 1}) == 1
+
+            results = store.search("docs", [1.0, 0.0], k=4, filter={"page": 0})
+            assert [r.document.page_content for r in results] == ["zero"]
+            results = store.search("docs", [1.0, 0.0], k=4, filter={"draft": True})
+            assert [r.document.page_content for r in results] == ["three"]
+
+            assert store.delete("docs", {"page": 0}) == 1
+            assert store.count("docs") == 3
+
+    def test_promote_vec0_collection(self, store):
+        rowids = store._get_connection().execute("SELECT rowid FROM docs ORDER BY rowid").fetchall()
+
+        columns = store.promote_metadata_keys("docs", {"year": int})
+
+        assert columns == {"category": "text", "year": "integer"}
+        assert store.get_collection_info("docs")["metadata_columns"] == columns
+        assert store._get_connection().execute("SELECT rowid FROM docs ORDER BY rowid").fetchall() == rowids
+        assert not store.collection_exists("docs_rebuild")
+
+        # 승격된 키는 KNN 검색 안에서 필터링
+        results = store.search("docs", [1.0, 0.0, 0.0], k=3, filter={"year": 2021})
+        assert [r.document.page_content for r in results] == ["c", "b"]
+        assert store.count("docs", {"year": 2021}) == 2
+
+        with pytest.raises(ValueError):
+            store.promote_metadata_keys("docs", {"year": "text"})
+
+    def test_promote_over_missing_and_mistyped_values(self, store):
+        store.insert(
+            "docs",
+            [
+                Document(page_content="d", metadata={"category": "x", "year": "2021"}, embedding=[0.0, 0.0, 1.0]),
+                Document(page_content="e", metadata={"category": "x", "year": 0}, embedding=[0.0, 0.5, 0.5]),
+                Document(page_content="f", metadata={"category": 1}, embedding=[0.5, 0.5, 0.0]),
+            ],
+        )
+
+        assert store.promote_metadata_keys("docs", {"year": int}) == {"category": "text", "year": "integer"}
+
+        assert store.count("docs") == 6
+        assert store.count("docs", {"year": 2021}) == 2
+        assert store.count("docs", {"year": "2021"}) == 1
+        assert store.count("docs", {"year": 0}) == 1
+        assert store.count("docs", {"category": 1}) == 1
+        results = store.search("docs", [1.0, 0.0, 0.0], k=6, filter={"year": 0})
+        assert [r.document.page_content for r in results] == ["e"]
+
+    def test_promote_plain_table(self, tmp_path):
+        with SqliteVecStore({"db_path": tmp_path / "plain.db"}) as store:
+            conn = store._get_connection()
+            conn.execute(
+                "CREATE TABLE plain (id INTEGER PRIMARY KEY AUTOINCREMENT, page_content TEXT NOT NULL, "
+                "metadata TEXT, embedding FLOAT32[2])"
+            )
+            conn.commit()
+            store.insert(
+                "plain",
+                [
+                    Document(page_content="a", metadata={"source": "s1"}, embedding=[1.0, 0.0]),
+                    Document(page_content="b", metadata={"source": "s2"}, embedding=[0.0, 1.0]),
+                ],
+            )
+
+            assert store.promote_metadata_keys("plain", {"source": "text"}) == {"source": "text"}
+
+            plan = conn.execute("EXPLAIN QUERY PLAN SELECT * FROM plain WHERE source = ?", ("s1",)).fetchall()
+            assert "plain_source_idx" in plan[0][-1]
+            assert store.count("plain", {"source": "s2"}) == 1
+            assert store.search("plain", [1.0, 0.0], k=2, filter={"source": "s2"})[0].document.page_content == "b"
+
+            # vec0로 변환해도 승격된 키 유지
+            store.migrate_collection("plain")
+            assert store.get_collection_info("plain")["metadata_columns"] == {"source": "text"}
+            assert store.count("plain", {"source": "s1"}) == 1
+
+
+class TestSqliteVecQuantization:
+    """양자화 검색 테스트"""
+
+    @staticmethod
+    def _documents():
+        documents = []
+        for i in range(40):
+            # 질의 벡터 [1, 0, ...]에서 i가 클수록 멀어짐
+            embedding = [1.0, i / 20, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+            category = "even" if i % 2 == 0 else "odd"
+            documents.append(Document(page_content=str(i), metadata={"category": category}, embedding=embedding))
+        return documents
+
+    @pytest.mark.parametrize("quantization", ["int8", "binary"])
+    def test_rerank_with_full_precision(self, tmp_path, quantization):
+        with SqliteVecStore({"db_path": tmp_path / "quantized.db"}) as store:
+            store.create_collection("docs", dimension=8, metadata_columns={"category": str}, quantization=quantization)
+            store.insert("docs", self._documents())
+
+            assert store.get_collection_info("docs")["quantization"] == quantization
+
+            # 이진 양자화 벡터는 모두 같지만 원본 벡터로 재정렬하므로 순서가 정확함
+            results = store.search("docs", [1.0] + [0.0] * 7, k=3, rerank_factor=40)
+            assert [r.document.page_content for r in results] == ["0", "1", "2"]
+            assert results[0].score == pytest.approx(1.0)
+
+            results = store.search("docs", [1.0] + [0.0] * 7, k=2, filter={"category": "odd"}, rerank_factor=40)
+            assert [r.document.page_content for r in results] == ["1", "3"]
+
+    def test_binary_requires_multiple_of_8(self, tmp_path):
+        with SqliteVecStore({"db_path": tmp_path / "quantized.db"}) as store:
+            with pytest.raises(ValueError):
+                store.create_collection("docs", dimension=3, quantization="binary")
+            with pytest.raises(ValueError):
+                store.create_collection("docs", dimension=8, quantization="halfvec")
+
+    def test_quantize_collection(self, tmp_path):
+        with SqliteVecStore({"db_path": tmp_path / "quantized.db"}) as store:
+            store.create_collection("docs", dimension=8, metadata_columns={"category": str})
+            store.insert("docs", self._documents())
+            rowids = store._get_connection().execute("SELECT rowid FROM docs ORDER BY rowid").fetchall()
+
+            assert store.quantize_collection("docs", "int8") == 40
+            assert store.quantize_collection("docs", "int8") == 0
+
+            info = store.get_collection_info("docs")
+            assert info["quantization"] == "int8"
+            assert info["metadata_columns"] == {"category": "text"}
+            assert store._get_connection().execute("SELECT rowid FROM docs ORDER BY rowid").fetchall() == rowids
+            assert store.search("docs", [1.0] + [0.0] * 7, k=1)[0].document.page_content == "0"
+
+            # 양자화 컬렉션에도 삽입 가능
+            store.insert("docs", [Document(page_content="new", metadata={}, embedding=[0.0, 1.0] + [0.0] * 6)])
+            assert store.search("docs", [0.0, 1.0] + [0.0] * 6, k=1)[0].document.page_content == "new"
+
+            store.quantize_collection("docs", None)
+            assert "quantization" not in store.get_collection_info("docs")
+            assert store.count("docs") == 41
+
+
+class TestSqliteVecHybridSearch:
+    """FTS5 전문 검색과 하이브리드 검색 테스트"""
+
+    @pytest.fixture
+    def hybrid_store(self, tmp_path):
+        with SqliteVecStore({"db_path": tmp_path / "hybrid.db"}) as store:
+            store.create_collection("docs", dimension=3, metadata_columns={"category": str}, lexical_index=True)
+            store.insert(
+                "docs",
+                [
+                    Document(page_content="엔진 오일 교환 주기", metadata={"category": "x"}, embedding=[1.0, 0.0, 0.0]),
+                    Document(
+                        page_content="부품 AB-1234 교체 방법", metadata={"category": "y"}, embedding=[0.0, 1.0, 0.0]
+                    ),
+                    Document(page_content="타이어 공기압 점검", metadata={"category": "x"}, embedding=[0.9, 0.1, 0.0]),
+                ],
+            )
+            yield store
+
+    def test_lexical_search(self, hybrid_store):
+        assert [r.document.page_content for r in hybrid_store.lexical_search("docs", "AB-1234")] == [
+            "부품 AB-1234 교체 방법"
+        ]
+        assert [r.document.page_content for r in hybrid_store.lexical_search("docs", "엔진 오일")] == [
+            "엔진 오일 교환 주기"
+        ]
+        assert hybrid_store.lexical_search("docs", "AB-1234", filter={"category": "x"}) == []
+        assert hybrid_store.get_collection_info("docs")["lexical_index"] is True
+
+    def test_index_follows_delete(self, hybrid_store):
+        hybrid_store.delete("docs", {"category": "y"})
+        assert hybrid_store.lexical_search("docs", "AB-1234") == []
+
+    def test_hybrid_search(self, hybrid_store):
+        # 벡터 검색만으로는 [1, 0, 0]에서 가장 먼 문서이지만, 전문 검색으로 1위가 됨
+        results = hybrid_store.hybrid_search("docs", "AB-1234", [1.0, 0.0, 0.0], k=2, alpha=0.3)
+        assert [r.document.page_content for r in results] == ["부품 AB-1234 교체 방법", "엔진 오일 교환 주기"]
+
+        results = hybrid_store.hybrid_search("docs", "AB-1234", [1.0, 0.0, 0.0], k=2, alpha=1.0)
+        assert [r.document.page_content for r in results] == ["엔진 오일 교환 주기", "타이어 공기압 점검"]
+
+    def test_create_lexical_index_backfills(self, store):
+        store.create_lexical_index("docs")
+        store.insert("docs", [Document(page_content="abc 추가", metadata={}, embedding=[0.0, 0.0, 1.0])])
+
+        assert [r.document.page_content for r in store.lexical_search("docs", "abc")] == ["abc 추가"]
+
+
+class TestSqliteVecSearchMany:
+    """여러 쿼리 일괄 검색 테스트"""
+
+    queries = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.5, 0.5, 0.0]]
+
+    @staticmethod
+    def _contents(results):
+        return [[(r.document.page_content, round(r.score, 6)) for r in query_results] for query_results in results]
+
+    @pytest.mark.parametrize("filter", [None, {"category": "x"}, {"year": 2021}])
+    def test_same_as_search(self, store, filter):
+        expected = [store.search("docs", query, k=2, filter=filter) for query in self.queries]
+        assert self._contents(store.search_many("docs", self.queries, k=2, filter=filter)) == self._contents(expected)
+
+    def test_quantized(self, tmp_path):
+        with SqliteVecStore({"db_path": tmp_path / "quantized.db"}) as store:
+            store.create_collection("docs", dimension=8, quantization="binary")
+            store.insert(
+                "docs",
+                [
+                    Document(page_content=str(i), metadata={}, embedding=[1.0, i / 20, 0, 0, 0, 0, 0, 0])
+                    for i in range(20)
+                ],
+            )
+
+            results = store.search_many("docs", [[1.0] + [0.0] * 7, [1.0, 1.0] + [0.0] * 6], k=2, rerank_factor=20)
+
+        assert [[r.document.page_content for r in query_results] for query_results in results] == [
+            ["0", "1"],
+            ["19", "18"],
+        ]
+
+    def test_empty(self, store):
+        assert store.search_many("docs", []) == []
+
+
+class TestSqliteVecIvf:
+    """IVF 파티션 검색 테스트"""
+
+    @pytest.fixture
+    def clusters(self):
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(8, 16)) * 10
+        return centers, np.concatenate([center + rng.normal(size=(50, 16)) for center in centers])
+
+    @pytest.fixture
+    def ivf_store(self, tmp_path, clusters):
+        __, vectors = clusters
+        with SqliteVecStore({"db_path": tmp_path / "ivf.db", "nprobe": 2}) as store:
+            store.create_collection("docs", dimension=16, distance_metric="l2", metadata_columns={"shard": int})
+            store.insert(
+                "docs",
+                [
+                    Document(page_content=str(i), metadata={"shard": i % 2}, embedding=vector.tolist())
+                    for i, vector in enumerate(vectors)
+                ],
+            )
+            yield store
+
+    def test_train_assigns_partitions(self, ivf_store):
+        assert ivf_store.train_ivf("docs", n_lists=8) == 8
+
+        info = ivf_store.get_collection_info("docs")
+        assert info["ivf_lists"] == 8
+        assert info["metadata_columns"] == {"shard": "integer"}
+        assert sum(ivf_store.get_ivf_list_sizes("docs").values()) == 400
+
+    def test_search_probes_nearest_partitions(self, ivf_store, clusters):
+        centers, vectors = clusters
+        expected = [r.document.page_content for r in ivf_store.search("docs", vectors[123].tolist(), k=5)]
+        ivf_store.train_ivf("docs", n_lists=8)
+
+        assert [r.document.page_content for r in ivf_store.search("docs", vectors[123].tolist(), k=5)] == expected
+        assert [r.document.page_content for r in ivf_store.search("docs", vectors[123].tolist(), k=5, nprobe=8)] == (
+            expected
+        )
+
+        # 가장 가까운 파티션 하나만 탐색하면 다른 군집의 문서는 나오지 않습니다.
+        results = ivf_store.search("docs", centers[3].tolist(), k=60, nprobe=1)
+        assert len(results) == 50
+        assert {int(r.document.page_content) // 50 for r in results} == {3}
+
+        results = ivf_store.search("docs", centers[3].tolist(), k=3, filter={"shard": 1})
+        assert all(r.document.metadata["shard"] == 1 for r in results)
+        assert ivf_store.search_many("docs", [centers[3].tolist()], k=3, filter={"shard": 1}) == [results]
+
+    def test_insert_after_training(self, ivf_store, clusters):
+        centers, __ = clusters
+        ivf_store.train_ivf("docs", n_lists=8)
+
+        ivf_store.insert("docs", [Document(page_content="new", metadata={}, embedding=(centers[5] + 0.01).tolist())])
+
+        assert ivf_store.search("docs", centers[5].tolist(), k=1, nprobe=1)[0].document.page_content == "new"
+
+    def test_rebalance(self, ivf_store, clusters):
+        centers, __ = clusters
+        ivf_store.train_ivf("docs", n_lists=8)
+
+        # 한 군집에 문서가 몰리도록 데이터가 바뀐 경우
+        ivf_store.insert(
+            "docs",
+            [
+                Document(page_content=f"drift-{i}", metadata={}, embedding=(centers[0] + i / 100).tolist())
+                for i in range(400)
+            ],
+        )
+        sizes = ivf_store.rebalance_ivf("docs")
+
+        assert sum(sizes.values()) == 800
+        assert len(sizes) >= 8
+        assert ivf_store.search("docs", centers[0].tolist(), k=1)[0].document.page_content == "drift-0"
+
+    def test_quantized_collection(self, tmp_path, clusters):
+        __, vectors = clusters
+        with SqliteVecStore({"db_path": tmp_path / "ivf.db"}) as store:
+            store.create_collection("docs", dimension=16, quantization="int8")
+            store.insert(
+                "docs",
+                [Document(page_content=str(i), metadata={}, embedding=v.tolist()) for i, v in enumerate(vectors)],
+            )
+            store.train_ivf("docs", n_lists=8)
+            assert store.quantize_collection("docs", None) == 400
+
+            info = store.get_collection_info("docs")
+            results = store.search("docs", vectors[10].tolist(), k=1, nprobe=2)
+
+        assert info["ivf_lists"] == 8
+        assert results[0].document.page_content == "10"
+
+
+class TestSqliteVecAsync:
+    """비동기 API 테스트"""
+
+    queries = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.5, 0.5, 0.0]]
+
+    async def test_concurrent_search(self, store):
+        expected = [store.search("docs", query, k=2) for query in self.queries]
+
+        results = await asyncio.gather(*(store.search_async("docs", query, k=2) for query in self.queries))
+
+        assert [[r.document.page_content for r in query_results] for query_results in results] == [
+            [r.document.page_content for r in query_results] for query_results in expected
+        ]
+        assert await store.search_many_async("docs", self.queries, k=2, filter={"category": "x"}) == [
+            store.search("docs", query, k=2, filter={"category": "x"}) for query in self.queries
+        ]
+
+    async def test_dedicated_executor(self, store):
+        thread_name = await store._run_async(lambda: threading.current_thread().name)
+        assert thread_name.startswith("sqlite-vec")
+
+    async def test_insert_count_delete(self, tmp_path):
+        async with SqliteVecStore({"db_path": tmp_path / "async.db"}) as store:
+            store.create_collection("docs", dimension=3)
+            documents = [
+                Document(page_content=str(i), metadata={"even": i % 2 == 0}, embedding=[1.0, float(i), 0.0])
+                for i in range(10)
+            ]
+
+            assert await store.insert_async("docs", documents) == 10
+            assert await store.count_async("docs") == 10
+            assert await store.delete_async("docs", {"even": True}) == 5
+            assert await store.count_async("docs") == 5
+
+            path = tmp_path / "docs.jsonl"
+            path.write_text('{"page_content": "x", "metadata": {}, "embedding": [0.0, 0.0, 1.0]}\n', encoding="utf-8")
+            assert await store.import_jsonl_async("docs", path, clear_existing=True) == 1
+            assert await store.count_async("docs") == 1
+
+        assert store._async_executor is None
@@ -0,0 +1,174 @@
+"""Tests for agent/LLM tracing."""
+
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from pyhub.llm.agents import Tool
+from pyhub.llm.agents.react import AsyncReactAgent, ReactAgent
+from pyhub.llm.base import BaseLLM
+from pyhub.llm.tracing import (
+    InMemorySpanSink,
+    JSONLSpanSink,
+    LoggingSpanSink,
+    Tracer,
+    format_waterfall,
+    trace_span,
+)
+from pyhub.llm.types import Reply, Usage
+
+
+class FakeLLM(BaseLLM):
+    """고정 응답과 토큰 사용량을 반환하는 LLM"""
+
+    def __init__(self, responses):
+        super().__init__(model="gpt-4o-mini")
+        self.responses = list(responses)
+
+    def _make_request_params(self, input_context, human_message, messages, model):
+        return {}
+
+    def _make_ask(self, input_context, human_message, messages, model):
+        return Reply(text=self.responses.pop(0), usage=Usage(input=10, output=5))
+
+    async def _make_ask_async(self, input_context, human_message, messages, model):
+        return self._make_ask(input_context, human_message, messages, model)
+
+    def _make_ask_stream(self, input_context, human_message, messages, model):
+        yield Reply(text="")
+
+    async def _make_ask_stream_async(self, input_context, human_message, messages, model):
+        yield Reply(text="")
+
+    def embed(self, input, model=None):
+        raise NotImplementedError
+
+    async def embed_async(self, input, model=None):
+        raise NotImplementedError
+
+
+REACT_RESPONSES = [
+    'Thought: I need to add\nAction: add\nAction Input: {"a": 1, "b": 2}',
+    "Thought: Done\nFinal Answer: 3",
+]
+
+
+class TestTracer:
+    """Tracer/Sink 테스트"""
+
+    def test_noop_without_tracer(self):
+        with trace_span("test") as span:
+            span.set(value=1)
+        assert span.attributes == {}
+
+    def test_nested_spans(self):
+        sink = InMemorySpanSink()
+        with Tracer(sink).activate():
+            with trace_span("parent", kind="agent") as parent:
+                with trace_span("child", kind="tool") as child:
+                    child.set(cache_hit=True)
+
+        assert [span.name for span in sink.spans] == ["child", "parent"]
+        assert child.parent_id == parent.span_id
+        assert child.trace_id == parent.trace_id
+        assert child.attributes == {"cache_hit": True}
+        assert parent.duration_ms >= child.duration_ms
+
+    def test_error_status(self):
+        sink = InMemorySpanSink()
+        with Tracer(sink).activate():
+            with pytest.raises(ValueError):
+                with trace_span("failing"):
+                    raise ValueError("boom")
+
+        assert sink.spans[0].status == "error"
+        assert "boom" in sink.spans[0].error
+
+    @pytest.mark.asyncio
+    async def test_async_propagation(self):
+        sink = InMemorySpanSink()
+
+        async def work(i):
+            with trace_span(f"task-{i}"):
+                await asyncio.sleep(0)
+
+        with Tracer(sink).activate():
+            with trace_span("root") as root:
+                await asyncio.gather(work(1), work(2))
+
+        children = [span for span in sink.spans if span.name.startswith("task-")]
+        assert len(children) == 2
+        assert all(span.parent_id == root.span_id for span in children)
+
+    def test_jsonl_sink(self, tmp_path):
+        path = tmp_path / "trace.jsonl"
+        tracer = Tracer(JSONLSpanSink(path))
+        with tracer.activate():
+            with trace_span("a", kind="llm", input_tokens=3):
+                pass
+            with trace_span("b"):
+                pass
+        tracer.close()
+
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [row["name"] for row in rows] == ["a", "b"]
+        assert rows[0]["attributes"]["input_tokens"] == 3
+
+    def test_logging_sink(self, caplog):
+        with caplog.at_level("INFO", logger="pyhub.llm.trace"):
+            with Tracer(LoggingSpanSink()).activate():
+                with trace_span("logged", kind="tool"):
+                    pass
+
+        assert "[tool] logged" in caplog.text
+
+
+class TestAgentTracing:
+    """Agent 실행 추적 테스트"""
+
+    @pytest.fixture
+    def add_tool(self):
+        return Tool(name="add", description="Add numbers", func=lambda a, b: str(a + b))
+
+    def test_react_agent_spans(self, add_tool):
+        sink = InMemorySpanSink()
+        agent = ReactAgent(llm=FakeLLM(REACT_RESPONSES), tools=[add_tool])
+
+        with Tracer(sink).activate():
+            assert agent.run("1 + 2?") == "3"
+
+        names = [span.name for span in sink.spans]
+        assert names.count("llm.ask") == 2
+        assert names.count("react.parse") == 2
+        assert "tool:add" in names
+
+        root = next(span for span in sink.spans if span.name == "agent.run")
+        assert root.parent_id is None
+        assert root.attributes["iterations"] == 2
+
+        llm_span = next(span for span in sink.spans if span.name == "llm.ask")
+        assert llm_span.attributes["input_tokens"] == 10
+        assert llm_span.attributes["output_tokens"] == 5
+
+        waterfall = format_waterfall(sink.spans)
+        assert "agent.run" in waterfall
+        assert "tokens input=20 output=10" in waterfall
+
+    @pytest.mark.asyncio
+    async def test_async_react_agent_spans(self, add_tool):
+        sink = InMemorySpanSink()
+        llm = Mock()
+        llm.system_prompt = None
+        del llm.aask
+        del llm.ask_async
+        llm.ask.side_effect = REACT_RESPONSES
+
+        agent = AsyncReactAgent(llm=llm, tools=[add_tool])
+        with Tracer(sink).activate():
+            assert await agent.arun("1 + 2?") == "3"
+
+        root = next(span for span in sink.spans if span.name == "agent.run")
+        tool_span = next(span for span in sink.spans if span.name == "tool:add")
+        assert tool_span.trace_id == root.trace_id
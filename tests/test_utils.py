@@ -3,7 +3,14 @@ from typing import List, Literal, Optional, Union
 import pytest
 import tiktoken
 
-from pyhub.rag.utils import aenumerate, get_literal_values, make_groups_by_length
+from pyhub.rag.utils import (
+    aenumerate,
+    deserialize_f32,
+    get_literal_values,
+    make_groups_by_length,
+    serialize_f32,
+    serialize_f32_batch,
+)
 
 
 @pytest.mark.it("make_groups_by_length 함수가 올바르게 텍스트를 그룹화하는지 테스트합니다.")
@@ -59,3 +66,24 @@ def test_get_literal_values():
 
     # 실제 값 테스트
     assert get_literal_values("actual_value") == {"actual_value"}
+
+
+@pytest.mark.it("serialize_f32 함수가 벡터를 little-endian float32 blob으로 변환하는지 테스트합니다.")
+def test_serialize_f32():
+    import struct
+
+    import numpy as np
+
+    from pyhub.llm.types import Embed
+
+    blob = serialize_f32([1.5, -2.0, 0.25])
+    assert blob == struct.pack("<3f", 1.5, -2.0, 0.25)
+    assert serialize_f32(np.array([1.5, -2.0, 0.25], dtype=np.float64)) == blob
+    assert serialize_f32(Embed(array=[1.5, -2.0, 0.25])) == blob
+    assert serialize_f32(blob) == blob
+    assert deserialize_f32(blob) == [1.5, -2.0, 0.25]
+
+    assert serialize_f32_batch([[1.5, -2.0, 0.25], [0.0, 0.0, 1.0]]) == [blob, struct.pack("<3f", 0, 0, 1)]
+    # 차원이 다른 벡터가 섞여 있어도 개별 변환
+    assert serialize_f32_batch([[1.0], [1.0, 2.0]]) == [struct.pack("<f", 1), struct.pack("<2f", 1, 2)]
+    assert serialize_f32_batch([]) == []